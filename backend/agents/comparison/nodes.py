@@ -1,10 +1,10 @@
 """Comparison Agent 노드 함수."""
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 from typing import Any, Dict, List
+from backend.common.async_utils import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,7 @@ async def batch_diagnosis(
     warnings = []
     cache_hits = []
     cache_misses = []
+    pending = []
     
     for repo_str in repos:
         try:
@@ -44,7 +45,7 @@ async def batch_diagnosis(
         
         normalized_key = f"{owner}/{repo}"
         
-        if normalized_key in results:
+        if normalized_key in results or normalized_key in cache_misses:
             logger.info(f"Already processed {normalized_key}, skipping duplicate")
             continue
         
@@ -64,8 +65,14 @@ async def batch_diagnosis(
                         analysis_cache.make_repo_key(owner, repo, ref), None
                     )
         
-        # 캐시 미스 - 진단 실행 (비동기)
         cache_misses.append(normalized_key)
+        pending.append((owner, repo))
+    
+    # 캐시 미스 저장소의 fetch 단계를 배치 GraphQL 1회(청크당)로 미리 조회
+    await prefetch_bundles(pending, ref)
+    
+    for owner, repo in pending:
+        normalized_key = f"{owner}/{repo}"
         logger.info(f"CACHE MISS - Running diagnosis: {normalized_key}")
         
         try:
@@ -97,6 +104,27 @@ async def batch_diagnosis(
     }
 
 
+async def prefetch_bundles(repos: List[tuple], ref: str) -> None:
+    """
+    여러 저장소의 진단 번들을 배치 조회해 캐시에 적재.
+
+    이후 저장소별 진단(full_path)은 캐시된 번들을 사용하므로 저장소마다 fetch를 반복하지 않습니다.
+    배치 조회가 불가능하면(토큰 없음 등) 저장소별 조회로 그대로 진행합니다.
+    """
+    if len(repos) < 2:
+        return
+    from backend.core.bundle_core import fetch_diagnosis_bundles_async
+    
+    try:
+        bundles = await fetch_diagnosis_bundles_async(repos, ref)
+    except Exception as e:
+        logger.info(f"Batch prefetch skipped: {e}")
+        return
+    failed = [key for key, value in bundles.items() if isinstance(value, Exception)]
+    if failed:
+        logger.warning(f"Batch prefetch failed for: {failed}")
+
+
 async def compare_results(results: Dict[str, Any]) -> Dict[str, Any]:
     """
     여러 저장소의 분석 결과를 비교하여 LLM 기반 요약 생성.
@@ -135,7 +163,6 @@ async def compare_results(results: Dict[str, Any]) -> Dict[str, Any]:
 
 async def _generate_llm_comparison_async(comparison_data: List[Dict[str, Any]]) -> str:
     """LLM을 사용하여 비교 분석 메시지 생성 (비동기)."""
-    import asyncio
     from backend.llm.factory import fetch_llm_client
     from backend.llm.base import ChatRequest, ChatMessage
     
@@ -207,8 +234,7 @@ ODOC 평가 기준: 건강점수=문서25%+활동성65%+구조10%, 온보딩점
         )
         
         # 동기 LLM 호출을 비동기로 실행
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(None, client.chat, request)
+        response = await run_blocking(client.chat, request)
         
         if response.content:
             return response.content.strip()
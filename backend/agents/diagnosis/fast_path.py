@@ -3,12 +3,21 @@ Diagnosis Agent - Fast Path
 빠른 조회 실행 (README, Activity, Dependencies 등)
 """
 from typing import Dict, Any, Optional, Literal
+from dataclasses import asdict, is_dataclass
+from backend.agents.diagnosis.partial_cache import find_part
 from backend.common import github_client
 from backend.common.cache_manager import get_cache_manager
 import logging
 
 logger = logging.getLogger(__name__)
 
+# fast path 대상 → full path가 저장한 분석기별 부분 결과
+_TARGET_PARTS = {
+    "activity": "activity",
+    "dependencies": "dependencies",
+    "structure": "structure",
+}
+
 
 async def execute_fast_path(
     owner: str,
@@ -58,6 +67,19 @@ async def execute_fast_path(
                 start_time=start_time
             )
     
+    # 이전 전체 진단의 분석기별 결과 재사용 (같은 커밋)
+    part = _TARGET_PARTS.get(target)
+    if part:
+        commit_sha = await github_client.resolve_commit_sha_async(owner, repo, ref)
+        partial = find_part(owner, repo, commit_sha, part)
+        if partial is not None:
+            return _format_result(
+                target=target,
+                data=_part_to_dict(partial),
+                from_cache=True,
+                start_time=start_time
+            )
+    
     # 캐시 없으면 GitHub에서 가져오기
     try:
         if target == "readme":
@@ -92,8 +114,8 @@ async def execute_fast_path(
 async def _fetch_readme(owner: str, repo: str) -> Dict[str, Any]:
     """README 가져오기"""
     try:
-        # fetch_repo_overview에 README가 포함되어 있음
-        overview = github_client.fetch_repo_overview(owner, repo)
+        # fetch_repo_overview_async에 README가 포함되어 있음
+        overview = await github_client.fetch_repo_overview_async(owner, repo)
         content = overview.get("readme_content")
         
         if not content:
@@ -113,8 +135,8 @@ async def _fetch_readme(owner: str, repo: str) -> Dict[str, Any]:
 async def _fetch_activity(owner: str, repo: str) -> Dict[str, Any]:
     """활동 정보 가져오기"""
     try:
-        # fetch_activity_summary 사용 (GraphQL - 한번에 commits, issues, PRs 조회)
-        activity = github_client.fetch_activity_summary(owner, repo)
+        # fetch_activity_summary_async 사용 (GraphQL - 한번에 commits, issues, PRs 조회)
+        activity = await github_client.fetch_activity_summary_async(owner, repo)
         
         commits = activity.get("commits", [])
         issues = activity.get("issues", [])
@@ -135,7 +157,7 @@ async def _fetch_activity(owner: str, repo: str) -> Dict[str, Any]:
 async def _fetch_dependencies(owner: str, repo: str) -> Dict[str, Any]:
     """의존성 정보 가져오기"""
     try:
-        contents = github_client.fetch_repo_contents(owner, repo, "")
+        contents = await github_client.fetch_repo_contents_async(owner, repo, "")
         
         dep_file_names = [
             "package.json",  # Node.js
@@ -185,8 +207,8 @@ def _detect_dep_type(filename: str) -> str:
 async def _fetch_structure(owner: str, repo: str) -> Dict[str, Any]:
     """구조 정보 가져오기"""
     try:
-        # fetch_repo_contents 사용하여 루트 디렉토리 확인
-        contents = github_client.fetch_repo_contents(owner, repo, "")
+        # fetch_repo_contents_async 사용하여 루트 디렉토리 확인
+        contents = await github_client.fetch_repo_contents_async(owner, repo, "")
         
         files = [item for item in contents if item.get("type") == "file"]
         dirs = [item for item in contents if item.get("type") == "dir"]
@@ -201,6 +223,15 @@ async def _fetch_structure(owner: str, repo: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
+def _part_to_dict(result: Any) -> Dict[str, Any]:
+    """분석기 결과(dataclass)를 응답용 dict로 변환."""
+    if hasattr(result, "to_dict"):
+        return result.to_dict()
+    if is_dataclass(result):
+        return asdict(result)
+    return result
+
+
 def _detect_readme_sections(content: str) -> list:
     """README 섹션 감지"""
     import re
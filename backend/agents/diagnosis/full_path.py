@@ -6,14 +6,30 @@ from typing import Dict, Any, Optional
 import asyncio
 import time
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
-from backend.core.github_core import fetch_repo_snapshot
+from backend.agents.diagnosis.incremental import (
+    carry_forward_unchanged,
+    record_fingerprint,
+    refresh_activity_async,
+    remember_activity_summary,
+)
+from backend.agents.diagnosis.partial_cache import load_parts, load_summary, required_parts, store_parts
+from backend.agents.diagnosis.summary_jobs import summary_job_id, summary_jobs
+from backend.common.async_utils import run_blocking
+from backend.common.config import DEFER_LLM_SUMMARY, INCREMENTAL_DIAGNOSIS_ENABLED, QUICK_ANALYSIS_TIME_BUDGET
+from backend.common.deadline import DeadlineExceeded, Deadline, deadline_scope, remaining_seconds
+from backend.common.errors import RepoNotFoundError
+from backend.common.github_client import resolve_commit_sha_async
+from backend.common.health_history import build_snapshot, record_snapshot
+from backend.common.stage_scheduler import StageScheduler, emit_stage
+from backend.core.bundle_core import fetch_diagnosis_bundle_async
+from backend.core.github_core import fetch_repo_snapshot_async
 from backend.core.docs_core import analyze_docs
-from backend.core.activity_core import analyze_activity_optimized
-from backend.core.structure_core import analyze_structure
-from backend.core.dependencies_core import parse_dependencies
+from backend.core.activity_core import analyze_activity_async, analyze_activity_from_summary
+from backend.core.structure_core import analyze_structure_from_tree, fetch_structure_tree_async
+from backend.core.dependencies_core import build_dependencies_snapshot, parse_dependencies_async
 from backend.core.scoring_core import compute_scores
+from backend.core.models import ActivityCoreResult, DocsCoreResult
 from backend.llm.factory import fetch_llm_client
 from backend.llm.base import ChatRequest, ChatMessage
 
@@ -26,19 +42,94 @@ async def execute_full_path(
     ref: str = "main",
     analysis_depth: str = "standard",
     use_llm_summary: bool = True,
-    force_refresh: bool = False
+    force_refresh: bool = False,
+    defer_llm_summary: Optional[bool] = None,
+    time_budget: Optional[float] = None,
 ) -> Dict[str, Any]:
+    """
+    전체 진단 실행.
+
+    점수/발견사항/추천은 분석이 끝나는 즉시 반환하고, LLM 요약은 defer_llm_summary(기본
+    DEFER_LLM_SUMMARY)이면 백그라운드 작업으로 생성합니다. 결과의 summary_job_id로
+    summary_jobs에서 조회하거나 기다릴 수 있습니다.
+
+    time_budget(초, quick은 기본 QUICK_ANALYSIS_TIME_BUDGET)이나 바깥 요청 마감이 있으면
+    그때까지 끝나지 않은 분석기를 취소하고, 끝난 결과로 점수를 계산해 partial=True와
+    missing_parts를 함께 반환합니다.
+
+    INCREMENTAL_DIAGNOSIS_ENABLED이면 이전에 진단한 커밋과 입력 지문을 비교해 바뀐 분석기만 다시
+    계산하고(결과의 incremental에 기준 커밋/재사용 항목 기록), 활동성은 변경분만 조회해 합칩니다.
+    """
+    if time_budget is None and analysis_depth == "quick":
+        time_budget = QUICK_ANALYSIS_TIME_BUDGET
+    with deadline_scope(time_budget) as deadline:
+        return await _execute_full_path(
+            owner, repo, ref, analysis_depth, use_llm_summary, force_refresh,
+            defer_llm_summary, deadline,
+        )
+
+
+async def _execute_full_path(
+    owner: str,
+    repo: str,
+    ref: str,
+    analysis_depth: str,
+    use_llm_summary: bool,
+    force_refresh: bool,
+    defer_llm_summary: Optional[bool],
+    deadline: Optional[Deadline],
+) -> Dict[str, Any]:
+    if defer_llm_summary is None:
+        defer_llm_summary = DEFER_LLM_SUMMARY
     start_time = time.time()
     logger.info(f"Full path execution: {owner}/{repo}@{ref} (depth={analysis_depth})")
     
     try:
-        snapshot = await _fetch_snapshot_async(owner, repo, ref, analysis_depth)
-        docs_result, activity_result, structure_result, deps_result = await asyncio.gather(
-            _analyze_docs_async(snapshot),
-            _analyze_activity_async(snapshot, analysis_depth),
-            _analyze_structure_async(snapshot),
-            _parse_dependencies_async(snapshot, analysis_depth)
-        )
+        # ref를 커밋 SHA로 한 번 고정 → 트리/파일/README 조회가 immutable 캐시를 사용
+        commit_sha = await resolve_commit_sha_async(owner, repo, ref)
+        content_ref = commit_sha or ref
+
+        stage_timings: Dict[str, Any] = {}
+        required = required_parts(analysis_depth)
+        parts = None
+        incremental = None
+        if not force_refresh and INCREMENTAL_DIAGNOSIS_ENABLED:
+            try:
+                incremental = await carry_forward_unchanged(owner, repo, commit_sha, analysis_depth)
+            except Exception as e:
+                logger.warning(f"Incremental diagnosis unavailable for {owner}/{repo}: {e}")
+            if incremental:
+                emit_stage("incremental", incremental)
+        if not force_refresh:
+            parts = await _analyze_from_parts_async(
+                owner, repo, commit_sha, analysis_depth, stage_timings
+            )
+        if parts is None:
+            parts = await _analyze_from_bundle_async(owner, repo, content_ref, analysis_depth)
+        if parts is None:
+            parts = await _run_analyzer_stages(
+                owner, repo, content_ref, analysis_depth, required, stage_timings,
+            )
+        # 마감으로 취소된 분석기 (끝난 결과는 캐시에 남아 다음 요청이 나머지만 계산)
+        missing_parts = [part for part in required if part not in parts]
+        if "docs" in missing_parts and "activity" in missing_parts:
+            raise DeadlineExceeded(
+                f"Deadline exceeded before any analyzer finished for {owner}/{repo}"
+            )
+        if missing_parts:
+            logger.warning(
+                f"Partial diagnosis for {owner}/{repo}: {', '.join(missing_parts)} past deadline"
+            )
+            if deadline is not None:
+                deadline.mark_partial(missing_parts)
+            emit_stage("partial", {"missing_parts": missing_parts})
+        store_parts(owner, repo, commit_sha, analysis_depth, parts)
+        if INCREMENTAL_DIAGNOSIS_ENABLED and not missing_parts:
+            record_fingerprint(owner, repo, commit_sha, _history_days(analysis_depth))
+        docs_result = parts.get("docs") or _placeholder_part("docs")
+        activity_result = parts.get("activity") or _placeholder_part("activity")
+        structure_result = parts.get("structure")
+        deps_result = parts.get("dependencies")
         
         if deps_result is None:
             from backend.core.models import DependenciesSnapshot
@@ -55,12 +146,52 @@ async def execute_full_path(
             deps=deps_result,
             structure=structure_result
         )
+        emit_stage("scoring", {
+            "health_score": getattr(scoring_result, 'health_score', 0),
+            "health_level": getattr(scoring_result, 'health_level', None),
+            "onboarding_score": getattr(scoring_result, 'onboarding_score', 0),
+            "docs_score": getattr(scoring_result, 'documentation_quality', 0),
+            "activity_score": getattr(scoring_result, 'activity_maintainability', 0),
+        })
+        if commit_sha and not missing_parts:
+            await _record_health_snapshot(
+                owner, repo, commit_sha, analysis_depth, scoring_result, activity_result, structure_result,
+            )
         
         llm_summary = None
-        if use_llm_summary:
-            llm_summary = await _generate_summary_async(
-                owner, repo, scoring_result, docs_result, activity_result
-            )
+        summary_status = "disabled"
+        job_id = None
+        if use_llm_summary and missing_parts:
+            # 빠진 항목을 0점으로 채운 점수라 요약은 만들지 않음
+            summary_status = "skipped"
+        elif use_llm_summary:
+            job_id = summary_job_id(owner, repo, ref)
+            if not force_refresh:
+                llm_summary = load_summary(owner, repo, commit_sha, analysis_depth)
+            summary_args = (owner, repo, scoring_result, docs_result, activity_result)
+
+            def keep_summary(summary: str) -> None:
+                store_parts(owner, repo, commit_sha, analysis_depth, {"summary": summary})
+
+            if llm_summary:
+                summary_jobs.record(job_id, llm_summary)
+            elif defer_llm_summary:
+                summary_jobs.submit(job_id, _generate_summary, *summary_args, on_done=keep_summary)
+                emit_stage("summary_pending", {"job_id": job_id})
+            else:
+                llm_started = time.time()
+                llm_summary = await run_blocking(_generate_summary, *summary_args)
+                stage_timings["llm_summary"] = {
+                    "started_ms": round((llm_started - start_time) * 1000, 1),
+                    "duration_ms": round((time.time() - llm_started) * 1000, 1),
+                    "ok": llm_summary is not None,
+                }
+                summary_jobs.record(job_id, llm_summary)
+                if llm_summary:
+                    keep_summary(llm_summary)
+            summary_status = summary_jobs.get(job_id).status
+            if llm_summary:
+                emit_stage("llm_summary", {"llm_summary": llm_summary})
         
         key_findings = _extract_key_findings(docs_result, activity_result, scoring_result)
         warnings = _extract_warnings(docs_result, activity_result, scoring_result)
@@ -75,6 +206,7 @@ async def execute_full_path(
             "owner": owner,
             "repo": repo,
             "ref": ref,
+            "commit_sha": commit_sha,
             "analyzed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             "analysis_depth": analysis_depth,
             
@@ -86,8 +218,8 @@ async def execute_full_path(
             "structure_score": structure_result.structure_score if structure_result else 0,
             
             # 상세 분석 (데이터클래스는 asdict 사용)
-            "documentation": docs_result.__dict__ if hasattr(docs_result, '__dict__') else docs_result,
-            "activity": activity_result.__dict__ if hasattr(activity_result, '__dict__') else activity_result,
+            "documentation": _part_detail(parts.get("docs")),
+            "activity": _part_detail(parts.get("activity")),
             "structure": structure_result.__dict__ if structure_result and hasattr(structure_result, '__dict__') else structure_result,
             "dependencies": deps_result.__dict__ if deps_result and hasattr(deps_result, '__dict__') else deps_result,
             
@@ -98,9 +230,19 @@ async def execute_full_path(
             
             # 요약
             "llm_summary": llm_summary,
+            "summary_status": summary_status,
+            "summary_job_id": job_id,
+            
+            # 마감 초과로 빠진 분석기 (점수는 빠진 항목을 0점으로 계산)
+            "partial": bool(missing_parts),
+            "missing_parts": missing_parts,
+            
+            # 증분 재진단 (이전 커밋 결과를 재사용한 경우 기준 커밋과 다시 계산한 입력)
+            "incremental": incremental,
             
             # 메타
             "execution_time_ms": execution_time_ms,
+            "stage_timings": stage_timings,
             "from_cache": False
         }
         
@@ -118,46 +260,244 @@ async def execute_full_path(
         }
 
 
-async def _fetch_snapshot_async(owner: str, repo: str, ref: str, analysis_depth: str):
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        snapshot = await loop.run_in_executor(
-            executor,
-            fetch_repo_snapshot,
-            owner, repo, ref
+def _history_days(analysis_depth: str) -> int:
+    return {
+        "quick": 30,
+        "standard": 90,
+        "thorough": 180
+    }.get(analysis_depth, 90)
+
+
+async def _analyze_from_parts_async(
+    owner: str,
+    repo: str,
+    commit_sha: Optional[str],
+    analysis_depth: str,
+    stage_timings: Optional[Dict[str, Any]] = None,
+):
+    """
+    같은 커밋/depth의 분석기별 캐시 결과로 진단 구성 (부분 재실행).
+
+    빠진 항목만 다시 계산합니다 (push webhook이 이전 커밋 결과를 이어 붙인 경우 등).
+    activity 외에 재사용할 항목이 하나도 없으면 None을 반환해 전체 fetch 경로를 사용합니다.
+    마감으로 다시 계산하지 못한 항목은 반환값에서 빠집니다.
+    """
+    parts = load_parts(owner, repo, commit_sha, analysis_depth)
+    required = required_parts(analysis_depth)
+    if not any(part in parts for part in required if part != "activity"):
+        return None
+    missing = [part for part in required if part not in parts]
+    for part in required:
+        if part in parts:
+            _emit_part(part, parts[part])
+    if missing:
+        logger.info(
+            f"Partial cache: recomputing {', '.join(missing)} only for {owner}/{repo}@{commit_sha}"
         )
-    return snapshot
+        parts.update(await _run_analyzer_stages(
+            owner, repo, commit_sha, analysis_depth, missing, stage_timings
+        ))
+    else:
+        logger.info(f"Partial cache: all analyzers cached for {owner}/{repo}@{commit_sha}")
+    return parts
 
 
-async def _analyze_docs_async(snapshot):
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(executor, analyze_docs, snapshot)
-    return result
+async def _run_analyzer_stages(
+    owner: str,
+    repo: str,
+    ref: str,
+    analysis_depth: str,
+    parts,
+    stage_timings: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    요청된 분석기만 의존성 DAG로 실행.
 
+    activity는 owner/repo만, structure는 트리만 필요하므로 스냅샷 조회를 기다리지 않고
+    스냅샷·활동성·트리 조회가 동시에 시작됩니다. docs는 스냅샷, dependencies는 스냅샷과
+    (캐시를 데우는) 트리 조회가 끝나는 즉시 시작합니다.
+    요청 마감이 있으면 그때까지 끝난 분석기만 반환합니다.
+    """
+    scheduler = StageScheduler(f"diagnosis {owner}/{repo}@{ref}", on_complete=_emit_part)
+    if "docs" in parts or "dependencies" in parts:
+        scheduler.add("snapshot", lambda: _fetch_snapshot_async(owner, repo, ref, analysis_depth))
+    if "structure" in parts or "dependencies" in parts:
+        scheduler.add("tree", lambda: _fetch_tree_async(owner, repo, ref))
+    if "activity" in parts:
+        scheduler.add("activity", lambda: _analyze_activity_async(owner, repo, analysis_depth))
+    if "docs" in parts:
+        scheduler.add("docs", _analyze_docs_async, deps=("snapshot",))
+    if "structure" in parts:
+        scheduler.add(
+            "structure",
+            lambda tree: _analyze_structure_from_tree(owner, repo, tree),
+            deps=("tree",),
+            blocking=True,
+        )
+    if "dependencies" in parts:
+        scheduler.add(
+            "dependencies",
+            lambda snapshot, _tree: _parse_dependencies_async(snapshot, analysis_depth),
+            deps=("snapshot", "tree"),
+        )
+    try:
+        results = await scheduler.run(timeout=remaining_seconds())
+    finally:
+        if stage_timings is not None:
+            stage_timings.update(scheduler.timings_dict())
+    return {part: results[part] for part in parts if part in results}
 
-async def _analyze_activity_async(snapshot, analysis_depth: str):
-    history_days = {
-        "quick": 30,
-        "standard": 90,
-        "thorough": 180
-    }.get(analysis_depth, 90)
-    
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(
-            executor,
-            lambda: analyze_activity_optimized(snapshot, None, history_days)
+
+async def _analyze_from_bundle_async(owner: str, repo: str, ref: str, analysis_depth: str):
+    """
+    합성 GraphQL 번들 1회 조회로 fetch 단계를 끝내고 분석기별 결과 반환.
+
+    번들 조회가 불가능하면(토큰 없음, GraphQL 오류 등) None을 반환해 개별 호출 경로로 폴백.
+    번들은 전부 아니면 전무이므로 요청 마감이 있으면 남은 시간의 절반까지만 기다리고,
+    나머지 시간은 부분 결과를 낼 수 있는 개별 호출 경로에 남깁니다.
+    """
+    include_manifests = analysis_depth != "quick"
+    remaining = remaining_seconds()
+    try:
+        bundle = await asyncio.wait_for(
+            fetch_diagnosis_bundle_async(
+                owner, repo, ref,
+                days=_history_days(analysis_depth),
+                include_manifests=include_manifests,
+            ),
+            timeout=None if remaining is None else remaining / 2,
+        )
+    except RepoNotFoundError:
+        raise
+    except Exception as e:
+        logger.info(f"Bundle fetch unavailable, using per-call path: {e}")
+        return None
+
+    if INCREMENTAL_DIAGNOSIS_ENABLED:
+        remember_activity_summary(owner, repo, _history_days(analysis_depth), bundle.activity_summary)
+    snapshot = bundle.snapshot
+    deps_result = None
+    if include_manifests:
+        deps_result = build_dependencies_snapshot(
+            snapshot, bundle.file_tree, bundle.manifest_contents
+        )
+    results = {
+        "docs": analyze_docs(snapshot),
+        "activity": analyze_activity_from_summary(
+            bundle.activity_summary, owner, repo, _history_days(analysis_depth)
+        ),
+        "structure": analyze_structure_from_tree(owner, repo, bundle.file_tree),
+        "dependencies": deps_result,
+    }
+    for part, result in results.items():
+        if part != "dependencies" or include_manifests:
+            _emit_part(part, result)
+    return results
+
+
+def _placeholder_part(part: str):
+    """마감으로 빠진 docs/activity 대신 점수 계산에 쓰는 0점 결과."""
+    if part == "docs":
+        return DocsCoreResult(
+            readme_present=False, readme_word_count=0, category_scores={},
+            total_score=0, missing_sections=[], present_sections=[],
         )
+    return ActivityCoreResult(
+        commit_score=0.0, issue_score=0.0, pr_score=0.0, total_score=0,
+        days_since_last_commit=None, total_commits_in_window=0, unique_authors=0,
+    )
+
+
+async def _record_health_snapshot(
+    owner: str,
+    repo: str,
+    commit_sha: str,
+    analysis_depth: str,
+    scoring_result: Any,
+    activity_result: Any,
+    structure_result: Any,
+) -> None:
+    """건강도 시계열에 이번 진단 지표 추가 (같은 날 같은 커밋/depth는 한 번만)."""
+    scores = {
+        "health_score": getattr(scoring_result, 'health_score', None),
+        "onboarding_score": getattr(scoring_result, 'onboarding_score', None),
+        "docs_score": getattr(scoring_result, 'documentation_quality', None),
+        "activity_score": getattr(scoring_result, 'activity_maintainability', None),
+        "structure_score": structure_result.structure_score if structure_result else None,
+    }
+    snapshot = build_snapshot(owner, repo, commit_sha, analysis_depth, scores, activity_result)
+    # SQLite 쓰기(잠금 + WAL 커밋)는 이벤트 루프 밖에서
+    await run_blocking(record_snapshot, snapshot)
+
+
+def _part_detail(result: Any) -> Any:
+    """상세 분석 항목 (데이터클래스는 __dict__, 빠진 항목은 None)."""
+    return result.__dict__ if hasattr(result, '__dict__') else result
+
+
+# 분석기별 진행 이벤트에 싣는 필드 (결과 객체 속성 이름)
+_PART_PAYLOAD_FIELDS = {
+    "docs": ("total_score", "readme_present", "missing_sections"),
+    "activity": (
+        "total_score", "days_since_last_commit", "total_commits_in_window", "unique_authors",
+        "issue_close_rate", "median_pr_merge_days", "open_issues_count", "open_prs_count",
+    ),
+    "structure": ("structure_score", "has_tests", "has_ci", "has_docs_folder", "has_build_config"),
+}
+
+
+def _part_payload(part: str, result: Any) -> Dict[str, Any]:
+    """분석기 결과에서 진행 이벤트용 부분 결과 추출."""
+    if part == "dependencies":
+        return {
+            "dependency_count": len(getattr(result, "dependencies", None) or []),
+            "analyzed_files": list(getattr(result, "analyzed_files", None) or []),
+        }
+    payload = {field: getattr(result, field, None) for field in _PART_PAYLOAD_FIELDS.get(part, ())}
+    if "total_score" in payload:
+        payload[f"{part}_score"] = payload.pop("total_score")
+    return payload
+
+
+def _emit_part(part: str, result: Any) -> None:
+    """분석기 완료 알림 (스냅샷/트리 조회 같은 중간 단계는 제외)."""
+    if part in ("docs", "activity", "structure", "dependencies"):
+        emit_stage(part, _part_payload(part, result))
+
+
+async def _analyze_activity_async(owner: str, repo: str, analysis_depth: str):
+    """활동성 분석 (이전 목록이 있으면 변경분만 조회해 합치고, 없으면 전체 조회 후 기록)."""
+    days = _history_days(analysis_depth)
+    if not INCREMENTAL_DIAGNOSIS_ENABLED:
+        return await analyze_activity_async(owner, repo, days)
+    result = await refresh_activity_async(owner, repo, days)
+    if result is not None:
+        return result
+    result = await analyze_activity_async(owner, repo, days)
+    remember_activity_summary(owner, repo, days)
     return result
 
 
-async def _analyze_structure_async(snapshot):
+async def _fetch_snapshot_async(owner: str, repo: str, ref: str, analysis_depth: str):
+    return await fetch_repo_snapshot_async(owner, repo, ref)
+
+
+async def _analyze_docs_async(snapshot):
+    # README 분석은 I/O 없는 순수 CPU 작업이므로 루프에서 바로 실행
+    return analyze_docs(snapshot)
+
+
+async def _fetch_tree_async(owner: str, repo: str, ref: str) -> list:
     try:
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(executor, analyze_structure, snapshot)
-        return result
+        return await fetch_structure_tree_async(owner, repo, ref)
+    except Exception as e:
+        logger.warning(f"Failed to fetch file tree for {owner}/{repo}: {e}")
+        return []
+
+
+def _analyze_structure_from_tree(owner: str, repo: str, tree: list):
+    try:
+        return analyze_structure_from_tree(owner, repo, tree)
     except Exception as e:
         logger.warning(f"Structure analysis failed: {e}")
         return None
@@ -169,23 +509,20 @@ async def _parse_dependencies_async(snapshot, analysis_depth: str):
         return None
     
     try:
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(executor, parse_dependencies, snapshot)
-        return result
+        return await parse_dependencies_async(snapshot)
     except Exception as e:
         logger.warning(f"Dependency parsing failed: {e}")
         return None
 
 
-async def _generate_summary_async(
+def _generate_summary(
     owner: str,
     repo: str,
     scoring_result: Any,  # DiagnosisCoreResult 객체
     docs_result: Any,
     activity_result: Any
 ) -> Optional[str]:
-    """비동기 LLM 요약 생성"""
+    """LLM 요약 생성 (동기 LLM 호출이므로 공용 실행기에서 실행)"""
     try:
         llm_client = fetch_llm_client()
         
@@ -229,14 +566,13 @@ async def _generate_summary_async(
 
 3-5문장으로 저장소 상태를 요약해주세요."""
 
-        # 비동기 LLM 호출
-        loop = asyncio.get_event_loop()
+        # 비동기 LLM 호출 (공용 실행기)
         request = ChatRequest(
             messages=[ChatMessage(role="user", content=prompt)],
             temperature=0.3,
             max_tokens=500
         )
-        response = await loop.run_in_executor(None, llm_client.chat, request)
+        response = llm_client.chat(request)
         return response.content
         
     except Exception as e:
@@ -28,6 +28,7 @@ class DiagnosisGraphState(TypedDict):
     
     user_message: Optional[str]
     supervisor_intent: Optional[Dict[str, Any]]
+    defer_llm_summary: Optional[bool]
     diagnosis_intent: Optional[DiagnosisIntentV2]
     cache_key: Optional[str]
     cached_result: Optional[Dict[str, Any]]
@@ -142,11 +143,14 @@ async def full_path_node(state: DiagnosisGraphState) -> Dict[str, Any]:
         ref=state.get("ref", "main"),
         analysis_depth=analysis_depth,
         use_llm_summary=True,
-        force_refresh=force_refresh
+        force_refresh=force_refresh,
+        defer_llm_summary=state.get("defer_llm_summary"),
     )
     
     cache_key = state.get("cache_key")
-    if not result.get("error") and cache_key and intent:
+    # 마감으로 일부 분석기가 빠진 결과, 요약이 아직 생성 중인 결과는 캐시하지 않음
+    cacheable = not result.get("partial") and result.get("summary_status") != "pending"
+    if not result.get("error") and cacheable and cache_key and intent:
         cache_manager = get_cache_manager()
         strategy = determine_cache_strategy(
             intent=intent,
@@ -242,7 +246,8 @@ async def run_diagnosis(
     repo: str,
     ref: str = "main",
     user_message: Optional[str] = None,
-    supervisor_intent: Optional[Dict[str, Any]] = None
+    supervisor_intent: Optional[Dict[str, Any]] = None,
+    defer_llm_summary: Optional[bool] = None,
 ) -> Dict[str, Any]:
     graph = get_diagnosis_graph()
     initial_state: DiagnosisGraphState = {
@@ -251,6 +256,7 @@ async def run_diagnosis(
         "ref": ref,
         "user_message": user_message or f"{owner}/{repo} 저장소를 진단해주세요",
         "supervisor_intent": supervisor_intent,
+        "defer_llm_summary": defer_llm_summary,
         "use_cache": True,
         "execution_time_ms": 0,
         "diagnosis_intent": None,
@@ -0,0 +1,250 @@
+"""
+Diagnosis Agent - Incremental Re-diagnosis
+진단한 커밋의 입력 지문(README/매니페스트 blob SHA, 트리 지문, 활동 커서)을 저장소별로 기록
+새 커밋을 진단할 때 지문이 같은 분석 결과는 이전 커밋에서 이어 붙여 바뀐 분석기만 다시 계산
+활동성은 기록해 둔 목록에 커서 이후 변경분만 조회해 합침
+"""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Set
+import hashlib
+import logging
+import time
+
+from backend.agents.diagnosis.partial_cache import (
+    ANALYZER_PARTS,
+    carry_forward_parts,
+    load_parts,
+    part_for_path,
+    required_parts,
+)
+from backend.common.cache_manager import immutable_cache
+from backend.common.config import ACTIVITY_DELTA_MAX_AGE
+from backend.common.github_client import fetch_activity_delta_async, fetch_activity_summary_async
+from backend.core.activity_core import activity_cursor, analyze_activity_from_summary, merge_activity_summary
+from backend.core.github_core import fetch_repo_tree_entries_async
+from backend.core.models import ActivityCoreResult, TreeEntry
+
+logger = logging.getLogger(__name__)
+
+# 커서 직전에 만들어졌지만 늦게 push된 커밋도 합치도록 변경분 조회 시작을 앞당기는 시간
+_DELTA_OVERLAP = timedelta(hours=1)
+
+
+@dataclass
+class InputFingerprint:
+    """
+    분석기 입력 지문.
+
+    tree_digest는 (경로, blob SHA) 전체의 지문으로 루트 트리 SHA와 같은 역할을 하고,
+    paths_digest는 structure 분석 입력인 경로 목록만의 지문입니다.
+    """
+    commit_sha: str
+    tree_digest: str
+    paths_digest: str
+    readme_blobs: Dict[str, str] = field(default_factory=dict)
+    manifest_blobs: Dict[str, str] = field(default_factory=dict)
+    activity_cursor: Optional[str] = None
+    recorded_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ActivityWindow:
+    """활동성 계산에 쓴 목록 (fetch_activity_summary 형식), 그 커서, 마지막 전체 조회 시각."""
+    days: int
+    summary: Dict[str, Any]
+    cursor: Optional[str]
+    base_fetched_at: float = field(default_factory=time.time)
+
+
+def compute_fingerprint(
+    commit_sha: str,
+    entries: Iterable[TreeEntry],
+    activity_cursor: Optional[str] = None,
+) -> InputFingerprint:
+    """트리 항목으로 입력 지문 계산 (README/매니페스트 판별은 push webhook의 affected_parts와 동일)."""
+    tree_hash = hashlib.sha1()
+    paths_hash = hashlib.sha1()
+    readme_blobs: Dict[str, str] = {}
+    manifest_blobs: Dict[str, str] = {}
+    for entry in sorted(entries, key=lambda e: e.path):
+        tree_hash.update(f"{entry.path}\0{entry.type}\0{entry.sha}\n".encode("utf-8"))
+        paths_hash.update(f"{entry.path}\n".encode("utf-8"))
+        if entry.type != "blob":
+            continue
+        part = part_for_path(entry.path)
+        if part == "docs":
+            readme_blobs[entry.path] = entry.sha
+        elif part == "dependencies":
+            manifest_blobs[entry.path] = entry.sha
+    return InputFingerprint(
+        commit_sha=commit_sha,
+        tree_digest=tree_hash.hexdigest(),
+        paths_digest=paths_hash.hexdigest(),
+        readme_blobs=readme_blobs,
+        manifest_blobs=manifest_blobs,
+        activity_cursor=activity_cursor,
+    )
+
+
+def changed_parts(previous: InputFingerprint, current: InputFingerprint) -> Set[str]:
+    """
+    지문이 달라져 다시 계산해야 하는 분석 결과.
+
+    README blob → docs, 매니페스트 blob(추가/삭제 포함) → dependencies, 경로 목록 → structure.
+    activity는 커밋과 무관하게 바뀌므로 항상 포함합니다 (변경분 병합은 refresh_activity_async).
+    """
+    parts = {"activity"}
+    if previous.tree_digest == current.tree_digest:
+        return parts
+    if previous.readme_blobs != current.readme_blobs:
+        parts.add("docs")
+    if previous.manifest_blobs != current.manifest_blobs:
+        parts.add("dependencies")
+    if previous.paths_digest != current.paths_digest:
+        parts.add("structure")
+    return parts
+
+
+def _fingerprint_key(owner: str, repo: str) -> str:
+    return f"{__name__}.fingerprint:{owner.lower()}/{repo.lower()}"
+
+
+def _activity_key(owner: str, repo: str, days: int) -> str:
+    return f"{__name__}.activity:{owner.lower()}/{repo.lower()}:{days}"
+
+
+def load_fingerprint(owner: str, repo: str) -> Optional[InputFingerprint]:
+    return immutable_cache.get(_fingerprint_key(owner, repo))
+
+
+def store_fingerprint(owner: str, repo: str, fingerprint: InputFingerprint) -> None:
+    immutable_cache.set(_fingerprint_key(owner, repo), fingerprint)
+
+
+def load_activity_window(owner: str, repo: str, days: int) -> Optional[ActivityWindow]:
+    return immutable_cache.get(_activity_key(owner, repo, days))
+
+
+def remember_activity_summary(
+    owner: str,
+    repo: str,
+    days: int,
+    summary: Optional[Dict[str, Any]] = None,
+    base_fetched_at: Optional[float] = None,
+) -> None:
+    """
+    활동 목록을 다음 변경분 병합의 기준으로 기록.
+
+    summary가 없으면 이번 진단이 캐시에 남긴 fetch_activity_summary_async 결과를 사용합니다
+    (REST 폴백 등으로 남은 결과가 없으면 기록하지 않음).
+    """
+    if summary is None:
+        summary = fetch_activity_summary_async.peek(owner, repo, days=days)
+    if summary is None:
+        return
+    window = ActivityWindow(days=days, summary=summary, cursor=activity_cursor(summary))
+    if base_fetched_at is not None:
+        window.base_fetched_at = base_fetched_at
+    immutable_cache.set(_activity_key(owner, repo, days), window)
+
+
+async def refresh_activity_async(owner: str, repo: str, days: int) -> Optional[ActivityCoreResult]:
+    """
+    기록해 둔 활동 목록에 커서 이후 변경분만 합쳐 활동성 계산.
+
+    기록이 없거나, 마지막 전체 조회가 ACTIVITY_DELTA_MAX_AGE보다 오래됐거나, 변경분이 조회 한도를
+    넘거나, 조회에 실패하면 None을 반환해 전체 조회 경로를 사용합니다.
+    """
+    window = load_activity_window(owner, repo, days)
+    if window is None or not window.cursor:
+        return None
+    if time.time() - window.base_fetched_at >= ACTIVITY_DELTA_MAX_AGE:
+        logger.info(f"Activity window for {owner}/{repo} is older than {ACTIVITY_DELTA_MAX_AGE}s, full refresh")
+        return None
+
+    cursor = datetime.strptime(window.cursor, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    since = (cursor - _DELTA_OVERLAP).strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        delta = await fetch_activity_delta_async(owner, repo, since)
+    except Exception as e:
+        logger.warning(f"Activity delta fetch failed for {owner}/{repo}, full refresh: {e}")
+        return None
+    if delta.get("truncated"):
+        logger.info(f"Activity delta for {owner}/{repo} since {since} exceeds query limits, full refresh")
+        return None
+
+    summary = merge_activity_summary(window.summary, delta, days)
+    remember_activity_summary(owner, repo, days, summary, window.base_fetched_at)
+    logger.info(
+        f"Activity delta merged for {owner}/{repo} since {since}: "
+        f"{len(delta['commits'])} commits, {len(delta['issues'])} issues, "
+        f"{len(delta['pull_requests'])} PRs"
+    )
+    return analyze_activity_from_summary(summary, owner, repo, days)
+
+
+async def carry_forward_unchanged(
+    owner: str,
+    repo: str,
+    commit_sha: Optional[str],
+    analysis_depth: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    이전에 진단한 커밋과 입력 지문을 비교해 바뀌지 않은 분석 결과를 새 커밋 키로 이어 붙임.
+
+    이어 붙인 항목은 이후 부분 재실행(_analyze_from_parts_async)이 그대로 사용하고 나머지만 계산합니다.
+    이 커밋의 결과가 이미 있거나, 이전 기록/트리가 없거나, 이어 붙일 결과가 없으면 None을 반환합니다.
+    """
+    if not commit_sha:
+        return None
+    previous = load_fingerprint(owner, repo)
+    if previous is None or previous.commit_sha == commit_sha:
+        return None
+    cached = load_parts(owner, repo, commit_sha, analysis_depth)
+    if any(part in cached for part in required_parts(analysis_depth) if part != "activity"):
+        return None
+
+    entries = await fetch_repo_tree_entries_async(owner, repo, commit_sha)
+    if not entries:
+        return None
+    current = compute_fingerprint(commit_sha, entries, previous.activity_cursor)
+    store_fingerprint(owner, repo, current)
+
+    changed = changed_parts(previous, current)
+    carried = carry_forward_parts(owner, repo, previous.commit_sha, commit_sha, changed)
+    reused = [part for part in ANALYZER_PARTS if f"{part}@{analysis_depth}" in carried]
+    if not reused:
+        return None
+    logger.info(
+        f"Incremental diagnosis for {owner}/{repo} {previous.commit_sha[:7]}..{commit_sha[:7]}: "
+        f"reusing {', '.join(reused)}"
+    )
+    return {
+        "base_sha": previous.commit_sha,
+        "changed_parts": sorted(changed),
+        "reused_parts": reused,
+    }
+
+
+def record_fingerprint(owner: str, repo: str, commit_sha: Optional[str], days: int) -> None:
+    """
+    진단이 끝난 커밋의 입력 지문 기록 (다음 커밋 진단의 비교 기준).
+
+    이번 진단이 캐시에 남긴 트리만 사용하고 새로 조회하지 않습니다 (트리를 쓰지 않은 archive
+    모드 등에서는 기록하지 않음). 같은 커밋이면 활동 커서만 갱신합니다.
+    """
+    if not commit_sha:
+        return
+    window = load_activity_window(owner, repo, days)
+    cursor = window.cursor if window is not None else None
+    previous = load_fingerprint(owner, repo)
+    if previous is not None and previous.commit_sha == commit_sha:
+        if cursor and cursor != previous.activity_cursor:
+            previous.activity_cursor = cursor
+            store_fingerprint(owner, repo, previous)
+        return
+    entries = fetch_repo_tree_entries_async.peek(owner, repo, commit_sha)
+    if not entries:
+        return
+    store_fingerprint(owner, repo, compute_fingerprint(commit_sha, entries, cursor))
@@ -0,0 +1,166 @@
+"""
+Diagnosis Agent - Partial Result Cache
+분석기(docs/activity/structure/dependencies)별 결과를 repo + commit SHA + depth 키로 개별 캐시
+Full Path가 저장하고, Fast Path와 부분 재실행이 재사용
+Push webhook은 바뀐 경로에 영향받지 않는 결과를 새 커밋 SHA로 이어 붙여 부분 재실행만 남김
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set
+import logging
+import posixpath
+import re
+
+from backend.agents.security.config import DEPENDENCY_FILES
+from backend.common.cache_manager import github_cache, immutable_cache
+from backend.common.config import ANALYSIS_PART_ACTIVITY_TTL
+from backend.common.ttl_policy import scaled_ttl
+from backend.core.dependencies_core import MANIFEST_PARSERS
+
+logger = logging.getLogger(__name__)
+
+ANALYZER_PARTS = ("docs", "activity", "structure", "dependencies")
+
+# 같은 커밋이어도 이슈/PR 지표는 계속 바뀌므로 activity와 (활동성 지표가 들어가는) LLM 요약은
+# 짧은 TTL로 보관 (저장소 활동성 등급 배수 적용)
+_VOLATILE_PARTS = {"activity": ANALYSIS_PART_ACTIVITY_TTL, "summary": ANALYSIS_PART_ACTIVITY_TTL}
+
+# fast path는 depth를 모르므로 더 넓은 창으로 계산된 결과부터 찾음
+DEPTH_PREFERENCE = ("standard", "thorough", "quick")
+
+_README_RE = re.compile(r"^readme(\.[a-z0-9]+)?$", re.IGNORECASE)
+_MANIFEST_NAMES = frozenset(DEPENDENCY_FILES)
+_MANIFEST_SUFFIXES = tuple(suffix for suffix, _ in MANIFEST_PARSERS)
+
+
+def required_parts(analysis_depth: str) -> tuple:
+    """depth별로 진단에 필요한 분석 결과 (quick은 의존성 분석 생략)."""
+    if analysis_depth == "quick":
+        return ("docs", "activity", "structure")
+    return ANALYZER_PARTS
+
+
+def part_key(part: str, owner: str, repo: str, commit_sha: str, analysis_depth: str) -> str:
+    return f"{__name__}.{part}:{owner.lower()}/{repo.lower()}@{commit_sha}:{analysis_depth}"
+
+
+def store_parts(
+    owner: str,
+    repo: str,
+    commit_sha: Optional[str],
+    analysis_depth: str,
+    parts: Dict[str, Any],
+) -> None:
+    """분석 결과를 항목별로 저장 (SHA를 모르면 저장하지 않음)."""
+    if not commit_sha:
+        return
+    for part, result in parts.items():
+        if result is None:
+            continue
+        key = part_key(part, owner, repo, commit_sha, analysis_depth)
+        if part in _VOLATILE_PARTS:
+            github_cache.set(key, result, scaled_ttl(owner, repo, _VOLATILE_PARTS[part]))
+        else:
+            immutable_cache.set(key, result)
+
+
+def load_parts(
+    owner: str,
+    repo: str,
+    commit_sha: Optional[str],
+    analysis_depth: str,
+) -> Dict[str, Any]:
+    """저장된 분석 결과 조회 (없는 항목은 결과 dict에서 빠짐)."""
+    if not commit_sha:
+        return {}
+    found: Dict[str, Any] = {}
+    for part in ANALYZER_PARTS:
+        result = _get_part(part, owner, repo, commit_sha, analysis_depth)
+        if result is not None:
+            found[part] = result
+    return found
+
+
+def load_summary(
+    owner: str,
+    repo: str,
+    commit_sha: Optional[str],
+    analysis_depth: str,
+) -> Optional[str]:
+    """같은 커밋/depth로 생성해 둔 LLM 요약 조회."""
+    if not commit_sha:
+        return None
+    return _get_part("summary", owner, repo, commit_sha, analysis_depth)
+
+
+def _get_part(part: str, owner: str, repo: str, commit_sha: str, analysis_depth: str) -> Optional[Any]:
+    cache = github_cache if part in _VOLATILE_PARTS else immutable_cache
+    return cache.get(part_key(part, owner, repo, commit_sha, analysis_depth))
+
+
+def find_part(owner: str, repo: str, commit_sha: Optional[str], part: str) -> Optional[Any]:
+    """depth와 무관하게 저장된 분석 결과 하나 조회 (fast path용)."""
+    if not commit_sha:
+        return None
+    for depth in DEPTH_PREFERENCE:
+        result = _get_part(part, owner, repo, commit_sha, depth)
+        if result is not None:
+            logger.info(f"Partial cache HIT: {owner}/{repo}@{commit_sha} {part} ({depth})")
+            return result
+    return None
+
+
+def affected_parts(modified: Iterable[str], added_or_removed: Iterable[str] = ()) -> Set[str]:
+    """
+    변경된 경로로 다시 계산해야 하는 분석 결과 판별.
+
+    README → docs, 매니페스트/lock 파일 → dependencies(보안 분석 입력도 동일), 그 외 → structure.
+    파일이 추가/삭제되면 트리가 바뀌므로 종류와 무관하게 structure도 포함합니다.
+    activity는 push마다 커밋이 늘어나므로 항상 포함합니다.
+    """
+    parts = {"activity"}
+    added_or_removed = list(added_or_removed)
+    if added_or_removed:
+        parts.add("structure")
+    for path in [*modified, *added_or_removed]:
+        parts.add(part_for_path(path))
+    return parts
+
+
+def part_for_path(path: str) -> str:
+    """파일 내용이 입력이 되는 분석 결과 (README → docs, 매니페스트/lock → dependencies, 그 외 structure)."""
+    name = posixpath.basename(path)
+    if _README_RE.match(name):
+        return "docs"
+    if name in _MANIFEST_NAMES or name.endswith(_MANIFEST_SUFFIXES):
+        return "dependencies"
+    return "structure"
+
+
+def carry_forward_parts(
+    owner: str,
+    repo: str,
+    from_sha: Optional[str],
+    to_sha: Optional[str],
+    changed: Set[str],
+) -> List[str]:
+    """
+    변경에 영향받지 않는 분석 결과를 이전 커밋에서 새 커밋 키로 복사.
+
+    다음 full path 실행은 빠진 항목만 다시 계산합니다. 복사한 "part@depth" 목록 반환.
+    """
+    if not from_sha or not to_sha or from_sha == to_sha:
+        return []
+    carried = []
+    for depth in DEPTH_PREFERENCE:
+        for part in ANALYZER_PARTS:
+            if part in changed or part in _VOLATILE_PARTS:
+                continue
+            result = _get_part(part, owner, repo, from_sha, depth)
+            if result is not None:
+                immutable_cache.set(part_key(part, owner, repo, to_sha, depth), result)
+                carried.append(f"{part}@{depth}")
+    if carried:
+        logger.info(
+            f"Partial cache: carried {', '.join(carried)} for {owner}/{repo} "
+            f"{from_sha[:7]}..{to_sha[:7]}"
+        )
+    return carried
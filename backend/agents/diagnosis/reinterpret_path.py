@@ -7,7 +7,7 @@ from backend.llm.factory import fetch_llm_client
 from backend.llm.base import ChatRequest, ChatMessage
 import json
 import logging
-import asyncio
+from backend.common.async_utils import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -117,13 +117,12 @@ async def execute_reinterpret_path(
 
     try:
         # 비동기 LLM 호출
-        loop = asyncio.get_event_loop()
         request = ChatRequest(
             messages=[ChatMessage(role="user", content=prompt)],
             temperature=0.3,
             max_tokens=1500
         )
-        response = await loop.run_in_executor(None, llm.chat, request)
+        response = await run_blocking(llm.chat, request)
         reinterpreted_answer = response.content
         
         execution_time_ms = int((time.time() - start_time) * 1000)
@@ -0,0 +1,138 @@
+"""
+Diagnosis Agent - Background Summary Jobs
+LLM 요약을 진단 응답 경로에서 분리해 공용 실행기에서 생성
+작업 ID(owner/repo@ref, AnalyzeResponse.job_id와 동일)로 상태를 조회하거나 완료를 기다림
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from backend.common.async_utils import get_shared_executor
+from backend.common.config import SUMMARY_JOB_MAX_ENTRIES
+from backend.common.deadline import detached_context
+
+logger = logging.getLogger(__name__)
+
+
+def summary_job_id(owner: str, repo: str, ref: str) -> str:
+    return f"{owner}/{repo}@{ref}"
+
+
+@dataclass
+class SummaryJob:
+    """요약 생성 작업 (future 결과가 None이면 생성 실패)."""
+    job_id: str
+    future: Future
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "pending"
+        return "done" if self.summary else "failed"
+
+    @property
+    def summary(self) -> Optional[str]:
+        if not self.future.done() or self.future.cancelled() or self.future.exception():
+            return None
+        return self.future.result()
+
+    def to_dict(self) -> Dict[str, Any]:
+        duration_ms = None
+        if self.finished_at is not None:
+            duration_ms = round((self.finished_at - self.submitted_at) * 1000, 1)
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "summary": self.summary,
+            "duration_ms": duration_ms,
+        }
+
+
+class SummaryJobRegistry:
+    """작업 ID별 최신 요약 작업 (LRU 상한, 스레드 안전)."""
+
+    def __init__(self, max_entries: int = SUMMARY_JOB_MAX_ENTRIES):
+        self._jobs: "OrderedDict[str, SummaryJob]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        job_id: str,
+        func: Callable[..., Optional[str]],
+        *args: Any,
+        on_done: Optional[Callable[[Optional[str]], None]] = None,
+    ) -> SummaryJob:
+        """
+        공용 실행기에서 요약 생성 시작 (같은 ID의 이전 작업은 조회 대상에서 교체).
+
+        on_done(summary)은 작업 스레드에서 호출됩니다. 응답 이후에도 계속되는 작업이므로
+        요청 마감은 물려받지 않습니다.
+        """
+        ctx = detached_context()
+        job = SummaryJob(job_id, get_shared_executor().submit(ctx.run, func, *args))
+
+        def finish(future: Future) -> None:
+            job.finished_at = time.time()
+            summary = job.summary
+            if future.exception() is not None:
+                logger.warning(f"Summary job {job_id} failed: {future.exception()}")
+            if on_done is not None and summary:
+                try:
+                    on_done(summary)
+                except Exception as e:
+                    logger.warning(f"Summary job {job_id} callback failed: {e}")
+
+        job.future.add_done_callback(finish)
+        self._put(job)
+        return job
+
+    def record(self, job_id: str, summary: Optional[str]) -> SummaryJob:
+        """이미 있는 요약(캐시 등)을 완료된 작업으로 등록."""
+        future: Future = Future()
+        future.set_result(summary)
+        job = SummaryJob(job_id, future)
+        job.finished_at = job.submitted_at
+        self._put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[SummaryJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[SummaryJob]:
+        """작업 완료를 최대 timeout초 기다린 뒤 반환 (시간 초과 시 pending 상태로 반환)."""
+        job = self.get(job_id)
+        if job is None or job.future.done():
+            return job
+        try:
+            # shield: 기다리는 쪽이 포기해도 요약 생성은 계속
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job.future)), timeout)
+        except asyncio.TimeoutError:
+            pass
+        except Exception:
+            pass
+        return job
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+
+    def _put(self, job: SummaryJob) -> None:
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self._max_entries:
+                self._jobs.popitem(last=False)
+
+
+summary_jobs = SummaryJobRegistry()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 from typing import Any, Dict, List, Optional
+from backend.common.async_utils import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,6 @@ async def fetch_issues(
     Returns:
         이슈 목록
     """
-    import asyncio
     from backend.common.github_client import fetch_beginner_issues
     
     label_map = {
@@ -39,15 +39,12 @@ async def fetch_issues(
     
     try:
         # 동기 GitHub 호출을 비동기로 실행
-        loop = asyncio.get_event_loop()
-        issues = await loop.run_in_executor(
-            None,
-            lambda: fetch_beginner_issues(
-                owner=owner,
-                repo=repo,
-                labels=labels,
-                max_count=max_count,
-            )
+        issues = await run_blocking(
+            fetch_beginner_issues,
+            owner=owner,
+            repo=repo,
+            labels=labels,
+            max_count=max_count,
         )
         logger.info(f"Fetched {len(issues)} issues")
         return issues
@@ -68,22 +65,18 @@ async def generate_plan(
     Returns:
         {"plan": [...], "error": None} 또는 {"plan": None, "error": "..."}
     """
-    import asyncio
     from backend.llm.kanana_wrapper import KananaWrapper
     
     kanana = KananaWrapper()
     
     try:
         # 동기 LLM 호출을 비동기로 실행
-        loop = asyncio.get_event_loop()
-        plan = await loop.run_in_executor(
-            None,
-            lambda: kanana.generate_onboarding_plan(
-                repo_id=repo_id,
-                diagnosis_summary=diagnosis_summary,
-                user_context=user_context or {},
-                candidate_issues=candidate_issues or [],
-            )
+        plan = await run_blocking(
+            kanana.generate_onboarding_plan,
+            repo_id=repo_id,
+            diagnosis_summary=diagnosis_summary,
+            user_context=user_context or {},
+            candidate_issues=candidate_issues or [],
         )
         logger.info(f"Onboarding plan generated: {len(plan)} weeks")
         return {"plan": plan, "error": None}
@@ -110,7 +103,6 @@ async def summarize_plan(
         plan: 주차별 플랜 목록
         summary_context: 에이전트 분석 결과 (health_level, onboarding_level, risks 등)
     """
-    import asyncio
     from backend.llm.kanana_wrapper import KananaWrapper
     
     if not plan:
@@ -120,13 +112,10 @@ async def summarize_plan(
     
     try:
         # 동기 LLM 호출을 비동기로 실행
-        loop = asyncio.get_event_loop()
-        summary = await loop.run_in_executor(
-            None,
-            lambda: kanana.summarize_onboarding_plan(
-                repo_id=repo_id,
-                plan=plan,
-            )
+        summary = await run_blocking(
+            kanana.summarize_onboarding_plan,
+            repo_id=repo_id,
+            plan=plan,
         )
         
         # 에이전트 분석 결과가 있으면 리스크 정보 추가
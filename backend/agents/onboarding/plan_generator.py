@@ -5,9 +5,9 @@
 from __future__ import annotations
 
 import logging
-import asyncio
 from typing import Any, Optional
 from datetime import datetime
+from backend.common.async_utils import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -393,8 +393,6 @@ JSON 형식으로 응답하세요. 각 단계는 기존 정보를 유지하면
 응답 형식: {{"steps": [...]}}
 """
         
-        loop = asyncio.get_event_loop()
-        
         request = ChatRequest(
             messages=[
                 ChatMessage(role="user", content=prompt)
@@ -404,11 +402,7 @@ JSON 형식으로 응답하세요. 각 단계는 기존 정보를 유지하면
         )
         
         try:
-            response = await loop.run_in_executor(
-                None,
-                self.llm.chat,
-                request
-            )
+            response = await run_blocking(self.llm.chat, request)
             
             # JSON 파싱
             import json
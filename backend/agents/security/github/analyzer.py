@@ -2,9 +2,11 @@
 GitHub 레포지토리 의존성 분석기
 """
 import fnmatch
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from backend.common.blob_cache import get_blob, git_blob_sha, parse_blob, put_blob
+from backend.common.config import GITHUB_FETCH_MODE
 from ..models import DependencyFile, Dependency
 from ..config import DEPENDENCY_FILES, LOCK_FILES
 from ..extractors import DependencyExtractor
@@ -108,19 +110,37 @@ class RepositoryAnalyzer:
             url=file_info['url']
         )
 
-        # 파일 내용 가져오기
-        content = self.client.get_file_content_with_retry(owner, repo, file_info['path'])
+        # 파일 내용 가져오기 (같은 blob SHA를 이미 받았으면 재사용)
+        content = get_blob(dep_file.sha)
+        if content is None:
+            content = self.client.get_file_content_with_retry(owner, repo, file_info['path'])
+            # 트리 조회 이후 푸시로 내용이 바뀌었을 수 있으므로 SHA가 일치할 때만 저장
+            if content and git_blob_sha(content) == dep_file.sha:
+                put_blob(dep_file.sha, content)
         if content:
-            dep_file.content = content
-
-            # 의존성 추출
-            filename = file_info['path'].split('/')[-1]
-            is_lock = self.is_lockfile(file_info['path'])
-            dep_file.dependencies = self.extractor.extract(content, filename, is_lock)
+            self._extract_dependencies(dep_file, content)
 
         return dep_file
 
-    def analyze_repository(self, owner: str, repo: str, max_workers: int = 5) -> Dict[str, Any]:
+    def _extract_dependencies(self, dep_file: DependencyFile, content: str) -> None:
+        """파일 내용에서 의존성 추출"""
+        dep_file.content = content
+        filename = dep_file.path.split('/')[-1]
+        is_lock = self.is_lockfile(dep_file.path)
+        # 추출 결과는 내용·파일명·lock 여부로만 정해지므로 내용의 blob SHA 기준으로 공유
+        dep_file.dependencies = list(parse_blob(
+            git_blob_sha(content),
+            f"security:{filename}:{int(is_lock)}",
+            lambda: self.extractor.extract(content, filename, is_lock),
+        ))
+
+    def analyze_repository(
+        self,
+        owner: str,
+        repo: str,
+        max_workers: int = 5,
+        fetch_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         레포지토리의 모든 의존성 파일을 분석
 
@@ -128,10 +148,14 @@ class RepositoryAnalyzer:
             owner: 레포지토리 소유자
             repo: 레포지토리 이름
             max_workers: 병렬 처리 워커 수
+            fetch_mode: "api" (파일별 API 호출) 또는 "archive" (tarball 1회), 기본값은 GITHUB_FETCH_MODE
 
         Returns:
             Dict[str, Any]: 분석 결과
         """
+        if (fetch_mode or GITHUB_FETCH_MODE) == "archive":
+            return self.analyze_repository_from_archive(owner, repo)
+
         print(f"Analyzing repository: {owner}/{repo}")
 
         # 1. 의존성 파일 목록 가져오기
@@ -176,6 +200,48 @@ class RepositoryAnalyzer:
         # 3. 결과 정리
         return self._build_result(owner, repo, analyzed_files)
 
+    def analyze_repository_from_archive(
+        self, owner: str, repo: str, ref: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        tarball 한 번으로 레포지토리의 모든 의존성 파일을 분석
+
+        파일마다 contents API를 호출하지 않으므로 모노레포에서도 요청 수가 1회로 고정됩니다.
+
+        Args:
+            owner: 레포지토리 소유자
+            repo: 레포지토리 이름
+            ref: 브랜치/커밋 (없으면 기본 브랜치)
+
+        Returns:
+            Dict[str, Any]: 분석 결과 (analyze_repository와 동일 형식)
+        """
+        print(f"Analyzing repository from archive: {owner}/{repo}")
+        archive = self.client.get_repository_archive(owner, repo, self.dependency_files, ref)
+        print(f"Found {len(archive.files)} dependency files in {len(archive.paths)} files")
+        for path in archive.skipped:
+            print(f"  ✗ {path}: Skipped (too large)")
+
+        analyzed_files = []
+        for path, content in archive.files.items():
+            raw = content.encode('utf-8')
+            # git blob sha (트리 API의 sha와 동일한 값)
+            sha = git_blob_sha(raw)
+            put_blob(sha, content)
+            dep_file = DependencyFile(
+                path=path,
+                sha=sha,
+                size=len(raw),
+                url=f"{self.client.base_url}/{owner}/{repo}/git/blobs/{sha}"
+            )
+            try:
+                self._extract_dependencies(dep_file, content)
+            except Exception as e:
+                print(f"  ✗ {path}: Error - {e}")
+            analyzed_files.append(dep_file)
+
+        return self._build_result(owner, repo, analyzed_files)
+
     def _build_result(self, owner: str, repo: str, analyzed_files: List[DependencyFile]) -> Dict[str, Any]:
         """
         분석 결과 구성
@@ -3,11 +3,13 @@ GitHub API 클라이언트
 """
 import os
 import base64
-import requests
 import time
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 
+from backend.common.http_client import get_http_client
+from backend.common.repo_archive import ArchiveContents, download_tarball
+
 
 class GitHubClient:
     """GitHub API와 통신하는 클라이언트"""
@@ -44,7 +46,7 @@ class GitHubClient:
         url = f"{self.base_url}/{owner}/{repo}/git/trees/HEAD?recursive=1"
 
         try:
-            response = requests.get(url=url, headers=self.headers)
+            response = get_http_client().get(url=url, headers=self.headers, timeout=15)
             response.raise_for_status()
 
             data = response.json()
@@ -66,6 +68,26 @@ class GitHubClient:
             print(f"Error getting repository tree: {e}")
             return []
 
+    def get_repository_archive(
+        self, owner: str, repo: str, patterns: List[str], ref: Optional[str] = None
+    ) -> ArchiveContents:
+        """
+        레포지토리 tarball을 한 번 스트리밍하여 패턴에 맞는 파일만 추출
+
+        Args:
+            owner: 레포지토리 소유자
+            repo: 레포지토리 이름
+            patterns: 추출할 파일 패턴 (파일명 또는 경로 glob)
+            ref: 브랜치/커밋 (없으면 기본 브랜치)
+
+        Returns:
+            ArchiveContents: 전체 경로 목록과 추출된 파일 내용
+        """
+        url = f"{self.base_url}/{owner}/{repo}/tarball"
+        if ref:
+            url += f"/{ref}"
+        return download_tarball(url, self.headers, patterns)
+
     def get_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
         """
         GitHub에서 파일 내용 가져오기
@@ -81,7 +103,7 @@ class GitHubClient:
         url = f"{self.base_url}/{owner}/{repo}/contents/{path}"
 
         try:
-            response = requests.get(url=url, headers=self.headers)
+            response = get_http_client().get(url=url, headers=self.headers, timeout=15)
             response.raise_for_status()
 
             data = response.json()
@@ -12,6 +12,8 @@ from backend.agents.diagnosis.graph import run_diagnosis
 from backend.common.session import get_session_store, Session
 from backend.common.trace_manager import get_trace_manager
 from backend.common.pronoun_resolver import resolve_pronoun, detect_implicit_context
+from backend.common.async_utils import run_blocking
+from backend.common.deadline import deadline_scope
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +31,9 @@ async def _enhance_answer_with_context(
     try:
         from backend.llm.factory import fetch_llm_client
         from backend.llm.base import ChatRequest, ChatMessage, Role
-        import asyncio
         import json
         
         llm = fetch_llm_client()
-        loop = asyncio.get_event_loop()
         
         # 컨텍스트 요약
         context_summary = json.dumps(referenced_data, ensure_ascii=False, indent=2)[:1000]
@@ -67,7 +67,7 @@ async def _enhance_answer_with_context(
             max_tokens=1000
         )
         
-        response = await loop.run_in_executor(None, llm.chat, request)
+        response = await run_blocking(llm.chat, request)
         enhanced_answer = response.content
         
         logger.info(f"Enhanced answer with context from '{refers_to}'")
@@ -225,7 +225,9 @@ async def run_diagnosis_agent_node(state: SupervisorState) -> Dict[str, Any]:
         repo=state["repo"],
         ref=state.get("ref", "main"),
         user_message=state["user_message"],
-        supervisor_intent=state.get("supervisor_intent")
+        supervisor_intent=state.get("supervisor_intent"),
+        # 요약을 나중에 전달할 수 있는 호출자(/api/analyze, SSE)만 백그라운드 생성
+        defer_llm_summary=(state.get("user_context") or {}).get("defer_llm_summary"),
     )
     
     return {
@@ -320,10 +322,8 @@ async def chat_response_node(state: SupervisorState) -> Dict[str, Any]:
     try:
         from backend.llm.factory import fetch_llm_client
         from backend.llm.base import ChatRequest, ChatMessage
-        import asyncio
         
         llm = fetch_llm_client()
-        loop = asyncio.get_event_loop()
         
         request = ChatRequest(
             messages=[
@@ -331,7 +331,7 @@ async def chat_response_node(state: SupervisorState) -> Dict[str, Any]:
             ]
         )
         
-        response = await loop.run_in_executor(None, llm.chat, request)
+        response = await run_blocking(llm.chat, request)
         answer = response.content
     except Exception as e:
         logger.warning(f"LLM call failed, using fallback: {e}")
@@ -373,7 +373,7 @@ async def finalize_answer_node(state: SupervisorState) -> Dict[str, Any]:
         # 진단 결과 요약
         health_score = agent_result.get("health_score", 0)
         onboarding_score = agent_result.get("onboarding_score", 0)
-        summary = agent_result.get("llm_summary", "")
+        summary = agent_result.get("llm_summary") or ""
         
         answer = f"""## 진단 결과
 
@@ -646,11 +646,14 @@ async def run_supervisor(
     repo: str,
     user_message: str,
     session_id: Optional[str] = None,
-    ref: str = "main"
+    ref: str = "main",
+    time_budget: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Supervisor 실행
     
+    time_budget(초)이 있으면 그 안에 끝나지 않은 분석기는 취소되고 partial=True로 표시됩니다.
+    
     Returns:
         {
             "session_id": "uuid",
@@ -688,11 +691,14 @@ async def run_supervisor(
         "trace_id": None
     })
     
-    final_state = await graph.ainvoke(initial_state)
+    with deadline_scope(time_budget) as deadline:
+        final_state = await graph.ainvoke(initial_state)
     
     return {
         "session_id": final_state.get("session_id"),
         "final_answer": final_state.get("final_answer"),
         "suggested_actions": final_state.get("suggested_actions", []),
-        "awaiting_clarification": final_state.get("awaiting_clarification", False)
+        "awaiting_clarification": final_state.get("awaiting_clarification", False),
+        "partial": bool(deadline and deadline.partial),
+        "missing_parts": list(deadline.missing_parts) if deadline else [],
     }
@@ -9,7 +9,7 @@ from backend.agents.supervisor.models import SupervisorState
 logger = logging.getLogger(__name__)
 
 
-def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
+async def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
     """
     여러 저장소를 순차적으로 분석하거나 캐시에서 로드.
     
@@ -18,8 +18,6 @@ def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
     - warnings: 실패한 저장소에 대한 경고
     """
     from backend.common.cache_manager import analysis_cache
-    from backend.agents.diagnosis.service import run_diagnosis
-    from backend.agents.diagnosis.models import DiagnosisInput
     
     repos = state.compare_repos
     if not repos:
@@ -34,6 +32,7 @@ def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
     warnings = list(state.warnings)
     cache_hits = []
     cache_misses = []
+    pending = []
     
     for repo_str in repos:
         if repo_str in results:
@@ -49,7 +48,7 @@ def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
         
         normalized_key = f"{owner}/{repo}"
         
-        if normalized_key in results:
+        if normalized_key in results or normalized_key in cache_misses:
             logger.info(f"Already processed {normalized_key}, skipping duplicate")
             continue
         
@@ -64,22 +63,24 @@ def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
                 continue
             else:
                 logger.warning(f"Invalid cache data for {normalized_key}: health_score={cached_health}, re-analyzing")
-                analysis_cache._store.pop(analysis_cache.make_repo_key(owner, repo, "main"), None)
+                analysis_cache.invalidate_analysis(owner, repo, "main")
         
         cache_misses.append(normalized_key)
-        logger.info(f"CACHE MISS - Running diagnosis for comparison: {normalized_key}")
-        try:
-            diagnosis_input = DiagnosisInput(owner=owner, repo=repo, ref="main")
-            diagnosis_result = run_diagnosis(diagnosis_input)
-            if diagnosis_result:
-                result_dict = diagnosis_result.to_dict()
-                analysis_cache.set_analysis(owner, repo, "main", result_dict)
-                results[normalized_key] = result_dict
-            else:
-                warnings.append(f"{normalized_key} 분석 실패")
-        except Exception as e:
-            logger.error(f"Diagnosis failed for {normalized_key}: {e}")
-            warnings.append(f"{normalized_key} 분석 중 오류: {str(e)}")
+        pending.append((owner, repo))
+    
+    outcomes = await _diagnose_pending(pending) if pending else {}
+    
+    for normalized_key, outcome in outcomes.items():
+        owner, repo = normalized_key.split("/", 1)
+        if isinstance(outcome, Exception):
+            logger.error(f"Diagnosis failed for {normalized_key}: {outcome}")
+            warnings.append(f"{normalized_key} 분석 중 오류: {str(outcome)}")
+        elif outcome:
+            result_dict = outcome.to_dict()
+            analysis_cache.set_analysis(owner, repo, "main", result_dict)
+            results[normalized_key] = result_dict
+        else:
+            warnings.append(f"{normalized_key} 분석 실패")
     
     logger.info(
         f"Batch diagnosis complete: {len(results)}/{len(repos)} successful, "
@@ -94,6 +95,27 @@ def batch_diagnosis_node(state: SupervisorState) -> Dict[str, Any]:
     }
 
 
+async def _diagnose_pending(pending: List[tuple]) -> Dict[str, Any]:
+    """캐시 미스 저장소를 배치 프리페치 후 순서대로 진단 (저장소별 결과 또는 예외)."""
+    from backend.agents.comparison.nodes import prefetch_bundles
+    from backend.agents.diagnosis.service import run_diagnosis
+    from backend.agents.diagnosis.models import DiagnosisInput
+    
+    await prefetch_bundles(pending, "main")
+    
+    outcomes: Dict[str, Any] = {}
+    for owner, repo in pending:
+        normalized_key = f"{owner}/{repo}"
+        logger.info(f"CACHE MISS - Running diagnosis for comparison: {normalized_key}")
+        try:
+            outcomes[normalized_key] = await run_diagnosis(
+                DiagnosisInput(owner=owner, repo=repo, ref="main")
+            )
+        except Exception as e:
+            outcomes[normalized_key] = e
+    return outcomes
+
+
 def compare_results_node(state: SupervisorState) -> Dict[str, Any]:
     """
     여러 저장소의 분석 결과를 비교하여 LLM 기반 요약 생성.
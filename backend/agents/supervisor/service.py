@@ -6,6 +6,7 @@ import logging
 from backend.agents.supervisor.models import SupervisorInput, SupervisorState
 from backend.agents.supervisor.trace import TracingCallbackHandler
 from backend.agents.supervisor.memory import get_conversation_memory, ConversationMemory
+from backend.common.deadline import deadline_scope
 from backend.common.logging_config import setup_logging
 from backend.common.metrics import get_metrics_tracker, TaskMetrics
 
@@ -353,8 +354,17 @@ async def run_supervisor_diagnosis_async(
     user_message: Optional[str] = None,
     priority: str = "thoroughness",
     task_type: str = "diagnose_repo",
+    time_budget: Optional[float] = None,
+    defer_llm_summary: bool = False,
 ) -> tuple[Optional[dict], Optional[str], Optional[List[Dict[str, Any]]]]:
-    """비동기 Supervisor 진단 실행."""
+    """
+    비동기 Supervisor 진단 실행.
+
+    time_budget(초)이 있으면 그래프 전체에 요청 마감을 적용하고, 마감으로 빠진 분석기는
+    진단 결과의 partial/missing_parts로 표시합니다.
+    defer_llm_summary면 LLM 요약을 백그라운드 작업으로 생성합니다 (요약을 summary_job_id로
+    나중에 전달할 수 있는 호출자만 사용).
+    """
 
     task_info = f"task={task_type} owner={owner} repo={repo} ref={ref}"
     logger.info(f"[{task_info}] Starting async diagnosis")
@@ -376,7 +386,7 @@ async def run_supervisor_diagnosis_async(
         task_type=task_type,
         owner=owner,
         repo=repo,
-        user_context={"use_llm_summary": use_llm_summary},
+        user_context={"use_llm_summary": use_llm_summary, "defer_llm_summary": defer_llm_summary},
         user_message=user_message,
     )
     
@@ -384,7 +394,8 @@ async def run_supervisor_diagnosis_async(
     initial_state.priority = priority
     
     # 비동기 그래프 실행
-    result = await graph.ainvoke(initial_state, config=config)
+    with deadline_scope(time_budget) as deadline:
+        result = await graph.ainvoke(initial_state, config=config)
     
     if result is None:
         result = {}
@@ -417,6 +428,8 @@ async def run_supervisor_diagnosis_async(
         diagnosis_result["task_plan"] = result.get("task_plan")
         diagnosis_result["task_results"] = result.get("task_results")
         diagnosis_result["chat_response"] = result.get("chat_response")
+        diagnosis_result["partial"] = bool(deadline and deadline.partial)
+        diagnosis_result["missing_parts"] = list(deadline.missing_parts) if deadline else []
     
     return diagnosis_result, error_msg, trace
 
@@ -257,6 +257,23 @@ class ProgressStreamHandler:
         )
         return self._emit(event)
     
+    def on_stage_complete(
+        self,
+        stage: str,
+        message: str,
+        percent: int,
+        partial: Optional[Dict[str, Any]] = None,
+    ) -> ProgressEvent:
+        """진단 분석기 단계 완료 이벤트 (부분 결과 포함)."""
+        event = ProgressEvent(
+            event_type=ProgressEventType.PROGRESS_UPDATE,
+            node_name=stage,
+            message=message,
+            progress_percent=percent,
+            data={"stage": stage, "partial": partial or {}},
+        )
+        return self._emit(event)
+    
     def _extract_summary(self, node_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
         """노드별 결과 요약 추출."""
         if node_name == "run_diagnosis_node":
@@ -1,10 +1,19 @@
+import asyncio
+import copy
 import logging
 from typing import Dict, Any, Optional, List
 from backend.agents.supervisor.service import run_supervisor_diagnosis, run_supervisor_onboarding
 from backend.api.schemas import to_summary_dto
+from backend.common.singleflight import SingleFlight
+from backend.common.stage_scheduler import StageFanout, current_stage_listener, listen_stages
 
 logger = logging.getLogger(__name__)
 
+# 같은 저장소에 대한 동시 진단 요청은 한 번만 실행 (GitHub 쿼터/LLM 호출 보호)
+diagnosis_flight = SingleFlight("diagnose_repo")
+# 진행 중인 진단별 단계 이벤트 분배기: 병합된 호출자들도 각자의 리스너(SSE)로 단계 이벤트를 받음
+_stage_fanouts: Dict[Any, StageFanout] = {}
+
 def run_agent_task(
     task_type: str,
     owner: str,
@@ -157,12 +166,16 @@ async def run_agent_task_async(
     use_llm_summary: bool = True,
     debug_trace: bool = False,
     user_message: Optional[str] = None,
-    priority: str = "thoroughness"
+    priority: str = "thoroughness",
+    time_budget: Optional[float] = None,
+    defer_llm_summary: bool = False,
 ) -> Dict[str, Any]:
     """
     비동기 에이전트 작업 실행.
     
     ainvoke()를 사용하는 비동기 그래프 버전.
+    time_budget(초)이 있으면 진단에 요청 마감을 적용합니다 (마감이 다른 요청끼리는 병합하지 않음).
+    defer_llm_summary면 LLM 요약 없이 먼저 반환하고 요약은 summary_jobs에서 생성합니다.
     """
     from backend.agents.supervisor.service import run_supervisor_diagnosis_async
     
@@ -171,10 +184,28 @@ async def run_agent_task_async(
     
     try:
         if task_type in ["diagnose_repo", "general_inquiry"]:
-            return await _handle_diagnose_repo_async(
-                owner, repo, ref, use_llm_summary, debug_trace, 
-                user_message, priority, task_type
+            flight_key = (
+                task_type, owner, repo, ref, use_llm_summary,
+                debug_trace, user_message, priority, time_budget, defer_llm_summary,
             )
+            fanout_key = (asyncio.get_running_loop(), flight_key)
+            fanout = _stage_fanouts.setdefault(fanout_key, StageFanout())
+            listener = current_stage_listener()
+            if listener is not None:
+                fanout.add(listener)
+            try:
+                result = await diagnosis_flight.do_async(
+                    flight_key,
+                    _diagnose_with_fanout,
+                    fanout_key, fanout,
+                    owner, repo, ref, use_llm_summary, debug_trace,
+                    user_message, priority, task_type, time_budget, defer_llm_summary,
+                )
+            finally:
+                if listener is not None:
+                    fanout.remove(listener)
+            # 병합된 호출자들이 응답을 각자 수정해도 서로 영향 없도록 복사본 반환
+            return copy.deepcopy(result)
         elif task_type == "build_onboarding_plan":
             context = user_context or {}
             return await _handle_onboarding_plan_async(owner, repo, context, debug_trace)
@@ -194,6 +225,16 @@ async def run_agent_task_async(
         }
 
 
+async def _diagnose_with_fanout(fanout_key: Any, fanout: StageFanout, *args: Any) -> Dict[str, Any]:
+    """병합된 진단 실행 (단계 이벤트를 이 진단을 기다리는 모든 호출자의 리스너에 전달)."""
+    try:
+        with listen_stages(fanout):
+            return await _handle_diagnose_repo_async(*args)
+    finally:
+        if _stage_fanouts.get(fanout_key) is fanout:
+            del _stage_fanouts[fanout_key]
+
+
 async def _handle_diagnose_repo_async(
     owner: str, 
     repo: str, 
@@ -202,7 +243,9 @@ async def _handle_diagnose_repo_async(
     debug_trace: bool = False,
     user_message: Optional[str] = None,
     priority: str = "thoroughness",
-    task_type: str = "diagnose_repo"
+    task_type: str = "diagnose_repo",
+    time_budget: Optional[float] = None,
+    defer_llm_summary: bool = False,
 ) -> Dict[str, Any]:
     """비동기 진단 핸들러."""
     from backend.agents.supervisor.service import run_supervisor_diagnosis_async
@@ -215,7 +258,9 @@ async def _handle_diagnose_repo_async(
         debug_trace=debug_trace,
         user_message=user_message,
         priority=priority,
-        task_type=task_type
+        task_type=task_type,
+        time_budget=time_budget,
+        defer_llm_summary=defer_llm_summary,
     )
     
     if error_msg:
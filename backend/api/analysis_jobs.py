@@ -0,0 +1,200 @@
+"""
+분석 작업 큐 - POST /api/analyze를 작업 ID 기반 비동기 실행으로 처리.
+
+같은 저장소+ref(+요청 메시지/우선순위) 제출은 진행 중인 한 작업을 공유하고,
+동시에 실행되는 분석 수는 ANALYSIS_JOB_WORKERS로 제한합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from backend.common.config import ANALYSIS_JOB_MAX_ENTRIES, ANALYSIS_JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+FINISHED_STATES = frozenset({JOB_DONE, JOB_FAILED, JOB_CANCELLED})
+
+
+def analysis_job_id(
+    owner: str,
+    repo: str,
+    ref: str,
+    user_message: Optional[str] = None,
+    priority: str = "thoroughness",
+    time_budget: Optional[float] = None,
+) -> str:
+    """
+    작업 ID (기본 분석은 AnalyzeResponse.job_id와 같은 owner/repo@ref).
+
+    요청 메시지/우선순위/요청 마감이 다르면 결과도 다르므로 짧은 해시를 붙여 구분합니다
+    (마감이 다른 요청이 한 작업을 공유하면 먼저 제출한 쪽의 마감이 적용되기 때문).
+    """
+    job_id = f"{owner}/{repo}@{ref}"
+    if user_message or priority != "thoroughness" or time_budget:
+        budget = f"{time_budget:g}" if time_budget else ""
+        key = f"{priority}\0{user_message or ''}\0{budget}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        job_id = f"{job_id}:{digest}"
+    return job_id
+
+
+@dataclass
+class AnalysisJob:
+    """분석 작업 상태."""
+    job_id: str
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_status: int = 500
+    submissions: int = 1
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "submissions": self.submissions,
+            "error": self.error,
+        }
+
+
+class AnalysisJobQueue:
+    """
+    이벤트 루프 기반 분석 작업 큐.
+
+    작업마다 Task를 만들고 세마포어로 동시 실행 수를 제한합니다 (대기 중인 작업은 queued).
+    진행 중인 같은 ID 제출은 기존 작업을 반환하고, 끝난 작업은 최근 기록으로만 남습니다.
+    """
+
+    def __init__(self, max_workers: int = ANALYSIS_JOB_WORKERS, max_entries: int = ANALYSIS_JOB_MAX_ENTRIES):
+        self.max_workers = max(1, max_workers)
+        self._max_entries = max_entries
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _worker_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._semaphore
+
+    def submit(self, job_id: str, run: Callable[[], Awaitable[Dict[str, Any]]]) -> AnalysisJob:
+        """작업 제출 (같은 ID 작업이 진행 중이면 그 작업을 공유)."""
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing is not None and not existing.finished:
+                existing.submissions += 1
+                logger.info(f"Analysis job {job_id} deduplicated ({existing.submissions} submissions)")
+                return existing
+            job = AnalysisJob(job_id)
+            self._put(job)
+        job.task = asyncio.create_task(self._run(job, run))
+        return job
+
+    def record(self, job_id: str, result: Dict[str, Any]) -> AnalysisJob:
+        """이미 있는 결과(캐시 등)를 완료된 작업으로 등록."""
+        now = time.time()
+        job = AnalysisJob(job_id, status=JOB_DONE, started_at=now, finished_at=now, result=result)
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing is not None and not existing.finished:
+                return existing
+            self._put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[AnalysisJob]:
+        """대기/실행 중인 작업 취소 (끝난 작업은 그대로 반환)."""
+        job = self.get(job_id)
+        if job is not None and not job.finished and job.task is not None:
+            job.task.cancel()
+        return job
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[AnalysisJob]:
+        """작업 종료를 최대 timeout초 기다림 (기다리는 쪽이 취소돼도 작업은 계속)."""
+        job = self.get(job_id)
+        if job is None or job.finished or job.task is None:
+            return job
+        await asyncio.wait({job.task}, timeout=timeout)
+        return job
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts = {state: 0 for state in (JOB_QUEUED, JOB_RUNNING, *FINISHED_STATES)}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        counts["max_workers"] = self.max_workers
+        return counts
+
+    def clear(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+
+    async def _run(self, job: AnalysisJob, run: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        try:
+            async with self._worker_slots():
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                job.result = await run()
+                job.status = JOB_DONE
+        except asyncio.CancelledError:
+            job.status = JOB_CANCELLED
+            logger.info(f"Analysis job {job.job_id} cancelled")
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(getattr(e, "detail", None) or e)
+            job.error_status = getattr(e, "status_code", 500)
+            logger.warning(f"Analysis job {job.job_id} failed: {job.error}")
+        finally:
+            job.finished_at = time.time()
+
+    def _put(self, job: AnalysisJob) -> None:
+        """작업 기록 (상한을 넘으면 오래된 완료 작업부터 제거, lock 보유 상태에서 호출)."""
+        self._jobs.pop(job.job_id, None)
+        self._jobs[job.job_id] = job
+        if len(self._jobs) <= self._max_entries:
+            return
+        for old_id in [jid for jid, old in self._jobs.items() if old.finished]:
+            if len(self._jobs) <= self._max_entries:
+                break
+            del self._jobs[old_id]
+
+
+_job_queue: Optional[AnalysisJobQueue] = None
+
+
+def get_analysis_job_queue() -> AnalysisJobQueue:
+    """프로세스 전역 분석 작업 큐."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = AnalysisJobQueue()
+    return _job_queue
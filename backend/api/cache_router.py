@@ -5,12 +5,16 @@
 """
 import logging
 import time
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
-from backend.common.cache_manager import analysis_cache, cache_invalidation_trigger
+from backend.common.cache_manager import (
+    analysis_cache,
+    cache_invalidation_trigger,
+    get_memory_cache_stats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +23,13 @@ router = APIRouter(prefix="/api/cache", tags=["cache"])
 
 class CacheStatsResponse(BaseModel):
     """캐시 통계 응답."""
+    backend: str = "memory"
     total_entries: int
-    active_entries: int
-    expired_entries: int
-    ttl_seconds: int
+    total_accesses: int
+    avg_access_per_entry: float
+    memory: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="인메모리 함수 캐시별 용량/적중 통계"
+    )
 
 
 class CacheInvalidateResponse(BaseModel):
@@ -47,6 +54,11 @@ class WebhookPushEvent(BaseModel):
     ref: str
     pusher: dict
     head_commit: Optional[dict] = None
+    before: Optional[str] = None
+    after: Optional[str] = None
+    commits: List[dict] = Field(default_factory=list)
+    forced: bool = False
+    deleted: bool = False
 
 
 @router.get("/stats", response_model=CacheStatsResponse)
@@ -54,10 +66,11 @@ async def get_cache_stats() -> CacheStatsResponse:
     """
     캐시 통계 조회.
     
-    현재 캐시의 상태 정보를 반환합니다.
+    분석 결과 캐시와 GitHub/immutable 인메모리 캐시의
+    항목 수, 바이트, 함수별 hit/miss/eviction 통계를 반환합니다.
     """
     stats = analysis_cache.get_stats()
-    return CacheStatsResponse(**stats)
+    return CacheStatsResponse(**stats, memory=get_memory_cache_stats())
 
 
 @router.post("/invalidate", response_model=CacheInvalidateResponse)
@@ -121,12 +134,40 @@ async def clear_all_cache() -> dict:
     }
 
 
+def _changed_paths(event: WebhookPushEvent) -> Optional[Tuple[Set[str], Set[str]]]:
+    """
+    push에 포함된 (수정된 경로, 추가/삭제된 경로).
+
+    강제 push이거나 커밋 목록이 없으면 변경 범위를 알 수 없으므로 None.
+    """
+    if event.forced or not event.commits:
+        return None
+    modified: Set[str] = set()
+    added_or_removed: Set[str] = set()
+    for commit in event.commits:
+        modified.update(commit.get("modified") or [])
+        added_or_removed.update(commit.get("added") or [])
+        added_or_removed.update(commit.get("removed") or [])
+    return modified, added_or_removed
+
+
+async def _reanalyze(owner: str, repo: str, ref: str) -> None:
+    """Push 후 예약된 재분석: /api/analyze와 같은 파이프라인으로 캐시를 미리 채움."""
+    from backend.api.http_router import _run_analysis
+
+    fresh = await _run_analysis(owner, repo, ref, None, "thoroughness")
+    analysis_cache.set_analysis(owner, repo, ref, fresh.model_dump())
+
+
 @router.post("/webhook/push")
 async def handle_push_webhook(event: WebhookPushEvent) -> dict:
     """
     GitHub Push Webhook 핸들러.
     
     저장소에 Push가 발생하면 해당 캐시를 자동으로 무효화합니다.
+    변경된 경로를 보고 영향받는 분석 결과만 버리고 나머지는 새 커밋으로 이어 붙인 뒤
+    (README → docs, 매니페스트 → dependencies/보안, 그 외 → structure),
+    저장소당 debounce된 백그라운드 재분석을 예약해 다음 요청이 캐시를 바로 사용하게 합니다.
     
     GitHub Webhook 설정:
     1. Repository Settings → Webhooks → Add webhook
@@ -134,6 +175,8 @@ async def handle_push_webhook(event: WebhookPushEvent) -> dict:
     3. Content type: application/json
     4. Events: Just the push event
     """
+    from backend.agents.diagnosis.partial_cache import affected_parts, carry_forward_parts
+
     try:
         repo_info = event.repository
         owner = repo_info.get("owner", {}).get("login") or repo_info.get("owner", {}).get("name")
@@ -142,9 +185,11 @@ async def handle_push_webhook(event: WebhookPushEvent) -> dict:
         # refs/heads/main → main
         ref = event.ref.replace("refs/heads/", "").replace("refs/tags/", "")
         
-        # Push 시간
+        # Push 시간 (repository.pushed_at 우선, 없으면 head commit 시간)
         pushed_at = None
-        if event.head_commit:
+        if isinstance(repo_info.get("pushed_at"), (int, float)):
+            pushed_at = float(repo_info["pushed_at"])
+        elif event.head_commit:
             # ISO 8601 → Unix timestamp
             import datetime
             timestamp_str = event.head_commit.get("timestamp")
@@ -158,17 +203,41 @@ async def handle_push_webhook(event: WebhookPushEvent) -> dict:
         if not owner or not repo:
             return {"ok": False, "message": "Invalid webhook payload"}
         
+        changed_parts: List[str] = []
+        carried: List[str] = []
+        changes = _changed_paths(event)
+        if changes is not None and not event.deleted:
+            parts = affected_parts(*changes)
+            changed_parts = sorted(parts)
+            carried = carry_forward_parts(owner, repo, event.before, event.after, parts)
+        
         # 캐시 무효화 트리거
         invalidated = cache_invalidation_trigger.trigger_push_invalidation(
             owner, repo, ref, pushed_at
         )
         
-        logger.info(f"Push webhook: {owner}/{repo}@{ref}, invalidated={invalidated}")
+        reanalysis_scheduled = False
+        if not event.deleted and (
+            invalidated or cache_invalidation_trigger.has_pending_reanalysis(owner, repo, ref)
+        ):
+            cache_invalidation_trigger.schedule_reanalysis(
+                owner, repo, ref, lambda: _reanalyze(owner, repo, ref)
+            )
+            reanalysis_scheduled = True
+        
+        logger.info(
+            f"Push webhook: {owner}/{repo}@{ref}, invalidated={invalidated}, "
+            f"changed={changed_parts or 'all'}, carried={len(carried)}, "
+            f"reanalysis={reanalysis_scheduled}"
+        )
         
         return {
             "ok": True,
             "message": f"Webhook processed for {owner}/{repo}@{ref}",
             "cache_invalidated": invalidated,
+            "changed_parts": changed_parts,
+            "carried_parts": carried,
+            "reanalysis_scheduled": reanalysis_scheduled,
         }
         
     except Exception as e:
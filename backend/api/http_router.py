@@ -12,10 +12,13 @@ import re
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from backend.api.agent_service import run_agent_task, run_agent_task_async
+from backend.api.analysis_jobs import analysis_job_id, get_analysis_job_queue
+from backend.common.config import ANALYSIS_TIME_BUDGET, QUICK_ANALYSIS_TIME_BUDGET
+from backend.common.deadline import deadline_scope
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,22 @@ class AnalyzeRequest(BaseModel):
     repo_url: str = Field(..., description="GitHub 저장소 URL", examples=["https://github.com/owner/repo"])
     user_message: Optional[str] = Field(None, description="분석 요청 메시지 (예: 보안 중점으로 깊게 분석해줘)")
     priority: str = Field(default="thoroughness", description="분석 우선순위 (speed 또는 thoroughness)")
+    wait: bool = Field(default=True, description="False면 분석을 기다리지 않고 작업 ID만 즉시 반환 (202)")
+    deadline_ms: Optional[int] = Field(
+        None, gt=0,
+        description="분석 마감 (ms). 지나면 끝난 분석기 결과만 partial=True로 반환 (기본: speed는 QUICK_ANALYSIS_TIME_BUDGET)",
+    )
+
+
+class AnalysisJobResponse(BaseModel):
+    """분석 작업 상태 응답."""
+    job_id: str = Field(..., description="작업 ID (owner/repo@ref, 요청 메시지가 있으면 해시 접미사)")
+    status: str = Field(..., description="queued | running | done | failed | cancelled")
+    created_at: float = Field(..., description="제출 시각 (epoch seconds)")
+    started_at: Optional[float] = Field(None, description="실행 시작 시각")
+    finished_at: Optional[float] = Field(None, description="종료 시각")
+    submissions: int = Field(1, description="이 작업을 공유한 제출 수")
+    error: Optional[str] = Field(None, description="실패 사유")
 
 
 class AnalyzeResponse(BaseModel):
@@ -48,6 +67,10 @@ class AnalyzeResponse(BaseModel):
     chat_response: Optional[str] = Field(None, description="채팅 응답")
     onboarding_plan: Optional[list[dict[str, Any]]] = Field(None, description="온보딩 플랜")
     security: Optional[dict[str, Any]] = Field(None, description="보안 분석 결과")
+    stale: bool = Field(False, description="만료된 캐시 결과 여부 (백그라운드 갱신 중)")
+    cache_age_seconds: Optional[int] = Field(None, description="캐시된 결과의 경과 시간(초)")
+    partial: bool = Field(False, description="마감으로 일부 분석기가 빠진 결과 여부")
+    missing_parts: list[str] = Field(default_factory=list, description="빠진 분석기 (docs/activity/structure/dependencies)")
 
 
 class HealthCheckResponse(BaseModel):
@@ -144,7 +167,7 @@ def _get_level_description(level: str) -> str:
 
 
 @router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
+async def analyze_repository(request: AnalyzeRequest):
     """
     저장소 분석 API (프론트엔드 호환).
     
@@ -154,9 +177,17 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
     메타 에이전트 지원: user_message와 priority 파라미터로
     동적 실행 계획 수립 및 조건부 에이전트 실행.
     
+    마감: deadline_ms(없으면 priority=speed는 QUICK_ANALYSIS_TIME_BUDGET)까지 끝나지 않은
+    분석기는 취소하고 끝난 결과만 partial=True, missing_parts와 함께 반환합니다 (캐시하지 않음).
+    
     캐시: user_message 없는 경우만 24시간 캐시 적용.
+    만료 후 유예 기간(ANALYSIS_CACHE_STALE_GRACE_HOURS) 안에는 stale 결과를 즉시 반환하고
+    백그라운드에서 저장소당 한 번만 갱신합니다.
+    
+    작업 큐: 분석은 동시 실행 수가 제한된 작업 큐에서 실행되고, 같은 저장소+ref 요청은
+    진행 중인 작업 하나를 공유합니다. wait=False면 작업 상태(202)를 즉시 반환하며
+    /api/analyze/jobs/status, /result, /cancel로 조회/취소합니다.
     """
-    from backend.common.github_client import fetch_beginner_issues
     from backend.common.cache_manager import analysis_cache
     
     try:
@@ -164,12 +195,196 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
+    queue = get_analysis_job_queue()
+    time_budget = _analysis_time_budget(request)
+    job_id = analysis_job_id(owner, repo, ref, request.user_message, request.priority, time_budget)
+    
     # user_message가 없으면 캐시 확인 (단순 진단용)
     if not request.user_message:
-        cached_response = analysis_cache.get_analysis(owner, repo, ref)
-        if cached_response:
-            logger.info(f"Returning cached analysis for {owner}/{repo}@{ref}")
-            return AnalyzeResponse(**cached_response)
+        cached = analysis_cache.lookup_analysis(owner, repo, ref)
+        if cached:
+            if cached.stale:
+                async def refresh() -> None:
+                    fresh = await _run_analysis(owner, repo, ref, None, request.priority)
+                    analysis_cache.set_analysis(owner, repo, ref, fresh.model_dump())
+                
+                analysis_cache.refresh_in_background(owner, repo, ref, refresh)
+            logger.info(f"Returning cached analysis for {owner}/{repo}@{ref} (stale={cached.stale})")
+            response = AnalyzeResponse(
+                **{**cached.data, "stale": cached.stale, "cache_age_seconds": cached.age_seconds}
+            )
+            job = queue.record(job_id, response.model_dump())
+            if not request.wait:
+                return JSONResponse(status_code=200, content=job.to_dict())
+            return response
+    
+    async def run() -> dict:
+        response = await _run_analysis(
+            owner, repo, ref, request.user_message, request.priority, time_budget
+        )
+        # user_message 없고 마감 안에 모두 끝난 경우만 캐시에 저장
+        if not request.user_message and not response.partial:
+            analysis_cache.set_analysis(owner, repo, ref, response.model_dump())
+        return response.model_dump()
+    
+    job = queue.submit(job_id, run)
+    if not request.wait:
+        return JSONResponse(status_code=202, content=job.to_dict())
+    
+    # 요청이 끊겨도 작업은 계속 실행되어 캐시를 채움
+    await queue.wait(job_id)
+    return _analysis_job_result(job)
+
+
+def _analysis_time_budget(request: AnalyzeRequest) -> Optional[float]:
+    """요청 마감 (초). deadline_ms가 없으면 speed는 quick 예산, 그 외는 ANALYSIS_TIME_BUDGET (0이면 없음)."""
+    if request.deadline_ms:
+        return request.deadline_ms / 1000
+    budget = QUICK_ANALYSIS_TIME_BUDGET if request.priority == "speed" else ANALYSIS_TIME_BUDGET
+    return budget or None
+
+
+def _analysis_job_result(job) -> AnalyzeResponse:
+    """끝난 작업의 결과를 응답으로 변환 (실패/취소는 HTTP 오류)."""
+    if job.status == "cancelled":
+        raise HTTPException(status_code=409, detail=f"Analysis job {job.job_id} was cancelled")
+    if job.status == "failed":
+        raise HTTPException(status_code=job.error_status, detail=job.error or "Analysis failed")
+    return AnalyzeResponse(**job.result)
+
+
+@router.get("/analyze/jobs/status", response_model=AnalysisJobResponse)
+async def get_analysis_job(job_id: str) -> AnalysisJobResponse:
+    """분석 작업 상태 조회."""
+    job = get_analysis_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No analysis job {job_id}")
+    return AnalysisJobResponse(**job.to_dict())
+
+
+@router.get("/analyze/jobs/result", response_model=AnalyzeResponse)
+async def get_analysis_job_result(job_id: str, wait: float = 0.0):
+    """
+    분석 작업 결과 조회.
+    
+    wait > 0이면 최대 wait초(60초 상한) 기다립니다. 아직 끝나지 않았으면 202와 작업 상태를 반환합니다.
+    """
+    queue = get_analysis_job_queue()
+    job = await queue.wait(job_id, min(wait, 60.0)) if wait > 0 else queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No analysis job {job_id}")
+    if not job.finished:
+        return JSONResponse(status_code=202, content=job.to_dict())
+    return _analysis_job_result(job)
+
+
+@router.post("/analyze/jobs/cancel", response_model=AnalysisJobResponse)
+async def cancel_analysis_job(job_id: str) -> AnalysisJobResponse:
+    """대기/실행 중인 분석 작업 취소 (공유 중인 다른 제출도 함께 취소됨)."""
+    queue = get_analysis_job_queue()
+    job = queue.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No analysis job {job_id}")
+    await queue.wait(job_id, 1.0)
+    return AnalysisJobResponse(**job.to_dict())
+
+
+@router.get("/analyze/summary")
+async def get_analysis_summary(job_id: str, wait: float = 0.0) -> dict:
+    """
+    백그라운드 LLM 요약 조회 (job_id는 분석 응답의 job_id, 예: owner/repo@main).
+    
+    wait > 0이면 요약이 끝날 때까지 최대 wait초(60초 상한) 기다린 뒤 응답합니다.
+    status: pending | done | failed
+    """
+    from backend.agents.diagnosis.summary_jobs import summary_jobs
+    
+    if wait > 0:
+        job = await summary_jobs.wait(job_id, min(wait, 60.0))
+    else:
+        job = summary_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No summary job for {job_id}")
+    return job.to_dict()
+
+
+class TrendResponse(BaseModel):
+    """건강도 추세 응답 (points는 날짜·기록 순, changes는 기간 첫 값 대비 마지막 값)."""
+    repo: str
+    since: Optional[str] = None
+    until: Optional[str] = None
+    metrics: list[str]
+    points: list[dict[str, Any]]
+    changes: dict[str, Optional[float]]
+
+
+@router.get("/analyze/trend", response_model=TrendResponse)
+async def get_health_trend(
+    repo_url: str,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    metrics: Optional[str] = None,
+    analysis_depth: Optional[str] = None,
+) -> TrendResponse:
+    """
+    저장소 건강도 추세 조회 (로컬 시계열만 읽고 GitHub를 호출하지 않음).
+    
+    since/until은 YYYY-MM-DD(양끝 포함), metrics는 쉼표 구분 지표 이름 (기본: 전체).
+    진단할 때마다 (날짜, 커밋 SHA, depth)당 한 점이 쌓입니다.
+    """
+    from datetime import date
+    from backend.common.async_utils import run_blocking
+    from backend.common.health_history import METRIC_FIELDS, get_health_history
+    
+    try:
+        owner, repo, _ = parse_github_url(repo_url)
+        since_date = date.fromisoformat(since) if since else None
+        until_date = date.fromisoformat(until) if until else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    names = [m.strip() for m in metrics.split(",") if m.strip()] if metrics else list(METRIC_FIELDS)
+    unknown = [m for m in names if m not in METRIC_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown metrics: {', '.join(unknown)}")
+    
+    store = get_health_history()
+    if store is None:
+        raise HTTPException(status_code=503, detail="Health history is disabled (HEALTH_HISTORY_PATH)")
+    trend = await run_blocking(
+        store.trend, owner, repo, names, since_date, until_date, analysis_depth,
+    )
+    return TrendResponse(
+        repo=f"{owner}/{repo}",
+        since=since,
+        until=until,
+        metrics=names,
+        **trend,
+    )
+
+
+async def _run_analysis(
+    owner: str,
+    repo: str,
+    ref: str,
+    user_message: Optional[str],
+    priority: str,
+    time_budget: Optional[float] = None,
+) -> AnalyzeResponse:
+    """진단 실행 후 프론트엔드 응답 형식으로 변환 (time_budget초 요청 마감은 추천 이슈 조회까지 적용)."""
+    with deadline_scope(time_budget):
+        return await _analyze_and_format(owner, repo, ref, user_message, priority, time_budget)
+
+
+async def _analyze_and_format(
+    owner: str,
+    repo: str,
+    ref: str,
+    user_message: Optional[str],
+    priority: str,
+    time_budget: Optional[float],
+) -> AnalyzeResponse:
+    from backend.common.async_utils import run_blocking
+    from backend.common.github_client import fetch_beginner_issues
     
     # Supervisor 호출 (메타 에이전트 통합 - 비동기)
     result = await run_agent_task_async(
@@ -177,9 +392,12 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
         owner=owner,
         repo=repo,
         ref=ref,
-        user_message=request.user_message,
-        priority=request.priority,
-        use_llm_summary=True
+        user_message=user_message,
+        priority=priority,
+        use_llm_summary=True,
+        time_budget=time_budget,
+        # 요약은 /api/analyze/summary?job_id=로 나중에 조회
+        defer_llm_summary=True,
     )
     
     if not result.get("ok"):
@@ -210,7 +428,7 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
     
     # Good First Issues 가져오기
     try:
-        recommended_issues = fetch_beginner_issues(owner, repo, max_count=5)
+        recommended_issues = await run_blocking(fetch_beginner_issues, owner, repo, max_count=5)
     except Exception:
         recommended_issues = []
     
@@ -261,12 +479,10 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
         ),
         # 보안 분석 결과
         security=_extract_security_response(data.get("task_results", {}).get("security")),
+        partial=bool(data.get("partial")),
+        missing_parts=data.get("missing_parts") or [],
     )
     
-    # user_message 없는 경우만 캐시에 저장
-    if not request.user_message:
-        analysis_cache.set_analysis(owner, repo, ref, response.model_dump())
-    
     return response
 
 
@@ -636,7 +852,7 @@ async def compare_repositories(request: CompareRequest) -> CompareResponse:
         initial_state_dict["detected_intent"] = "compare"
         initial_state_dict["compare_repos"] = repos
         
-        result = graph.invoke(SupervisorState(**initial_state_dict), config=config)
+        result = await graph.ainvoke(SupervisorState(**initial_state_dict), config=config)
         
         comparison_data = {
             "repositories": {},
@@ -722,6 +938,32 @@ async def get_metrics_summary() -> MetricsSummaryResponse:
     )
 
 
+@router.get("/admin/metrics/http")
+async def get_http_pool_stats() -> dict:
+    """
+    GitHub HTTP 커넥션 풀 통계 조회.
+
+    Returns:
+        dict: 요청 수, 신규/재사용 연결 수, 재사용 비율,
+              조건부 요청(ETag) hit/revalidated/miss 통계,
+              토큰별 rate limit 예산, singleflight 병합 통계
+    """
+    from backend.api.agent_service import diagnosis_flight
+    from backend.common.cache_manager import cache_flight
+    from backend.common.http_client import get_http_client
+    from backend.common.conditional_cache import get_conditional_cache
+    from backend.common.rate_limiter import get_rate_limit_scheduler
+
+    stats = get_http_client().get_stats()
+    stats["conditional"] = get_conditional_cache().get_stats()
+    stats["rate_limit"] = get_rate_limit_scheduler().get_stats()
+    stats["singleflight"] = {
+        "cache": cache_flight.get_stats(),
+        "diagnose_repo": diagnosis_flight.get_stats(),
+    }
+    return stats
+
+
 # === Streaming Analysis API ===
 
 class StreamingAnalyzeRequest(BaseModel):
@@ -744,6 +986,8 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
     from backend.agents.supervisor.service import init_state_from_input
     from backend.common.github_client import fetch_beginner_issues
     from backend.common.cache_manager import analysis_cache
+    from backend.common.async_utils import run_blocking
+    from backend.api.sse_analyze import stage_event_fields, stream_stage_events, wait_for_summary
     
     try:
         owner, repo, ref = parse_github_url(request.repo_url)
@@ -756,7 +1000,6 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
         # 분석 시작 이벤트
         start_event = handler.on_analysis_start()
         yield start_event.to_sse()
-        await asyncio.sleep(0.1)  # 클라이언트가 이벤트를 받을 시간
         
         try:
             # 캐시 확인
@@ -775,16 +1018,12 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
                 yield f"data: {json.dumps({'type': 'result', 'data': cached_response}, ensure_ascii=False)}\n\n"
                 return
             
-            # 의도 분석 시작
-            intent_start = handler.on_node_start("intent_analysis_node")
-            yield intent_start.to_sse()
-            await asyncio.sleep(0.05)
-            
             # Supervisor 그래프 실행 준비
             graph = get_supervisor_graph()
             config = {"configurable": {"thread_id": f"{owner}/{repo}@{ref}"}}
             
-            user_context = {"use_llm_summary": True}
+            # 요약은 complete 이후 summary 이벤트로 전달
+            user_context = {"use_llm_summary": True, "defer_llm_summary": True}
             if request.analysis_depth:
                 user_context["analysis_depth"] = request.analysis_depth
             
@@ -797,47 +1036,31 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
             
             initial_state = init_state_from_input(inp)
             
-            # 의도 분석 완료
-            intent_complete = handler.on_node_complete("intent_analysis_node", {
-                "detected_intent": "diagnose",
-                "analysis_depth": request.analysis_depth or "auto"
-            })
-            yield intent_complete.to_sse()
-            
-            # 결정 노드
-            decision_start = handler.on_node_start("decision_node")
-            yield decision_start.to_sse()
-            await asyncio.sleep(0.05)
-            
-            decision_complete = handler.on_node_complete("decision_node", {
-                "next_node": "run_diagnosis_node"
-            })
-            yield decision_complete.to_sse()
-            
             # 진단 노드 시작
             diagnosis_start = handler.on_node_start("run_diagnosis_node")
             yield diagnosis_start.to_sse()
             
-            # 실제 그래프 실행 (블로킹)
-            # Note: 실제 프로덕션에서는 비동기 실행이 필요하지만,
-            # 현재 LangGraph는 동기 실행이므로 스레드풀에서 실행
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(graph.invoke, initial_state, config=config)
-                
-                # 진행률 업데이트 (예상 시간 기반)
-                progress_steps = [30, 40, 50, 55]
-                for pct in progress_steps:
-                    if not future.done():
-                        progress_event = handler.on_progress_update(
-                            f"저장소 분석 중... ({pct}%)", 
-                            pct
-                        )
-                        yield progress_event.to_sse()
-                        await asyncio.sleep(1.5)
-                
-                # 결과 대기
-                result = future.result(timeout=900)
+            # 그래프 실행 - 분석기가 끝날 때마다 부분 결과 전달
+            progress = diagnosis_start.progress_percent
+            result = None
+            summary_job = None
+            missing_parts: list = []
+            async for stage, payload in stream_stage_events(
+                asyncio.wait_for(graph.ainvoke(initial_state, config=config), timeout=900)
+            ):
+                if stage == "result":
+                    result = payload
+                    continue
+                if stage == "summary_pending":
+                    summary_job = payload.get("job_id")
+                    continue
+                if stage == "partial":
+                    missing_parts = payload.get("missing_parts", [])
+                    continue
+                fields = stage_event_fields(stage, payload, progress)
+                if fields:
+                    _, progress, message, _ = fields
+                    yield handler.on_stage_complete(stage, message, progress, payload).to_sse()
             
             # 결과 처리
             if result is None:
@@ -852,14 +1075,6 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
             })
             yield diagnosis_complete.to_sse()
             
-            # 품질 검사
-            quality_start = handler.on_node_start("quality_check_node")
-            yield quality_start.to_sse()
-            await asyncio.sleep(0.1)
-            
-            quality_complete = handler.on_node_complete("quality_check_node", {})
-            yield quality_complete.to_sse()
-            
             # 에러 체크
             if result.get("error"):
                 error_event = handler.on_node_error("run_diagnosis_node", result["error"])
@@ -874,7 +1089,7 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
             
             # Good First Issues 수집
             try:
-                recommended_issues = fetch_beginner_issues(owner, repo, max_count=5)
+                recommended_issues = await run_blocking(fetch_beginner_issues, owner, repo, max_count=5)
             except Exception:
                 recommended_issues = []
             
@@ -885,6 +1100,9 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
             
             response_data = {
                 "job_id": f"{owner}/{repo}@{ref}",
+                "summary_job_id": summary_job,
+                "partial": bool(missing_parts),
+                "missing_parts": missing_parts,
                 "score": data.get("health_score", 0),
                 "analysis": {
                     "health_score": data.get("health_score", 0),
@@ -902,8 +1120,9 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
                 "readme_summary": data.get("summary_for_user"),
             }
             
-            # 캐시에 저장
-            analysis_cache.set_analysis(owner, repo, ref, response_data)
+            # 캐시에 저장 (마감으로 빠진 분석기가 있으면 저장하지 않음)
+            if not missing_parts:
+                analysis_cache.set_analysis(owner, repo, ref, response_data)
             
             # 분석 완료 이벤트
             complete_event = handler.on_analysis_complete(response_data)
@@ -912,6 +1131,11 @@ async def analyze_repository_stream(request: StreamingAnalyzeRequest):
             # 최종 결과
             yield f"data: {json.dumps({'type': 'result', 'data': response_data}, ensure_ascii=False)}\n\n"
             
+            # 백그라운드 LLM 요약
+            summary = await wait_for_summary(summary_job)
+            if summary:
+                yield f"data: {json.dumps({'type': 'summary', 'data': summary}, ensure_ascii=False)}\n\n"
+            
         except Exception as e:
             logger.exception(f"Streaming analysis failed: {e}")
             error_event = handler.on_node_error("analysis", str(e))
@@ -954,24 +1178,14 @@ async def analyze_repository_stream_get(
     from backend.agents.supervisor.service import init_state_from_input
     from backend.common.github_client import fetch_beginner_issues
     from backend.common.cache_manager import analysis_cache
+    from backend.common.async_utils import run_blocking
+    from backend.api.sse_analyze import stage_event_fields, stream_stage_events, wait_for_summary
     
     try:
         owner, repo, ref = parse_github_url(repo_url)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     
-    # 프론트엔드 호환 단계 정의
-    FRONTEND_STEPS = {
-        "intent_analysis_node": {"step": "intent", "progress": 5, "message": "AI가 요청 의도 분석 중"},
-        "decision_node": {"step": "github", "progress": 15, "message": "저장소 정보 수집 중"},
-        "run_diagnosis_node": {"step": "docs", "progress": 35, "message": "문서 품질 분석 중"},
-        "activity": {"step": "activity", "progress": 55, "message": "활동성 분석 중"},
-        "structure": {"step": "structure", "progress": 70, "message": "구조 분석 중"},
-        "scoring": {"step": "scoring", "progress": 85, "message": "건강도 점수 계산 중"},
-        "quality_check_node": {"step": "quality", "progress": 92, "message": "AI가 결과 품질 검사 중"},
-        "summary": {"step": "llm", "progress": 97, "message": "AI 요약 생성 중"},
-    }
-    
     async def event_generator():
         def send_event(step: str, progress: int, message: str, data: dict = None):
             event_data = {
@@ -985,7 +1199,6 @@ async def analyze_repository_stream_get(
         
         # 시작 이벤트
         yield send_event("github", 5, f"{owner}/{repo} 저장소 정보 수집 중...")
-        await asyncio.sleep(0.1)
         
         try:
             # 캐시 확인 (force_refresh가 아닐 때만)
@@ -998,18 +1211,12 @@ async def analyze_repository_stream_get(
             else:
                 logger.info(f"Force refresh requested for {owner}/{repo}@{ref}, skipping cache")
             
-            # 의도 분석
-            yield send_event("intent", 10, "AI가 요청 의도 분석 중...")
-            await asyncio.sleep(0.05)
-            
-            # 문서 분석
-            yield send_event("docs", 25, "문서 품질 분석 중...")
-            
             # Supervisor 그래프 실행 준비
             graph = get_supervisor_graph()
             config = {"configurable": {"thread_id": f"{owner}/{repo}@{ref}"}}
 
-            user_context = {"use_llm_summary": True}
+            # 요약은 complete 이후 summary 이벤트로 전달
+            user_context = {"use_llm_summary": True, "defer_llm_summary": True}
             user_context["priority"] = priority
 
             if local_user_message:
@@ -1028,32 +1235,28 @@ async def analyze_repository_stream_get(
             
             initial_state = init_state_from_input(inp)
             
-            # 활동성 분석
-            yield send_event("activity", 45, "활동성 분석 중...")
-            
-            # 그래프 실행 (블로킹)
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(graph.invoke, initial_state, config=config)
-                
-                # 진행률 업데이트
-                progress_updates = [
-                    ("structure", 55, "구조 분석 중..."),
-                    ("structure", 65, "의존성 분석 중..."),
-                    ("scoring", 75, "분석 결과 종합 중..."),
-                    ("scoring", 82, "AI가 플랜 생성 중..."),
-                ]
-                
-                for step, pct, msg in progress_updates:
-                    if not future.done():
-                        yield send_event(step, pct, msg)
-                        await asyncio.sleep(1.2)
-                
-                result = future.result(timeout=1800)  # 30분 (대규모 프로젝트 NVD 조회 시간 감안)
-            
-            # 품질 검사
-            yield send_event("quality", 90, "AI가 결과 품질 검사 중...")
-            await asyncio.sleep(0.1)
+            # 그래프 실행 - 분석기가 끝날 때마다 부분 결과 전달
+            # 30분 제한 (대규모 프로젝트 NVD 조회 시간 감안)
+            progress = 15
+            result = None
+            summary_job = None
+            missing_parts: list = []
+            async for stage, payload in stream_stage_events(
+                asyncio.wait_for(graph.ainvoke(initial_state, config=config), timeout=1800)
+            ):
+                if stage == "result":
+                    result = payload
+                    continue
+                if stage == "summary_pending":
+                    summary_job = payload.get("job_id")
+                    continue
+                if stage == "partial":
+                    missing_parts = payload.get("missing_parts", [])
+                    continue
+                fields = stage_event_fields(stage, payload, progress)
+                if fields:
+                    progress = fields[1]
+                    yield send_event(*fields)
             
             # 결과 처리
             if result is None:
@@ -1066,12 +1269,11 @@ async def analyze_repository_stream_get(
                 yield send_event("error", 0, result["error"], {"error": result["error"]})
                 return
             
-            # LLM 요약
-            yield send_event("llm", 95, "AI 요약 생성 중...")
+            yield send_event("llm", max(progress, 95), "추천 이슈 수집 중...")
             
             # Good First Issues 수집
             try:
-                recommended_issues = fetch_beginner_issues(owner, repo, max_count=5)
+                recommended_issues = await run_blocking(fetch_beginner_issues, owner, repo, max_count=5)
             except Exception:
                 recommended_issues = []
             
@@ -1082,6 +1284,9 @@ async def analyze_repository_stream_get(
             
             response_data = {
                 "job_id": f"{owner}/{repo}@{ref}",
+                "summary_job_id": summary_job,
+                "partial": bool(missing_parts),
+                "missing_parts": missing_parts,
                 "score": data.get("health_score", 0),
                 "analysis": {
                     "health_score": data.get("health_score", 0),
@@ -1118,12 +1323,18 @@ async def analyze_repository_stream_get(
                 "security": _extract_security_response(result.get("task_results", {}).get("security")),
             }
             
-            # 캐시에 저장
-            analysis_cache.set_analysis(owner, repo, ref, response_data)
+            # 캐시에 저장 (마감으로 빠진 분석기가 있으면 저장하지 않음)
+            if not missing_parts:
+                analysis_cache.set_analysis(owner, repo, ref, response_data)
             
-            # 완료 이벤트
+            # 완료 이벤트 (LLM 요약은 기다리지 않음)
             yield send_event("complete", 100, "분석 완료!", {"result": response_data})
             
+            # 백그라운드 LLM 요약
+            summary = await wait_for_summary(summary_job)
+            if summary:
+                yield send_event("summary", 100, "AI 요약 생성 완료", summary)
+            
         except Exception as e:
             logger.exception(f"Streaming analysis (GET) failed: {e}")
             yield send_event("error", 0, f"분석 중 오류 발생: {str(e)}", {"error": str(e)})
@@ -72,6 +72,10 @@ class DiagnosisSummaryDTO(BaseModel):
     warnings: list[str] = Field(default_factory=list, description="Agentic flow warnings")
     flow_adjustments: list[str] = Field(default_factory=list, description="Agentic flow adjustments")
     
+    # 요청 마감으로 일부 분석기가 빠진 결과
+    partial: bool = Field(default=False, description="Some analyzers were cancelled at the request deadline")
+    missing_parts: list[str] = Field(default_factory=list, description="Analyzers missing from a partial result")
+    
     # 메타 에이전트 결과
     task_plan: Optional[list[dict[str, Any]]] = Field(None, description="Meta agent task plan")
     task_results: Optional[dict[str, Any]] = Field(None, description="Meta agent task results")
@@ -254,9 +258,11 @@ def to_summary_dto(repo_id: str, res: Union[DiagnosisCoreResult, dict[str, Any]]
     # Agentic 메타데이터 추출
     warnings = []
     flow_adjustments = []
+    missing_parts = []
     if isinstance(res, dict):
         warnings = res.get("warnings", [])
         flow_adjustments = res.get("flow_adjustments", [])
+        missing_parts = list(res.get("missing_parts") or [])
     
     # 구조 분석 결과 추출
     structure_score = 0
@@ -309,6 +315,8 @@ def to_summary_dto(repo_id: str, res: Union[DiagnosisCoreResult, dict[str, Any]]
         similar_projects=res.get("similar_projects") if isinstance(res, dict) else None,
         warnings=warnings,
         flow_adjustments=flow_adjustments,
+        partial=bool(missing_parts),
+        missing_parts=missing_parts,
         # 메타 에이전트 결과
         task_plan=res.get("task_plan") if isinstance(res, dict) else None,
         task_results=res.get("task_results") if isinstance(res, dict) else None,
@@ -2,16 +2,24 @@
 SSE 기반 분석 진행률 스트리밍 API.
 
 분석 진행 상황을 실시간으로 클라이언트에 전달합니다.
+진단 분석기(docs/activity/structure/dependencies)와 점수 계산, LLM 요약이 실제로 끝나는 시점에
+부분 결과와 함께 이벤트를 보냅니다. 백그라운드로 생성되는 LLM 요약은 complete 이후
+summary 이벤트로 전달됩니다.
 """
 import asyncio
 import json
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Dict, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from backend.agents.diagnosis.summary_jobs import summary_jobs
+from backend.common.async_utils import run_blocking
+from backend.common.config import SUMMARY_STREAM_WAIT_SECONDS
+from backend.common.stage_scheduler import listen_stages
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["sse"])
@@ -30,9 +38,72 @@ class ProgressEvent(BaseModel):
     data: dict = Field(default_factory=dict)
 
 
+# 진단 단계 → (프론트엔드 step, 진행률, 메시지)
+STAGE_EVENTS = {
+    "docs": ("docs", 35, "문서 품질 분석 완료"),
+    "activity": ("activity", 55, "활동성 분석 완료"),
+    "structure": ("structure", 70, "구조 분석 완료"),
+    "dependencies": ("structure", 75, "의존성 분석 완료"),
+    "scoring": ("scoring", 85, "건강도 점수 계산 완료"),
+    "llm_summary": ("llm", 92, "AI 요약 생성 완료"),
+}
+
+
+async def stream_stage_events(
+    coro: Awaitable[Any],
+) -> AsyncGenerator[Tuple[str, Any], None]:
+    """
+    coro를 실행하면서 진단 단계가 끝날 때마다 (단계, 부분 결과)를 내보내고
+    마지막에 ("result", coro 결과)를 내보냄.
+
+    클라이언트가 연결을 끊어도 분석은 끝까지 실행해 캐시를 채웁니다.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def on_stage(name: str, payload: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (name, payload))
+
+    with listen_stages(on_stage):
+        task = asyncio.ensure_future(coro)
+    task.add_done_callback(_log_task_failure)
+
+    while True:
+        getter = asyncio.ensure_future(queue.get())
+        done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+        if getter not in done:
+            getter.cancel()
+            break
+        yield getter.result()
+    await asyncio.sleep(0)  # 태스크 종료 직전에 예약된 알림 반영
+    while not queue.empty():
+        yield queue.get_nowait()
+    yield "result", task.result()
+
+
+def _log_task_failure(task: asyncio.Future) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Streamed analysis task failed: {task.exception()}")
+
+
+async def wait_for_summary(job_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """백그라운드 LLM 요약 작업을 SUMMARY_STREAM_WAIT_SECONDS까지 기다려 상태 반환."""
+    if not job_id:
+        return None
+    job = await summary_jobs.wait(job_id, SUMMARY_STREAM_WAIT_SECONDS)
+    return job.to_dict() if job else None
+
+
+def stage_event_fields(stage: str, payload: Dict[str, Any], last_progress: int) -> Optional[Tuple[str, int, str, dict]]:
+    """단계 완료 알림을 (step, progress, message, data)로 변환 (진행률은 감소하지 않음)."""
+    if stage not in STAGE_EVENTS:
+        return None
+    step, progress, message = STAGE_EVENTS[stage]
+    return step, max(progress, last_progress), message, {"stage": stage, "partial": payload}
+
+
 async def analyze_with_progress(owner: str, repo: str, ref: str, message: str = None) -> AsyncGenerator[str, None]:
-    """분석 진행 상황을 SSE 이벤트로 스트리밍."""
-    from concurrent.futures import ThreadPoolExecutor
+    """분석 진행 상황을 SSE 이벤트로 스트리밍 (분석기가 끝날 때마다 부분 결과 전달)."""
     from backend.common.cache_manager import analysis_cache
     
     def send_event(step: str, progress: int, message: str, data: dict = None) -> str:
@@ -42,7 +113,7 @@ async def analyze_with_progress(owner: str, repo: str, ref: str, message: str =
             message=message,
             data=data or {}
         )
-        return f"data: {json.dumps(event.model_dump(), ensure_ascii=False)}\n\n"
+        return f"data: {json.dumps(event.model_dump(), ensure_ascii=False, default=str)}\n\n"
     
     try:
         # 캐시 확인
@@ -51,38 +122,35 @@ async def analyze_with_progress(owner: str, repo: str, ref: str, message: str =
         if cached_result:
             logger.info(f"SSE returning cached analysis for {owner}/{repo}@{ref}")
             yield send_event("github", 10, "캐시된 결과 확인 중...")
-            await asyncio.sleep(0.3)
             yield send_event("complete", 100, "분석 완료! (캐시)", {"result": cached_result})
             return
         
-        # Step 1: 시작
         yield send_event("github", 10, "GitHub 저장소 확인 중...")
-        await asyncio.sleep(0.5)  # UI가 첫 이벤트를 표시할 시간
         
-        # Step 2: 분석 진행
-        yield send_event("docs", 30, "문서 품질 분석 중...")
+        from backend.api.agent_service import run_agent_task_async
         
-        # Step 3: 실제 분석 실행 (기존 agent_service 사용)
-        yield send_event("activity", 50, "활동성 분석 중...")
-        
-        from backend.api.agent_service import run_agent_task
-        
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor,
-                lambda: run_agent_task(
-                    task_type="general_inquiry",
-                    owner=owner,
-                    repo=repo,
-                    ref=ref,
-                    use_llm_summary=True,
-                    user_message=message
-                )
-            )
-        
-        yield send_event("scoring", 80, "건강도 점수 계산 중...")
-        await asyncio.sleep(0.3)
+        progress = 10
+        result: Dict[str, Any] = {}
+        summary_job = None
+        async for stage, payload in stream_stage_events(run_agent_task_async(
+            task_type="general_inquiry",
+            owner=owner,
+            repo=repo,
+            ref=ref,
+            use_llm_summary=True,
+            user_message=message,
+            defer_llm_summary=True,
+        )):
+            if stage == "result":
+                result = payload or {}
+                continue
+            if stage == "summary_pending":
+                summary_job = payload.get("job_id")
+                continue
+            fields = stage_event_fields(stage, payload, progress)
+            if fields:
+                progress = fields[1]
+                yield send_event(*fields)
         
         if not result.get("ok"):
             error_msg = result.get("error", "분석 실패")
@@ -91,22 +159,17 @@ async def analyze_with_progress(owner: str, repo: str, ref: str, message: str =
         
         data = result.get("data", {})
         
-        # Step 4: Good First Issues 수집
-        yield send_event("llm", 90, "추천 이슈 수집 중...")
+        # Good First Issues 수집
+        yield send_event("llm", max(progress, 95), "추천 이슈 수집 중...")
         
         try:
             from backend.common.github_client import fetch_beginner_issues
             
-            with ThreadPoolExecutor() as executor:
-                recommended_issues = await loop.run_in_executor(
-                    executor,
-                    lambda: fetch_beginner_issues(owner, repo, max_count=5)
-                )
-            data["recommended_issues"] = recommended_issues
+            data["recommended_issues"] = await run_blocking(fetch_beginner_issues, owner, repo, max_count=5)
         except Exception:
             data["recommended_issues"] = []
         
-        # Step 5: actions 및 risks 생성 (regular API와 동일하게)
+        # actions 및 risks 생성 (regular API와 동일하게)
         try:
             from backend.api.http_router import _generate_actions_from_issues, _generate_risks_from_issues
             
@@ -123,12 +186,20 @@ async def analyze_with_progress(owner: str, repo: str, ref: str, message: str =
             data["actions"] = []
             data["risks"] = []
         
-        # 캐시에 저장
-        analysis_cache.set_analysis(owner, repo, ref, data)
+        # 캐시에 저장 (마감으로 빠진 분석기가 있으면 저장하지 않음)
+        if not data.get("partial"):
+            analysis_cache.set_analysis(owner, repo, ref, data)
         
-        # 완료
+        # 완료 (LLM 요약은 기다리지 않음)
+        if summary_job:
+            data["summary_job_id"] = summary_job
         yield send_event("complete", 100, "분석 완료!", {"result": data})
         
+        # 백그라운드 요약이 끝나면 후속 이벤트로 전달
+        summary = await wait_for_summary(summary_job)
+        if summary:
+            yield send_event("summary", 100, "AI 요약 생성 완료", summary)
+        
     except Exception as e:
         logger.exception(f"SSE analysis failed: {e}")
         yield send_event("error", 0, f"분석 중 오류 발생: {str(e)}", {"error": str(e)})
@@ -0,0 +1,139 @@
+"""
+공유 비동기 HTTP 클라이언트 (GitHub API 호출용)
+이벤트 루프마다 하나의 httpx.AsyncClient를 두고 커넥션을 재사용
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .config import (
+    GITHUB_HTTP_POOL_SIZE,
+    GITHUB_HTTP_MAX_RETRIES,
+)
+from .deadline import clamp_timeout, current_deadline
+from .rate_limiter import get_rate_limit_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPooledHttpClient:
+    """
+    비동기 풀링 HTTP 클라이언트.
+
+    httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 클라이언트를 보관합니다.
+    (uvicorn 워커는 루프 하나, 테스트/스크립트의 asyncio.run()은 매번 새 루프)
+    """
+
+    def __init__(
+        self,
+        pool_size: int = GITHUB_HTTP_POOL_SIZE,
+        max_retries: int = GITHUB_HTTP_MAX_RETRIES,
+    ):
+        self._pool_size = pool_size
+        self._max_retries = max_retries
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._error_count = 0
+
+    def _build_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self._pool_size,
+            max_keepalive_connections=self._pool_size,
+        )
+        # 연결 실패만 transport 레벨에서 재시도 (5xx는 호출부에서 상태 코드로 처리)
+        transport = httpx.AsyncHTTPTransport(retries=self._max_retries, limits=limits)
+        logger.info(
+            f"Async HTTP client initialized (pool_size={self._pool_size}, "
+            f"max_retries={self._max_retries})"
+        )
+        return httpx.AsyncClient(transport=transport, follow_redirects=True)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 묶인 AsyncClient 반환."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._build_client()
+                self._clients[loop] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """공유 AsyncClient로 HTTP 요청 수행 (GitHub API는 rate limit 스케줄러 경유)."""
+        scheduler = get_rate_limit_scheduler()
+        if not scheduler.applies_to(url):
+            return await self._send(method, url, **kwargs)
+
+        headers, caller_token, managed = scheduler.prepare_headers(kwargs.pop("headers", None))
+        resource = scheduler.resource_for(url)
+        pinned = None if managed else caller_token
+
+        for _ in range(scheduler.max_attempts):
+            lease = await scheduler.acquire_async(resource, pinned_token=pinned)
+            resp = await self._send(method, url, headers=scheduler.apply(lease, headers), **kwargs)
+            if not scheduler.record(lease, resp):
+                break
+        return resp
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        # 요청 마감이 있으면 남은 시간 안에서만 기다림
+        if "timeout" in kwargs or current_deadline() is not None:
+            kwargs["timeout"] = clamp_timeout(kwargs.get("timeout"))
+        with self._lock:
+            self._request_count += 1
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            with self._lock:
+                self._error_count += 1
+            raise
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 통계."""
+        with self._lock:
+            return {
+                "total_requests": self._request_count,
+                "errors": self._error_count,
+                "active_clients": len(self._clients),
+                "pool_size": self._pool_size,
+                "max_retries": self._max_retries,
+            }
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 클라이언트 정리."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+# === 싱글톤 인스턴스 ===
+_async_http_client_instance: Optional[AsyncPooledHttpClient] = None
+_instance_lock = threading.Lock()
+
+
+def get_async_http_client() -> AsyncPooledHttpClient:
+    """공유 비동기 HTTP 클라이언트 싱글톤 인스턴스 반환"""
+    global _async_http_client_instance
+    if _async_http_client_instance is None:
+        with _instance_lock:
+            if _async_http_client_instance is None:
+                _async_http_client_instance = AsyncPooledHttpClient()
+    return _async_http_client_instance
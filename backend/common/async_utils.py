@@ -1,17 +1,56 @@
 """
-비동기 유틸리티 - 재시도, 에러 처리, 부분 결과 활용
+비동기 유틸리티 - 재시도, 에러 처리, 부분 결과 활용, 공용 블로킹 실행기
 """
 
 import asyncio
+import contextvars
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Any, Optional, TypeVar, Dict
-from functools import wraps
+from functools import partial, wraps
+
+from .config import SHARED_EXECUTOR_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+# === 공용 블로킹 실행기 ===
+
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_shared_executor() -> ThreadPoolExecutor:
+    """
+    프로세스 전역 블로킹 작업 실행기 (SHARED_EXECUTOR_MAX_WORKERS 스레드).
+
+    이벤트 루프마다 생기는 기본 executor나 호출마다 만드는 ThreadPoolExecutor 대신
+    모든 요청이 같은 상한을 공유합니다. 다른 공용 실행기 작업을 기다리는 작업
+    (그래프 전체 실행 등)을 여기에 넣으면 포화 시 교착될 수 있으므로 말단 호출에만 사용합니다.
+    """
+    global _shared_executor
+    if _shared_executor is None:
+        with _executor_lock:
+            if _shared_executor is None:
+                _shared_executor = ThreadPoolExecutor(
+                    max_workers=SHARED_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="odoc-shared",
+                )
+    return _shared_executor
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """동기 함수를 공용 실행기에서 실행 (asyncio.to_thread처럼 contextvars 유지)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_shared_executor(), partial(ctx.run, func, *args, **kwargs)
+    )
+
+
 async def retry_with_backoff(
     func: Callable,
     max_retries: int = 3,
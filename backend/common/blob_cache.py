@@ -0,0 +1,63 @@
+"""
+git blob SHA 기준 콘텐츠 캐시
+같은 내용의 파일(lockfile, requirements.txt, README 등)은 저장소·ref와 무관하게 SHA가 같으므로
+원문과 파싱 결과를 SHA 키로 immutable 캐시에 한 번만 저장하고 공유
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Callable, Optional, TypeVar, Union
+
+from .cache_manager import immutable_cache
+from .config import BLOB_CACHE_MAX_CONTENT_BYTES
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def git_blob_sha(content: Union[str, bytes]) -> str:
+    """git이 계산하는 blob SHA (트리 API의 sha와 같은 값)."""
+    raw = content.encode("utf-8") if isinstance(content, str) else content
+    return hashlib.sha1(b"blob %d\0" % len(raw) + raw).hexdigest()
+
+
+def _content_key(sha: str) -> str:
+    return f"{__name__}.content:{sha}"
+
+
+def _parsed_key(sha: str, parser: str) -> str:
+    return f"{__name__}.parsed:{sha}:{parser}"
+
+
+def get_blob(sha: Optional[str]) -> Optional[str]:
+    """캐시된 blob 원문 조회."""
+    if not sha:
+        return None
+    return immutable_cache.get(_content_key(sha))
+
+
+def put_blob(sha: Optional[str], content: Optional[str]) -> None:
+    """blob 원문 저장 (BLOB_CACHE_MAX_CONTENT_BYTES 초과 시 저장하지 않음)."""
+    if not sha or content is None or len(content) > BLOB_CACHE_MAX_CONTENT_BYTES:
+        return
+    immutable_cache.set(_content_key(sha), content)
+
+
+def parse_blob(sha: Optional[str], parser: str, parse: Callable[[], T]) -> T:
+    """
+    blob 파싱 결과를 SHA + 파서 이름 키로 캐시.
+
+    parser에는 결과를 바꾸는 입력(파일명, lockfile 여부 등)을 모두 포함해야 합니다.
+    파싱 중 예외는 캐시하지 않고 그대로 전파합니다.
+    """
+    if not sha:
+        return parse()
+    key = _parsed_key(sha, parser)
+    result = immutable_cache.get(key)
+    if result is not None:
+        return result
+    result = parse()
+    immutable_cache.set(key, result)
+    return result
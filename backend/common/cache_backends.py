@@ -0,0 +1,418 @@
+"""
+분석 결과 캐시(CacheManager) 저장소 백엔드
+프로세스 메모리 / 로컬 SQLite 파일 / Redis 중 선택 (ANALYSIS_CACHE_BACKEND)
+SQLite·Redis는 여러 워커와 재시작 사이에서 같은 캐시를 공유
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import ANALYSIS_CACHE_BACKEND, ANALYSIS_CACHE_SQLITE_PATH, REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    key: str
+    data: Dict[str, Any]
+    cached_at: datetime
+    ttl_hours: int
+    access_count: int = 0
+    grace_hours: float = 0  # 만료 후에도 stale 응답으로 보관하는 시간
+
+    def is_expired(self) -> bool:
+        """만료 여부 (신선 기간 경과)"""
+        return datetime.now() - self.cached_at > timedelta(hours=self.ttl_hours)
+
+    def is_purgeable(self) -> bool:
+        """stale 유예 기간까지 지나 삭제 대상인지 여부"""
+        return datetime.now().timestamp() > self.expires_at
+
+    def access(self):
+        """접근 카운트 증가"""
+        self.access_count += 1
+
+    @property
+    def age_seconds(self) -> int:
+        return int((datetime.now() - self.cached_at).total_seconds())
+
+    @property
+    def expires_at(self) -> float:
+        """저장소에서 제거되는 시각 (TTL + stale 유예)."""
+        return (self.cached_at + timedelta(hours=self.ttl_hours + self.grace_hours)).timestamp()
+
+
+def serialize_value(data: Dict[str, Any]) -> bytes:
+    """분석 결과를 압축 JSON 바이트로 직렬화 (공백 제거 + zlib)."""
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+    return zlib.compress(raw.encode("utf-8"), 6)
+
+
+def deserialize_value(blob: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class AnalysisCacheBackend(ABC):
+    """분석 결과 캐시 백엔드 인터페이스."""
+
+    name: str = ""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """항목 조회 (만료 판단은 호출부에서)."""
+
+    @abstractmethod
+    def set(self, entry: CacheEntry) -> None:
+        """항목 저장 (같은 키는 덮어씀)."""
+
+    @abstractmethod
+    def record_access(self, key: str) -> None:
+        """접근 카운트 증가."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """항목 삭제. 존재했으면 True."""
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """접두사가 같은 항목 일괄 삭제. 삭제 수 반환."""
+
+    @abstractmethod
+    def delete_expired(self) -> int:
+        """만료 항목 정리. 삭제 수 반환."""
+
+    @abstractmethod
+    def stats(self) -> Tuple[int, int]:
+        """(항목 수, 누적 접근 수)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제."""
+
+    def is_available(self) -> bool:
+        return True
+
+
+class InMemoryCacheBackend(AnalysisCacheBackend):
+    """프로세스 로컬 dict 백엔드 (직렬화 없음)."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self._entries.get(key)
+
+    def set(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[entry.key] = entry
+
+    def record_access(self, key: str) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.access()
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def delete_expired(self) -> int:
+        with self._lock:
+            keys = [k for k, entry in self._entries.items() if entry.is_purgeable()]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> Tuple[int, int]:
+        entries = list(self._entries.values())
+        return len(entries), sum(entry.access_count for entry in entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(AnalysisCacheBackend):
+    """
+    로컬 SQLite 파일 백엔드.
+
+    WAL 모드로 열어 같은 호스트의 여러 워커가 동시에 읽고 쓸 수 있고, 재시작 후에도 유지됩니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = ANALYSIS_CACHE_SQLITE_PATH):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    cached_at REAL NOT NULL,
+                    ttl_hours INTEGER NOT NULL,
+                    grace_hours REAL NOT NULL DEFAULT 0,
+                    expires_at REAL NOT NULL,
+                    access_count INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_expires ON analysis_cache (expires_at)"
+            )
+
+    def _execute(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, cached_at, ttl_hours, grace_hours, access_count"
+                " FROM analysis_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        value, cached_at, ttl_hours, grace_hours, access_count = row
+        try:
+            data = deserialize_value(value)
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Corrupt analysis cache entry dropped: {key} ({e})")
+            self.delete(key)
+            return None
+        return CacheEntry(
+            key=key,
+            data=data,
+            cached_at=datetime.fromtimestamp(cached_at),
+            ttl_hours=ttl_hours,
+            access_count=access_count,
+            grace_hours=grace_hours,
+        )
+
+    def set(self, entry: CacheEntry) -> None:
+        self._execute(
+            """
+            INSERT OR REPLACE INTO analysis_cache
+                (key, value, cached_at, ttl_hours, grace_hours, expires_at, access_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                entry.key,
+                serialize_value(entry.data),
+                entry.cached_at.timestamp(),
+                entry.ttl_hours,
+                entry.grace_hours,
+                entry.expires_at,
+                entry.access_count,
+            ),
+        )
+
+    def record_access(self, key: str) -> None:
+        self._execute(
+            "UPDATE analysis_cache SET access_count = access_count + 1 WHERE key = ?", (key,)
+        )
+
+    def delete(self, key: str) -> bool:
+        return self._execute("DELETE FROM analysis_cache WHERE key = ?", (key,)).rowcount > 0
+
+    def delete_prefix(self, prefix: str) -> int:
+        # LIKE 와일드카드 대신 범위 비교로 접두사 일치 (키에 %, _가 있어도 안전)
+        return self._execute(
+            "DELETE FROM analysis_cache WHERE key >= ? AND key < ?",
+            (prefix, prefix + "\U0010ffff"),
+        ).rowcount
+
+    def delete_expired(self) -> int:
+        now = datetime.now().timestamp()
+        return self._execute(
+            "DELETE FROM analysis_cache WHERE expires_at < ?", (now,)
+        ).rowcount
+
+    def stats(self) -> Tuple[int, int]:
+        with self._lock:
+            count, accesses = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(access_count), 0) FROM analysis_cache"
+            ).fetchone()
+        return count, accesses
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM analysis_cache")
+
+
+class RedisCacheBackend(AnalysisCacheBackend):
+    """
+    Redis 백엔드 (REDIS_URL 공유).
+
+    항목은 해시(value/cached_at/ttl_hours/grace_hours/access_count)로 저장하고
+    Redis 키 만료(TTL + stale 유예)에 정리를 맡깁니다.
+    """
+
+    name = "redis"
+
+    def __init__(self, redis_url: str, namespace: str = "analysis_cache:"):
+        self.redis_url = redis_url
+        self.namespace = namespace
+        self._client = None
+        self._available = False
+        self._init_client()
+
+    def _init_client(self) -> None:
+        try:
+            import redis
+            self._client = redis.from_url(
+                self.redis_url,
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+            self._client.ping()
+            self._available = True
+            logger.info(f"Analysis cache Redis connected: {self.redis_url}")
+        except ImportError:
+            logger.warning("redis package not installed. Using fallback.")
+            self._available = False
+        except Exception as e:
+            logger.warning(f"Redis connection failed: {e}. Using fallback.")
+            self._available = False
+
+    def is_available(self) -> bool:
+        return self._available
+
+    def _key(self, key: str) -> str:
+        return self.namespace + key
+
+    def _scan(self, prefix: str = "") -> Iterator[bytes]:
+        return self._client.scan_iter(match=self._escape(self._key(prefix)) + "*", count=500)
+
+    @staticmethod
+    def _escape(pattern: str) -> str:
+        # SCAN MATCH glob 특수문자 이스케이프
+        for ch in "\\*?[]":
+            pattern = pattern.replace(ch, "\\" + ch)
+        return pattern
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            fields = self._client.hgetall(self._key(key))
+        except Exception as e:
+            logger.error(f"Failed to get analysis cache: {e}")
+            return None
+        if not fields:
+            return None
+        try:
+            return CacheEntry(
+                key=key,
+                data=deserialize_value(fields[b"value"]),
+                cached_at=datetime.fromtimestamp(float(fields[b"cached_at"])),
+                ttl_hours=int(fields[b"ttl_hours"]),
+                access_count=int(fields.get(b"access_count", 0)),
+                grace_hours=float(fields.get(b"grace_hours", 0)),
+            )
+        except (KeyError, zlib.error, ValueError) as e:
+            logger.warning(f"Corrupt analysis cache entry dropped: {key} ({e})")
+            self.delete(key)
+            return None
+
+    def set(self, entry: CacheEntry) -> None:
+        redis_key = self._key(entry.key)
+        try:
+            pipe = self._client.pipeline()
+            pipe.delete(redis_key)
+            pipe.hset(redis_key, mapping={
+                "value": serialize_value(entry.data),
+                "cached_at": entry.cached_at.timestamp(),
+                "ttl_hours": entry.ttl_hours,
+                "grace_hours": entry.grace_hours,
+                "access_count": entry.access_count,
+            })
+            pipe.expire(redis_key, max(1, int((entry.ttl_hours + entry.grace_hours) * 3600)))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to set analysis cache: {e}")
+
+    def record_access(self, key: str) -> None:
+        try:
+            redis_key = self._key(key)
+            if self._client.exists(redis_key):
+                self._client.hincrby(redis_key, "access_count", 1)
+        except Exception as e:
+            logger.error(f"Failed to record analysis cache access: {e}")
+
+    def delete(self, key: str) -> bool:
+        try:
+            return self._client.delete(self._key(key)) > 0
+        except Exception as e:
+            logger.error(f"Failed to delete analysis cache: {e}")
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        try:
+            keys: List[bytes] = list(self._scan(prefix))
+            return self._client.delete(*keys) if keys else 0
+        except Exception as e:
+            logger.error(f"Failed to delete analysis cache prefix: {e}")
+            return 0
+
+    def delete_expired(self) -> int:
+        # Redis 키 만료가 처리
+        return 0
+
+    def stats(self) -> Tuple[int, int]:
+        count = accesses = 0
+        try:
+            for redis_key in self._scan():
+                count += 1
+                accesses += int(self._client.hget(redis_key, "access_count") or 0)
+        except Exception as e:
+            logger.error(f"Failed to read analysis cache stats: {e}")
+        return count, accesses
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+
+def create_cache_backend(kind: Optional[str] = None) -> AnalysisCacheBackend:
+    """
+    설정에 맞는 백엔드 생성.
+
+    Redis에 연결할 수 없으면 메모리 백엔드로 폴백합니다.
+    """
+    kind = (kind or ANALYSIS_CACHE_BACKEND).lower()
+    if kind == "sqlite":
+        return SQLiteCacheBackend(ANALYSIS_CACHE_SQLITE_PATH)
+    if kind == "redis":
+        if REDIS_URL:
+            backend = RedisCacheBackend(REDIS_URL)
+            if backend.is_available():
+                return backend
+        logger.warning("Analysis cache Redis unavailable, using in-memory backend")
+        return InMemoryCacheBackend()
+    if kind != "memory":
+        logger.warning(f"Unknown ANALYSIS_CACHE_BACKEND '{kind}', using in-memory backend")
+    return InMemoryCacheBackend()
@@ -3,15 +3,42 @@
 진단 결과, 온보딩 플랜 등을 캐싱
 """
 
-from typing import Dict, Any, Optional, Callable, TypeVar
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import Dict, Any, Awaitable, Optional, Callable, TypeVar, Union
+from collections import OrderedDict
+from datetime import datetime
+from dataclasses import dataclass, fields, is_dataclass
+import asyncio
+import contextvars
 import hashlib
+import inspect
 import json
 import logging
+import re
+import sys
+import threading
 import time
+import weakref
 from functools import wraps
 
+from .config import (
+    ANALYSIS_CACHE_STALE_GRACE_HOURS,
+    CACHE_SWEEP_INTERVAL,
+    GITHUB_CACHE_MAX_BYTES,
+    GITHUB_CACHE_MAX_ENTRIES,
+    IMMUTABLE_CACHE_MAX_BYTES,
+    IMMUTABLE_CACHE_MAX_ENTRIES,
+    IMMUTABLE_CACHE_TTL,
+    REANALYSIS_DEBOUNCE_SECONDS,
+)
+from .cache_backends import (
+    AnalysisCacheBackend,
+    CacheEntry,
+    InMemoryCacheBackend,
+    create_cache_backend,
+)
+from .singleflight import SingleFlight
+from .ttl_policy import analysis_ttl_hours
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TTL_SECONDS = 300  # 5분
@@ -26,65 +53,443 @@ class SimpleCacheEntry:
     """간단한 캐시 엔트리"""
     value: Any
     expires_at: float
+    size: int = 0
+    group: str = ""
+
+
+@dataclass
+class CacheGroupStats:
+    """함수(키 접두사)별 캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    값의 대략적인 메모리 크기(바이트).
+
+    컨테이너/데이터클래스/일반 객체 속성을 재귀적으로 합산합니다 (공유 객체는 한 번만).
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _seen) for item in value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return size + sum(estimate_size(getattr(value, f.name, None), _seen) for f in fields(value))
+    if hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), _seen)
+    return size
+
+
+def _group_of(key: str) -> str:
+    # cached 데코레이터 키는 "{module}.{func}:{hash}" 형식
+    return key.split(":", 1)[0] if ":" in key else "other"
 
 
 class SimpleCache:
-    """간단한 TTL 기반 인메모리 캐시"""
+    """
+    TTL + LRU 기반 인메모리 캐시 (스레드 안전).
+
+    - max_entries / max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - 만료 항목은 조회 시점과 백그라운드 sweeper(CACHE_SWEEP_INTERVAL)에서 정리
+    - 키 접두사(함수 이름)별 hit/miss/eviction/bytes 통계 제공
+    """
     
-    def __init__(self, ttl: int = DEFAULT_TTL_SECONDS):
-        self._store: Dict[str, SimpleCacheEntry] = {}
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        name: str = "",
+    ):
+        self._store: "OrderedDict[str, SimpleCacheEntry]" = OrderedDict()
         self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self.name = name
+        self._lock = threading.RLock()
+        self._bytes = 0
+        self._groups: Dict[str, CacheGroupStats] = {}
+        _register_cache(self)
     
     def _make_key(self, *args, **kwargs) -> str:
         key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
         return hashlib.md5(key_data.encode()).hexdigest()
     
-    def get(self, key: str) -> Optional[Any]:
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        if time.time() > entry.expires_at:
-            del self._store[key]
-            return None
-        return entry.value
+    def _group(self, name: str) -> CacheGroupStats:
+        stats = self._groups.get(name)
+        if stats is None:
+            stats = self._groups[name] = CacheGroupStats()
+        return stats
+    
+    def _remove(self, key: str) -> Optional[SimpleCacheEntry]:
+        entry = self._store.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+            stats = self._group(entry.group)
+            stats.entries -= 1
+            stats.bytes -= entry.size
+        return entry
+    
+    def get(self, key: str, record: bool = True) -> Optional[Any]:
+        """조회 (record=False면 hit/miss 통계에 반영하지 않음 - 내부 재확인용)."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                if record:
+                    self._group(_group_of(key)).misses += 1
+                return None
+            if time.time() > entry.expires_at:
+                self._remove(key)
+                stats = self._group(entry.group)
+                stats.expirations += 1
+                if record:
+                    stats.misses += 1
+                return None
+            self._store.move_to_end(key)
+            if record:
+                self._group(entry.group).hits += 1
+            return entry.value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         expires_at = time.time() + (ttl or self._ttl)
-        self._store[key] = SimpleCacheEntry(value=value, expires_at=expires_at)
+        size = estimate_size(value)
+        entry = SimpleCacheEntry(
+            value=value, expires_at=expires_at, size=size, group=_group_of(key)
+        )
+        with self._lock:
+            self._remove(key)
+            if self._max_bytes and size > self._max_bytes:
+                # 단일 항목이 상한보다 크면 저장하지 않음 (다른 항목 전부를 밀어내지 않도록)
+                self._group(entry.group).evictions += 1
+                return
+            self._store[key] = entry
+            self._bytes += size
+            stats = self._group(entry.group)
+            stats.entries += 1
+            stats.bytes += size
+            self._evict_over_limit()
+        _ensure_sweeper()
+    
+    def _evict_over_limit(self) -> None:
+        while self._store and (
+            (self._max_entries and len(self._store) > self._max_entries)
+            or (self._max_bytes and self._bytes > self._max_bytes)
+        ):
+            key = next(iter(self._store))
+            entry = self._remove(key)
+            self._group(entry.group).evictions += 1
     
     def delete(self, key: str) -> None:
-        self._store.pop(key, None)
+        with self._lock:
+            self._remove(key)
     
     def clear(self) -> None:
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+            self._bytes = 0
+            for stats in self._groups.values():
+                stats.entries = 0
+                stats.bytes = 0
+    
+    def sweep(self) -> int:
+        """만료 항목 일괄 정리. 정리된 항목 수 반환."""
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._store.items() if now > entry.expires_at]
+            for key in expired:
+                entry = self._remove(key)
+                self._group(entry.group).expirations += 1
+        if expired:
+            logger.debug("Cache sweep [%s]: %d expired", self.name, len(expired))
+        return len(expired)
+    
+    def __len__(self) -> int:
+        return len(self._store)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 및 함수별 통계."""
+        with self._lock:
+            functions = {
+                name: {
+                    "hits": s.hits,
+                    "misses": s.misses,
+                    "evictions": s.evictions,
+                    "expirations": s.expirations,
+                    "entries": s.entries,
+                    "bytes": s.bytes,
+                    "hit_ratio": round(s.hits / (s.hits + s.misses), 3) if s.hits + s.misses else 0.0,
+                }
+                for name, s in sorted(self._groups.items())
+            }
+            return {
+                "name": self.name,
+                "entries": len(self._store),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "ttl_seconds": self._ttl,
+                "hits": sum(s.hits for s in self._groups.values()),
+                "misses": sum(s.misses for s in self._groups.values()),
+                "evictions": sum(s.evictions for s in self._groups.values()),
+                "expirations": sum(s.expirations for s in self._groups.values()),
+                "functions": functions,
+            }
+
+
+# === 만료 항목 백그라운드 정리 ===
+
+_caches: "weakref.WeakSet[SimpleCache]" = weakref.WeakSet()
+_sweeper_lock = threading.Lock()
+_sweeper_thread: Optional[threading.Thread] = None
+
+
+def _register_cache(cache: SimpleCache) -> None:
+    with _sweeper_lock:
+        _caches.add(cache)
+
+
+def _sweep_loop() -> None:
+    while True:
+        time.sleep(CACHE_SWEEP_INTERVAL)
+        with _sweeper_lock:
+            caches = list(_caches)
+        for cache in caches:
+            try:
+                cache.sweep()
+            except Exception as e:  # sweeper는 어떤 경우에도 멈추지 않음
+                logger.warning(f"Cache sweep failed [{cache.name}]: {e}")
+
+
+def _ensure_sweeper() -> None:
+    """첫 저장 시 sweeper 데몬 스레드 시작 (프로세스당 1개)."""
+    global _sweeper_thread
+    if _sweeper_thread is not None or CACHE_SWEEP_INTERVAL <= 0:
+        return
+    with _sweeper_lock:
+        if _sweeper_thread is None:
+            _sweeper_thread = threading.Thread(
+                target=_sweep_loop, name="cache-sweeper", daemon=True
+            )
+            _sweeper_thread.start()
+
+
+def get_memory_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """이름이 있는 인메모리 캐시 전체의 통계."""
+    with _sweeper_lock:
+        caches = [c for c in _caches if c.name]
+    return {cache.name: cache.get_stats() for cache in caches}
 
 
 # GitHub API 전용 캐시
-github_cache = SimpleCache(ttl=DEFAULT_TTL_SECONDS)
+github_cache = SimpleCache(
+    ttl=DEFAULT_TTL_SECONDS,
+    max_entries=GITHUB_CACHE_MAX_ENTRIES,
+    max_bytes=GITHUB_CACHE_MAX_BYTES,
+    name="github",
+)
+
+# 커밋 SHA로 고정된 콘텐츠(트리, blob, README, 분석 결과) 캐시 - 내용이 바뀌지 않으므로 긴 TTL
+immutable_cache = SimpleCache(
+    ttl=IMMUTABLE_CACHE_TTL,
+    max_entries=IMMUTABLE_CACHE_MAX_ENTRIES,
+    max_bytes=IMMUTABLE_CACHE_MAX_BYTES,
+    name="immutable",
+)
+
+_COMMIT_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+
+
+def is_commit_sha(ref: Optional[str]) -> bool:
+    """ref가 전체 커밋 SHA(40자리 hex)인지 확인."""
+    return bool(ref) and bool(_COMMIT_SHA_RE.match(ref))
+
+
+# cached 데코레이터 공용 in-flight 병합기 (캐시 미스 동시 호출을 한 번의 실행으로 합침)
+cache_flight = SingleFlight("cache")
 
 
-def cached(cache: SimpleCache = github_cache, ttl: Optional[int] = None):
-    """함수 결과를 캐싱하는 데코레이터"""
+class _NegativeResult:
+    """'없음'으로 확정된 결과 (404 README/파일 등)를 나타내는 캐시 sentinel."""
+
+    def __repr__(self) -> str:
+        return "NEGATIVE"
+
+
+NEGATIVE = _NegativeResult()
+
+# 실행 중인 cached 호출의 negative 표시 (스레드/Task별로 분리)
+_negative_marker: contextvars.ContextVar[Optional[list]] = contextvars.ContextVar(
+    "negative_marker", default=None
+)
+
+
+def mark_negative() -> None:
+    """
+    현재 cached 함수의 None 반환을 '확실히 없음'으로 표시.
+
+    404 같은 확정 응답에서만 호출합니다. 표시된 None은 negative_ttl 동안 캐시되고,
+    타임아웃/일시적 오류로 인한 None은 지금처럼 캐시하지 않습니다.
+    """
+    marker = _negative_marker.get()
+    if marker is not None:
+        marker.append(True)
+
+
+def _store_result(cache: SimpleCache, key: str, result: Any, marker: list,
+                  ttl: Optional[int], negative_ttl: Optional[int]) -> None:
+    if result is not None:
+        cache.set(key, result, ttl)
+    elif marker and negative_ttl:
+        cache.set(key, NEGATIVE, negative_ttl)
+
+
+def cached(
+    cache: SimpleCache = github_cache,
+    ttl: Optional[Union[int, Callable[..., int]]] = None,
+    negative_ttl: Optional[int] = None,
+):
+    """
+    함수 결과를 캐싱하는 데코레이터 (async 함수 지원, 동시 미스는 singleflight로 병합)
+
+    ttl에 함수를 주면 호출 인자로 저장 시점의 TTL을 계산합니다 (저장소별 활동성 TTL 등).
+    negative_ttl을 주면 mark_negative()로 표시된 None 결과를 sentinel로 별도(짧은) TTL 동안 캐시합니다.
+    """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            key = f"{func.__module__}.{func.__name__}:" + cache._make_key(*args, **kwargs)
-            
-            cached_value = cache.get(key)
-            if cached_value is not None:
-                logger.debug("Cache HIT: %s", key[:50])
-                return cached_value
-            
-            logger.debug("Cache MISS: %s", key[:50])
-            result = func(*args, **kwargs)
-            cache.set(key, result, ttl)
-            return result
+        def make_key(*args, **kwargs) -> str:
+            return f"{func.__module__}.{func.__name__}:" + cache._make_key(*args, **kwargs)
+        
+        def ttl_for(args, kwargs) -> Optional[int]:
+            return ttl(*args, **kwargs) if callable(ttl) else ttl
+        
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                key = make_key(*args, **kwargs)
+                
+                cached_value = cache.get(key)
+                if cached_value is not None:
+                    logger.debug("Cache HIT: %s", key[:50])
+                    return None if cached_value is NEGATIVE else cached_value
+                
+                logger.debug("Cache MISS: %s", key[:50])
+                
+                async def load() -> T:
+                    # 앞선 실행이 방금 끝났다면 그 결과 사용
+                    cached_value = cache.get(key, record=False)
+                    if cached_value is not None:
+                        return None if cached_value is NEGATIVE else cached_value
+                    marker: list = []
+                    token = _negative_marker.set(marker)
+                    try:
+                        result = await func(*args, **kwargs)
+                    finally:
+                        _negative_marker.reset(token)
+                    _store_result(cache, key, result, marker, ttl_for(args, kwargs), negative_ttl)
+                    return result
+                
+                return await cache_flight.do_async(key, load)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> T:
+                key = make_key(*args, **kwargs)
+                
+                cached_value = cache.get(key)
+                if cached_value is not None:
+                    logger.debug("Cache HIT: %s", key[:50])
+                    return None if cached_value is NEGATIVE else cached_value
+                
+                logger.debug("Cache MISS: %s", key[:50])
+                
+                def load() -> T:
+                    cached_value = cache.get(key, record=False)
+                    if cached_value is not None:
+                        return None if cached_value is NEGATIVE else cached_value
+                    marker: list = []
+                    token = _negative_marker.set(marker)
+                    try:
+                        result = func(*args, **kwargs)
+                    finally:
+                        _negative_marker.reset(token)
+                    _store_result(cache, key, result, marker, ttl_for(args, kwargs), negative_ttl)
+                    return result
+                
+                return cache_flight.do(key, load)
         
         def invalidate(*args, **kwargs) -> None:
-            key = f"{func.__module__}.{func.__name__}:" + cache._make_key(*args, **kwargs)
-            cache.delete(key)
+            cache.delete(make_key(*args, **kwargs))
+        
+        def peek(*args, **kwargs) -> Optional[T]:
+            """캐시에 남은 결과만 조회 (없으면 None, 원본 함수는 호출하지 않음)."""
+            cached_value = cache.get(make_key(*args, **kwargs), record=False)
+            return None if cached_value is NEGATIVE else cached_value
         
         wrapper.invalidate = invalidate  # type: ignore
+        wrapper.peek = peek  # type: ignore
+        return wrapper
+    return decorator
+
+
+def cached_by_ref(
+    ttl: Optional[Union[int, Callable[..., int]]] = None,
+    ref_arg: str = "ref",
+    negative_ttl: Optional[int] = None,
+):
+    """
+    ref 인자에 따라 캐시를 고르는 데코레이터.
+
+    ref가 커밋 SHA면 immutable_cache(장기 보관), 브랜치/태그/HEAD면 github_cache(ttl)에 저장합니다.
+    negative 결과는 두 경우 모두 negative_ttl만큼만 보관합니다.
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(func)
+        by_ref = cached(cache=github_cache, ttl=ttl, negative_ttl=negative_ttl)(func)
+        by_sha = cached(cache=immutable_cache, negative_ttl=negative_ttl)(func)
+
+        def bind(args, kwargs):
+            # 위치/키워드 호출 형태와 무관하게 같은 캐시 키가 되도록 인자를 정규화
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            target = by_sha if is_commit_sha(bound.arguments.get(ref_arg)) else by_ref
+            return target, bound.args, bound.kwargs
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                target, args, kwargs = bind(args, kwargs)
+                return await target(*args, **kwargs)
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> T:
+                target, args, kwargs = bind(args, kwargs)
+                return target(*args, **kwargs)
+
+        def invalidate(*args, **kwargs) -> None:
+            _, args, kwargs = bind(args, kwargs)
+            by_ref.invalidate(*args, **kwargs)
+            by_sha.invalidate(*args, **kwargs)
+
+        def peek(*args, **kwargs) -> Optional[T]:
+            target, args, kwargs = bind(args, kwargs)
+            return target.peek(*args, **kwargs)
+
+        wrapper.invalidate = invalidate  # type: ignore
+        wrapper.peek = peek  # type: ignore
         return wrapper
     return decorator
 
@@ -93,30 +498,37 @@ def cached(cache: SimpleCache = github_cache, ttl: Optional[int] = None):
 
 
 @dataclass
-class CacheEntry:
-    """캐시 항목"""
-    key: str
+class AnalysisLookup:
+    """stale 허용 분석 결과 조회 결과."""
     data: Dict[str, Any]
-    cached_at: datetime
-    ttl_hours: int
-    access_count: int = 0
-    
-    def is_expired(self) -> bool:
-        """만료 여부"""
-        return datetime.now() - self.cached_at > timedelta(hours=self.ttl_hours)
-    
-    def access(self):
-        """접근 카운트 증가"""
-        self.access_count += 1
+    age_seconds: int
+    stale: bool
 
 
 class CacheManager:
-    """캐시 관리자"""
+    """캐시 관리자 (저장소는 교체 가능한 백엔드: memory / sqlite / redis)"""
     
-    def __init__(self, default_ttl_hours: int = 6):
-        self._cache: Dict[str, CacheEntry] = {}
+    def __init__(
+        self,
+        default_ttl_hours: int = 6,
+        backend: Optional[AnalysisCacheBackend] = None,
+        stale_grace_hours: float = 0,
+        ttl_resolver: Optional[Callable[[str, str], Optional[int]]] = None,
+    ):
+        self._backend = backend or InMemoryCacheBackend()
         self._default_ttl = default_ttl_hours
-        logger.info(f"CacheManager initialized (TTL: {default_ttl_hours}h)")
+        self._stale_grace = stale_grace_hours
+        # (owner, repo) → 저장소별 분석 결과 TTL(시간), None이면 기본 TTL
+        self._ttl_resolver = ttl_resolver
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._refresh_lock = threading.Lock()
+        logger.info(
+            f"CacheManager initialized (TTL: {default_ttl_hours}h, backend: {self._backend.name})"
+        )
+    
+    @property
+    def backend_type(self) -> str:
+        return self._backend.name
     
     def make_cache_key(
         self,
@@ -143,23 +555,34 @@ class CacheManager:
         
         return base_key
     
+    def get_entry(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        """
+        캐시 항목 조회 (접근 카운트 변경 없음).
+        
+        allow_stale이면 TTL이 지났어도 stale 유예 기간 안의 항목을 반환합니다.
+        """
+        entry = self._backend.get(key)
+        if entry is None:
+            return None
+        if entry.is_purgeable():
+            logger.info(f"Cache expired: {key}")
+            self._backend.delete(key)
+            return None
+        if entry.is_expired() and not allow_stale:
+            return None
+        return entry
+    
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """캐시 조회"""
-        entry = self._cache.get(key)
+        entry = self.get_entry(key)
         
         if entry is None:
             logger.debug(f"Cache miss: {key}")
             return None
         
-        # 만료 체크
-        if entry.is_expired():
-            logger.info(f"Cache expired: {key}")
-            del self._cache[key]
-            return None
-        
         # 접근 카운트 증가
-        entry.access()
-        logger.debug(f"Cache hit: {key} (access_count: {entry.access_count})")
+        self._backend.record_access(key)
+        logger.debug(f"Cache hit: {key} (access_count: {entry.access_count + 1})")
         
         return entry.data
     
@@ -176,48 +599,40 @@ class CacheManager:
             key=key,
             data=data,
             cached_at=datetime.now(),
-            ttl_hours=ttl
+            ttl_hours=ttl,
+            grace_hours=self._stale_grace,
         )
         
-        self._cache[key] = entry
+        self._backend.set(entry)
         logger.info(f"Cache set: {key} (TTL: {ttl}h)")
     
-    def invalidate(self, key: str):
+    def invalidate(self, key: str) -> bool:
         """캐시 무효화"""
-        if key in self._cache:
-            del self._cache[key]
+        existed = self._backend.delete(key)
+        if existed:
             logger.info(f"Cache invalidated: {key}")
+        return existed
     
     def invalidate_repo(self, owner: str, repo: str):
         """특정 저장소의 모든 캐시 무효화"""
-        prefix = f"{owner}/{repo}@"
-        keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-        
-        for key in keys_to_delete:
-            del self._cache[key]
+        count = self._backend.delete_prefix(f"{owner}/{repo}@")
         
-        if keys_to_delete:
-            logger.info(f"Invalidated {len(keys_to_delete)} cache entries for {owner}/{repo}")
+        if count:
+            logger.info(f"Invalidated {count} cache entries for {owner}/{repo}")
     
     def cleanup_expired(self):
         """만료된 캐시 정리"""
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del self._cache[key]
+        count = self._backend.delete_expired()
         
-        if expired_keys:
-            logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+        if count:
+            logger.info(f"Cleaned up {count} expired cache entries")
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계"""
-        total_entries = len(self._cache)
-        total_accesses = sum(entry.access_count for entry in self._cache.values())
+        total_entries, total_accesses = self._backend.stats()
         
         return {
+            "backend": self._backend.name,
             "total_entries": total_entries,
             "total_accesses": total_accesses,
             "avg_access_per_entry": total_accesses / total_entries if total_entries > 0 else 0
@@ -225,7 +640,7 @@ class CacheManager:
     
     def clear_all(self):
         """모든 캐시 삭제 (테스트용)"""
-        self._cache.clear()
+        self._backend.clear()
         logger.warning("All cache cleared")
     
     
@@ -248,6 +663,55 @@ class CacheManager:
             logger.debug(f"Analysis cache MISS: {owner}/{repo}@{ref}")
         return result
     
+    def lookup_analysis(self, owner: str, repo: str, ref: str = "main") -> Optional[AnalysisLookup]:
+        """
+        stale-while-revalidate용 분석 결과 조회.
+        
+        TTL 안이면 stale=False, TTL이 지났지만 유예 기간 안이면 stale=True로 반환합니다.
+        """
+        key = self.make_repo_key(owner, repo, ref)
+        entry = self.get_entry(key, allow_stale=True)
+        if entry is None:
+            logger.debug(f"Analysis cache MISS: {owner}/{repo}@{ref}")
+            return None
+        self._backend.record_access(key)
+        stale = entry.is_expired()
+        logger.info(f"Analysis cache {'STALE' if stale else 'HIT'}: {owner}/{repo}@{ref}")
+        return AnalysisLookup(data=entry.data, age_seconds=entry.age_seconds, stale=stale)
+    
+    def refresh_in_background(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        refresh: Callable[[], Awaitable[Any]],
+    ) -> bool:
+        """
+        stale 항목 백그라운드 갱신 예약 (키당 동시에 하나만).
+        
+        refresh는 새 결과를 계산해 set_analysis까지 수행하는 코루틴 함수입니다.
+        이미 갱신 중이면 예약하지 않고 False를 반환합니다.
+        """
+        key = self.make_repo_key(owner, repo, ref)
+        loop = asyncio.get_running_loop()
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            task = loop.create_task(self._run_refresh(key, refresh))
+            self._refreshing[key] = task
+        return True
+    
+    async def _run_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            await refresh()
+            logger.info(f"Analysis cache REFRESHED: {key}")
+        except Exception as e:
+            # 실패해도 stale 항목은 유예 기간 동안 계속 제공
+            logger.warning(f"Background refresh failed for {key}: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.pop(key, None)
+    
     def set_analysis(
         self, 
         owner: str, 
@@ -256,16 +720,21 @@ class CacheManager:
         result: Dict[str, Any],
         ttl_hours: Optional[int] = None
     ) -> None:
-        """분석 결과 저장 (AnalysisCache 호환)"""
+        """
+        분석 결과 저장 (AnalysisCache 호환)
+        
+        ttl_hours를 주지 않으면 ttl_resolver의 저장소별 TTL, 그것도 없으면 기본 TTL을 사용합니다.
+        """
         key = self.make_repo_key(owner, repo, ref)
+        if ttl_hours is None and self._ttl_resolver is not None:
+            ttl_hours = self._ttl_resolver(owner, repo)
         self.set(key, result, ttl_hours)
         logger.info(f"Analysis cache SET: {owner}/{repo}@{ref}")
     
     def invalidate_analysis(self, owner: str, repo: str, ref: str = "main") -> bool:
         """특정 저장소 캐시 무효화 (AnalysisCache 호환)"""
         key = self.make_repo_key(owner, repo, ref)
-        existed = key in self._cache
-        self.invalidate(key)
+        existed = self.invalidate(key)
         if existed:
             logger.info(f"Analysis cache INVALIDATED: {owner}/{repo}@{ref}")
         return existed
@@ -273,12 +742,10 @@ class CacheManager:
     def invalidate_all_refs(self, owner: str, repo: str) -> int:
         """특정 저장소의 모든 ref 캐시 무효화 (AnalysisCache 호환)"""
         prefix = f"analysis:{owner.lower()}/{repo.lower()}:"
-        keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-        for key in keys_to_delete:
-            del self._cache[key]
-        if keys_to_delete:
-            logger.info(f"Analysis cache INVALIDATED ALL: {owner}/{repo} ({len(keys_to_delete)} entries)")
-        return len(keys_to_delete)
+        count = self._backend.delete_prefix(prefix)
+        if count:
+            logger.info(f"Analysis cache INVALIDATED ALL: {owner}/{repo} ({count} entries)")
+        return count
     
     def clear(self):
         """캐시 전체 삭제 (AnalysisCache 호환)"""
@@ -293,7 +760,12 @@ def get_cache_manager() -> CacheManager:
     """캐시 관리자 싱글톤 인스턴스 반환"""
     global _cache_manager_instance
     if _cache_manager_instance is None:
-        _cache_manager_instance = CacheManager(default_ttl_hours=24)  # AnalysisCache 기본 TTL과 동일
+        _cache_manager_instance = CacheManager(
+            default_ttl_hours=24,  # AnalysisCache 기본 TTL과 동일
+            backend=create_cache_backend(),
+            stale_grace_hours=ANALYSIS_CACHE_STALE_GRACE_HOURS,
+            ttl_resolver=analysis_ttl_hours,
+        )
     return _cache_manager_instance
 
 analysis_cache = get_cache_manager()
@@ -306,13 +778,15 @@ class CacheInvalidationTrigger:
     캐시 자동 무효화 트리거.
     
     GitHub webhook 이벤트나 주기적 검사를 통해
-    캐시를 자동으로 무효화합니다.
+    캐시를 자동으로 무효화하고, push 후 재분석을 debounce하여 예약합니다.
     """
     
-    def __init__(self, cache: CacheManager):
+    def __init__(self, cache: CacheManager, debounce_seconds: float = REANALYSIS_DEBOUNCE_SECONDS):
         self._cache = cache
         self._last_check: Dict[str, float] = {}
         self._check_interval = 3600  # 1시간
+        self._debounce = debounce_seconds
+        self._pending_reanalysis: Dict[str, asyncio.Task] = {}
     
     def should_invalidate_on_push(
         self, 
@@ -325,7 +799,7 @@ class CacheInvalidationTrigger:
         Push 이벤트 시 캐시 무효화 여부 결정.
         """
         key = self._cache.make_repo_key(owner, repo, ref)
-        entry = self._cache._cache.get(key)
+        entry = self._cache.get_entry(key)
         
         if entry is None:
             return False
@@ -351,6 +825,49 @@ class CacheInvalidationTrigger:
             return self._cache.invalidate_analysis(owner, repo, ref)
         return False
     
+    def has_pending_reanalysis(self, owner: str, repo: str, ref: str = "main") -> bool:
+        """재분석 예약이 대기 중인지 확인."""
+        return self._cache.make_repo_key(owner, repo, ref) in self._pending_reanalysis
+    
+    def schedule_reanalysis(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        reanalyze: Callable[[], Awaitable[Any]],
+    ) -> bool:
+        """
+        Push 후 백그라운드 재분석 예약 (저장소+ref당 debounce).
+        
+        대기 중에 같은 저장소로 push가 다시 오면 타이머를 처음부터 다시 시작하므로
+        연속 push에도 마지막 push 이후 한 번만 실행됩니다. 실행은 refresh_in_background를
+        거치므로 stale 갱신과도 겹치지 않습니다.
+        새로 예약했으면 True, 대기 중인 예약을 미뤘으면 False를 반환합니다.
+        """
+        key = self._cache.make_repo_key(owner, repo, ref)
+        loop = asyncio.get_running_loop()
+        pending = self._pending_reanalysis.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+        self._pending_reanalysis[key] = loop.create_task(
+            self._run_reanalysis(key, owner, repo, ref, reanalyze)
+        )
+        return pending is None
+    
+    async def _run_reanalysis(
+        self,
+        key: str,
+        owner: str,
+        repo: str,
+        ref: str,
+        reanalyze: Callable[[], Awaitable[Any]],
+    ) -> None:
+        await asyncio.sleep(self._debounce)
+        if self._pending_reanalysis.get(key) is asyncio.current_task():
+            del self._pending_reanalysis[key]
+        logger.info(f"Push re-analysis starting: {owner}/{repo}@{ref}")
+        self._cache.refresh_in_background(owner, repo, ref, reanalyze)
+    
     def trigger_periodic_check(
         self, 
         owner: str, 
@@ -0,0 +1,262 @@
+"""
+GitHub REST 조건부 요청 캐시 (ETag / Last-Modified)
+만료된 응답은 If-None-Match / If-Modified-Since로 재검증하여 304 시 본문을 재사용
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .config import GITHUB_ETAG_CACHE_MAX_ENTRIES, GITHUB_ETAG_FRESH_SECONDS
+from .http_client import get_http_client
+from .async_http_client import get_async_http_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConditionalEntry:
+    """검증자(ETag/Last-Modified)와 함께 저장된 응답 본문."""
+    content: bytes
+    encoding: Optional[str]
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+
+
+@dataclass
+class CachedResponse:
+    """캐시에서 재구성한 응답 (requests/httpx 응답의 읽기 인터페이스만 제공)."""
+    content: bytes
+    encoding: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    status_code: int = 200
+    revalidated: bool = False
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class ConditionalRequestCache:
+    """
+    조건부 요청용 LRU 캐시.
+
+    - hit: 신선 기간 내 → 네트워크 요청 없음
+    - revalidated: 304 Not Modified → 본문 재전송 없음, primary rate limit 미차감
+    - miss: 200 전체 응답 수신
+    """
+
+    def __init__(
+        self,
+        max_entries: int = GITHUB_ETAG_CACHE_MAX_ENTRIES,
+        fresh_seconds: int = GITHUB_ETAG_FRESH_SECONDS,
+    ):
+        self._entries: "OrderedDict[str, ConditionalEntry]" = OrderedDict()
+        self._max_entries = max_entries
+        self._fresh_seconds = fresh_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    @staticmethod
+    def make_key(
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> str:
+        """URL + 쿼리 + 응답 형태/인증 헤더 기준 키 (토큰별로 보이는 내용이 다를 수 있음)."""
+        headers = headers or {}
+        key_data = json.dumps(
+            {
+                "url": url,
+                "params": dict(params or {}),
+                "accept": headers.get("Accept"),
+                "auth": headers.get("Authorization"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def prepare(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[str, Optional[CachedResponse], Dict[str, str]]:
+        """
+        요청 전 단계.
+
+        Returns:
+            (키, 신선한 캐시 응답 또는 None, 검증자가 추가된 요청 헤더)
+        """
+        key = self.make_key(url, headers, params)
+        request_headers = dict(headers or {})
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return key, None, request_headers
+
+            self._entries.move_to_end(key)
+            if time.time() < entry.fresh_until:
+                self._hits += 1
+                return key, self._to_response(entry), request_headers
+
+        if entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+        return key, None, request_headers
+
+    def complete(self, key: str, resp: Any, fresh_seconds: Optional[int] = None) -> Optional[Any]:
+        """
+        응답 수신 후 단계.
+
+        304면 저장된 본문으로 응답을 재구성하고 신선 기간을 갱신합니다.
+        200이면 검증자가 있을 때만 저장합니다. 그 외 응답은 그대로 반환합니다.
+        304인데 그 사이 엔트리가 축출되어 본문이 없으면 None을 반환하므로
+        호출자는 검증자 없이 다시 요청해야 합니다.
+        """
+        ttl = self._fresh_seconds if fresh_seconds is None else fresh_seconds
+
+        if resp.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.fresh_until = time.time() + ttl
+                    self._revalidated += 1
+                    self._bytes_saved += len(entry.content)
+                    return self._to_response(entry, revalidated=True)
+            # 검증자를 보낸 뒤 응답 전에 엔트리가 축출된 경우 (빈 304 본문은 쓸 수 없음)
+            logger.info("304 for evicted conditional cache entry, refetching without validators")
+            return None
+
+        if resp.status_code != 200:
+            return resp
+
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with self._lock:
+            self._misses += 1
+            if not etag and not last_modified:
+                return resp
+            self._entries[key] = ConditionalEntry(
+                content=resp.content,
+                encoding=getattr(resp, "encoding", None),
+                headers={
+                    k: v for k, v in resp.headers.items()
+                    if k.lower() in ("content-type", "etag", "last-modified")
+                },
+                etag=etag,
+                last_modified=last_modified,
+                fresh_until=time.time() + ttl,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return resp
+
+    @staticmethod
+    def _to_response(entry: ConditionalEntry, revalidated: bool = False) -> CachedResponse:
+        return CachedResponse(
+            content=entry.content,
+            encoding=entry.encoding,
+            headers=dict(entry.headers),
+            revalidated=revalidated,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hit/revalidate/miss 통계."""
+        with self._lock:
+            total = self._hits + self._revalidated + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "revalidated": self._revalidated,
+                "misses": self._misses,
+                "bytes_saved": self._bytes_saved,
+                "network_avoided_ratio": (
+                    round((self._hits + self._revalidated) / total, 4) if total else 0.0
+                ),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# === 싱글톤 인스턴스 ===
+_conditional_cache_instance: Optional[ConditionalRequestCache] = None
+_instance_lock = threading.Lock()
+
+
+def get_conditional_cache() -> ConditionalRequestCache:
+    """조건부 요청 캐시 싱글톤 인스턴스 반환"""
+    global _conditional_cache_instance
+    if _conditional_cache_instance is None:
+        with _instance_lock:
+            if _conditional_cache_instance is None:
+                _conditional_cache_instance = ConditionalRequestCache()
+    return _conditional_cache_instance
+
+
+def conditional_get(
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    fresh_seconds: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    """공유 세션 + 조건부 요청 GET."""
+    cache = get_conditional_cache()
+    key, fresh, request_headers = cache.prepare(url, headers, params)
+    if fresh is not None:
+        return fresh
+    resp = get_http_client().get(url, headers=request_headers, params=params, **kwargs)
+    result = cache.complete(key, resp, fresh_seconds)
+    if result is None:
+        resp = get_http_client().get(url, headers=dict(headers or {}), params=params, **kwargs)
+        result = cache.complete(key, resp, fresh_seconds)
+    return result if result is not None else resp
+
+
+async def conditional_get_async(
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    params: Optional[Mapping[str, Any]] = None,
+    fresh_seconds: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    """공유 AsyncClient + 조건부 요청 GET."""
+    cache = get_conditional_cache()
+    key, fresh, request_headers = cache.prepare(url, headers, params)
+    if fresh is not None:
+        return fresh
+    resp = await get_async_http_client().get(
+        url, headers=request_headers, params=params, **kwargs
+    )
+    result = cache.complete(key, resp, fresh_seconds)
+    if result is None:
+        resp = await get_async_http_client().get(
+            url, headers=dict(headers or {}), params=params, **kwargs
+        )
+        result = cache.complete(key, resp, fresh_seconds)
+    return result if result is not None else resp
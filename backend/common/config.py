@@ -6,10 +6,90 @@ from dotenv import load_dotenv
 load_dotenv()
 
 GITHUB_TOKEN: str | None = os.getenv("GITHUB_TOKEN")
+# 토큰 풀 (쉼표 구분), 없으면 GITHUB_TOKEN 하나만 사용
+GITHUB_TOKENS: list[str] = [
+    t.strip() for t in os.getenv("GITHUB_TOKENS", "").split(",") if t.strip()
+] or ([GITHUB_TOKEN] if GITHUB_TOKEN else [])
 GITHUB_API_BASE: str = os.getenv("GITHUB_API_BASE", "https://api.github.com")
 
 DEFAULT_ACTIVITY_DAYS: int = 90
 
+# GitHub HTTP Pool Settings
+GITHUB_HTTP_POOL_SIZE: int = int(os.getenv("GITHUB_HTTP_POOL_SIZE", "20"))
+GITHUB_HTTP_MAX_RETRIES: int = int(os.getenv("GITHUB_HTTP_MAX_RETRIES", "3"))
+GITHUB_HTTP_BACKOFF: float = float(os.getenv("GITHUB_HTTP_BACKOFF", "0.5"))
+GITHUB_ETAG_CACHE_MAX_ENTRIES: int = int(os.getenv("GITHUB_ETAG_CACHE_MAX_ENTRIES", "2000"))
+GITHUB_ETAG_FRESH_SECONDS: int = int(os.getenv("GITHUB_ETAG_FRESH_SECONDS", "60"))
+
+# GitHub Rate Limit Scheduler Settings
+GITHUB_RATE_LIMIT_RPS: float = float(os.getenv("GITHUB_RATE_LIMIT_RPS", "10"))
+GITHUB_RATE_LIMIT_BURST: int = int(os.getenv("GITHUB_RATE_LIMIT_BURST", "20"))
+GITHUB_RATE_LIMIT_RESERVE: int = int(os.getenv("GITHUB_RATE_LIMIT_RESERVE", "10"))
+GITHUB_RATE_LIMIT_MAX_WAIT: float = float(os.getenv("GITHUB_RATE_LIMIT_MAX_WAIT", "300"))
+# 풀 밖 호출자 토큰(사용자 PAT)별 예산 상태 보관 수 (초과 시 LRU 제거)
+GITHUB_CALLER_TOKEN_MAX_ENTRIES: int = int(os.getenv("GITHUB_CALLER_TOKEN_MAX_ENTRIES", "256"))
+
+# GitHub Fetch Mode: "api" (트리 + 파일별 contents API) | "archive" (tarball 1회 스트리밍)
+GITHUB_FETCH_MODE: str = os.getenv("GITHUB_FETCH_MODE", "api")
+GITHUB_ARCHIVE_MAX_FILE_BYTES: int = int(os.getenv("GITHUB_ARCHIVE_MAX_FILE_BYTES", "5000000"))
+
+# Commit SHA 기준 캐시: ref→SHA 조회만 짧게, SHA로 고정된 콘텐츠는 사실상 영구 보관
+GITHUB_REF_RESOLVE_TTL: int = int(os.getenv("GITHUB_REF_RESOLVE_TTL", "60"))
+IMMUTABLE_CACHE_TTL: int = int(os.getenv("IMMUTABLE_CACHE_TTL", "2592000"))  # 30 days
+
+# 인메모리 함수 결과 캐시 상한 (초과 시 LRU 제거) 및 만료 항목 정리 주기
+GITHUB_CACHE_MAX_ENTRIES: int = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", "5000"))
+GITHUB_CACHE_MAX_BYTES: int = int(os.getenv("GITHUB_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+IMMUTABLE_CACHE_MAX_ENTRIES: int = int(os.getenv("IMMUTABLE_CACHE_MAX_ENTRIES", "20000"))
+IMMUTABLE_CACHE_MAX_BYTES: int = int(os.getenv("IMMUTABLE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+CACHE_SWEEP_INTERVAL: int = int(os.getenv("CACHE_SWEEP_INTERVAL", "60"))
+# 없는 README/파일, 404/비공개 저장소 응답을 기억하는 시간 (봇의 반복 조회로 인한 쿼터 소모 방지)
+NEGATIVE_CACHE_TTL: int = int(os.getenv("NEGATIVE_CACHE_TTL", "120"))
+# 분석기별 부분 결과 캐시: docs/structure/dependencies는 SHA 기준 immutable, activity만 짧게
+ANALYSIS_PART_ACTIVITY_TTL: int = int(os.getenv("ANALYSIS_PART_ACTIVITY_TTL", "900"))
+# Push webhook 후 재분석 예약: 이 시간 동안 추가 push가 없을 때 저장소당 한 번만 실행
+REANALYSIS_DEBOUNCE_SECONDS: float = float(os.getenv("REANALYSIS_DEBOUNCE_SECONDS", "30"))
+# 활동성 기반 TTL: archived/휴면 저장소는 길게, 커밋이 잦은 저장소는 짧게 (false면 고정 TTL)
+ADAPTIVE_TTL_ENABLED: bool = os.getenv("ADAPTIVE_TTL_ENABLED", "true").lower() == "true"
+REPO_ACTIVITY_PROFILE_MAX_ENTRIES: int = int(os.getenv("REPO_ACTIVITY_PROFILE_MAX_ENTRIES", "10000"))
+# 증분 재진단: 새 커밋에서는 입력 지문(README/매니페스트 blob SHA, 트리)이 바뀐 분석기만 다시 계산하고
+# 활동성은 저장해 둔 목록에 변경분만 합침. 합친 목록은 이 시간이 지나면 전체 조회로 다시 맞춤
+INCREMENTAL_DIAGNOSIS_ENABLED: bool = os.getenv("INCREMENTAL_DIAGNOSIS_ENABLED", "true").lower() == "true"
+ACTIVITY_DELTA_MAX_AGE: int = int(os.getenv("ACTIVITY_DELTA_MAX_AGE", str(7 * 24 * 3600)))
+# git blob SHA 기준 콘텐츠 캐시: 이보다 큰 blob은 원문 대신 파싱 결과만 보관
+BLOB_CACHE_MAX_CONTENT_BYTES: int = int(os.getenv("BLOB_CACHE_MAX_CONTENT_BYTES", str(1024 * 1024)))
+
+# 프로세스 전역 블로킹 작업 실행기 (동기 LLM/HTTP 호출, CPU 분석) 스레드 상한
+SHARED_EXECUTOR_MAX_WORKERS: int = int(os.getenv("SHARED_EXECUTOR_MAX_WORKERS", "16"))
+# POST /api/analyze 작업 큐: 동시에 실행하는 분석 수 상한, 보관하는 작업 기록 수
+ANALYSIS_JOB_WORKERS: int = int(os.getenv("ANALYSIS_JOB_WORKERS", "4"))
+ANALYSIS_JOB_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_JOB_MAX_ENTRIES", "500"))
+# LLM 요약을 진단 응답 이후 백그라운드에서 생성하는 기본값 (요약을 나중에 전달할 수 있는
+# /api/analyze, SSE 스트림은 user_context의 defer_llm_summary로 호출마다 켬)
+DEFER_LLM_SUMMARY: bool = os.getenv("DEFER_LLM_SUMMARY", "false").lower() == "true"
+SUMMARY_JOB_MAX_ENTRIES: int = int(os.getenv("SUMMARY_JOB_MAX_ENTRIES", "1000"))
+# SSE 스트림이 완료 이벤트 후 요약 이벤트를 기다리는 최대 시간
+SUMMARY_STREAM_WAIT_SECONDS: float = float(os.getenv("SUMMARY_STREAM_WAIT_SECONDS", "60"))
+
+# 요청 마감 (초, 0이면 비활성). quick 분석과 priority=speed 요청은 QUICK_ANALYSIS_TIME_BUDGET 안에
+# 끝나지 않은 분석기를 취소하고 부분 결과를 반환
+QUICK_ANALYSIS_TIME_BUDGET: float = float(os.getenv("QUICK_ANALYSIS_TIME_BUDGET", "10"))
+ANALYSIS_TIME_BUDGET: float = float(os.getenv("ANALYSIS_TIME_BUDGET", "0"))
+# 마감 직전 시작한 HTTP/LLM 호출에 허용하는 추가 시간 (단계 취소가 먼저 일어나도록)
+DEADLINE_CLIENT_GRACE_SECONDS: float = float(os.getenv("DEADLINE_CLIENT_GRACE_SECONDS", "0.25"))
+
+# 대량 진단 실행기 (backend/scripts/bulk_runner.py): 동시 진단 수, 저장소당 시도 횟수,
+# 남은 GitHub core 예산이 이보다 적으면 reset까지(최대 BULK_DIAGNOSIS_MAX_PAUSE초) 새 진단을 멈춤
+BULK_DIAGNOSIS_CONCURRENCY: int = int(os.getenv("BULK_DIAGNOSIS_CONCURRENCY", "4"))
+BULK_DIAGNOSIS_MAX_ATTEMPTS: int = int(os.getenv("BULK_DIAGNOSIS_MAX_ATTEMPTS", "3"))
+BULK_DIAGNOSIS_MIN_RATE_BUDGET: int = int(os.getenv("BULK_DIAGNOSIS_MIN_RATE_BUDGET", "100"))
+BULK_DIAGNOSIS_MAX_PAUSE: float = float(os.getenv("BULK_DIAGNOSIS_MAX_PAUSE", "900"))
+
+# GitHub GraphQL Batch Settings (쿼리당 저장소 수, 노드 한도와 함께 청크 크기 결정)
+GITHUB_GRAPHQL_BATCH_MAX_REPOS: int = int(os.getenv("GITHUB_GRAPHQL_BATCH_MAX_REPOS", "10"))
+# 합성 쿼리 하나에 넣는 object(expression:) blob 조회 수 상한 (모노레포 중첩 매니페스트는 여러 쿼리로 나눔)
+GITHUB_GRAPHQL_MAX_BLOBS_PER_QUERY: int = int(os.getenv("GITHUB_GRAPHQL_MAX_BLOBS_PER_QUERY", "50"))
+
 # LLM Settings
 LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai_compatible")
 LLM_API_BASE: str | None = os.getenv("LLM_API_BASE", "http://localhost:8000/v1")
@@ -21,6 +101,15 @@ REDIS_URL: str | None = os.getenv("REDIS_URL", "redis://localhost:6379")
 REDIS_CONVERSATION_TTL: int = int(os.getenv("REDIS_CONVERSATION_TTL", "604800"))  # 7 days
 REDIS_SUMMARY_TTL: int = int(os.getenv("REDIS_SUMMARY_TTL", "2592000"))  # 30 days
 
+# 분석 결과 캐시 백엔드: "memory" (프로세스 로컬) | "sqlite" (로컬 파일) | "redis" (REDIS_URL)
+ANALYSIS_CACHE_BACKEND: str = os.getenv("ANALYSIS_CACHE_BACKEND", "memory")
+ANALYSIS_CACHE_SQLITE_PATH: str = os.getenv("ANALYSIS_CACHE_SQLITE_PATH", ".cache/analysis_cache.db")
+# 만료된 분석 결과를 stale로 제공하며 백그라운드 갱신하는 유예 시간 (0이면 비활성)
+ANALYSIS_CACHE_STALE_GRACE_HOURS: float = float(os.getenv("ANALYSIS_CACHE_STALE_GRACE_HOURS", "6"))
+# 저장소 건강도 시계열: 진단마다 점수/활동성 지표를 (날짜, 커밋 SHA) 키로 추가하는 로컬 SQLite 파일
+# (빈 값이면 기록하지 않음, GET /api/analyze/trend가 GitHub 호출 없이 조회)
+HEALTH_HISTORY_PATH: str = os.getenv("HEALTH_HISTORY_PATH", ".cache/health_history.db")
+
 # Security Agent LLM Settings
 SECURITY_LLM_BASE_URL: str | None = os.getenv("LLM_API_BASE")
 SECURITY_LLM_API_KEY: str | None = os.getenv("LLM_API_KEY")
@@ -0,0 +1,116 @@
+"""
+요청 단위 마감 시간(deadline) 전파
+진입점(/api/analyze, run_supervisor, execute_full_path)에서 연 deadline_scope()의 마감 시각이
+contextvar로 태스크/run_blocking까지 전파
+HTTP/LLM 클라이언트는 clamp_timeout()으로 호출 타임아웃을 남은 시간에 맞추고,
+단계 스케줄러는 마감까지 끝나지 않은 분석기를 취소해 부분 결과를 반환
+"""
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .config import DEADLINE_CLIENT_GRACE_SECONDS
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 마감이 지나 더 이상 호출을 시작할 수 없음."""
+
+
+@dataclass
+class Deadline:
+    """마감 범위 (expires_at은 time.monotonic() 기준)."""
+    expires_at: float
+    parent: Optional["Deadline"] = field(default=None, repr=False)
+    missing_parts: List[str] = field(default_factory=list)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.missing_parts)
+
+    def mark_partial(self, parts: Iterable[str]) -> None:
+        """마감으로 빠진 결과 기록 (바깥 범위에도 전달)."""
+        parts = list(parts)
+        scope: Optional[Deadline] = self
+        while scope is not None:
+            for part in parts:
+                if part not in scope.missing_parts:
+                    scope.missing_parts.append(part)
+            scope = scope.parent
+
+
+# 현재 요청의 마감 (태스크/run_blocking으로 컨텍스트와 함께 전파)
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    블록 안의 호출에 seconds초 마감 적용 (바깥 마감이 더 이르면 그쪽을 따름).
+
+    seconds가 None이거나 0 이하면 새 범위를 만들지 않고 바깥 마감(없으면 None)을 그대로 씁니다.
+    """
+    parent = _current_deadline.get()
+    if seconds is None or seconds <= 0:
+        yield parent
+        return
+    expires_at = time.monotonic() + seconds
+    if parent is not None:
+        expires_at = min(expires_at, parent.expires_at)
+    scope = Deadline(expires_at, parent)
+    token = _current_deadline.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def remaining_seconds() -> Optional[float]:
+    """현재 마감까지 남은 시간 (마감이 없으면 None)."""
+    scope = _current_deadline.get()
+    return None if scope is None else scope.remaining()
+
+
+def clamp_timeout(timeout: Any) -> Any:
+    """
+    클라이언트 호출 타임아웃을 남은 시간(+DEADLINE_CLIENT_GRACE_SECONDS)으로 제한.
+
+    마감이 없으면 그대로 반환하고, 이미 지났으면 DeadlineExceeded를 올립니다.
+    숫자/None/(connect, read) 튜플만 조정하고 그 밖의 타임아웃 객체는 그대로 둡니다.
+    """
+    scope = _current_deadline.get()
+    if scope is None:
+        return timeout
+    budget = scope.expires_at - time.monotonic() + DEADLINE_CLIENT_GRACE_SECONDS
+    if budget <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    if timeout is None:
+        return budget
+    if isinstance(timeout, (int, float)):
+        return min(timeout, budget)
+    if isinstance(timeout, tuple):
+        return tuple(budget if t is None else min(t, budget) for t in timeout)
+    return timeout
+
+
+def detached_context() -> contextvars.Context:
+    """마감을 뺀 현재 컨텍스트 복사본 (응답 이후에도 계속되는 백그라운드 작업용)."""
+    ctx = contextvars.copy_context()
+    ctx.run(_current_deadline.set, None)
+    return ctx
@@ -1,16 +1,33 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+import asyncio
 import datetime as dt
+import httpx
 import requests
 import logging
 
-from .config import GITHUB_API_BASE, GITHUB_TOKEN, DEFAULT_ACTIVITY_DAYS
-from .cache_manager import cached, github_cache
-from .errors import GitHubError, RepoNotFoundError, RepoPrivateError
+from .config import (
+    DEFAULT_ACTIVITY_DAYS,
+    GITHUB_API_BASE,
+    GITHUB_REF_RESOLVE_TTL,
+    GITHUB_TOKEN,
+    NEGATIVE_CACHE_TTL,
+)
+from .cache_manager import cached, github_cache, is_commit_sha, mark_negative
+from .http_client import get_http_client
+from .async_http_client import get_async_http_client
+from .conditional_cache import conditional_get, conditional_get_async
+from .rate_limiter import get_rate_limit_scheduler
+from .ttl_policy import repo_ttl
+from .graphql_composer import BatchQueryComposer, RepoQueryComposer, build_repository_query
+from .errors import ErrorKind, GitHubError, RepoNotFoundError, RepoPrivateError
 
 logger = logging.getLogger(__name__)
 
+# 레거시 이름 호환 (기존 코드에서 GitHubClientError로 참조)
+GitHubClientError = GitHubError
+
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
 
@@ -39,74 +56,96 @@ def check_repo_access(owner: str, repo: str) -> RepoAccessResult:
     repo_id = f"{owner}/{repo}"
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
     
+    denied = github_cache.get(_access_denied_key(owner, repo))
+    if denied is not None:
+        return denied
+    
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=10)
-        
-        if resp.status_code == 200:
-            data = resp.json()
-            return RepoAccessResult(
-                accessible=True,
-                owner=owner,
-                repo=repo,
-                repo_id=repo_id,
-                status_code=200,
-                reason="ok",
-                default_branch=data.get("default_branch", "main"),
-            )
-        elif resp.status_code == 404:
-            return RepoAccessResult(
-                accessible=False,
-                owner=owner,
-                repo=repo,
-                repo_id=repo_id,
-                status_code=404,
-                reason="not_found",
-            )
-        elif resp.status_code == 403:
-            # Check if rate limit or private repo
-            if "rate limit" in resp.text.lower():
-                return RepoAccessResult(
-                    accessible=False,
-                    owner=owner,
-                    repo=repo,
-                    repo_id=repo_id,
-                    status_code=403,
-                    reason="rate_limit",
-                )
+        resp = get_http_client().get(url, headers=_build_headers(), timeout=10)
+        return _remember_access_denial(_build_access_result(owner, repo, resp))
+    except requests.Timeout:
+        return _build_access_result(owner, repo, None, reason="timeout")
+    except Exception as e:
+        logger.warning(f"check_repo_access failed for {repo_id}: {e}")
+        return _build_access_result(owner, repo, None, reason="error")
+
+
+def _access_denied_key(owner: str, repo: str) -> str:
+    return f"{__name__}.repo_access_denied:{owner}/{repo}"
+
+
+def _remember_access_denial(result: RepoAccessResult) -> RepoAccessResult:
+    """404/비공개 결과만 NEGATIVE_CACHE_TTL 동안 기억 (접근 가능 결과와 일시 오류는 매번 확인)."""
+    if result.is_private_error:
+        github_cache.set(_access_denied_key(result.owner, result.repo), result, NEGATIVE_CACHE_TTL)
+    return result
+
+
+def _build_access_result(
+    owner: str,
+    repo: str,
+    resp: Any,
+    reason: str = "error",
+) -> RepoAccessResult:
+    """HTTP 응답(requests/httpx 공용)을 RepoAccessResult로 변환."""
+    repo_id = f"{owner}/{repo}"
+    
+    if resp is None:
+        return RepoAccessResult(
+            accessible=False,
+            owner=owner,
+            repo=repo,
+            repo_id=repo_id,
+            status_code=0,
+            reason=reason,
+        )
+    
+    if resp.status_code == 200:
+        data = resp.json()
+        return RepoAccessResult(
+            accessible=True,
+            owner=owner,
+            repo=repo,
+            repo_id=repo_id,
+            status_code=200,
+            reason="ok",
+            default_branch=data.get("default_branch", "main"),
+        )
+    elif resp.status_code == 404:
+        return RepoAccessResult(
+            accessible=False,
+            owner=owner,
+            repo=repo,
+            repo_id=repo_id,
+            status_code=404,
+            reason="not_found",
+        )
+    elif resp.status_code == 403:
+        # Check if rate limit or private repo
+        if "rate limit" in resp.text.lower():
             return RepoAccessResult(
                 accessible=False,
                 owner=owner,
                 repo=repo,
                 repo_id=repo_id,
                 status_code=403,
-                reason="private_no_access",
+                reason="rate_limit",
             )
-        else:
-            return RepoAccessResult(
-                accessible=False,
-                owner=owner,
-                repo=repo,
-                repo_id=repo_id,
-                status_code=resp.status_code,
-                reason="error",
-            )
-    except requests.Timeout:
         return RepoAccessResult(
             accessible=False,
             owner=owner,
             repo=repo,
             repo_id=repo_id,
-            status_code=0,
-            reason="timeout",
+            status_code=403,
+            reason="private_no_access",
         )
-    except Exception as e:
-        logger.warning(f"check_repo_access failed for {repo_id}: {e}")
+    else:
         return RepoAccessResult(
             accessible=False,
             owner=owner,
             repo=repo,
             repo_id=repo_id,
-            status_code=0,
+            status_code=resp.status_code,
             reason="error",
         )
 
@@ -120,34 +159,50 @@ def _build_headers() -> Dict[str, str]:
     return headers
 
 
-def _github_graphql(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+def _github_graphql(
+    query: str, variables: Dict[str, Any], allow_partial: bool = False
+) -> Dict[str, Any]:
     """Common helper for making GitHub GraphQL calls."""
     logger.debug("GitHub GraphQL: variables=%s", variables)
-    resp = requests.post(
+    resp = get_http_client().post(
         GITHUB_GRAPHQL_URL,
         json={"query": query, "variables": variables},
         headers=_build_headers(),
         timeout=15,
     )
+    return _parse_graphql_response(resp, allow_partial)
+
+
+def _parse_graphql_response(resp: Any, allow_partial: bool = False) -> Dict[str, Any]:
+    """
+    GraphQL 응답(requests/httpx 공용)에서 data 추출.
+
+    allow_partial=True면 data가 있는 한 alias별 오류(예: 배치 중 없는 저장소)는
+    경고만 남기고 해당 alias를 null로 둔 채 반환합니다.
+    """
     if resp.status_code != 200:
         raise GitHubError(
             f"GraphQL request failed: {resp.status_code} {resp.text}"
         )
 
     data = resp.json()
-    if "errors" in data and data["errors"]:
+    if allow_partial and data.get("errors") and data.get("data"):
+        logger.warning(f"GraphQL partial errors: {data['errors']}")
+    elif "errors" in data and data["errors"]:
+        if all(err.get("type") == "NOT_FOUND" for err in data["errors"]):
+            raise GitHubError(
+                f"GraphQL errors: {data['errors']}",
+                kind=ErrorKind.GITHUB_NOT_FOUND,
+                status_code=404,
+            )
         raise GitHubError(f"GraphQL errors: {data['errors']}")
 
-    return data.get("data") or {}
+    payload = data.get("data") or {}
+    get_rate_limit_scheduler().record_graphql_cost(resp, payload.get("rateLimit"))
+    return payload
 
 
-@cached(ttl=300)
-def fetch_repo_overview(owner: str, repo: str) -> Dict[str, Any]:
-    logger.debug("GitHub GraphQL: fetch_repo_overview %s/%s", owner, repo)
-    
-    query = """
-    query($owner: String!, $name: String!) {
-      repository(owner: $owner, name: $name) {
+REPO_OVERVIEW_FIELDS = """
         name
         nameWithOwner
         description
@@ -182,11 +237,19 @@ def fetch_repo_overview(owner: str, repo: str) -> Dict[str, Any]:
             byteSize
           }
         }
-      }
-    }
-    """
-    
-    data = _github_graphql(query, {"owner": owner, "name": repo})
+"""
+
+REPO_OVERVIEW_QUERY = build_repository_query(REPO_OVERVIEW_FIELDS)
+
+
+@cached(ttl=repo_ttl(300))
+def fetch_repo_overview(owner: str, repo: str) -> Dict[str, Any]:
+    logger.debug("GitHub GraphQL: fetch_repo_overview %s/%s", owner, repo)
+    data = _github_graphql(REPO_OVERVIEW_QUERY, {"owner": owner, "name": repo})
+    return _parse_repo_overview(owner, repo, data)
+
+
+def _parse_repo_overview(owner: str, repo: str, data: Dict[str, Any]) -> Dict[str, Any]:
     repo_data = data.get("repository")
     if not repo_data:
         raise GitHubClientError(f"Repository {owner}/{repo} not found.")
@@ -220,12 +283,12 @@ def fetch_repo_overview(owner: str, repo: str) -> Dict[str, Any]:
     }
 
 
-@cached(ttl=300)
+@cached(ttl=repo_ttl(300))
 def fetch_repo(owner: str, repo: str) -> Dict[str, Any]:
     """Fetches basic repo info from `repos/{owner}/{repo}` (REST API for legacy compatibility)."""
     logger.debug("GitHub API: fetch_repo %s/%s", owner, repo)
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
-    resp = requests.get(url, headers=_build_headers(), timeout=10)
+    resp = conditional_get(url, headers=_build_headers(), timeout=10)
     if resp.status_code == 404:
         raise GitHubClientError(f"Repository {owner}/{repo} not found.")
     if resp.status_code != 200:
@@ -233,20 +296,58 @@ def fetch_repo(owner: str, repo: str) -> Dict[str, Any]:
     return resp.json()
 
 
-@cached(ttl=300)
+def resolve_commit_sha(owner: str, repo: str, ref: str = "HEAD") -> Optional[str]:
+    """
+    ref(브랜치/태그/HEAD)를 커밋 SHA로 변환.
+
+    파이프라인 시작 시 한 번 호출해 이후 콘텐츠 조회를 SHA 기준(immutable 캐시)으로 고정합니다.
+    조회에 실패하면 None을 반환하고 호출부는 원래 ref를 그대로 사용합니다.
+    """
+    if is_commit_sha(ref):
+        return ref
+    return _resolve_commit_sha(owner, repo, ref)
+
+
+@cached(ttl=GITHUB_REF_RESOLVE_TTL)
+def _resolve_commit_sha(owner: str, repo: str, ref: str) -> Optional[str]:
+    url, headers = _commit_sha_request(owner, repo, ref)
+    try:
+        resp = conditional_get(url, headers=headers, fresh_seconds=GITHUB_REF_RESOLVE_TTL, timeout=10)
+    except Exception as e:
+        logger.warning(f"Failed to resolve {owner}/{repo}@{ref}: {e}")
+        return None
+    return _parse_commit_sha(resp)
+
+
+def _commit_sha_request(owner: str, repo: str, ref: str) -> Tuple[str, Dict[str, str]]:
+    # vnd.github.sha 미디어 타입은 커밋 객체 대신 40자리 SHA 텍스트만 반환
+    headers = _build_headers()
+    headers["Accept"] = "application/vnd.github.sha"
+    return f"{GITHUB_API_BASE}/repos/{owner}/{repo}/commits/{ref}", headers
+
+
+def _parse_commit_sha(resp: Any) -> Optional[str]:
+    if resp.status_code != 200:
+        return None
+    sha = resp.text.strip()
+    return sha if is_commit_sha(sha) else None
+
+
+@cached(ttl=repo_ttl(300), negative_ttl=NEGATIVE_CACHE_TTL)
 def fetch_readme(owner: str, repo: str) -> Optional[Dict[str, Any]]:
     """Fetches README info (REST API for legacy compatibility)."""
     logger.debug("GitHub API: fetch_readme %s/%s", owner, repo)
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/readme"
-    resp = requests.get(url, headers=_build_headers(), timeout=10)
+    resp = conditional_get(url, headers=_build_headers(), timeout=10)
     if resp.status_code == 404:
+        mark_negative()
         return None
     if resp.status_code != 200:
         raise GitHubClientError(f"Failed to fetch README: {resp.status_code} {resp.text}")
     return resp.json()
 
 
-@cached(ttl=180)
+@cached(ttl=repo_ttl(180))
 def fetch_recent_commits(
     owner: str,
     repo: str,
@@ -264,41 +365,21 @@ def fetch_recent_commits(
         "per_page": per_page,
     }
 
-    resp = requests.get(url, headers=_build_headers(), params=params, timeout=15)
+    resp = get_http_client().get(url, headers=_build_headers(), params=params, timeout=15)
     if resp.status_code != 200:
         raise GitHubClientError(f"Failed to fetch commits: {resp.status_code} {resp.text}")
     return resp.json()
 
 
-@cached(ttl=180)
-def fetch_activity_summary(
-    owner: str,
-    repo: str,
-    days: int = DEFAULT_ACTIVITY_DAYS,
-    commits_limit: int = 100,
-    issues_limit: int = 100,
-    prs_limit: int = 100,
-) -> Dict[str, Any]:
-    """Fetches commits, issues, and PRs in a single GraphQL call."""
-    logger.debug(
-        "GitHub GraphQL: fetch_activity_summary %s/%s (days=%d)",
-        owner, repo, days,
-    )
-    
-    since_dt = dt.datetime.now() - dt.timedelta(days=days)
-    since_iso = since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-    
-    query = """
-    query(
-      $owner: String!,
-      $name: String!,
-      $since: GitTimestamp!,
-      $issueSince: DateTime!,
-      $commitsLimit: Int!,
-      $issuesLimit: Int!,
-      $prsLimit: Int!
-    ) {
-      repository(owner: $owner, name: $name) {
+ACTIVITY_SUMMARY_VARIABLE_TYPES = {
+    "since": "GitTimestamp!",
+    "issueSince": "DateTime!",
+    "commitsLimit": "Int!",
+    "issuesLimit": "Int!",
+    "prsLimit": "Int!",
+}
+
+ACTIVITY_SUMMARY_FIELDS = """
         defaultBranchRef {
           target {
             ... on Commit {
@@ -346,21 +427,132 @@ def fetch_activity_summary(
             mergedAt
           }
         }
-      }
-    }
-    """
+"""
+
+ACTIVITY_SUMMARY_QUERY = build_repository_query(
+    ACTIVITY_SUMMARY_FIELDS, ACTIVITY_SUMMARY_VARIABLE_TYPES
+)
+
+# 증분 재진단용 변경분 조회: since 이후 커밋, 갱신된 이슈, 갱신된 PR (PR은 생성일이 아닌 갱신일 순)
+ACTIVITY_DELTA_FIELDS = """
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: $commitsLimit, since: $since) {
+                totalCount
+                nodes {
+                  oid
+                  message
+                  committedDate
+                  author {
+                    name
+                    email
+                    user { login }
+                  }
+                }
+              }
+            }
+          }
+        }
+        issues(
+          first: $issuesLimit,
+          states: [OPEN, CLOSED],
+          filterBy: { since: $issueSince },
+          orderBy: { field: UPDATED_AT, direction: DESC }
+        ) {
+          totalCount
+          nodes {
+            number
+            state
+            createdAt
+            closedAt
+          }
+        }
+        pullRequests(
+          first: $prsLimit,
+          states: [OPEN, CLOSED, MERGED],
+          orderBy: { field: UPDATED_AT, direction: DESC }
+        ) {
+          totalCount
+          nodes {
+            number
+            state
+            createdAt
+            closedAt
+            mergedAt
+            updatedAt
+          }
+        }
+"""
+
+ACTIVITY_DELTA_QUERY = build_repository_query(
+    ACTIVITY_DELTA_FIELDS, ACTIVITY_SUMMARY_VARIABLE_TYPES
+)
+
+
+@cached(ttl=repo_ttl(180))
+def fetch_activity_summary(
+    owner: str,
+    repo: str,
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    commits_limit: int = 100,
+    issues_limit: int = 100,
+    prs_limit: int = 100,
+) -> Dict[str, Any]:
+    """Fetches commits, issues, and PRs in a single GraphQL call."""
+    logger.debug(
+        "GitHub GraphQL: fetch_activity_summary %s/%s (days=%d)",
+        owner, repo, days,
+    )
     
     variables = {
         "owner": owner,
         "name": repo,
+        **_activity_summary_variables(days, commits_limit, issues_limit, prs_limit),
+    }
+    data = _github_graphql(ACTIVITY_SUMMARY_QUERY, variables)
+    return _parse_activity_summary(data, variables["since"])
+
+
+def build_activity_summary_query(
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    commits_limit: int = 100,
+    issues_limit: int = 100,
+    prs_limit: int = 100,
+    composer: Optional[RepoQueryComposer] = None,
+) -> RepoQueryComposer:
+    """활동 요약 조회 파트(activity)를 composer에 추가."""
+    composer = composer or RepoQueryComposer()
+    variables = _activity_summary_variables(days, commits_limit, issues_limit, prs_limit)
+    composer.add("activity", ACTIVITY_SUMMARY_FIELDS, ACTIVITY_SUMMARY_VARIABLE_TYPES, **variables)
+    return composer
+
+
+def parse_activity_summary(
+    parts: Dict[str, Dict[str, Any]], composer: RepoQueryComposer
+) -> Dict[str, Any]:
+    """합성 응답의 activity 파트를 fetch_activity_summary 형식으로 변환."""
+    return _parse_activity_summary(parts.get("activity") or {}, composer.values["since"])
+
+
+def _activity_summary_variables(
+    days: int,
+    commits_limit: int,
+    issues_limit: int,
+    prs_limit: int,
+) -> Dict[str, Any]:
+    since_dt = dt.datetime.now() - dt.timedelta(days=days)
+    since_iso = since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
         "since": since_iso,
         "issueSince": since_iso,
         "commitsLimit": commits_limit,
         "issuesLimit": issues_limit,
         "prsLimit": prs_limit,
     }
-    
-    data = _github_graphql(query, variables)
+
+
+def _parse_activity_summary(data: Dict[str, Any], since_iso: str) -> Dict[str, Any]:
     repo_data = data.get("repository")
     if not repo_data:
         return {"commits": [], "issues": [], "pull_requests": []}
@@ -412,7 +604,7 @@ def fetch_activity_summary(
     }
 
 
-@cached(ttl=180)
+@cached(ttl=repo_ttl(180))
 def fetch_recent_issues(
     owner: str,
     repo: str,
@@ -484,7 +676,7 @@ def fetch_recent_issues(
     return all_issues
 
 
-@cached(ttl=180)
+@cached(ttl=repo_ttl(180))
 def fetch_recent_pull_requests(
     owner: str,
     repo: str,
@@ -575,12 +767,12 @@ def fetch_recent_pull_requests(
 
 # Consilience 지원 함수
 
-@cached(ttl=86400)  # 24시간 캐시
+@cached(ttl=repo_ttl(86400))  # 24시간 캐시
 def fetch_repo_tree(owner: str, repo: str, sha: str = "HEAD") -> Dict[str, Any]:
     """리포지토리 트리 가져오기 (재귀적)."""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{sha}?recursive=1"
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=10)
+        resp = conditional_get(url, headers=_build_headers(), timeout=10)
         if resp.status_code == 200:
             return resp.json()
         return {"tree": []}
@@ -592,7 +784,7 @@ def fetch_repo_tree(owner: str, repo: str, sha: str = "HEAD") -> Dict[str, Any]:
         return {"tree": []}
 
 
-@cached(ttl=86400)  # 24시간 캐시
+@cached(ttl=repo_ttl(86400))  # 24시간 캐시
 def fetch_workflow_runs(owner: str, repo: str, workflow_file: str = None) -> Dict[str, Any]:
     """GitHub Actions 워크플로 실행 기록 가져오기."""
     if workflow_file:
@@ -601,7 +793,7 @@ def fetch_workflow_runs(owner: str, repo: str, workflow_file: str = None) -> Dic
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/actions/runs?per_page=10"
     
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=10)
+        resp = get_http_client().get(url, headers=_build_headers(), timeout=10)
         if resp.status_code == 200:
             return resp.json()
         return {"workflow_runs": []}
@@ -613,12 +805,12 @@ def fetch_workflow_runs(owner: str, repo: str, workflow_file: str = None) -> Dic
         return {"workflow_runs": []}
 
 
-@cached(ttl=86400)  # 24시간 캐시
+@cached(ttl=repo_ttl(86400))  # 24시간 캐시
 def fetch_workflows(owner: str, repo: str) -> List[Dict[str, Any]]:
     """워크플로 목록 가져오기."""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/actions/workflows"
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=10)
+        resp = conditional_get(url, headers=_build_headers(), timeout=10)
         if resp.status_code == 200:
             return resp.json().get("workflows", [])
         return []
@@ -630,12 +822,12 @@ def fetch_workflows(owner: str, repo: str) -> List[Dict[str, Any]]:
         return []
 
 
-@cached(ttl=3600)  # 1시간 캐시
+@cached(ttl=repo_ttl(3600))  # 1시간 캐시
 def fetch_repo_contents(owner: str, repo: str, path: str = "") -> List[Dict[str, Any]]:
     """리포지토리 디렉토리 내용 가져오기."""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=10)
+        resp = conditional_get(url, headers=_build_headers(), timeout=10)
         if resp.status_code == 200:
             result = resp.json()
             return result if isinstance(result, list) else []
@@ -648,15 +840,203 @@ def fetch_repo_contents(owner: str, repo: str, path: str = "") -> List[Dict[str,
         return []
 
 
+def fetch_composed(composer: RepoQueryComposer, owner: str, repo: str) -> Dict[str, Any]:
+    """합성 쿼리를 1회 호출로 실행하고 data 전체 반환."""
+    query, variables = composer.build(owner, repo)
+    logger.debug("GitHub GraphQL: composed query %s/%s", owner, repo)
+    return _github_graphql(query, variables)
+
+
+def fetch_batch(batch: BatchQueryComposer) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    여러 저장소에 같은 합성 쿼리를 청크 단위로 실행.
+
+    Returns:
+        (owner, repo) → 템플릿 단일 응답 형태의 data (없는 저장소는 파트 값이 None)
+    """
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for chunk in batch.chunks():
+        query, variables = chunk.build()
+        logger.debug("GitHub GraphQL: batch query (%d repos)", len(chunk.repos))
+        results.update(chunk.split(_github_graphql(query, variables, allow_partial=True)))
+    return results
+
+
+# 비동기 변형 (asyncio 진단 경로용, 파싱 로직은 동기 버전과 공유)
+
+async def check_repo_access_async(owner: str, repo: str) -> RepoAccessResult:
+    """check_repo_access의 비동기 버전."""
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
+    
+    denied = github_cache.get(_access_denied_key(owner, repo))
+    if denied is not None:
+        return denied
+    
+    try:
+        resp = await get_async_http_client().get(url, headers=_build_headers(), timeout=10)
+        return _remember_access_denial(_build_access_result(owner, repo, resp))
+    except httpx.TimeoutException:
+        return _build_access_result(owner, repo, None, reason="timeout")
+    except Exception as e:
+        logger.warning(f"check_repo_access_async failed for {owner}/{repo}: {e}")
+        return _build_access_result(owner, repo, None, reason="error")
+
+
+async def _github_graphql_async(
+    query: str, variables: Dict[str, Any], allow_partial: bool = False
+) -> Dict[str, Any]:
+    """_github_graphql의 비동기 버전."""
+    logger.debug("GitHub GraphQL (async): variables=%s", variables)
+    try:
+        resp = await get_async_http_client().post(
+            GITHUB_GRAPHQL_URL,
+            json={"query": query, "variables": variables},
+            headers=_build_headers(),
+            timeout=15,
+        )
+    except httpx.HTTPError as e:
+        raise GitHubError(f"GraphQL request failed: {e}") from e
+    return _parse_graphql_response(resp, allow_partial)
+
+
+async def fetch_composed_async(composer: RepoQueryComposer, owner: str, repo: str) -> Dict[str, Any]:
+    """fetch_composed의 비동기 버전."""
+    query, variables = composer.build(owner, repo)
+    logger.debug("GitHub GraphQL (async): composed query %s/%s", owner, repo)
+    return await _github_graphql_async(query, variables)
+
+
+async def fetch_batch_async(batch: BatchQueryComposer) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """fetch_batch의 비동기 버전 (청크를 동시에 실행)."""
+    async def run(chunk: BatchQueryComposer) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        query, variables = chunk.build()
+        logger.debug("GitHub GraphQL (async): batch query (%d repos)", len(chunk.repos))
+        return chunk.split(await _github_graphql_async(query, variables, allow_partial=True))
+
+    results: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for chunk_result in await asyncio.gather(*(run(c) for c in batch.chunks())):
+        results.update(chunk_result)
+    return results
+
+
+async def resolve_commit_sha_async(owner: str, repo: str, ref: str = "HEAD") -> Optional[str]:
+    """resolve_commit_sha의 비동기 버전."""
+    if is_commit_sha(ref):
+        return ref
+    return await _resolve_commit_sha_async(owner, repo, ref)
+
+
+@cached(ttl=GITHUB_REF_RESOLVE_TTL)
+async def _resolve_commit_sha_async(owner: str, repo: str, ref: str) -> Optional[str]:
+    url, headers = _commit_sha_request(owner, repo, ref)
+    try:
+        resp = await conditional_get_async(
+            url, headers=headers, fresh_seconds=GITHUB_REF_RESOLVE_TTL, timeout=10
+        )
+    except Exception as e:
+        logger.warning(f"Failed to resolve {owner}/{repo}@{ref}: {e}")
+        return None
+    return _parse_commit_sha(resp)
+
+
+@cached(ttl=repo_ttl(300))
+async def fetch_repo_overview_async(owner: str, repo: str) -> Dict[str, Any]:
+    """fetch_repo_overview의 비동기 버전."""
+    logger.debug("GitHub GraphQL (async): fetch_repo_overview %s/%s", owner, repo)
+    data = await _github_graphql_async(REPO_OVERVIEW_QUERY, {"owner": owner, "name": repo})
+    return _parse_repo_overview(owner, repo, data)
+
+
+@cached(ttl=repo_ttl(180))
+async def fetch_activity_summary_async(
+    owner: str,
+    repo: str,
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    commits_limit: int = 100,
+    issues_limit: int = 100,
+    prs_limit: int = 100,
+) -> Dict[str, Any]:
+    """fetch_activity_summary의 비동기 버전."""
+    logger.debug(
+        "GitHub GraphQL (async): fetch_activity_summary %s/%s (days=%d)",
+        owner, repo, days,
+    )
+    variables = {
+        "owner": owner,
+        "name": repo,
+        **_activity_summary_variables(days, commits_limit, issues_limit, prs_limit),
+    }
+    data = await _github_graphql_async(ACTIVITY_SUMMARY_QUERY, variables)
+    return _parse_activity_summary(data, variables["since"])
+
+
+async def fetch_activity_delta_async(
+    owner: str,
+    repo: str,
+    since_iso: str,
+    commits_limit: int = 100,
+    issues_limit: int = 100,
+    prs_limit: int = 100,
+) -> Dict[str, Any]:
+    """
+    since_iso 이후 바뀐 활동만 조회 (fetch_activity_summary와 같은 형식, 캐시하지 않음).
+
+    커밋은 since 이후 커밋, 이슈/PR은 since 이후 갱신된 항목(상태 변경 포함)입니다.
+    결과의 *_total은 변경분 개수이며, 어느 목록이든 limit에 닿으면 truncated=True입니다.
+    """
+    logger.debug("GitHub GraphQL (async): fetch_activity_delta %s/%s (since=%s)", owner, repo, since_iso)
+    variables = {
+        "owner": owner,
+        "name": repo,
+        "since": since_iso,
+        "issueSince": since_iso,
+        "commitsLimit": commits_limit,
+        "issuesLimit": issues_limit,
+        "prsLimit": prs_limit,
+    }
+    data = await _github_graphql_async(ACTIVITY_DELTA_QUERY, variables)
+    delta = _parse_activity_summary(data, "")
+    delta["pull_requests"] = [
+        pr for pr in delta["pull_requests"] if (pr.get("updatedAt") or "") >= since_iso
+    ]
+    delta["truncated"] = (
+        delta["commits_total"] > len(delta["commits"])
+        or delta["issues_total"] > len(delta["issues"])
+        or len(delta["pull_requests"]) >= prs_limit
+    )
+    return delta
+
+
+@cached(ttl=repo_ttl(3600))  # 1시간 캐시
+async def fetch_repo_contents_async(owner: str, repo: str, path: str = "") -> List[Dict[str, Any]]:
+    """fetch_repo_contents의 비동기 버전."""
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}"
+    try:
+        resp = await conditional_get_async(url, headers=_build_headers(), timeout=10)
+        if resp.status_code == 200:
+            result = resp.json()
+            return result if isinstance(result, list) else []
+        return []
+    except httpx.TimeoutException:
+        logger.warning("fetch_repo_contents_async timeout: %s/%s/%s", owner, repo, path)
+        return []
+    except httpx.HTTPError as e:
+        logger.warning("fetch_repo_contents_async failed: %s/%s/%s - %s", owner, repo, path, e)
+        return []
+
+
 def clear_repo_cache(owner: str, repo: str) -> None:
     """Invalidates the cache for a specific repository."""
     fetch_repo.invalidate(owner, repo)
     fetch_readme.invalidate(owner, repo)
+    github_cache.delete(_access_denied_key(owner, repo))
     fetch_recent_commits.invalidate(owner, repo)
     fetch_recent_issues.invalidate(owner, repo)
     fetch_recent_pull_requests.invalidate(owner, repo)
     fetch_repo_overview.invalidate(owner, repo)
     fetch_activity_summary.invalidate(owner, repo)
+    fetch_repo_overview_async.invalidate(owner, repo)
+    fetch_activity_summary_async.invalidate(owner, repo)
 
 
 def clear_all_cache() -> None:
@@ -664,7 +1044,7 @@ def clear_all_cache() -> None:
     github_cache.clear()
 
 
-@cached(ttl=300)
+@cached(ttl=repo_ttl(300))
 def fetch_beginner_issues(
     owner: str,
     repo: str,
@@ -705,40 +1085,23 @@ def fetch_beginner_issues(
         owner, repo, labels[:3],  # 로그에는 처음 3개만 표시
     )
     
-    # 먼저 라벨 있는 이슈 검색
-    result = _fetch_issues_with_labels(owner, repo, labels, max_count)
-    
-    # 라벨 있는 이슈가 부족하면 최근 열린 이슈 추가
-    if len(result) < 3:
-        recent_issues = _fetch_recent_open_issues(owner, repo, max_count - len(result))
-        # 중복 제거
-        existing_numbers = {issue["number"] for issue in result}
-        for issue in recent_issues:
-            if issue["number"] not in existing_numbers:
-                result.append(issue)
-                if len(result) >= max_count:
-                    break
-    
+    # 라벨 이슈 + 최근 열린 이슈를 하나의 GraphQL 문서로 조회
+    composer = build_beginner_issues_query(labels, max_count)
+    try:
+        data = fetch_composed(composer, owner, repo)
+    except GitHubClientError as e:
+        logger.warning("Failed to fetch beginner issues: %s", e)
+        return []
+    except Exception as e:
+        logger.error("Unexpected error fetching beginner issues: %s", e)
+        return []
+
+    result = parse_beginner_issues(composer.split(data), max_count)
     logger.info("Fetched %d beginner issues for %s/%s", len(result), owner, repo)
-    return result[:max_count]
+    return result
 
 
-def _fetch_issues_with_labels(
-    owner: str,
-    repo: str,
-    labels: List[str],
-    max_count: int = 10,
-) -> List[Dict[str, Any]]:
-    """라벨이 있는 이슈 검색."""
-    query = """
-    query($owner: String!, $name: String!, $labels: [String!], $first: Int!) {
-      repository(owner: $owner, name: $name) {
-        issues(
-          first: $first
-          states: OPEN
-          labels: $labels
-          orderBy: { field: CREATED_AT, direction: DESC }
-        ) {
+BEGINNER_ISSUE_NODE_FIELDS = """
           nodes {
             number
             title
@@ -753,93 +1116,59 @@ def _fetch_issues_with_labels(
               login
             }
           }
-        }
-      }
-    }
-    """
-    
-    variables = {
-        "owner": owner,
-        "name": repo,
-        "labels": labels,
-        "first": max_count,
-    }
-    
-    try:
-        data = _github_graphql(query, variables)
-        repo_data = data.get("repository")
-        if not repo_data:
-            return []
-        
-        issues_data = repo_data.get("issues") or {}
-        nodes = issues_data.get("nodes") or []
-        
-        return _format_issues(nodes)
-        
-    except GitHubClientError as e:
-        logger.warning("Failed to fetch labeled issues: %s", e)
-        return []
-    except Exception as e:
-        logger.error("Unexpected error fetching labeled issues: %s", e)
-        return []
+"""
 
+BEGINNER_LABELED_FIELDS = """
+        issues(
+          first: $beginnerFirst
+          states: OPEN
+          labels: $beginnerLabels
+          orderBy: { field: CREATED_AT, direction: DESC }
+        ) {""" + BEGINNER_ISSUE_NODE_FIELDS + """        }
+"""
 
-def _fetch_recent_open_issues(
-    owner: str,
-    repo: str,
-    max_count: int = 5,
-) -> List[Dict[str, Any]]:
-    """최근 열린 이슈 검색 (라벨 무관)."""
-    query = """
-    query($owner: String!, $name: String!, $first: Int!) {
-      repository(owner: $owner, name: $name) {
+BEGINNER_RECENT_FIELDS = """
         issues(
-          first: $first
+          first: $beginnerFirst
           states: OPEN
           orderBy: { field: CREATED_AT, direction: DESC }
-        ) {
-          nodes {
-            number
-            title
-            url
-            createdAt
-            labels(first: 10) {
-              nodes {
-                name
-              }
-            }
-            author {
-              login
-            }
-          }
-        }
-      }
-    }
-    """
-    
-    variables = {
-        "owner": owner,
-        "name": repo,
-        "first": max_count,
-    }
-    
-    try:
-        data = _github_graphql(query, variables)
-        repo_data = data.get("repository")
-        if not repo_data:
-            return []
-        
-        issues_data = repo_data.get("issues") or {}
-        nodes = issues_data.get("nodes") or []
-        
-        return _format_issues(nodes)
-        
-    except GitHubClientError as e:
-        logger.warning("Failed to fetch recent issues: %s", e)
-        return []
-    except Exception as e:
-        logger.error("Unexpected error fetching recent issues: %s", e)
-        return []
+        ) {""" + BEGINNER_ISSUE_NODE_FIELDS + """        }
+"""
+
+
+def build_beginner_issues_query(
+    labels: List[str],
+    max_count: int,
+    composer: Optional[RepoQueryComposer] = None,
+) -> RepoQueryComposer:
+    """초보자 이슈 조회 파트(beginnerLabeled, beginnerRecent)를 composer에 추가."""
+    composer = composer or RepoQueryComposer()
+    composer.add(
+        "beginnerLabeled",
+        BEGINNER_LABELED_FIELDS,
+        {"beginnerLabels": "[String!]", "beginnerFirst": "Int!"},
+        beginnerLabels=labels,
+        beginnerFirst=max_count,
+    )
+    composer.add("beginnerRecent", BEGINNER_RECENT_FIELDS, {"beginnerFirst": "Int!"})
+    return composer
+
+
+def parse_beginner_issues(parts: Dict[str, Dict[str, Any]], max_count: int) -> List[Dict[str, Any]]:
+    """분리된 응답에서 라벨 이슈 우선, 부족하면(3개 미만) 최근 이슈로 보충."""
+    def nodes_of(alias: str) -> List[Dict]:
+        repo_data = (parts.get(alias) or {}).get("repository") or {}
+        return (repo_data.get("issues") or {}).get("nodes") or []
+
+    result = _format_issues(nodes_of("beginnerLabeled"))
+    if len(result) < 3:
+        existing_numbers = {issue["number"] for issue in result}
+        for issue in _format_issues(nodes_of("beginnerRecent")):
+            if issue["number"] not in existing_numbers:
+                result.append(issue)
+                if len(result) >= max_count:
+                    break
+    return result[:max_count]
 
 
 def _format_issues(nodes: List[Dict]) -> List[Dict[str, Any]]:
@@ -0,0 +1,297 @@
+"""
+GitHub GraphQL 쿼리 합성기
+여러 repository 조회를 alias로 묶어 단일 GraphQL 문서로 만들고 응답을 다시 분리
+(단일 저장소: RepoQueryComposer, 여러 저장소: BatchQueryComposer)
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import GITHUB_GRAPHQL_BATCH_MAX_REPOS
+
+_NAME_RE = re.compile(r"^[_A-Za-z][_0-9A-Za-z]*$")
+
+# 모든 합성 쿼리에 포함하는 비용 조회 (rate limit 스케줄러가 사용)
+RATE_LIMIT_FIELDS = "rateLimit { cost remaining resetAt }"
+
+BLOB_FIELDS = "... on Blob { text byteSize isBinary }"
+
+# GitHub GraphQL 쿼리당 최대 노드 수 (connection first/last 곱의 합)
+GRAPHQL_NODE_LIMIT = 500_000
+
+_NODE_TOKEN_RE = re.compile(r"[(){}]|\b(?:first|last)\s*:\s*(\$?\w+)")
+
+
+def estimate_node_count(fields: str, values: Optional[Dict[str, Any]] = None) -> int:
+    """
+    선택 집합의 노드 수 추정 (GitHub 계산 방식: connection마다 상위 first/last의 곱을 합산).
+
+    변수로 지정된 first 값을 알 수 없으면 connection 최대값(100)으로 계산합니다.
+    """
+    values = values or {}
+    total = 0
+    stack = [1]
+    paren_depth = 0
+    pending: Optional[int] = None
+
+    for match in _NODE_TOKEN_RE.finditer(fields):
+        token = match.group(0)
+        size = match.group(1)
+        if size is not None:
+            if paren_depth > 0:
+                if size.startswith("$"):
+                    pending = int(values.get(size[1:], 100))
+                else:
+                    pending = int(size)
+        elif token == "(":
+            paren_depth += 1
+        elif token == ")":
+            paren_depth -= 1
+        elif paren_depth > 0:
+            # 인자 안의 입력 객체 ({ field: CREATED_AT }) 는 선택 집합이 아님
+            continue
+        elif token == "{":
+            multiplier = stack[-1]
+            if pending is not None:
+                multiplier *= pending
+                total += multiplier
+                pending = None
+            stack.append(multiplier)
+        elif token == "}" and len(stack) > 1:
+            stack.pop()
+    return total
+
+
+def build_repository_query(fields: str, variable_types: Optional[Dict[str, str]] = None) -> str:
+    """단일 repository 조회 문서 생성 (응답은 data["repository"])."""
+    return RepoQueryComposer().add("repository", fields, variable_types).document()
+
+
+@dataclass
+class _Part:
+    alias: str
+    fields: str
+
+
+class RepoQueryComposer:
+    """
+    repository(owner, name) 루트 필드를 alias로 여러 번 선택하는 쿼리 합성기.
+
+    각 파트는 기존 단일 쿼리의 repository 하위 선택을 그대로 사용하고,
+    split()은 파트별로 {"repository": ...} 형태를 돌려주므로 기존 파서를 재사용할 수 있습니다.
+
+    예:
+        composer = RepoQueryComposer()
+        composer.add("meta", "stargazerCount")
+        blobs = composer.add_blobs("manifests", ["HEAD:package.json"])
+        query, variables = composer.build(owner, repo)
+    """
+
+    def __init__(self):
+        self._parts: List[_Part] = []
+        self._variable_types: Dict[str, str] = {"owner": "String!", "name": "String!"}
+        self._values: Dict[str, Any] = {}
+        self._blob_aliases: Dict[str, Dict[str, str]] = {}
+
+    def add(
+        self,
+        alias: str,
+        fields: str,
+        variable_types: Optional[Dict[str, str]] = None,
+        **values: Any,
+    ) -> "RepoQueryComposer":
+        """repository 하위 선택 추가 (변수 이름은 파트 간 공유되므로 충돌 시 ValueError)."""
+        self._check_name(alias)
+        if any(p.alias == alias for p in self._parts):
+            raise ValueError(f"Duplicate alias: {alias}")
+
+        for name, type_ in (variable_types or {}).items():
+            self._check_name(name)
+            existing = self._variable_types.get(name)
+            if existing is not None and existing != type_:
+                raise ValueError(f"Variable ${name} declared as {existing} and {type_}")
+            self._variable_types[name] = type_
+
+        for name, value in values.items():
+            if name not in self._variable_types:
+                raise ValueError(f"Undeclared variable: ${name}")
+            if name in self._values and self._values[name] != value:
+                raise ValueError(f"Conflicting values for ${name}")
+            self._values[name] = value
+
+        self._parts.append(_Part(alias=alias, fields=fields))
+        return self
+
+    def add_blobs(self, alias: str, expressions: Iterable[str]) -> Dict[str, str]:
+        """
+        object(expression:) Blob 조회를 하나의 파트로 추가.
+
+        Returns:
+            expression → blob alias 매핑
+        """
+        mapping: Dict[str, str] = {}
+        selections = []
+        types: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        for i, expression in enumerate(dict.fromkeys(expressions)):
+            blob_alias = f"{alias}_{i}"
+            mapping[expression] = blob_alias
+            types[blob_alias] = "String!"
+            values[blob_alias] = expression
+            selections.append(
+                f"{blob_alias}: object(expression: ${blob_alias}) {{ {BLOB_FIELDS} }}"
+            )
+        if not selections:
+            return mapping
+
+        self.add(alias, "\n".join(selections), types, **values)
+        self._blob_aliases[alias] = mapping
+        return mapping
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """파트가 등록한 변수 값 (owner/name 제외)."""
+        return dict(self._values)
+
+    @property
+    def variable_types(self) -> Dict[str, str]:
+        """선언된 변수 타입 (owner/name 포함)."""
+        return dict(self._variable_types)
+
+    def estimate_nodes(self) -> int:
+        """저장소 1개 기준 노드 수 추정."""
+        return sum(estimate_node_count(p.fields, self._values) for p in self._parts)
+
+    def render_parts(self, prefix: str = "", owner_var: str = "owner", name_var: str = "name") -> str:
+        """파트별 repository 선택 렌더링 (BatchQueryComposer가 저장소마다 재사용)."""
+        if not self._parts:
+            raise ValueError("No query parts added")
+        return "\n".join(
+            f"  {prefix}{p.alias}: repository(owner: ${owner_var}, name: ${name_var}) "
+            f"{{\n{p.fields.strip(chr(10))}\n  }}"
+            for p in self._parts
+        )
+
+    def document(self) -> str:
+        """합성된 GraphQL 문서."""
+        body = self.render_parts()
+        var_defs = ", ".join(f"${n}: {t}" for n, t in self._variable_types.items())
+        return f"query({var_defs}) {{\n  {RATE_LIMIT_FIELDS}\n{body}\n}}"
+
+    def build(self, owner: str, repo: str) -> Tuple[str, Dict[str, Any]]:
+        """(쿼리 문서, 변수) 반환."""
+        variables = {"owner": owner, "name": repo, **self._values}
+        missing = [n for n in self._variable_types if n not in variables]
+        if missing:
+            raise ValueError(f"Missing values for variables: {missing}")
+        return self.document(), variables
+
+    def split(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """합성 응답을 파트별 {"repository": ...}로 분리."""
+        return {p.alias: {"repository": data.get(p.alias)} for p in self._parts}
+
+    def split_blobs(self, data: Dict[str, Any], alias: str) -> Dict[str, Optional[str]]:
+        """Blob 파트를 expression → 텍스트 매핑으로 분리 (없거나 바이너리면 None)."""
+        part = data.get(alias) or {}
+        result: Dict[str, Optional[str]] = {}
+        for expression, blob_alias in self._blob_aliases.get(alias, {}).items():
+            blob = part.get(blob_alias)
+            result[expression] = None if not blob or blob.get("isBinary") else blob.get("text")
+        return result
+
+    @staticmethod
+    def _check_name(name: str) -> None:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid GraphQL name: {name}")
+
+
+class BatchQueryComposer:
+    """
+    같은 RepoQueryComposer 템플릿을 여러 저장소에 적용하는 배치 쿼리 합성기.
+
+    저장소 i의 각 파트는 repo{i}_{alias}: repository(owner: $owner{i}, name: $name{i})로
+    렌더링되고, 템플릿 변수($since 등)는 모든 저장소가 공유합니다.
+    split()은 저장소별로 템플릿 단일 응답과 같은 형태를 돌려주므로
+    template.split()/split_blobs()를 그대로 사용할 수 있습니다.
+
+    예:
+        batch = BatchQueryComposer(template, repos=[("a", "x"), ("b", "y")])
+        for chunk in batch.chunks():
+            query, variables = chunk.build()
+    """
+
+    def __init__(
+        self,
+        template: RepoQueryComposer,
+        repos: Iterable[Tuple[str, str]] = (),
+        max_nodes: int = GRAPHQL_NODE_LIMIT,
+        max_repos: int = GITHUB_GRAPHQL_BATCH_MAX_REPOS,
+    ):
+        self.template = template
+        self._repos: List[Tuple[str, str]] = list(dict.fromkeys(repos))
+        self._max_nodes = max_nodes
+        self._max_repos = max_repos
+
+    @property
+    def repos(self) -> List[Tuple[str, str]]:
+        return list(self._repos)
+
+    @property
+    def repos_per_chunk(self) -> int:
+        """노드 한도와 저장소 수 한도를 모두 만족하는 청크 크기."""
+        per_repo = max(self.template.estimate_nodes(), 1)
+        if per_repo > self._max_nodes:
+            raise ValueError(
+                f"Query template needs {per_repo} nodes per repository "
+                f"(limit {self._max_nodes})"
+            )
+        return max(1, min(self._max_repos, self._max_nodes // per_repo))
+
+    def chunks(self) -> List["BatchQueryComposer"]:
+        """한도 내로 나눈 배치 목록 (각 배치가 GraphQL 1회 호출)."""
+        size = self.repos_per_chunk
+        return [
+            BatchQueryComposer(
+                self.template, self._repos[i:i + size], self._max_nodes, self._max_repos
+            )
+            for i in range(0, len(self._repos), size)
+        ]
+
+    def build(self) -> Tuple[str, Dict[str, Any]]:
+        """(쿼리 문서, 변수) 반환."""
+        if not self._repos:
+            raise ValueError("No repositories added")
+
+        shared_types = {
+            n: t for n, t in self.template.variable_types.items() if n not in ("owner", "name")
+        }
+        var_defs = [f"${n}: {t}" for n, t in shared_types.items()]
+        variables: Dict[str, Any] = dict(self.template.values)
+        bodies = []
+        for i, (owner, repo) in enumerate(self._repos):
+            var_defs.extend([f"$owner{i}: String!", f"$name{i}: String!"])
+            variables[f"owner{i}"] = owner
+            variables[f"name{i}"] = repo
+            bodies.append(self.template.render_parts(f"repo{i}_", f"owner{i}", f"name{i}"))
+
+        missing = [n for n in shared_types if n not in variables]
+        if missing:
+            raise ValueError(f"Missing values for variables: {missing}")
+
+        body = "\n".join(bodies)
+        query = f"query({', '.join(var_defs)}) {{\n  {RATE_LIMIT_FIELDS}\n{body}\n}}"
+        return query, variables
+
+    def split(self, data: Dict[str, Any]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """배치 응답을 저장소별 템플릿 응답 형태({alias: ...})로 분리."""
+        result: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for i, key in enumerate(self._repos):
+            prefix = f"repo{i}_"
+            result[key] = {
+                name[len(prefix):]: value
+                for name, value in data.items()
+                if name.startswith(prefix)
+            }
+        return result
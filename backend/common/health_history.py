@@ -0,0 +1,217 @@
+"""
+저장소 건강도 시계열 저장소
+진단이 끝날 때마다 점수와 활동성 지표(ActivityCoreResult)를 (저장소, 날짜, 커밋 SHA, depth) 키로
+로컬 SQLite 파일에 추가만 하고, 기간 조회로 추세를 GitHub 호출 없이 계산
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, fields
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import HEALTH_HISTORY_PATH
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HealthSnapshot:
+    """진단 한 번의 지표 스냅샷 (activity_* 이외 점수는 0-100, activity 세부 점수는 0-1)."""
+    repo_id: str  # owner/repo (소문자)
+    date: str  # YYYY-MM-DD (UTC)
+    commit_sha: str
+    analysis_depth: str
+    recorded_at: float
+    health_score: Optional[float] = None
+    onboarding_score: Optional[float] = None
+    docs_score: Optional[float] = None
+    activity_score: Optional[float] = None
+    structure_score: Optional[float] = None
+    # ActivityCoreResult
+    commit_score: Optional[float] = None
+    issue_score: Optional[float] = None
+    pr_score: Optional[float] = None
+    days_since_last_commit: Optional[int] = None
+    total_commits_in_window: Optional[int] = None
+    unique_authors: Optional[int] = None
+    issue_close_rate: Optional[float] = None
+    median_pr_merge_days: Optional[float] = None
+    median_issue_close_days: Optional[float] = None
+    open_issues_count: Optional[int] = None
+    open_prs_count: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_KEY_FIELDS = ("repo_id", "date", "commit_sha", "analysis_depth", "recorded_at")
+METRIC_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(HealthSnapshot) if f.name not in _KEY_FIELDS)
+_ACTIVITY_FIELDS = METRIC_FIELDS[METRIC_FIELDS.index("commit_score"):]
+_COLUMNS = (*_KEY_FIELDS, *METRIC_FIELDS)
+
+
+def repo_id_of(owner: str, repo: str) -> str:
+    return f"{owner.lower()}/{repo.lower()}"
+
+
+def build_snapshot(
+    owner: str,
+    repo: str,
+    commit_sha: str,
+    analysis_depth: str,
+    scores: Dict[str, Any],
+    activity: Any = None,
+    recorded_at: Optional[datetime] = None,
+) -> HealthSnapshot:
+    """진단 점수 dict와 ActivityCoreResult로 스냅샷 생성 (모르는 지표는 None)."""
+    recorded_at = recorded_at or datetime.now(timezone.utc)
+    snapshot = HealthSnapshot(
+        repo_id=repo_id_of(owner, repo),
+        date=recorded_at.strftime("%Y-%m-%d"),
+        commit_sha=commit_sha,
+        analysis_depth=analysis_depth,
+        recorded_at=recorded_at.timestamp(),
+    )
+    for name in METRIC_FIELDS:
+        if name in scores:
+            setattr(snapshot, name, scores[name])
+    if activity is not None:
+        for name in _ACTIVITY_FIELDS:
+            setattr(snapshot, name, getattr(activity, name, None))
+    return snapshot
+
+
+class HealthHistoryStore:
+    """
+    추가 전용 SQLite 시계열 저장소.
+
+    (저장소, 날짜, 커밋 SHA, depth)마다 하루 첫 진단 한 줄만 남기고(같은 키는 무시), 테이블을
+    이 키로 클러스터링(WITHOUT ROWID)해 저장소별 기간 조회가 인덱스 범위 스캔 한 번으로 끝납니다.
+    """
+
+    def __init__(self, path: str = HEALTH_HISTORY_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        metric_columns = ",\n".join(f"    {name} REAL" for name in METRIC_FIELDS)
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS health_snapshots (
+                    repo_id TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    commit_sha TEXT NOT NULL,
+                    analysis_depth TEXT NOT NULL,
+                    recorded_at REAL NOT NULL,
+                {metric_columns},
+                    PRIMARY KEY (repo_id, date, commit_sha, analysis_depth)
+                ) WITHOUT ROWID
+                """
+            )
+
+    def append(self, snapshot: HealthSnapshot) -> bool:
+        """스냅샷 추가 (같은 날 같은 커밋/depth가 이미 있으면 False)."""
+        values = tuple(getattr(snapshot, name) for name in _COLUMNS)
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"INSERT OR IGNORE INTO health_snapshots ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                values,
+            )
+        return cursor.rowcount > 0
+
+    def query(
+        self,
+        owner: str,
+        repo: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        analysis_depth: Optional[str] = None,
+    ) -> List[HealthSnapshot]:
+        """기간(since~until, 양끝 포함) 스냅샷을 날짜·기록 순으로 조회."""
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM health_snapshots WHERE repo_id = ?"
+        params: List[Any] = [repo_id_of(owner, repo)]
+        if since is not None:
+            sql += " AND date >= ?"
+            params.append(since.isoformat())
+        if until is not None:
+            sql += " AND date <= ?"
+            params.append(until.isoformat())
+        if analysis_depth:
+            sql += " AND analysis_depth = ?"
+            params.append(analysis_depth)
+        sql += " ORDER BY date, recorded_at"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [HealthSnapshot(**dict(zip(_COLUMNS, row))) for row in rows]
+
+    def trend(
+        self,
+        owner: str,
+        repo: str,
+        metrics: Sequence[str] = METRIC_FIELDS,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        analysis_depth: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        지표별 추세 (기간 안 스냅샷 목록과 첫 값 대비 마지막 값 변화량).
+
+        Returns:
+            {"points": [{date, commit_sha, analysis_depth, <metric>...}], "changes": {metric: 변화량}}
+        """
+        snapshots = self.query(owner, repo, since, until, analysis_depth)
+        points = [
+            {
+                "date": s.date,
+                "commit_sha": s.commit_sha,
+                "analysis_depth": s.analysis_depth,
+                **{name: getattr(s, name) for name in metrics},
+            }
+            for s in snapshots
+        ]
+        changes: Dict[str, Optional[float]] = {}
+        for name in metrics:
+            values = [point[name] for point in points if point[name] is not None]
+            changes[name] = round(values[-1] - values[0], 4) if len(values) >= 2 else None
+        return {"points": points, "changes": changes}
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM health_snapshots").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_store: Optional[HealthHistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_health_history() -> Optional[HealthHistoryStore]:
+    """프로세스 전역 시계열 저장소 (HEALTH_HISTORY_PATH가 비어 있으면 None)."""
+    global _store
+    if _store is None and HEALTH_HISTORY_PATH:
+        with _store_lock:
+            if _store is None:
+                _store = HealthHistoryStore(HEALTH_HISTORY_PATH)
+    return _store
+
+
+def record_snapshot(snapshot: HealthSnapshot) -> bool:
+    """진단 결과 기록 (저장소 비활성/오류 시 진단에 영향 없이 False)."""
+    try:
+        store = get_health_history()
+        return store.append(snapshot) if store is not None else False
+    except Exception as e:
+        logger.warning(f"Health history write failed for {snapshot.repo_id}: {e}")
+        return False
@@ -0,0 +1,181 @@
+"""
+공유 HTTP 클라이언트 (GitHub API 호출용)
+커넥션 풀링, keep-alive, 재시도 어댑터를 프로세스 단위로 관리
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import (
+    GITHUB_HTTP_POOL_SIZE,
+    GITHUB_HTTP_MAX_RETRIES,
+    GITHUB_HTTP_BACKOFF,
+)
+from .deadline import clamp_timeout
+from .rate_limiter import get_rate_limit_scheduler
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 상태 코드 (일시적 서버 오류만, rate limit은 호출부에서 처리)
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class PooledHttpClient:
+    """
+    스레드 안전한 풀링 HTTP 클라이언트.
+
+    하나의 requests.Session을 공유하여 TCP/TLS 연결을 재사용합니다.
+    GitHub API는 쿠키를 쓰지 않으므로 쿠키 저장을 꺼서 스레드 간 공유 상태를 없앱니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = GITHUB_HTTP_POOL_SIZE,
+        max_retries: int = GITHUB_HTTP_MAX_RETRIES,
+        backoff_factor: float = GITHUB_HTTP_BACKOFF,
+    ):
+        self._pool_size = pool_size
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._lock = threading.Lock()
+        self._request_count = 0
+        self._error_count = 0
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self._max_retries,
+            backoff_factor=self._backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self._pool_size,
+            max_retries=retry,
+            pool_block=False,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.headers.update({"Connection": "keep-alive"})
+
+        self._adapter = adapter
+        logger.info(
+            f"HTTP session initialized (pool_size={self._pool_size}, "
+            f"max_retries={self._max_retries})"
+        )
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        공유 세션으로 HTTP 요청 수행.
+
+        GitHub API 요청은 rate limit 스케줄러를 거쳐 토큰 선택/페이싱되고,
+        rate limit 응답이면 다른 토큰(또는 reset 대기 후)으로 재시도합니다.
+        """
+        scheduler = get_rate_limit_scheduler()
+        if not scheduler.applies_to(url):
+            return self._send(method, url, **kwargs)
+
+        headers, caller_token, managed = scheduler.prepare_headers(kwargs.pop("headers", None))
+        resource = scheduler.resource_for(url)
+        pinned = None if managed else caller_token
+
+        for _ in range(scheduler.max_attempts):
+            lease = scheduler.acquire(resource, pinned_token=pinned)
+            resp = self._send(method, url, headers=scheduler.apply(lease, headers), **kwargs)
+            if not scheduler.record(lease, resp):
+                break
+        return resp
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        # 요청 마감이 있으면 남은 시간 안에서만 기다림
+        kwargs["timeout"] = clamp_timeout(kwargs.get("timeout"))
+        with self._lock:
+            self._request_count += 1
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._error_count += 1
+            raise
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """커넥션 재사용 통계."""
+        connections = 0
+        pooled_requests = 0
+
+        adapter = self._adapter
+        if adapter is not None:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += getattr(pool, "num_connections", 0)
+                pooled_requests += getattr(pool, "num_requests", 0)
+
+        with self._lock:
+            total_requests = self._request_count
+            errors = self._error_count
+
+        reused = max(pooled_requests - connections, 0)
+        return {
+            "total_requests": total_requests,
+            "errors": errors,
+            "pooled_requests": pooled_requests,
+            "connections_opened": connections,
+            "connections_reused": reused,
+            "reuse_ratio": round(reused / pooled_requests, 4) if pooled_requests else 0.0,
+            "pool_size": self._pool_size,
+            "max_retries": self._max_retries,
+        }
+
+    def close(self) -> None:
+        """세션과 풀 연결 정리."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
+
+
+# === 싱글톤 인스턴스 ===
+_http_client_instance: Optional[PooledHttpClient] = None
+_instance_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHttpClient:
+    """공유 HTTP 클라이언트 싱글톤 인스턴스 반환"""
+    global _http_client_instance
+    if _http_client_instance is None:
+        with _instance_lock:
+            if _http_client_instance is None:
+                _http_client_instance = PooledHttpClient()
+    return _http_client_instance
@@ -6,7 +6,7 @@ Intent Parser 공통 유틸리티
 from typing import Dict, Any, Optional, List
 import json
 import logging
-import asyncio
+from .async_utils import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -35,8 +35,7 @@ class IntentParserBase:
                 messages=[ChatMessage(role="user", content=prompt)]
             )
             
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, self.llm.chat, request)
+            response = await run_blocking(self.llm.chat, request)
             return json.loads(response.content)
             
         except json.JSONDecodeError as e:
@@ -0,0 +1,414 @@
+"""
+GitHub API Rate Limit 스케줄러
+토큰 풀 순환, REST/GraphQL 예산 추적, 토큰 버킷 페이싱, 한도 소진 시 대기열 처리
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+from .config import (
+    GITHUB_API_BASE,
+    GITHUB_CALLER_TOKEN_MAX_ENTRIES,
+    GITHUB_TOKENS,
+    GITHUB_RATE_LIMIT_RPS,
+    GITHUB_RATE_LIMIT_BURST,
+    GITHUB_RATE_LIMIT_RESERVE,
+    GITHUB_RATE_LIMIT_MAX_WAIT,
+)
+from .errors import GitHubRateLimitError
+
+logger = logging.getLogger(__name__)
+
+ANONYMOUS = "anonymous"
+
+# 토큰 없이 호출 시 GitHub 기본 한도 (시간당)
+_DEFAULT_LIMITS = {
+    "core": {True: 5000, False: 60},
+    "graphql": {True: 5000, False: 0},
+}
+
+
+@dataclass
+class ResourceBudget:
+    """토큰 하나의 리소스(core/graphql)별 잔여 예산."""
+    limit: int
+    remaining: int
+    reset_at: float = 0.0
+    last_cost: Optional[int] = None
+
+
+@dataclass
+class TokenState:
+    """토큰별 상태."""
+    token: Optional[str]
+    budgets: Dict[str, ResourceBudget] = field(default_factory=dict)
+    blocked_until: float = 0.0
+    requests: int = 0
+    rate_limited: int = 0
+
+    @property
+    def label(self) -> str:
+        if not self.token:
+            return ANONYMOUS
+        return f"...{self.token[-4:]}"
+
+
+@dataclass
+class TokenLease:
+    """acquire()가 발급한 토큰 사용권."""
+    state: Optional[TokenState]
+    resource: str
+
+    @property
+    def token(self) -> Optional[str]:
+        return self.state.token if self.state else None
+
+
+class TokenBucket:
+    """
+    토큰 버킷 페이서.
+
+    reserve()는 토큰을 먼저 차감하고(음수 허용) 대기해야 할 시간을 반환하므로
+    sync/async 호출부가 각자의 sleep으로 대기할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        if self._rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+
+class RateLimitScheduler:
+    """
+    GitHub 요청 스케줄러.
+
+    - 토큰별 REST(core) / GraphQL 예산을 응답 헤더(X-RateLimit-*)로 추적
+    - 잔여 예산이 가장 많은 토큰을 골라 요청에 주입 (토큰 풀 순환)
+    - 전체 요청을 토큰 버킷으로 페이싱 (secondary rate limit 회피)
+    - 모든 토큰이 소진되면 실패 대신 가장 빠른 reset까지 대기 (max_wait 초과 시 에러)
+    """
+
+    def __init__(
+        self,
+        tokens: Optional[List[str]] = None,
+        rate_per_second: float = GITHUB_RATE_LIMIT_RPS,
+        burst: int = GITHUB_RATE_LIMIT_BURST,
+        reserve: int = GITHUB_RATE_LIMIT_RESERVE,
+        max_wait: float = GITHUB_RATE_LIMIT_MAX_WAIT,
+        api_base: str = GITHUB_API_BASE,
+        caller_token_max_entries: int = GITHUB_CALLER_TOKEN_MAX_ENTRIES,
+    ):
+        token_list = [t for t in (tokens if tokens is not None else GITHUB_TOKENS) if t]
+        self._states: List[TokenState] = [TokenState(token=t) for t in token_list] or [
+            TokenState(token=None)
+        ]
+        self._by_token = {s.token: s for s in self._states}
+        # 풀 밖 호출자 토큰 상태 (요청마다 다른 사용자 PAT가 쌓이지 않도록 LRU로 제한)
+        self._caller_states: "OrderedDict[str, TokenState]" = OrderedDict()
+        self._caller_max_entries = max(1, caller_token_max_entries)
+        self._bucket = TokenBucket(rate_per_second, burst)
+        self._reserve = reserve
+        self._max_wait = max_wait
+        self._host = urlparse(api_base).netloc
+        self._lock = threading.Lock()
+        self._waits = 0
+        self._wait_seconds = 0.0
+
+    @property
+    def max_attempts(self) -> int:
+        """rate limit 응답 시 재시도 횟수 (토큰 수 + 1)."""
+        return len(self._states) + 1
+
+    def applies_to(self, url: str) -> bool:
+        return urlparse(url).netloc == self._host
+
+    @staticmethod
+    def resource_for(url: str) -> str:
+        return "graphql" if urlparse(url).path.rstrip("/").endswith("/graphql") else "core"
+
+    # === 토큰 선택 ===
+
+    def _budget(self, state: TokenState, resource: str) -> ResourceBudget:
+        budget = state.budgets.get(resource)
+        if budget is None:
+            limit = _DEFAULT_LIMITS.get(resource, _DEFAULT_LIMITS["core"])[bool(state.token)]
+            budget = ResourceBudget(limit=limit, remaining=limit)
+            state.budgets[resource] = budget
+        return budget
+
+    def _reserve_slot(
+        self, resource: str, pinned: Optional[TokenState] = None
+    ) -> Tuple[Optional[TokenState], float]:
+        """
+        사용할 토큰과 대기 시간 계산.
+
+        Returns:
+            (토큰 상태, 0) 또는 (None, 가장 빠른 재개까지 남은 초)
+        """
+        now = time.time()
+        with self._lock:
+            candidates = [pinned] if pinned is not None else self._states
+            best: Optional[TokenState] = None
+            best_remaining = -1
+            earliest = float("inf")
+
+            for state in candidates:
+                budget = self._budget(state, resource)
+                if budget.reset_at and now >= budget.reset_at:
+                    budget.remaining = budget.limit
+                    budget.reset_at = 0.0
+
+                available_at = state.blocked_until
+                if budget.limit > 0 and budget.remaining <= self._reserve:
+                    available_at = max(available_at, budget.reset_at or now + 60)
+
+                if available_at > now:
+                    earliest = min(earliest, available_at)
+                    continue
+                if budget.remaining > best_remaining:
+                    best, best_remaining = state, budget.remaining
+
+            if best is None:
+                return None, earliest - now
+
+            # 동시 요청이 같은 토큰에 몰리지 않도록 낙관적으로 차감
+            self._budget(best, resource).remaining -= 1
+            best.requests += 1
+            return best, self._bucket.reserve()
+
+    def _raise_if_too_long(self, wait: float) -> None:
+        if wait > self._max_wait:
+            reset_at = datetime.fromtimestamp(time.time() + wait, tz=timezone.utc)
+            raise GitHubRateLimitError(reset_at=reset_at.isoformat())
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._waits += 1
+            self._wait_seconds += wait
+
+    def _pinned_state(self, token: Optional[str]) -> Optional[TokenState]:
+        """고정할 토큰의 상태 (풀 밖 토큰은 LRU에서 찾거나 새로 만듦)."""
+        if not token:
+            return None
+        state = self._by_token.get(token)
+        if state is not None:
+            return state
+        with self._lock:
+            state = self._caller_states.get(token)
+            if state is None:
+                state = TokenState(token=token)
+                self._caller_states[token] = state
+            self._caller_states.move_to_end(token)
+            while len(self._caller_states) > self._caller_max_entries:
+                self._caller_states.popitem(last=False)
+        return state
+
+    def acquire(self, resource: str, pinned_token: Optional[str] = None) -> TokenLease:
+        """요청 슬롯 획득 (필요 시 블로킹 대기)."""
+        pinned = self._pinned_state(pinned_token)
+        while True:
+            state, wait = self._reserve_slot(resource, pinned)
+            if state is None:
+                self._raise_if_too_long(wait)
+                logger.warning(f"GitHub {resource} budget exhausted, waiting {wait:.1f}s")
+            if wait > 0:
+                self._record_wait(wait)
+                time.sleep(wait)
+            if state is not None:
+                return TokenLease(state=state, resource=resource)
+
+    async def acquire_async(self, resource: str, pinned_token: Optional[str] = None) -> TokenLease:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)."""
+        pinned = self._pinned_state(pinned_token)
+        while True:
+            state, wait = self._reserve_slot(resource, pinned)
+            if state is None:
+                self._raise_if_too_long(wait)
+                logger.warning(f"GitHub {resource} budget exhausted, waiting {wait:.1f}s")
+            if wait > 0:
+                self._record_wait(wait)
+                await asyncio.sleep(wait)
+            if state is not None:
+                return TokenLease(state=state, resource=resource)
+
+    # === 요청/응답 연동 ===
+
+    def prepare_headers(
+        self, headers: Optional[Mapping[str, str]]
+    ) -> Tuple[Dict[str, str], Optional[str], bool]:
+        """
+        요청 헤더 분석.
+
+        Returns:
+            (헤더 복사본, 호출부가 지정한 토큰, 스케줄러가 토큰을 관리하는지 여부)
+            풀에 없는 토큰(예: 사용자 개인 토큰)은 교체하지 않고 그 토큰에 고정합니다.
+        """
+        request_headers = dict(headers or {})
+        auth = request_headers.get("Authorization", "")
+        caller_token = auth.split(" ", 1)[1].strip() if " " in auth else None
+        managed = caller_token is None or caller_token in self._by_token
+        return request_headers, caller_token, managed
+
+    def apply(self, lease: TokenLease, headers: Dict[str, str]) -> Dict[str, str]:
+        """선택된 토큰을 Authorization 헤더에 주입."""
+        if lease.token:
+            headers["Authorization"] = f"Bearer {lease.token}"
+        return headers
+
+    def record(self, lease: TokenLease, resp: Any) -> bool:
+        """
+        응답 헤더로 예산 갱신.
+
+        Returns:
+            rate limit 응답(403/429 + 한도 소진 또는 Retry-After)이면 True
+        """
+        state = lease.state
+        if state is None:
+            return False
+        headers = resp.headers
+        now = time.time()
+
+        with self._lock:
+            resource = headers.get("X-RateLimit-Resource") or lease.resource
+            budget = self._budget(state, resource)
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                budget.remaining = int(remaining)
+            limit = headers.get("X-RateLimit-Limit")
+            if limit is not None:
+                budget.limit = int(limit)
+            reset = headers.get("X-RateLimit-Reset")
+            if reset is not None:
+                budget.reset_at = float(reset)
+
+            retry_after = headers.get("Retry-After")
+            limited = resp.status_code in (403, 429) and (
+                retry_after is not None or budget.remaining <= 0
+            )
+            if not limited:
+                return False
+
+            state.rate_limited += 1
+            if retry_after is not None:
+                state.blocked_until = now + float(retry_after)
+            else:
+                budget.remaining = 0
+
+        logger.warning(
+            f"GitHub rate limited (token={state.label}, resource={resource}, "
+            f"retry_after={retry_after})"
+        )
+        return True
+
+    def record_graphql_cost(self, resp: Any, rate_limit: Optional[Mapping[str, Any]]) -> None:
+        """GraphQL 응답 본문의 rateLimit { cost remaining resetAt } 반영."""
+        if not rate_limit:
+            return
+        request = getattr(resp, "request", None)
+        auth = request.headers.get("Authorization", "") if request is not None else ""
+        token = auth.split(" ", 1)[1].strip() if " " in auth else None
+        with self._lock:
+            state = self._by_token.get(token) or self._caller_states.get(token)
+            if state is None:
+                return
+            budget = self._budget(state, "graphql")
+            if rate_limit.get("remaining") is not None:
+                budget.remaining = int(rate_limit["remaining"])
+            if rate_limit.get("cost") is not None:
+                budget.last_cost = int(rate_limit["cost"])
+            reset_at = rate_limit.get("resetAt")
+            if reset_at:
+                try:
+                    budget.reset_at = datetime.fromisoformat(
+                        reset_at.replace("Z", "+00:00")
+                    ).timestamp()
+                except ValueError:
+                    pass
+
+    def headroom(self, resource: str = "core") -> Tuple[int, float]:
+        """
+        지금 쓸 수 있는 예산 (대량 실행기의 페이싱용).
+
+        Returns:
+            (reserve를 뺀 전체 토큰 잔여량 합, 가장 빠른 reset까지 남은 초 (모르면 0))
+        """
+        now = time.time()
+        total = 0
+        earliest = float("inf")
+        with self._lock:
+            for state in self._states:
+                budget = self._budget(state, resource)
+                if budget.reset_at and now >= budget.reset_at:
+                    budget.remaining = budget.limit
+                    budget.reset_at = 0.0
+                if budget.reset_at:
+                    earliest = min(earliest, budget.reset_at)
+                if state.blocked_until > now:
+                    earliest = min(earliest, state.blocked_until)
+                    continue
+                total += max(0, budget.remaining - self._reserve)
+        reset_in = 0.0 if earliest == float("inf") else max(0.0, earliest - now)
+        return total, reset_in
+
+    def get_stats(self) -> Dict[str, Any]:
+        """토큰별 예산과 대기 통계."""
+        with self._lock:
+            tokens = []
+            for state in self._states:
+                tokens.append({
+                    "token": state.label,
+                    "requests": state.requests,
+                    "rate_limited": state.rate_limited,
+                    "blocked_until": state.blocked_until or None,
+                    "budgets": {
+                        name: {
+                            "limit": b.limit,
+                            "remaining": b.remaining,
+                            "reset_at": b.reset_at or None,
+                            "last_cost": b.last_cost,
+                        }
+                        for name, b in state.budgets.items()
+                    },
+                })
+            return {
+                "tokens": tokens,
+                "pool_size": len(self._states),
+                "caller_tokens": len(self._caller_states),
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 3),
+            }
+
+
+# === 싱글톤 인스턴스 ===
+_scheduler_instance: Optional[RateLimitScheduler] = None
+_instance_lock = threading.Lock()
+
+
+def get_rate_limit_scheduler() -> RateLimitScheduler:
+    """Rate Limit 스케줄러 싱글톤 인스턴스 반환"""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        with _instance_lock:
+            if _scheduler_instance is None:
+                _scheduler_instance = RateLimitScheduler()
+    return _scheduler_instance
@@ -0,0 +1,118 @@
+"""
+저장소 아카이브(tarball) 스트리밍 리더
+파일마다 contents API를 호출하는 대신 ref의 tarball을 한 번 내려받아
+필요한 경로만 메모리로 추출 (아카이브 전체를 디스크에 쓰지 않음)
+"""
+from __future__ import annotations
+
+import fnmatch
+import logging
+import tarfile
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterable, List, Optional
+
+from .config import GITHUB_ARCHIVE_MAX_FILE_BYTES
+from .errors import ErrorKind, GitHubError
+from .http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ArchiveContents:
+    """아카이브 한 번 읽기 결과."""
+    paths: List[str] = field(default_factory=list)  # 전체 파일 경로 (구조 분석용)
+    files: Dict[str, str] = field(default_factory=dict)  # 패턴에 맞는 파일 내용
+    skipped: List[str] = field(default_factory=list)  # 패턴에 맞지만 크기 초과로 건너뜀
+    bytes_read: int = 0
+
+
+class _CountingReader:
+    """읽은 바이트 수를 세는 스트림 래퍼."""
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        self.count += len(chunk)
+        return chunk
+
+
+def matches_patterns(path: str, patterns: Iterable[str]) -> bool:
+    """파일명 또는 전체 경로가 glob 패턴 중 하나와 일치하는지 확인."""
+    filename = path.rsplit("/", 1)[-1]
+    return any(fnmatch.fnmatch(filename, p) or fnmatch.fnmatch(path, p) for p in patterns)
+
+
+def read_tarball(
+    stream: BinaryIO,
+    patterns: Iterable[str],
+    max_file_bytes: int = GITHUB_ARCHIVE_MAX_FILE_BYTES,
+) -> ArchiveContents:
+    """
+    gzip tar 스트림을 한 번 순회하며 경로 목록과 패턴에 맞는 파일 내용을 추출.
+
+    GitHub tarball은 최상위에 {owner}-{repo}-{sha}/ 디렉터리가 있으므로 첫 경로 요소를 제거합니다.
+    """
+    patterns = tuple(patterns)
+    reader = _CountingReader(stream)
+    result = ArchiveContents()
+
+    with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            _, _, path = member.name.partition("/")
+            if not path:
+                continue
+            result.paths.append(path)
+            if not matches_patterns(path, patterns):
+                continue
+            if member.size > max_file_bytes:
+                result.skipped.append(path)
+                continue
+            extracted = tar.extractfile(member)
+            if extracted is not None:
+                result.files[path] = extracted.read().decode("utf-8", errors="replace")
+
+    result.bytes_read = reader.count
+    return result
+
+
+def tarball_url(api_base: str, owner: str, repo: str, ref: Optional[str] = None) -> str:
+    """tarball 엔드포인트 URL (ref가 없거나 HEAD면 기본 브랜치)."""
+    url = f"{api_base}/repos/{owner}/{repo}/tarball"
+    if ref and ref != "HEAD":
+        url += f"/{ref}"
+    return url
+
+
+def download_tarball(
+    url: str,
+    headers: Dict[str, str],
+    patterns: Iterable[str],
+    max_file_bytes: int = GITHUB_ARCHIVE_MAX_FILE_BYTES,
+    timeout: int = 60,
+) -> ArchiveContents:
+    """tarball을 스트리밍으로 내려받으며 read_tarball로 추출."""
+    resp = get_http_client().get(url, headers=headers, stream=True, timeout=timeout)
+    try:
+        if resp.status_code == 404:
+            raise GitHubError(
+                f"Archive not found: {url}", kind=ErrorKind.GITHUB_NOT_FOUND, status_code=404
+            )
+        if resp.status_code != 200:
+            raise GitHubError(f"Failed to download archive: {resp.status_code}")
+        # Content-Encoding이 붙은 경우에도 tar.gz 원본 바이트를 읽도록 디코딩 활성화
+        resp.raw.decode_content = True
+        contents = read_tarball(resp.raw, patterns, max_file_bytes)
+    finally:
+        resp.close()
+
+    logger.info(
+        f"Archive read: {len(contents.paths)} files, {len(contents.files)} extracted, "
+        f"{contents.bytes_read} bytes"
+    )
+    return contents
@@ -0,0 +1,109 @@
+"""
+Singleflight 요청 병합
+같은 키로 동시에 들어온 호출은 먼저 시작된 한 번의 실행 결과를 함께 기다림
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call:
+    """진행 중인 동기 호출."""
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    동일 키 동시 호출 병합기.
+
+    - do(): 스레드 간 병합 (첫 호출자가 실행, 나머지는 완료 이벤트 대기)
+    - do_async(): 이벤트 루프 내 병합 (첫 호출자가 Task를 만들고 모두 같은 Task를 await)
+
+    결과는 저장하지 않으므로 실행이 끝난 뒤의 호출은 다시 실행됩니다 (캐시와 함께 사용).
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn(*args, **kwargs)를 키당 한 번만 실행하고 결과 공유."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        코루틴 함수를 키당 한 번만 실행하고 결과 공유.
+
+        공유 Task는 shield로 감싸므로 한 호출자가 취소되어도 나머지 호출자의 실행은 계속됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = loop.create_task(fn(*args, **kwargs))
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda t: self._forget(task_key, t))
+                self._executed += 1
+            else:
+                self._coalesced += 1
+                logger.debug("Singleflight[%s] joined in-flight call: %s", self.name, key)
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(task_key) is task:
+                del self._tasks[task_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행/병합 통계."""
+        with self._lock:
+            total = self._executed + self._coalesced
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls) + len(self._tasks),
+                "coalesced_ratio": round(self._coalesced / total, 3) if total else 0.0,
+            }
@@ -0,0 +1,242 @@
+"""
+의존성 기반 단계 스케줄러
+각 단계는 실제 입력(선행 단계 결과)이 준비되는 즉시 시작하고, 단계별 시작 시점/소요 시간을 기록
+블로킹 단계는 공용 실행기(get_shared_executor)에서 실행
+마감(timeout)까지 끝나지 않은 단계는 취소하고 끝난 단계 결과만 반환
+완료된 단계는 listen_stages()로 등록한 리스너에 전달 (SSE 진행률 스트리밍 등)
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .async_utils import run_blocking
+from .deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+StageListener = Callable[[str, Dict[str, Any]], None]
+
+# 현재 요청의 단계 완료 리스너 (태스크/run_blocking으로 컨텍스트와 함께 전파)
+_stage_listener: contextvars.ContextVar[Optional[StageListener]] = contextvars.ContextVar(
+    "stage_listener", default=None
+)
+
+
+@contextmanager
+def listen_stages(listener: StageListener) -> Iterator[None]:
+    """
+    블록 안에서 시작한 태스크의 단계 완료 이벤트를 listener(단계, payload)로 전달.
+
+    리스너는 다른 스레드에서 호출될 수 있으므로 loop.call_soon_threadsafe 등으로 넘겨야 합니다.
+    """
+    token = _stage_listener.set(listener)
+    try:
+        yield
+    finally:
+        _stage_listener.reset(token)
+
+
+def current_stage_listener() -> Optional[StageListener]:
+    """현재 컨텍스트의 단계 리스너 (없으면 None)."""
+    return _stage_listener.get()
+
+
+class StageFanout:
+    """
+    한 실행의 단계 이벤트를 여러 리스너에 전달 (singleflight로 병합된 호출자들의 SSE 스트림 등).
+
+    늦게 붙은 리스너에는 그때까지의 이벤트를 먼저 재생합니다. 다른 스레드에서 호출될 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners: List[StageListener] = []
+        self._history: List[Tuple[str, Dict[str, Any]]] = []
+
+    def add(self, listener: StageListener) -> None:
+        # 재생과 새 이벤트 전달 순서가 섞이지 않도록 잠근 채로 전달 (리스너는 큐에 넣기만 해야 함)
+        with self._lock:
+            for name, payload in self._history:
+                _notify(listener, name, payload)
+            self._listeners.append(listener)
+
+    def remove(self, listener: StageListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def __call__(self, name: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._history.append((name, payload))
+            for listener in self._listeners:
+                _notify(listener, name, payload)
+
+
+def _notify(listener: StageListener, name: str, payload: Dict[str, Any]) -> None:
+    try:
+        listener(name, payload)
+    except Exception as e:
+        logger.debug(f"Stage listener failed for {name}: {e}")
+
+
+def emit_stage(name: str, payload: Dict[str, Any]) -> None:
+    """현재 컨텍스트의 리스너에 단계 완료 알림 (리스너가 없으면 무시)."""
+    listener = _stage_listener.get()
+    if listener is not None:
+        _notify(listener, name, payload)
+
+
+@dataclass
+class StageTiming:
+    """단계 실행 기록 (started_ms는 스케줄러 시작 기준)."""
+    started_ms: float
+    duration_ms: float
+    ok: bool = True
+
+
+@dataclass
+class _Stage:
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...]
+    blocking: bool
+
+
+class StageScheduler:
+    """
+    단계 DAG 실행기.
+
+    add()로 단계를 등록하고 run()으로 실행합니다. 선행 단계는 먼저 등록해야 하므로 순환이 생기지 않습니다.
+    단계 함수는 선행 단계 결과를 deps 순서대로 위치 인자로 받습니다.
+    한 단계가 실패하면 나머지 단계를 취소하고 그 예외를 그대로 올립니다.
+    on_complete(단계 이름, 결과)는 각 단계가 성공하는 즉시 호출됩니다.
+    run(timeout)이면 마감까지 끝나지 않은 단계를 취소하고 expired에 기록합니다.
+
+    예:
+        scheduler = StageScheduler("diagnosis")
+        scheduler.add("snapshot", fetch_snapshot)
+        scheduler.add("docs", analyze_docs, deps=("snapshot",), blocking=True)
+        results = await scheduler.run()
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        on_complete: Optional[Callable[[str, Any], None]] = None,
+    ):
+        self.name = name
+        self.on_complete = on_complete
+        self._stages: Dict[str, _Stage] = {}
+        self.timings: Dict[str, StageTiming] = {}
+        self.expired: List[str] = []
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._stages
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        deps: Iterable[str] = (),
+        blocking: bool = False,
+    ) -> "StageScheduler":
+        """단계 등록 (blocking=True면 동기 함수를 공용 실행기에서 실행)."""
+        deps = tuple(deps)
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already registered")
+        unknown = [dep for dep in deps if dep not in self._stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on unregistered stages: {unknown}")
+        self._stages[name] = _Stage(name, func, deps, blocking)
+        return self
+
+    async def run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        모든 단계 실행 후 {단계 이름: 결과} 반환.
+
+        timeout(초)이 있으면 그때까지 끝나지 않은 단계와 그 후속 단계를 취소하고 끝난 단계 결과만
+        반환합니다. DeadlineExceeded로 끝난 단계도 실패가 아니라 마감 초과로 취급합니다.
+        """
+        origin = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: _Stage) -> Any:
+            inputs = [await tasks[dep] for dep in stage.deps]
+            started = time.perf_counter()
+            ok = False
+            try:
+                if stage.blocking:
+                    result = await run_blocking(stage.func, *inputs)
+                else:
+                    result = stage.func(*inputs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                ok = True
+            finally:
+                self.timings[stage.name] = StageTiming(
+                    started_ms=round((started - origin) * 1000, 1),
+                    duration_ms=round((time.perf_counter() - started) * 1000, 1),
+                    ok=ok,
+                )
+            if self.on_complete is not None:
+                self.on_complete(stage.name, result)
+            return result
+
+        for stage in self._stages.values():
+            tasks[stage.name] = asyncio.create_task(run_stage(stage))
+        loop = asyncio.get_running_loop()
+        until = None if timeout is None else loop.time() + max(0.0, timeout)
+        pending = set(tasks.values())
+        try:
+            while pending:
+                wait_for = None if until is None else until - loop.time()
+                if wait_for is not None and wait_for <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_for, return_when=asyncio.FIRST_EXCEPTION
+                )
+                for task in done:
+                    if task.cancelled():
+                        continue
+                    error = task.exception()
+                    if error is not None and not isinstance(error, DeadlineExceeded):
+                        raise error
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            logger.debug(
+                "Stages [%s]: %s", self.name,
+                ", ".join(f"{n}@{t.started_ms}+{t.duration_ms}ms" for n, t in self.timings.items()),
+            )
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        results: Dict[str, Any] = {}
+        for name, task in tasks.items():
+            if task.cancelled() or task.exception() is not None:
+                self.expired.append(name)
+            else:
+                results[name] = task.result()
+        if self.expired:
+            logger.info(f"Stages [{self.name}] past deadline: {', '.join(self.expired)}")
+        return results
+
+    def timings_dict(self) -> Dict[str, Dict[str, Any]]:
+        """응답/메트릭용 단계별 기록."""
+        return {
+            name: {"started_ms": t.started_ms, "duration_ms": t.duration_ms, "ok": t.ok}
+            for name, t in self.timings.items()
+        }
@@ -0,0 +1,196 @@
+"""
+저장소 활동성 기반 캐시 TTL 정책
+보관(archived)/휴면 저장소는 몇 주까지 길게, 커밋이 매우 잦은 저장소는 한 시간 안으로 짧게 보관
+pushed_at/is_archived(RepoSnapshot)와 커밋 속도(활동성 분석)를 관측할 때마다 저장소별 프로필을 갱신
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Optional
+
+from .config import ADAPTIVE_TTL_ENABLED, REPO_ACTIVITY_PROFILE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+# 커밋 속도(주당) 기준
+HYPERACTIVE_COMMITS_PER_WEEK = 50.0
+ACTIVE_COMMITS_PER_WEEK = 10.0
+# 마지막 push 이후 경과일 기준
+DORMANT_IDLE_DAYS = 180
+QUIET_IDLE_DAYS = 30
+
+
+@dataclass(frozen=True)
+class TTLPolicy:
+    """활동성 등급별 TTL (github_ttl_factor는 GitHub 조회 기본 TTL에 곱하는 배수)."""
+    tier: str
+    analysis_ttl_hours: int
+    github_ttl_factor: float
+
+
+POLICIES = {
+    "archived": TTLPolicy("archived", analysis_ttl_hours=24 * 30, github_ttl_factor=96),
+    "dormant": TTLPolicy("dormant", analysis_ttl_hours=24 * 14, github_ttl_factor=24),
+    "quiet": TTLPolicy("quiet", analysis_ttl_hours=72, github_ttl_factor=4),
+    "steady": TTLPolicy("steady", analysis_ttl_hours=24, github_ttl_factor=1),
+    "active": TTLPolicy("active", analysis_ttl_hours=6, github_ttl_factor=1),
+    "hyperactive": TTLPolicy("hyperactive", analysis_ttl_hours=1, github_ttl_factor=0.5),
+}
+
+# 늘어난 GitHub 조회 TTL 상한 (30일)
+MAX_GITHUB_TTL_SECONDS = 30 * 24 * 3600
+
+
+@dataclass
+class RepoActivityProfile:
+    """저장소별로 관측된 활동성 신호."""
+    pushed_at: Optional[datetime] = None
+    last_commit_at: Optional[datetime] = None
+    is_archived: bool = False
+    commits_per_week: Optional[float] = None
+
+    def idle_days(self, now: Optional[datetime] = None) -> Optional[int]:
+        """마지막 push/커밋 이후 경과일."""
+        latest = max(
+            (_as_utc(t) for t in (self.pushed_at, self.last_commit_at) if t is not None),
+            default=None,
+        )
+        if latest is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        return max(0, (now - latest).days)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def classify(profile: RepoActivityProfile, now: Optional[datetime] = None) -> Optional[str]:
+    """프로필의 활동성 등급 (판단할 신호가 없으면 None)."""
+    if profile.is_archived:
+        return "archived"
+    velocity = profile.commits_per_week
+    if velocity is not None and velocity >= HYPERACTIVE_COMMITS_PER_WEEK:
+        return "hyperactive"
+    if velocity is not None and velocity >= ACTIVE_COMMITS_PER_WEEK:
+        return "active"
+    idle_days = profile.idle_days(now)
+    if idle_days is None:
+        return "steady" if velocity is not None else None
+    if idle_days >= DORMANT_IDLE_DAYS:
+        return "dormant"
+    if idle_days >= QUIET_IDLE_DAYS:
+        return "quiet"
+    return "steady"
+
+
+def commits_per_week(total_commits: int, window_days: int, oldest_commit: Optional[date]) -> float:
+    """
+    조회 창 안의 주당 커밋 수.
+
+    조회 개수 상한으로 목록이 잘렸을 수 있으므로, 가장 오래된 커밋까지의 기간이
+    창보다 짧으면 그 기간을 기준으로 계산합니다.
+    """
+    span = max(window_days, 1)
+    if oldest_commit is not None:
+        today = datetime.now(timezone.utc).date()
+        span = min(span, max(1, (today - oldest_commit).days + 1))
+    return total_commits / span * 7.0
+
+
+class RepoProfileStore:
+    """저장소별 활동성 프로필 (LRU 상한, 스레드 안전)."""
+
+    def __init__(self, max_entries: int = REPO_ACTIVITY_PROFILE_MAX_ENTRIES):
+        self._profiles: "OrderedDict[str, RepoActivityProfile]" = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(owner: str, repo: str) -> str:
+        return f"{owner.lower()}/{repo.lower()}"
+
+    def observe(self, owner: str, repo: str, **signals: Any) -> None:
+        """관측된 신호 반영 (None인 신호는 기존 값 유지)."""
+        key = self._key(owner, repo)
+        with self._lock:
+            profile = self._profiles.pop(key, None) or RepoActivityProfile()
+            for name, value in signals.items():
+                if value is not None:
+                    setattr(profile, name, value)
+            self._profiles[key] = profile
+            while len(self._profiles) > self._max_entries:
+                self._profiles.popitem(last=False)
+
+    def get(self, owner: str, repo: str) -> Optional[RepoActivityProfile]:
+        with self._lock:
+            return self._profiles.get(self._key(owner, repo))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+repo_profiles = RepoProfileStore()
+
+
+def observe_repo(
+    owner: str,
+    repo: str,
+    *,
+    pushed_at: Optional[datetime] = None,
+    last_commit_at: Optional[datetime] = None,
+    is_archived: Optional[bool] = None,
+    commits_per_week: Optional[float] = None,
+) -> None:
+    """스냅샷/활동성 분석에서 얻은 신호 기록."""
+    repo_profiles.observe(
+        owner,
+        repo,
+        pushed_at=pushed_at,
+        last_commit_at=last_commit_at,
+        is_archived=is_archived,
+        commits_per_week=commits_per_week,
+    )
+
+
+def policy_for(owner: str, repo: str) -> Optional[TTLPolicy]:
+    """저장소의 TTL 정책 (비활성화됐거나 관측된 신호가 없으면 None → 기본 TTL 사용)."""
+    if not ADAPTIVE_TTL_ENABLED:
+        return None
+    profile = repo_profiles.get(owner, repo)
+    if profile is None:
+        return None
+    tier = classify(profile)
+    return POLICIES[tier] if tier else None
+
+
+def analysis_ttl_hours(owner: str, repo: str) -> Optional[int]:
+    """분석 결과 캐시 TTL(시간). CacheManager의 ttl_resolver로 사용."""
+    policy = policy_for(owner, repo)
+    return policy.analysis_ttl_hours if policy else None
+
+
+def scaled_ttl(owner: str, repo: str, base_seconds: int) -> int:
+    """GitHub 조회 기본 TTL에 저장소 등급 배수 적용."""
+    policy = policy_for(owner, repo)
+    if policy is None:
+        return base_seconds
+    return max(1, min(int(base_seconds * policy.github_ttl_factor), MAX_GITHUB_TTL_SECONDS))
+
+
+def repo_ttl(base_seconds: int) -> Callable[..., int]:
+    """
+    (owner, repo, ...) 인자 함수용 cached ttl 콜백.
+
+    예: @cached(ttl=repo_ttl(180))
+    """
+    def resolve(owner: str, repo: str, *args: Any, **kwargs: Any) -> int:
+        return scaled_ttl(owner, repo, base_seconds)
+
+    resolve.base_seconds = base_seconds  # type: ignore[attr-defined]
+    return resolve
@@ -10,12 +10,17 @@ from .models import (
     ProjectRules,
     UserGuidelines,
 )
-from .github_core import fetch_repo_snapshot, verify_repo_access
+from .github_core import fetch_repo_snapshot, fetch_repo_snapshot_async, verify_repo_access
 from .docs_core import analyze_documentation
-from .activity_core import analyze_activity
-from .structure_core import analyze_structure, analyze_structure_from_snapshot
+from .activity_core import analyze_activity, analyze_activity_async
+from .structure_core import analyze_structure, analyze_structure_async, analyze_structure_from_snapshot
 from .scoring_core import compute_diagnosis
-from .dependencies_core import parse_dependencies
+from .dependencies_core import parse_dependencies, parse_dependencies_async
+from .bundle_core import (
+    fetch_diagnosis_bundle,
+    fetch_diagnosis_bundle_async,
+    fetch_diagnosis_bundles_async,
+)
 
 __all__ = [
     # Models
@@ -30,11 +35,18 @@ __all__ = [
     "UserGuidelines",
     # Functions
     "fetch_repo_snapshot",
+    "fetch_repo_snapshot_async",
     "verify_repo_access",
     "analyze_documentation",
     "analyze_activity",
+    "analyze_activity_async",
     "analyze_structure",
+    "analyze_structure_async",
     "analyze_structure_from_snapshot",
     "compute_diagnosis",
     "parse_dependencies",
+    "parse_dependencies_async",
+    "fetch_diagnosis_bundle",
+    "fetch_diagnosis_bundle_async",
+    "fetch_diagnosis_bundles_async",
 ]
@@ -12,8 +12,11 @@ from backend.common.github_client import (
     fetch_recent_issues,
     fetch_recent_pull_requests,
     fetch_activity_summary,
+    fetch_activity_summary_async,
     DEFAULT_ACTIVITY_DAYS,
 )
+from backend.common.ttl_policy import commits_per_week, observe_repo
+from backend.common.async_utils import run_blocking
 from .models import ActivityCoreResult, RepoSnapshot
 
 logger = logging.getLogger(__name__)
@@ -367,6 +370,19 @@ def activity_score_to_100(breakdown: ActivityScoreBreakdown) -> int:
 
 # 5. Main Analysis Function
 
+def _observe_commit_velocity(m: CommitActivityMetrics) -> None:
+    """커밋 속도/마지막 커밋 시점을 저장소별 TTL 정책에 기록."""
+    last_commit_at = None
+    if m.last_commit_date is not None:
+        last_commit_at = datetime.combine(m.last_commit_date, datetime.min.time(), timezone.utc)
+    observe_repo(
+        m.owner,
+        m.repo,
+        last_commit_at=last_commit_at,
+        commits_per_week=commits_per_week(m.total_commits, m.window_days, m.first_commit_date),
+    )
+
+
 from typing import Union
 
 def analyze_activity(
@@ -386,6 +402,7 @@ def analyze_activity(
     commit = compute_commit_activity(owner, repo, days=days)
     issue = compute_issue_activity(owner, repo, days=days)
     pr = compute_pr_activity(owner, repo, days=days)
+    _observe_commit_velocity(commit)
 
     breakdown = aggregate_activity_score(commit, issue, pr)
     total_score = activity_score_to_100(breakdown)
@@ -427,16 +444,51 @@ def analyze_activity_optimized(
 
     try:
         summary = fetch_activity_summary(owner, repo, days=days)
-        commits_data = summary.get("commits", [])
-        issues_data = summary.get("issues", [])
-        prs_data = summary.get("pull_requests", [])
     except Exception as e:
         logger.warning(f"fetch_activity_summary failed, falling back: {e}")
         return analyze_activity(snapshot_or_owner, repo, days)
 
+    return analyze_activity_from_summary(summary, owner, repo, days)
+
+
+async def analyze_activity_async(
+    snapshot_or_owner: Union[RepoSnapshot, str],
+    repo: Optional[str] = None,
+    days: int = DEFAULT_ACTIVITY_DAYS,
+) -> ActivityCoreResult:
+    """analyze_activity_optimized의 비동기 버전 (실패 시 REST 3회 호출로 폴백)."""
+    if hasattr(snapshot_or_owner, "owner") and hasattr(snapshot_or_owner, "repo"):
+        owner = snapshot_or_owner.owner
+        repo = snapshot_or_owner.repo
+    else:
+        owner = str(snapshot_or_owner)
+        if repo is None:
+            raise ValueError("Repo argument is required when passing owner as string")
+
+    try:
+        summary = await fetch_activity_summary_async(owner, repo, days=days)
+    except Exception as e:
+        logger.warning(f"fetch_activity_summary_async failed, falling back: {e}")
+        return await run_blocking(analyze_activity, snapshot_or_owner, repo, days)
+
+    return analyze_activity_from_summary(summary, owner, repo, days)
+
+
+def analyze_activity_from_summary(
+    summary: dict[str, Any],
+    owner: str,
+    repo: str,
+    days: int,
+) -> ActivityCoreResult:
+    """fetch_activity_summary 결과로 ActivityCoreResult 계산."""
+    commits_data = summary.get("commits", [])
+    issues_data = summary.get("issues", [])
+    prs_data = summary.get("pull_requests", [])
+
     commit = _compute_commit_metrics(commits_data, owner, repo, days)
     issue = _compute_issue_metrics(issues_data, owner, repo, days)
     pr = _compute_pr_metrics(prs_data, owner, repo, days)
+    _observe_commit_velocity(commit)
 
     breakdown = aggregate_activity_score(commit, issue, pr)
     total_score = activity_score_to_100(breakdown)
@@ -455,3 +507,90 @@ def analyze_activity_optimized(
         open_issues_count=issue.open_issues,
         open_prs_count=pr.open_prs,
     )
+
+
+# 5. Incremental (delta window) merge
+
+def activity_cursor(summary: dict[str, Any]) -> Optional[str]:
+    """
+    활동 목록에서 가장 늦은 시각 (ISO8601 UTC).
+
+    목록을 조회한 시각보다 늦을 수 없으므로, 이 시각 이후 변경분만 다시 조회하면 빠짐없이 합칠 수 있습니다.
+    """
+    latest: Optional[datetime] = None
+    candidates: list[Optional[str]] = []
+    for c in summary.get("commits") or []:
+        commit_block = c.get("commit") or {}
+        candidates.append((commit_block.get("committer") or {}).get("date"))
+        candidates.append((commit_block.get("author") or {}).get("date"))
+    for item in [*(summary.get("issues") or []), *(summary.get("pull_requests") or [])]:
+        candidates.extend(item.get(field) for field in ("createdAt", "closedAt", "mergedAt", "updatedAt"))
+    for value in candidates:
+        parsed = _parse_iso8601(value) if value else None
+        if parsed is None:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        if latest is None or parsed > latest:
+            latest = parsed
+    return latest.strftime("%Y-%m-%dT%H:%M:%SZ") if latest else None
+
+
+def merge_activity_summary(
+    base: dict[str, Any],
+    delta: dict[str, Any],
+    days: int,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """
+    저장해 둔 활동 목록에 변경분(fetch_activity_delta_async)을 합쳐 days 창으로 다시 자름.
+
+    같은 커밋(sha)/이슈·PR(number)은 변경분이 이전 항목을 대체하고, 창을 벗어난 항목은 빠집니다.
+    목록별로 최신 limit개만 남겨 전체 조회(fetch_activity_summary)와 같은 크기를 유지합니다.
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=max(days, 1))
+
+    def newest_first(items: dict, key) -> list:
+        return sorted(items.values(), key=key, reverse=True)[:limit]
+
+    def in_window(value: Optional[str]) -> bool:
+        parsed = _parse_iso8601(value) if value else None
+        if parsed is None:
+            return False
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed >= since
+
+    commits: dict[str, Any] = {}
+    for c in [*(base.get("commits") or []), *(delta.get("commits") or [])]:
+        commit_date = ((c.get("commit") or {}).get("committer") or {}).get("date")
+        if c.get("sha") and in_window(commit_date):
+            commits[c["sha"]] = c
+
+    issues: dict[Any, Any] = {}
+    for issue in [*(base.get("issues") or []), *(delta.get("issues") or [])]:
+        if issue.get("number") is None:
+            continue
+        if (issue.get("state") or "").upper() == "OPEN" or in_window(issue.get("createdAt")) or in_window(issue.get("closedAt")):
+            issues[issue["number"]] = issue
+        else:
+            issues.pop(issue["number"], None)
+
+    prs: dict[Any, Any] = {}
+    for pr in [*(base.get("pull_requests") or []), *(delta.get("pull_requests") or [])]:
+        if pr.get("number") is not None and in_window(pr.get("createdAt")):
+            prs[pr["number"]] = pr
+
+    merged_commits = newest_first(
+        commits, lambda c: ((c.get("commit") or {}).get("committer") or {}).get("date") or ""
+    )
+    merged_issues = newest_first(issues, lambda i: i.get("createdAt") or "")
+    merged_prs = newest_first(prs, lambda p: p.get("createdAt") or "")
+    return {
+        "commits": merged_commits,
+        "commits_total": len(merged_commits),
+        "issues": merged_issues,
+        "issues_total": len(merged_issues),
+        "pull_requests": merged_prs,
+        "pull_requests_total": len(merged_prs),
+    }
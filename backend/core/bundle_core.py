@@ -0,0 +1,402 @@
+"""진단 fetch 단계 번들 조회 Core 레이어 - 합성 GraphQL로 왕복 횟수 최소화."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from dataclasses import replace
+from typing import Any, Iterable, Optional, Union
+
+from backend.common.cache_manager import github_cache
+from backend.common.config import (
+    DEFAULT_ACTIVITY_DAYS,
+    GITHUB_GRAPHQL_MAX_BLOBS_PER_QUERY,
+    GITHUB_TOKENS,
+)
+from backend.common.errors import ErrorKind, GitHubError, RepoNotFoundError
+from backend.common.graphql_composer import BatchQueryComposer, RepoQueryComposer
+from backend.common.github_client import (
+    build_activity_summary_query,
+    build_beginner_issues_query,
+    fetch_batch_async,
+    fetch_composed,
+    fetch_composed_async,
+    parse_activity_summary,
+    parse_beginner_issues,
+)
+from .dependencies_core import MANIFEST_PARSERS, select_manifests
+from .github_core import _build_repo_snapshot, fetch_repo_tree, fetch_repo_tree_async
+from .models import DiagnosisBundle, RepoSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+# REST /repos/{owner}/{repo} + 접근 확인을 대체하는 메타데이터 선택
+DIAGNOSIS_META_FIELDS = """
+        nameWithOwner
+        description
+        stargazerCount
+        forkCount
+        openIssues: issues(states: OPEN) { totalCount }
+        openPullRequests: pullRequests(states: OPEN) { totalCount }
+        primaryLanguage { name }
+        licenseInfo { spdxId }
+        createdAt
+        pushedAt
+        isArchived
+        isFork
+"""
+
+# REST /readme 엔드포인트 대신 조회할 루트 README 후보 (우선순위 순)
+README_CANDIDATES = (
+    "README.md", "README.MD", "readme.md", "Readme.md",
+    "README.rst", "README.txt", "README",
+)
+
+_README_RE = re.compile(r"^readme(\.[a-z0-9]+)?$", re.IGNORECASE)
+
+# 기본 파트 조회에 포함할 루트 매니페스트 (중첩 경로는 트리 확인 후 2차 조회)
+ROOT_MANIFESTS = tuple(suffix for suffix, _ in MANIFEST_PARSERS)
+
+# 활동 요약 캐시(fetch_activity_summary)와 같은 수명
+BUNDLE_CACHE_TTL = 180
+
+BEGINNER_LABELS = [
+    "good first issue", "help wanted", "beginner", "easy", "starter",
+    "first-timers-only", "good-first-issue", "help-wanted",
+    "low-hanging-fruit", "hacktoberfest", "docs", "documentation",
+]
+
+
+def _compose_primary(
+    ref: str,
+    days: int,
+    include_manifests: bool,
+    include_beginner_issues: bool,
+) -> RepoQueryComposer:
+    """1차 합성 쿼리: 메타 + README 후보 + 활동 요약 (+ 루트 매니페스트, 초보자 이슈)."""
+    composer = RepoQueryComposer()
+    composer.add("meta", DIAGNOSIS_META_FIELDS)
+    composer.add_blobs("readme", [f"{ref}:{name}" for name in README_CANDIDATES])
+    build_activity_summary_query(days=days, composer=composer)
+    if include_manifests:
+        composer.add_blobs("manifests", [f"{ref}:{name}" for name in ROOT_MANIFESTS])
+    if include_beginner_issues:
+        build_beginner_issues_query(BEGINNER_LABELS, 5, composer=composer)
+    return composer
+
+
+def _snapshot_from_meta(
+    owner: str,
+    repo: str,
+    ref: str,
+    meta: Optional[dict[str, Any]],
+    readme_content: Optional[str],
+) -> RepoSnapshot:
+    """GraphQL 메타데이터를 REST 형태로 맞춰 RepoSnapshot 생성."""
+    if not meta:
+        raise RepoNotFoundError(owner, repo)
+
+    license_info = meta.get("licenseInfo")
+    rest_shaped = {
+        "full_name": meta.get("nameWithOwner"),
+        "description": meta.get("description"),
+        "stargazers_count": meta.get("stargazerCount", 0),
+        "forks_count": meta.get("forkCount", 0),
+        # REST open_issues_count는 열린 PR을 포함
+        "open_issues_count": (
+            (meta.get("openIssues") or {}).get("totalCount", 0)
+            + (meta.get("openPullRequests") or {}).get("totalCount", 0)
+        ),
+        "language": (meta.get("primaryLanguage") or {}).get("name"),
+        "created_at": meta.get("createdAt"),
+        "pushed_at": meta.get("pushedAt"),
+        "archived": meta.get("isArchived", False),
+        "fork": meta.get("isFork", False),
+        "license": {"spdx_id": license_info.get("spdxId")} if license_info else None,
+    }
+    return _build_repo_snapshot(owner, repo, ref, rest_shaped, readme_content)
+
+
+def _first_readme(blobs: dict[str, Optional[str]]) -> Optional[str]:
+    for expression in blobs:
+        if blobs[expression]:
+            return blobs[expression]
+    return None
+
+
+def _followup_paths(
+    file_tree: list[str],
+    manifest_contents: dict[str, Optional[str]],
+    readme_found: bool,
+    include_manifests: bool,
+) -> list[str]:
+    """트리 확인 후 2차로 조회할 경로 (중첩 매니페스트, 후보 외 README)."""
+    paths: list[str] = []
+    if include_manifests:
+        paths.extend(p for p, _ in select_manifests(file_tree) if p not in manifest_contents)
+    if not readme_found:
+        paths.extend(
+            p for p in file_tree
+            if "/" not in p and _README_RE.match(p) and p not in README_CANDIDATES
+        )
+    return paths
+
+
+def _reraise_not_found(owner: str, repo: str, error: GitHubError) -> None:
+    if error.kind == ErrorKind.GITHUB_NOT_FOUND:
+        raise RepoNotFoundError(owner, repo) from error
+    raise error
+
+
+def _require_token() -> None:
+    # GitHub GraphQL은 인증 필수 - 토큰이 없으면 호출자가 REST 경로로 폴백
+    if not GITHUB_TOKENS:
+        raise GitHubError("GraphQL bundle fetch requires a GitHub token")
+
+
+def _assemble(
+    owner: str,
+    repo: str,
+    ref: str,
+    composer: RepoQueryComposer,
+    data: dict[str, Any],
+    file_tree: list[str],
+    include_beginner_issues: bool,
+) -> DiagnosisBundle:
+    """1차 응답 분리 → DiagnosisBundle (2차 조회 전)."""
+    parts = composer.split(data)
+    readme_content = _first_readme(composer.split_blobs(data, "readme"))
+    snapshot = _snapshot_from_meta(
+        owner, repo, ref, parts["meta"]["repository"], readme_content
+    )
+
+    # 루트 매니페스트 중 트리에 실제로 있는 파일만 사용
+    prefix_len = len(ref) + 1
+    manifest_contents = {
+        expression[prefix_len:]: content
+        for expression, content in composer.split_blobs(data, "manifests").items()
+        if content is not None and expression[prefix_len:] in file_tree
+    }
+
+    return DiagnosisBundle(
+        snapshot=snapshot,
+        activity_summary=parse_activity_summary(parts, composer),
+        file_tree=file_tree,
+        manifest_contents=manifest_contents,
+        beginner_issues=parse_beginner_issues(parts, 5) if include_beginner_issues else [],
+        graphql_calls=1,
+    )
+
+
+def _apply_followup(
+    bundle: DiagnosisBundle,
+    ref: str,
+    composer: RepoQueryComposer,
+    data: dict[str, Any],
+) -> DiagnosisBundle:
+    """2차 blob 응답 반영."""
+    prefix_len = len(ref) + 1
+    readme_content = bundle.snapshot.readme_content
+    for expression, content in composer.split_blobs(data, "followup").items():
+        path = expression[prefix_len:]
+        if _README_RE.match(path) and "/" not in path:
+            readme_content = readme_content or content
+        else:
+            bundle.manifest_contents[path] = content
+
+    if readme_content and not bundle.snapshot.readme_content:
+        bundle.snapshot = replace(bundle.snapshot, readme_content=readme_content, has_readme=True)
+    bundle.graphql_calls += 1
+    return bundle
+
+
+def _cache_key(
+    owner: str,
+    repo: str,
+    ref: str,
+    days: int,
+    include_manifests: bool,
+    include_beginner_issues: bool,
+) -> str:
+    return (
+        f"{__name__}.bundle:{owner}/{repo}@{ref}:{days}:"
+        f"{int(include_manifests)}:{int(include_beginner_issues)}"
+    )
+
+
+def _followup_composers(
+    bundle: DiagnosisBundle,
+    ref: str,
+    include_manifests: bool,
+    max_blobs: int = GITHUB_GRAPHQL_MAX_BLOBS_PER_QUERY,
+) -> list[RepoQueryComposer]:
+    """
+    2차 blob 조회 쿼리 목록.
+
+    모노레포는 중첩 매니페스트가 수백 개일 수 있으므로 쿼리 크기/복잡도 한도를 넘지 않도록
+    max_blobs개씩 나눕니다 (각 쿼리가 GraphQL 1회 호출).
+    """
+    paths = _followup_paths(
+        bundle.file_tree,
+        bundle.manifest_contents,
+        bool(bundle.snapshot.readme_content),
+        include_manifests,
+    )
+    size = max(1, max_blobs)
+    composers = []
+    for start in range(0, len(paths), size):
+        composer = RepoQueryComposer()
+        composer.add_blobs("followup", [f"{ref}:{p}" for p in paths[start:start + size]])
+        composers.append(composer)
+    return composers
+
+
+async def _complete_async(
+    bundle: DiagnosisBundle, ref: str, include_manifests: bool
+) -> DiagnosisBundle:
+    """중첩 매니페스트/후보 외 README가 있으면 2차 blob 조회로 보완."""
+    composers = _followup_composers(bundle, ref, include_manifests)
+    if not composers:
+        return bundle
+    snapshot = bundle.snapshot
+    responses = await asyncio.gather(
+        *(fetch_composed_async(composer, snapshot.owner, snapshot.repo) for composer in composers)
+    )
+    for composer, data in zip(composers, responses):
+        bundle = _apply_followup(bundle, ref, composer, data)
+    return bundle
+
+
+def fetch_diagnosis_bundle(
+    owner: str,
+    repo: str,
+    ref: str = "HEAD",
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    include_manifests: bool = True,
+    include_beginner_issues: bool = False,
+) -> DiagnosisBundle:
+    """
+    진단 fetch 단계를 합성 GraphQL로 조회.
+
+    기존: 접근 확인, REST repo, README, 활동 요약, 트리, 매니페스트 N개, 초보자 이슈 2회
+    변경: 합성 GraphQL 1회 + 트리 REST 1회 (+ 중첩 매니페스트가 있으면 blob 상한 단위로 합성 GraphQL)
+    """
+    key = _cache_key(owner, repo, ref, days, include_manifests, include_beginner_issues)
+    cached_bundle = github_cache.get(key)
+    if cached_bundle is not None:
+        return cached_bundle
+
+    _require_token()
+    composer = _compose_primary(ref, days, include_manifests, include_beginner_issues)
+    try:
+        data = fetch_composed(composer, owner, repo)
+    except GitHubError as e:
+        _reraise_not_found(owner, repo, e)
+    file_tree = fetch_repo_tree(owner, repo, ref)
+
+    bundle = _assemble(owner, repo, ref, composer, data, file_tree, include_beginner_issues)
+    for followup_composer in _followup_composers(bundle, ref, include_manifests):
+        followup_data = fetch_composed(followup_composer, owner, repo)
+        bundle = _apply_followup(bundle, ref, followup_composer, followup_data)
+
+    github_cache.set(key, bundle, BUNDLE_CACHE_TTL)
+    return bundle
+
+
+async def fetch_diagnosis_bundle_async(
+    owner: str,
+    repo: str,
+    ref: str = "HEAD",
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    include_manifests: bool = True,
+    include_beginner_issues: bool = False,
+) -> DiagnosisBundle:
+    """fetch_diagnosis_bundle의 비동기 버전 (합성 GraphQL과 트리 REST를 동시 실행)."""
+    key = _cache_key(owner, repo, ref, days, include_manifests, include_beginner_issues)
+    cached_bundle = github_cache.get(key)
+    if cached_bundle is not None:
+        return cached_bundle
+
+    _require_token()
+    composer = _compose_primary(ref, days, include_manifests, include_beginner_issues)
+    try:
+        data, file_tree = await asyncio.gather(
+            fetch_composed_async(composer, owner, repo),
+            fetch_repo_tree_async(owner, repo, ref),
+        )
+    except GitHubError as e:
+        _reraise_not_found(owner, repo, e)
+
+    bundle = _assemble(owner, repo, ref, composer, data, file_tree, include_beginner_issues)
+    bundle = await _complete_async(bundle, ref, include_manifests)
+    github_cache.set(key, bundle, BUNDLE_CACHE_TTL)
+    return bundle
+
+
+async def fetch_diagnosis_bundles_async(
+    repos: Iterable[tuple[str, str]],
+    ref: str = "HEAD",
+    days: int = DEFAULT_ACTIVITY_DAYS,
+    include_manifests: bool = True,
+    include_beginner_issues: bool = False,
+) -> dict[str, Union[DiagnosisBundle, Exception]]:
+    """
+    여러 저장소의 진단 번들을 배치 GraphQL로 조회 (비교/대량 진단용).
+
+    저장소마다 1차 합성 쿼리를 반복하는 대신 BatchQueryComposer로 묶어
+    노드 한도 내 청크당 GraphQL 1회만 호출합니다. 트리 REST와 2차 blob 조회는 저장소별로 동시 실행.
+    결과는 fetch_diagnosis_bundle(_async)와 같은 캐시 키에 저장되므로
+    이후 개별 진단 호출은 네트워크 없이 번들을 재사용합니다.
+
+    Returns:
+        "owner/repo" → DiagnosisBundle, 실패한 저장소는 예외 객체
+    """
+    results: dict[str, Union[DiagnosisBundle, Exception]] = {}
+    pending: list[tuple[str, str]] = []
+    for owner, repo in dict.fromkeys(repos):
+        key = _cache_key(owner, repo, ref, days, include_manifests, include_beginner_issues)
+        cached_bundle = github_cache.get(key)
+        if cached_bundle is not None:
+            results[f"{owner}/{repo}"] = cached_bundle
+        else:
+            pending.append((owner, repo))
+    if not pending:
+        return results
+
+    _require_token()
+    template = _compose_primary(ref, days, include_manifests, include_beginner_issues)
+    batch = BatchQueryComposer(template, pending)
+    batch_data, trees = await asyncio.gather(
+        fetch_batch_async(batch),
+        asyncio.gather(*(fetch_repo_tree_async(owner, repo, ref) for owner, repo in pending)),
+    )
+
+    assembled: list[DiagnosisBundle] = []
+    for (owner, repo), file_tree in zip(pending, trees):
+        try:
+            assembled.append(_assemble(
+                owner, repo, ref, template, batch_data.get((owner, repo), {}),
+                file_tree, include_beginner_issues,
+            ))
+        except Exception as e:
+            results[f"{owner}/{repo}"] = e
+
+    completed = await asyncio.gather(
+        *(_complete_async(bundle, ref, include_manifests) for bundle in assembled),
+        return_exceptions=True,
+    )
+    for bundle, outcome in zip(assembled, completed):
+        snapshot = bundle.snapshot
+        if isinstance(outcome, Exception):
+            # 2차 조회 실패 시 루트 매니페스트만으로 진행
+            logger.warning(f"Follow-up fetch failed for {snapshot.repo_id}: {outcome}")
+            outcome = bundle
+        key = _cache_key(
+            snapshot.owner, snapshot.repo, ref, days, include_manifests, include_beginner_issues
+        )
+        github_cache.set(key, outcome, BUNDLE_CACHE_TTL)
+        results[snapshot.repo_id] = outcome
+
+    logger.info(f"Batch bundle fetch: {len(pending)} repos, {len(batch.chunks())} GraphQL call(s)")
+    return results
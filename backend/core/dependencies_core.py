@@ -1,69 +1,153 @@
 """의존성 파싱 Core 레이어 - Pure Python implementation."""
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import logging
-from typing import Optional
+from dataclasses import replace
+from typing import Callable, Optional
 
-from .models import DependencyInfo, DependenciesSnapshot, RepoSnapshot
-from .github_core import fetch_repo_tree, fetch_file_content
+from backend.common.blob_cache import git_blob_sha, parse_blob
+from backend.common.config import GITHUB_FETCH_MODE
+from .models import DependencyInfo, DependenciesSnapshot, RepoSnapshot, TreeEntry
+from .github_core import (
+    fetch_blob,
+    fetch_blob_async,
+    fetch_file_content,
+    fetch_repo_archive,
+    fetch_repo_archive_async,
+    fetch_repo_tree_entries,
+    fetch_repo_tree_entries_async,
+    fetch_file_content_async,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def parse_dependencies(repo_snapshot: RepoSnapshot) -> DependenciesSnapshot:
-    """저장소의 의존성 파싱 (requirements.txt, package.json)."""
+# 비동기 파일 조회 동시 실행 한도
+MAX_CONCURRENT_FILE_FETCHES = 8
+
+
+def parse_dependencies(
+    repo_snapshot: RepoSnapshot, fetch_mode: Optional[str] = None
+) -> DependenciesSnapshot:
+    """
+    저장소의 의존성 파싱 (requirements.txt, package.json).
+
+    fetch_mode="archive"면 매니페스트마다 contents API를 호출하는 대신
+    tarball 한 번을 스트리밍해 필요한 파일만 추출합니다 (기본값: GITHUB_FETCH_MODE).
+    """
     owner = repo_snapshot.owner
     repo = repo_snapshot.repo
     ref = repo_snapshot.ref
 
+    if (fetch_mode or GITHUB_FETCH_MODE) == "archive":
+        try:
+            archive = fetch_repo_archive(owner, repo, ref, MANIFEST_ARCHIVE_PATTERNS)
+        except Exception as e:
+            return _tree_error_snapshot(repo_snapshot, e)
+        return build_dependencies_snapshot(repo_snapshot, archive.paths, archive.files)
+
     try:
-        file_tree = fetch_repo_tree(owner, repo, ref)
+        entries = fetch_repo_tree_entries(owner, repo, ref)
     except Exception as e:
-        return DependenciesSnapshot(
-            repo_id=repo_snapshot.repo_id,
-            dependencies=[],
-            analyzed_files=[],
-            parse_errors=[f"Failed to fetch tree: {e}"],
-        )
+        return _tree_error_snapshot(repo_snapshot, e)
 
-    dependencies: list[DependencyInfo] = []
-    analyzed_files: list[str] = []
-    errors: list[str] = []
-
-    # 1. requirements.txt (Python)
-    req_files = [f for f in file_tree if f.endswith("requirements.txt")]
-    for path in req_files:
+    # 트리에 blob SHA가 있으면 SHA 기준 캐시로 조회 (다른 저장소·ref와 같은 파일이면 재다운로드 없음)
+    file_tree = [entry.path for entry in entries]
+    blob_shas = _blob_shas(entries)
+    contents: dict[str, Optional[str] | Exception] = {}
+    for path, _ in select_manifests(file_tree):
+        sha = blob_shas.get(path)
         try:
-            content = fetch_file_content(owner, repo, path, ref)
-            if content:
-                deps = _parse_requirements_txt(content, path)
-                dependencies.extend(deps)
-                analyzed_files.append(path)
+            if sha:
+                contents[path] = fetch_blob(owner, repo, sha)
+            else:
+                contents[path] = fetch_file_content(owner, repo, path, ref)
         except Exception as e:
-            errors.append(f"Failed to parse {path}: {e}")
+            contents[path] = e
 
-    # 2. package.json (Node.js)
-    pkg_files = [f for f in file_tree if f.endswith("package.json")]
-    for path in pkg_files:
+    return build_dependencies_snapshot(repo_snapshot, file_tree, contents)
+
+
+async def parse_dependencies_async(
+    repo_snapshot: RepoSnapshot, fetch_mode: Optional[str] = None
+) -> DependenciesSnapshot:
+    """parse_dependencies의 비동기 버전 (매니페스트 파일 동시 조회)."""
+    owner = repo_snapshot.owner
+    repo = repo_snapshot.repo
+    ref = repo_snapshot.ref
+
+    if (fetch_mode or GITHUB_FETCH_MODE) == "archive":
         try:
-            content = fetch_file_content(owner, repo, path, ref)
-            if content:
-                deps = _parse_package_json(content, path)
-                dependencies.extend(deps)
-                analyzed_files.append(path)
+            archive = await fetch_repo_archive_async(owner, repo, ref, MANIFEST_ARCHIVE_PATTERNS)
         except Exception as e:
-            errors.append(f"Failed to parse {path}: {e}")
+            return _tree_error_snapshot(repo_snapshot, e)
+        return build_dependencies_snapshot(repo_snapshot, archive.paths, archive.files)
+
+    try:
+        entries = await fetch_repo_tree_entries_async(owner, repo, ref)
+    except Exception as e:
+        return _tree_error_snapshot(repo_snapshot, e)
 
-    # 3. pyproject.toml (Python) - 간단 파싱 (poetry/flit 등)
-    toml_files = [f for f in file_tree if f.endswith("pyproject.toml")]
-    for path in toml_files:
+    file_tree = [entry.path for entry in entries]
+    blob_shas = _blob_shas(entries)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_FETCHES)
+
+    async def fetch(path: str) -> Optional[str]:
+        sha = blob_shas.get(path)
+        async with semaphore:
+            if sha:
+                return await fetch_blob_async(owner, repo, sha)
+            return await fetch_file_content_async(owner, repo, path, ref)
+
+    paths = [path for path, _ in select_manifests(file_tree)]
+    results = await asyncio.gather(*(fetch(p) for p in paths), return_exceptions=True)
+    contents = dict(zip(paths, results))
+
+    return build_dependencies_snapshot(repo_snapshot, file_tree, contents)
+
+
+def _tree_error_snapshot(repo_snapshot: RepoSnapshot, error: Exception) -> DependenciesSnapshot:
+    return DependenciesSnapshot(
+        repo_id=repo_snapshot.repo_id,
+        dependencies=[],
+        analyzed_files=[],
+        parse_errors=[f"Failed to fetch tree: {error}"],
+    )
+
+
+def _blob_shas(entries: list[TreeEntry]) -> dict[str, str]:
+    return {entry.path: entry.sha for entry in entries if entry.type == "blob" and entry.sha}
+
+
+def select_manifests(file_tree: list[str]) -> list[tuple[str, Callable]]:
+    """파일 트리에서 (경로, 파서) 목록 추출."""
+    selected = []
+    for suffix, parser in MANIFEST_PARSERS:
+        selected.extend((f, parser) for f in file_tree if f.endswith(suffix))
+    return selected
+
+
+def build_dependencies_snapshot(
+    repo_snapshot: RepoSnapshot,
+    file_tree: list[str],
+    contents: dict,
+) -> DependenciesSnapshot:
+    """조회된 매니페스트 내용을 파싱하여 DependenciesSnapshot 생성."""
+    dependencies: list[DependencyInfo] = []
+    analyzed_files: list[str] = []
+    errors: list[str] = []
+
+    for path, parser in select_manifests(file_tree):
+        content = contents.get(path)
+        if isinstance(content, Exception):
+            errors.append(f"Failed to parse {path}: {content}")
+            continue
         try:
-            content = fetch_file_content(owner, repo, path, ref)
             if content:
-                deps = _parse_pyproject_toml(content, path)
-                dependencies.extend(deps)
+                dependencies.extend(_parse_manifest(parser, content, path))
                 analyzed_files.append(path)
         except Exception as e:
             errors.append(f"Failed to parse {path}: {e}")
@@ -73,7 +157,19 @@ def parse_dependencies(repo_snapshot: RepoSnapshot) -> DependenciesSnapshot:
         dependencies=dependencies,
         analyzed_files=analyzed_files,
         parse_errors=errors,
-        )
+    )
+
+
+def _parse_manifest(
+    parser: Callable[[str, str], list[DependencyInfo]], content: str, path: str
+) -> list[DependencyInfo]:
+    """
+    매니페스트 파싱 (내용의 blob SHA 기준 캐시).
+
+    파서 결과는 source(경로)만 파일 위치에 의존하므로 캐시된 결과의 source를 현재 경로로 바꿔 반환합니다.
+    """
+    deps = parse_blob(git_blob_sha(content), f"core.{parser.__name__}", lambda: parser(content, path))
+    return [replace(dep, source=path) for dep in deps]
 
 
 def _parse_requirements_txt(content: str, source: str) -> list[DependencyInfo]:
@@ -160,3 +256,14 @@ def _parse_pyproject_toml(content: str, source: str) -> list[DependencyInfo]:
                         dep_type=dep_type,
                     ))
     return deps
+
+
+# 매니페스트 파일 접미사 → 파서 (처리 순서 유지)
+MANIFEST_PARSERS: tuple[tuple[str, Callable[[str, str], list[DependencyInfo]]], ...] = (
+    ("requirements.txt", _parse_requirements_txt),
+    ("package.json", _parse_package_json),
+    ("pyproject.toml", _parse_pyproject_toml),  # 간단 파싱 (poetry/flit 등)
+)
+
+# archive 모드에서 tarball로부터 추출할 경로 (구조 분석도 같은 패턴으로 다운로드를 공유)
+MANIFEST_ARCHIVE_PATTERNS: tuple[str, ...] = tuple(f"*{suffix}" for suffix, _ in MANIFEST_PARSERS)
@@ -6,13 +6,23 @@ from typing import Optional
 
 from backend.common.github_client import (
     check_repo_access,
+    check_repo_access_async,
     GITHUB_API_BASE,
     GITHUB_TOKEN,
 )
+from backend.common.blob_cache import get_blob, put_blob
+from backend.common.async_utils import run_blocking
 from backend.common.errors import GitHubError, RepoNotFoundError
-from backend.common.cache_manager import cached
-from .models import RepoSnapshot
+from backend.common.cache_manager import cached, cached_by_ref, is_commit_sha, mark_negative
+from backend.common.config import NEGATIVE_CACHE_TTL
+from backend.common.http_client import get_http_client
+from backend.common.async_http_client import get_async_http_client
+from backend.common.conditional_cache import conditional_get, conditional_get_async
+from backend.common.repo_archive import ArchiveContents, download_tarball, tarball_url
+from backend.common.ttl_policy import observe_repo, repo_ttl
+from .models import RepoSnapshot, TreeEntry
 
+import httpx
 import requests
 import logging
 
@@ -39,7 +49,7 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
-@cached(ttl=300)
+@cached(ttl=repo_ttl(300))
 def fetch_repo_snapshot(
     owner: str,
     repo: str,
@@ -47,34 +57,75 @@ def fetch_repo_snapshot(
 ) -> RepoSnapshot:
     """GitHub 저장소 스냅샷 조회."""
     access = check_repo_access(owner, repo)
-    if not access.accessible:
-        if access.status_code == 404:
-            raise RepoNotFoundError(owner, repo)
-        else:
-            raise GitHubError(
-                f"Repository not accessible: {owner}/{repo} ({access.reason})",
-                owner=owner,
-                repo=repo,
-                status_code=access.status_code,
-            )
+    _raise_if_inaccessible(owner, repo, access)
 
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=15)
+        resp = conditional_get(url, headers=_build_headers(), timeout=15)
         resp.raise_for_status()
         data = resp.json()
     except requests.RequestException as e:
         raise GitHubError(f"Failed to fetch repo: {e}", owner=owner, repo=repo) from e
 
+    readme_content = _fetch_readme_content(owner, repo, ref)
+    return _build_repo_snapshot(owner, repo, ref, data, readme_content)
+
+
+@cached(ttl=repo_ttl(300))
+async def fetch_repo_snapshot_async(
+    owner: str,
+    repo: str,
+    ref: str = "HEAD",
+) -> RepoSnapshot:
+    """GitHub 저장소 스냅샷 조회 (비동기)."""
+    access = await check_repo_access_async(owner, repo)
+    _raise_if_inaccessible(owner, repo, access)
+
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
+    try:
+        resp = await conditional_get_async(url, headers=_build_headers(), timeout=15)
+        resp.raise_for_status()
+        data = resp.json()
+    except httpx.HTTPError as e:
+        raise GitHubError(f"Failed to fetch repo: {e}", owner=owner, repo=repo) from e
+
+    readme_content = await _fetch_readme_content_async(owner, repo, ref)
+    return _build_repo_snapshot(owner, repo, ref, data, readme_content)
+
+
+def _raise_if_inaccessible(owner: str, repo: str, access) -> None:
+    """접근 불가 저장소를 에러로 변환."""
+    if access.accessible:
+        return
+    if access.status_code == 404:
+        raise RepoNotFoundError(owner, repo)
+    raise GitHubError(
+        f"Repository not accessible: {owner}/{repo} ({access.reason})",
+        owner=owner,
+        repo=repo,
+        status_code=access.status_code,
+    )
+
+
+def _build_repo_snapshot(
+    owner: str,
+    repo: str,
+    ref: str,
+    data: dict,
+    readme_content: Optional[str],
+) -> RepoSnapshot:
+    """REST 응답 + README로 RepoSnapshot 생성."""
     created_at = _parse_datetime(data.get("created_at"))
     pushed_at = _parse_datetime(data.get("pushed_at"))
 
-    readme_content = _fetch_readme_content(owner, repo)
     has_readme = bool(readme_content)
 
     license_data = data.get("license")
     license_spdx = license_data.get("spdx_id") if license_data else None
 
+    is_archived = data.get("archived", False)
+    observe_repo(owner, repo, pushed_at=pushed_at, is_archived=is_archived)
+
     return RepoSnapshot(
         owner=owner,
         repo=repo,
@@ -87,7 +138,7 @@ def fetch_repo_snapshot(
         primary_language=data.get("language"),
         created_at=created_at,
         pushed_at=pushed_at,
-        is_archived=data.get("archived", False),
+        is_archived=is_archived,
         is_fork=data.get("fork", False),
         readme_content=readme_content,
         has_readme=has_readme,
@@ -95,53 +146,214 @@ def fetch_repo_snapshot(
     )
 
 
-def _fetch_readme_content(owner: str, repo: str) -> Optional[str]:
-    """README 콘텐츠 조회."""
+def _readme_url(owner: str, repo: str, ref: str) -> str:
+    # 커밋 SHA일 때만 ref를 고정 (HEAD/브랜치는 기존처럼 기본 브랜치 README)
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/readme"
+    if is_commit_sha(ref):
+        url += f"?ref={ref}"
+    return url
+
+
+@cached_by_ref(ttl=repo_ttl(300), negative_ttl=NEGATIVE_CACHE_TTL)
+def _fetch_readme_content(owner: str, repo: str, ref: str = "HEAD") -> Optional[str]:
+    """README 콘텐츠 조회 (ref가 커밋 SHA면 immutable 캐시)."""
+    url = _readme_url(owner, repo, ref)
     headers = _build_headers()
     headers["Accept"] = "application/vnd.github.v3.raw"
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = conditional_get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             return resp.text
+        if resp.status_code == 404:
+            mark_negative()
         return None
     except requests.RequestException:
         return None
 
 
+@cached_by_ref(ttl=repo_ttl(300), negative_ttl=NEGATIVE_CACHE_TTL)
+async def _fetch_readme_content_async(owner: str, repo: str, ref: str = "HEAD") -> Optional[str]:
+    """README 콘텐츠 조회 (비동기)."""
+    url = _readme_url(owner, repo, ref)
+    headers = _build_headers()
+    headers["Accept"] = "application/vnd.github.v3.raw"
+
+    try:
+        resp = await conditional_get_async(url, headers=headers, timeout=10)
+        if resp.status_code == 200:
+            return resp.text
+        if resp.status_code == 404:
+            mark_negative()
+        return None
+    except httpx.HTTPError:
+        return None
+
+
 def verify_repo_access(owner: str, repo: str) -> tuple[bool, str]:
     """저장소 접근 가능 여부 확인."""
     access = check_repo_access(owner, repo)
     return access.accessible, access.reason
 
 
-@cached(ttl=300)
-def fetch_repo_tree(owner: str, repo: str, ref: str = "HEAD") -> list[str]:
-    """저장소 파일 트리 조회 (경로 목록 반환)."""
+def _parse_tree_entries(data: dict) -> list[TreeEntry]:
+    return [
+        TreeEntry(
+            path=item.get("path", ""),
+            type=item.get("type", "blob"),
+            sha=item.get("sha"),
+            size=item.get("size") or 0,
+        )
+        for item in data.get("tree", [])
+    ]
+
+
+@cached_by_ref(ttl=repo_ttl(300))
+def fetch_repo_tree_entries(owner: str, repo: str, ref: str = "HEAD") -> list[TreeEntry]:
+    """저장소 파일 트리 조회 (경로 + blob SHA, ref가 커밋 SHA면 immutable 캐시)."""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
     try:
-        resp = requests.get(url, headers=_build_headers(), timeout=15)
+        resp = conditional_get(url, headers=_build_headers(), timeout=15)
         if resp.status_code != 200:
             logger.warning("Failed to fetch tree: %s", resp.status_code)
             return []
-        data = resp.json()
-        return [item.get("path", "") for item in data.get("tree", [])]
+        return _parse_tree_entries(resp.json())
     except Exception as e:
         logger.error("Error fetching repo tree: %s", e)
         return []
 
 
+def fetch_repo_tree(owner: str, repo: str, ref: str = "HEAD") -> list[str]:
+    """저장소 파일 트리 조회 (경로 목록 반환)."""
+    return [entry.path for entry in fetch_repo_tree_entries(owner, repo, ref)]
+
+
+def _blob_url(owner: str, repo: str, sha: str) -> str:
+    return f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/blobs/{sha}"
+
+
+def _raw_headers() -> dict:
+    headers = _build_headers()
+    headers["Accept"] = "application/vnd.github.v3.raw"
+    return headers
+
+
+def fetch_blob(owner: str, repo: str, sha: str) -> Optional[str]:
+    """
+    git blob 원문 조회 (blob SHA 기준 캐시).
+
+    같은 SHA의 blob은 어느 저장소·ref에서 조회했든 내용이 같으므로
+    한 번 받은 원문을 모든 저장소가 공유합니다.
+    """
+    content = get_blob(sha)
+    if content is not None:
+        return content
+    try:
+        resp = get_http_client().get(_blob_url(owner, repo, sha), headers=_raw_headers(), timeout=10)
+        if resp.status_code != 200:
+            return None
+    except Exception as e:
+        logger.error("Error fetching blob %s: %s", sha, e)
+        return None
+    put_blob(sha, resp.text)
+    return resp.text
+
+
+@cached_by_ref(ttl=repo_ttl(300), negative_ttl=NEGATIVE_CACHE_TTL)
 def fetch_file_content(owner: str, repo: str, path: str, ref: str = "HEAD") -> Optional[str]:
-    """파일 콘텐츠 조회 (Raw)."""
+    """파일 콘텐츠 조회 (Raw, ref가 커밋 SHA면 immutable 캐시)."""
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}?ref={ref}"
     headers = _build_headers()
     headers["Accept"] = "application/vnd.github.v3.raw"
     
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = get_http_client().get(url, headers=headers, timeout=10)
+        if resp.status_code == 200:
+            return resp.text
+        if resp.status_code == 404:
+            mark_negative()
+        return None
+    except Exception as e:
+        logger.error("Error fetching file content %s: %s", path, e)
+        return None
+
+
+@cached_by_ref(ttl=repo_ttl(300))
+def fetch_repo_archive(
+    owner: str, repo: str, ref: str = "HEAD", patterns: tuple[str, ...] = ()
+) -> ArchiveContents:
+    """
+    저장소 tarball을 1회 스트리밍 조회 (GITHUB_FETCH_MODE=archive).
+
+    전체 파일 경로와 patterns(glob)에 맞는 파일 내용을 함께 반환하므로
+    같은 patterns로 호출하는 의존성/구조 분석이 다운로드 한 번을 공유합니다.
+    """
+    url = tarball_url(GITHUB_API_BASE, owner, repo, ref)
+    return download_tarball(url, _build_headers(), patterns)
+
+
+async def fetch_repo_archive_async(
+    owner: str, repo: str, ref: str = "HEAD", patterns: tuple[str, ...] = ()
+) -> ArchiveContents:
+    """fetch_repo_archive의 비동기 버전 (tar 스트림 해제는 스레드에서 실행)."""
+    return await run_blocking(fetch_repo_archive, owner, repo, ref, patterns)
+
+
+@cached_by_ref(ttl=repo_ttl(300))
+async def fetch_repo_tree_entries_async(
+    owner: str, repo: str, ref: str = "HEAD"
+) -> list[TreeEntry]:
+    """저장소 파일 트리 조회 (경로 + blob SHA, 비동기)."""
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
+    try:
+        resp = await conditional_get_async(url, headers=_build_headers(), timeout=15)
+        if resp.status_code != 200:
+            logger.warning("Failed to fetch tree: %s", resp.status_code)
+            return []
+        return _parse_tree_entries(resp.json())
+    except Exception as e:
+        logger.error("Error fetching repo tree: %s", e)
+        return []
+
+
+async def fetch_repo_tree_async(owner: str, repo: str, ref: str = "HEAD") -> list[str]:
+    """저장소 파일 트리 조회 (비동기)."""
+    return [entry.path for entry in await fetch_repo_tree_entries_async(owner, repo, ref)]
+
+
+async def fetch_blob_async(owner: str, repo: str, sha: str) -> Optional[str]:
+    """fetch_blob의 비동기 버전."""
+    content = get_blob(sha)
+    if content is not None:
+        return content
+    try:
+        resp = await get_async_http_client().get(
+            _blob_url(owner, repo, sha), headers=_raw_headers(), timeout=10
+        )
+        if resp.status_code != 200:
+            return None
+    except Exception as e:
+        logger.error("Error fetching blob %s: %s", sha, e)
+        return None
+    put_blob(sha, resp.text)
+    return resp.text
+
+
+@cached_by_ref(ttl=repo_ttl(300), negative_ttl=NEGATIVE_CACHE_TTL)
+async def fetch_file_content_async(
+    owner: str, repo: str, path: str, ref: str = "HEAD"
+) -> Optional[str]:
+    """파일 콘텐츠 조회 (Raw, 비동기)."""
+    url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/{path}?ref={ref}"
+    headers = _build_headers()
+    headers["Accept"] = "application/vnd.github.v3.raw"
+
+    try:
+        resp = await get_async_http_client().get(url, headers=headers, timeout=10)
         if resp.status_code == 200:
             return resp.text
+        if resp.status_code == 404:
+            mark_negative()
         return None
     except Exception as e:
         logger.error("Error fetching file content %s: %s", path, e)
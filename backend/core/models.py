@@ -33,6 +33,15 @@ class RepoSnapshot:
         return f"{self.owner}/{self.repo}"
 
 
+@dataclass(frozen=True)
+class TreeEntry:
+    """git 트리 항목 (blob이면 sha가 파일 내용의 git blob SHA)."""
+    path: str
+    type: str = "blob"  # blob | tree | commit
+    sha: Optional[str] = None
+    size: int = 0
+
+
 @dataclass
 class DependencyInfo:
     """단일 의존성 정보."""
@@ -62,6 +71,17 @@ class DependenciesSnapshot:
 DependencySnapshot = DependenciesSnapshot
 
 
+@dataclass
+class DiagnosisBundle:
+    """진단 fetch 단계 결과 묶음 (합성 GraphQL + 파일 트리)."""
+    snapshot: RepoSnapshot
+    activity_summary: Dict[str, Any]
+    file_tree: List[str]
+    manifest_contents: Dict[str, Optional[str]] = field(default_factory=dict)
+    beginner_issues: List[Dict[str, Any]] = field(default_factory=list)
+    graphql_calls: int = 0
+
+
 @dataclass
 class DocsCoreResult:
     """문서 분석 결과."""
@@ -5,8 +5,15 @@ import logging
 import re
 from typing import Optional
 
+from backend.common.config import GITHUB_FETCH_MODE
 from backend.core.models import RepoSnapshot, StructureCoreResult
-from backend.core.github_core import fetch_repo_tree
+from backend.core.github_core import (
+    fetch_repo_archive,
+    fetch_repo_archive_async,
+    fetch_repo_tree,
+    fetch_repo_tree_async,
+)
+from backend.core.dependencies_core import MANIFEST_ARCHIVE_PATTERNS
 
 logger = logging.getLogger(__name__)
 
@@ -175,19 +182,57 @@ def _calculate_structure_score(
     return min(score, 100)
 
 
-def analyze_structure(snapshot: RepoSnapshot) -> StructureCoreResult:
+def analyze_structure(snapshot: RepoSnapshot, fetch_mode: Optional[str] = None) -> StructureCoreResult:
 
     owner = snapshot.owner
     repo = snapshot.repo
     ref = snapshot.ref
     
-    # 파일 트리 조회
+    # 파일 트리 조회 (archive 모드는 parse_dependencies와 같은 tarball 재사용)
     try:
-        file_tree = fetch_repo_tree(owner, repo, ref)
+        if (fetch_mode or GITHUB_FETCH_MODE) == "archive":
+            file_tree = fetch_repo_archive(owner, repo, ref, MANIFEST_ARCHIVE_PATTERNS).paths
+        else:
+            file_tree = fetch_repo_tree(owner, repo, ref)
     except Exception as e:
         logger.warning(f"Failed to fetch file tree for {owner}/{repo}: {e}")
         file_tree = []
     
+    return analyze_structure_from_tree(owner, repo, file_tree)
+
+
+async def analyze_structure_async(
+    snapshot: RepoSnapshot, fetch_mode: Optional[str] = None
+) -> StructureCoreResult:
+    """analyze_structure의 비동기 버전."""
+    owner = snapshot.owner
+    repo = snapshot.repo
+    
+    try:
+        file_tree = await fetch_structure_tree_async(owner, repo, snapshot.ref, fetch_mode)
+    except Exception as e:
+        logger.warning(f"Failed to fetch file tree for {owner}/{repo}: {e}")
+        file_tree = []
+    
+    return analyze_structure_from_tree(owner, repo, file_tree)
+
+
+async def fetch_structure_tree_async(
+    owner: str, repo: str, ref: str, fetch_mode: Optional[str] = None
+) -> list[str]:
+    """
+    구조 분석용 파일 경로 목록 조회 (저장소 메타데이터 없이 owner/repo/ref만 필요).
+
+    archive 모드는 의존성 분석과 같은 tarball을 재사용합니다.
+    """
+    if (fetch_mode or GITHUB_FETCH_MODE) == "archive":
+        archive = await fetch_repo_archive_async(owner, repo, ref, MANIFEST_ARCHIVE_PATTERNS)
+        return archive.paths
+    return await fetch_repo_tree_async(owner, repo, ref)
+
+
+def analyze_structure_from_tree(owner: str, repo: str, file_tree: list[str]) -> StructureCoreResult:
+    """파일 경로 목록 기반 구조 분석 (Pure Python)."""
     if not file_tree:
         logger.info(f"No file tree available for {owner}/{repo}, returning defaults")
         return StructureCoreResult(
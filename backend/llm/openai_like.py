@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 from openai import OpenAI
 
 from backend.common.config import LLM_API_BASE, LLM_MODEL_NAME, LLM_API_KEY
+from backend.common.deadline import clamp_timeout
 from .base import LLMClient, ChatRequest, ChatResponse, ChatMessage
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,8 @@ class OpenAILikeClient(LLMClient):
 
         last_error = None
         for attempt in range(self.max_retries):
+            # 요청 마감이 지났으면 DeadlineExceeded로 재시도 없이 중단
+            attempt_timeout = clamp_timeout(timeout)
             try:
                 response = self._client.chat.completions.create(
                     model=model,
@@ -67,7 +70,7 @@ class OpenAILikeClient(LLMClient):
                     max_tokens=request.max_tokens,
                     temperature=request.temperature,
                     top_p=request.top_p,
-                    timeout=timeout,
+                    timeout=attempt_timeout,
                 )
                 
                 content = response.choices[0].message.content
@@ -5,20 +5,31 @@ Usage:
     python backend/scripts/benchmark_repos.py
     python backend/scripts/benchmark_repos.py --preset oss_eval --output-format json
     python backend/scripts/benchmark_repos.py --output-path my_results.csv
+    python backend/scripts/benchmark_repos.py --repos-file repos.txt --concurrency 8 \\
+        --state-file nightly.sqlite --stream nightly.jsonl
 """
 import argparse
+import asyncio
 import csv
 import json
 import os
 import sys
 import logging
 from datetime import datetime
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from backend.api.agent_service import run_agent_task
+from backend.scripts.bulk_runner import (
+    SUMMARY_FIELDS,
+    BulkDiagnosisRunner,
+    add_runner_arguments,
+    load_repos_from_file,
+    run_with_progress,
+    runner_from_args,
+    summary_row,
+)
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -40,107 +51,25 @@ OSS_EVAL_REPOS = [
     ("microsoft", "vscode", "main"),
 ]
 
-def parse_repo_string(repo_str: str) -> Tuple[str, str, str]:
-    """
-    'owner/repo' 또는 'owner/repo@ref' 문자열을 파싱합니다.
-    ref가 없으면 'main'을 기본값으로 사용합니다.
-    """
-    repo_str = repo_str.strip()
-    ref = "main"
-    
-    if "@" in repo_str:
-        repo_part, ref = repo_str.split("@", 1)
-    else:
-        repo_part = repo_str
-        
-    if "/" not in repo_part:
-        raise ValueError(f"Invalid repo format: {repo_str}. Expected 'owner/repo' or 'owner/repo@ref'")
-        
-    owner, repo = repo_part.split("/", 1)
-    return owner.strip(), repo.strip(), ref.strip()
-
-def load_repos_from_file(file_path: str) -> List[Tuple[str, str, str]]:
-    repos = []
+def load_repos(file_path: str) -> List[Tuple[str, str, str]]:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                try:
-                    repos.append(parse_repo_string(line))
-                except ValueError as e:
-                    logger.warning(f"Skipping invalid line in {file_path}: {e}")
+        return load_repos_from_file(file_path)
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         sys.exit(1)
-    return repos
 
-def run_benchmark(repos: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
-    results = []
-    total = len(repos)
-    
-    for idx, (owner, repo, ref) in enumerate(repos, 1):
-        repo_id = f"{owner}/{repo}@{ref}"
-        logger.info(f"[{idx}/{total}] Diagnosing {repo_id}...")
-        
-        entry = {
-            "repo_id": repo_id,
-            "documentation_quality": None,
-            "activity_maintainability": None,
-            "health_score": None,
-            "health_level": None,
-            "onboarding_score": None,
-            "onboarding_level": None,
-            "dependency_complexity_score": None,
-            "dependency_flags": None,
-            "docs_issues_count": 0,
-            "activity_issues_count": 0,
-            "error": False,
-            "error_message": None,
-        }
-        
-        try:
-            # diagnose_repository 호출 (use_llm_summary=False로 속도 우선)
-            # 벤치마크는 점수 위주이므로 LLM 요약 불필요
-            response = run_agent_task(
-                task_type="diagnose_repo",
-                owner=owner,
-                repo=repo,
-                ref=ref,
-                use_llm_summary=False
-            )
-            
-            if not response["ok"]:
-                entry["error"] = True
-                entry["error_message"] = response["error"]
-                logger.warning(f"  -> Error: {response['error']}")
-            else:
-                data = response["data"]
-                entry["documentation_quality"] = data["documentation_quality"]
-                entry["activity_maintainability"] = data["activity_maintainability"]
-                entry["health_score"] = data["health_score"]
-                entry["health_level"] = data["health_level"]
-                entry["onboarding_score"] = data["onboarding_score"]
-                entry["onboarding_level"] = data["onboarding_level"]
-                
-                # 의존성 복잡도
-                entry["dependency_complexity_score"] = data["dependency_complexity_score"]
-                entry["dependency_flags"] = ",".join(data["dependency_flags"]) if data["dependency_flags"] else ""
-                
-                entry["docs_issues_count"] = data["docs_issues_count"]
-                entry["activity_issues_count"] = data["activity_issues_count"]
-                
-                logger.info(f"  -> Success. Health: {data['health_score']}, Complexity: {data['dependency_complexity_score']}")
-
-        except Exception as e:
-            entry["error"] = True
-            entry["error_message"] = str(e)
-            logger.error(f"  -> Exception: {e}")
-            
-        results.append(entry)
-        
-    return results
+def run_benchmark(
+    repos: List[Tuple[str, str, str]],
+    runner: Optional[BulkDiagnosisRunner] = None,
+    stream_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    레포지토리들을 동시에 진단합니다 (use_llm_summary=False로 속도 우선).
+    벤치마크는 점수 위주이므로 LLM 요약 불필요.
+    """
+    runner = runner or BulkDiagnosisRunner()
+    records = asyncio.run(run_with_progress(runner, repos, stream_path))
+    return [summary_row(record) for record in records]
 
 def save_results(results: List[Dict[str, Any]], output_path: str, output_format: str):
     if not results:
@@ -149,14 +78,7 @@ def save_results(results: List[Dict[str, Any]], output_path: str, output_format:
 
     try:
         if output_format == "csv":
-            keys = [
-                "repo_id", "documentation_quality", "activity_maintainability",
-                "health_score", "health_level",
-                "onboarding_score", "onboarding_level",
-                "dependency_complexity_score", "dependency_flags",
-                "docs_issues_count", "activity_issues_count",
-                "error", "error_message"
-            ]
+            keys = SUMMARY_FIELDS
             with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
                 writer = csv.DictWriter(f, fieldnames=keys)
                 writer.writeheader()
@@ -179,12 +101,13 @@ def main():
     parser.add_argument("--preset", help="Preset name (e.g., 'oss_eval')")
     parser.add_argument("--output-format", choices=["csv", "json"], default="csv", help="Output format (csv or json)")
     parser.add_argument("--output-path", help="Path to save the results")
+    add_runner_arguments(parser)
     
     args = parser.parse_args()
     
     # 레포 목록 로드
     if args.repos_file:
-        repos = load_repos_from_file(args.repos_file)
+        repos = load_repos(args.repos_file)
         logger.info(f"Loaded {len(repos)} repos from file: {args.repos_file}")
     elif args.preset == "oss_eval":
         repos = OSS_EVAL_REPOS
@@ -197,7 +120,7 @@ def main():
         logger.info("No repos file or preset provided. Using sample repos.")
 
     # 벤치마크 실행
-    results = run_benchmark(repos)
+    results = run_benchmark(repos, runner_from_args(args), args.stream)
     
     # 결과 저장
     if args.output_path:
@@ -0,0 +1,437 @@
+"""
+대량 진단 실행기 - 저장소 목록을 동시에 진단하고 결과를 끝나는 순서대로 스트리밍.
+
+benchmark_repos.py / generate_baseline.py / compare_repos.py가 공유합니다.
+- 세마포어로 동시 진단 수 제한 (--concurrency)
+- 진단 전에 저장소를 GITHUB_GRAPHQL_BATCH_MAX_REPOS개씩 묶어 배치 GraphQL로 번들을 미리 조회
+- GitHub core 잔여 예산이 BULK_DIAGNOSIS_MIN_RATE_BUDGET보다 적으면 reset까지 새 진단을 멈춤
+- SQLite 상태 파일(--state-file)에 저장소별 결과를 기록해, 중단 후 다시 실행하면
+  끝난 저장소는 건너뛰고 실패한 저장소만 BULK_DIAGNOSIS_MAX_ATTEMPTS까지 재시도
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from backend.common.config import (
+    BULK_DIAGNOSIS_CONCURRENCY,
+    BULK_DIAGNOSIS_MAX_ATTEMPTS,
+    BULK_DIAGNOSIS_MAX_PAUSE,
+    BULK_DIAGNOSIS_MIN_RATE_BUDGET,
+    GITHUB_GRAPHQL_BATCH_MAX_REPOS,
+)
+from backend.common.rate_limiter import RateLimitScheduler, get_rate_limit_scheduler
+
+logger = logging.getLogger(__name__)
+
+RepoSpec = Tuple[str, str, str]
+DiagnoseFunc = Callable[[str, str, str], Awaitable[Dict[str, Any]]]
+PrefetchFunc = Callable[[List[Tuple[str, str]], str], Awaitable[None]]
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# 벤치마크/베이스라인 결과 행 필드 (CSV 컬럼 순서)
+SUMMARY_FIELDS = [
+    "repo_id", "documentation_quality", "activity_maintainability",
+    "health_score", "health_level",
+    "onboarding_score", "onboarding_level",
+    "dependency_complexity_score", "dependency_flags",
+    "docs_issues_count", "activity_issues_count",
+    "error", "error_message",
+]
+
+
+def parse_repo_string(repo_str: str) -> RepoSpec:
+    """
+    'owner/repo' 또는 'owner/repo@ref' 문자열을 파싱합니다.
+    ref가 없으면 'main'을 기본값으로 사용합니다.
+    """
+    repo_str = repo_str.strip()
+    ref = "main"
+
+    if "@" in repo_str:
+        repo_part, ref = repo_str.split("@", 1)
+    else:
+        repo_part = repo_str
+
+    if "/" not in repo_part:
+        raise ValueError(f"Invalid repo format: {repo_str}. Expected 'owner/repo' or 'owner/repo@ref'")
+
+    owner, repo = repo_part.split("/", 1)
+    return owner.strip(), repo.strip(), ref.strip()
+
+
+def load_repos_from_file(file_path: str) -> List[RepoSpec]:
+    """한 줄에 하나씩 저장소를 적은 파일 로드 (빈 줄/# 주석 무시, 파일이 없으면 FileNotFoundError)."""
+    repos = []
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                repos.append(parse_repo_string(line))
+            except ValueError as e:
+                logger.warning(f"Skipping invalid line in {file_path}: {e}")
+    return repos
+
+
+def summary_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """실행 결과를 벤치마크/베이스라인 결과 행으로 변환."""
+    row: Dict[str, Any] = {key: None for key in SUMMARY_FIELDS}
+    row.update(
+        repo_id=record["repo_id"],
+        docs_issues_count=0,
+        activity_issues_count=0,
+        error=record["status"] != STATUS_DONE,
+        error_message=record.get("error"),
+    )
+    data = record.get("data")
+    if row["error"] or not data:
+        return row
+
+    for key in SUMMARY_FIELDS[1:-2]:
+        row[key] = data.get(key)
+    flags = data.get("dependency_flags")
+    row["dependency_flags"] = ",".join(flags) if flags else ""
+    row["docs_issues_count"] = data.get("docs_issues_count", 0)
+    row["activity_issues_count"] = data.get("activity_issues_count", 0)
+    return row
+
+
+async def diagnose_repo(owner: str, repo: str, ref: str) -> Dict[str, Any]:
+    """기본 진단 함수 (점수 위주 대량 실행이므로 LLM 요약 없음)."""
+    from backend.api.agent_service import run_agent_task_async
+
+    return await run_agent_task_async(
+        task_type="diagnose_repo",
+        owner=owner,
+        repo=repo,
+        ref=ref,
+        use_llm_summary=False,
+    )
+
+
+async def prefetch_repos(repos: List[Tuple[str, str]], ref: str) -> None:
+    """기본 사전 조회 함수 (diagnose_repo의 full_path가 재사용하는 진단 번들 캐시를 배치로 채움)."""
+    from backend.agents.comparison.nodes import prefetch_bundles
+
+    await prefetch_bundles(repos, ref)
+
+
+def _is_rate_limited(error: Optional[str]) -> bool:
+    return bool(error) and "rate limit" in error.lower()
+
+
+class CheckpointStore:
+    """
+    저장소별 최신 실행 결과를 담는 SQLite 상태 파일.
+
+    결과는 끝날 때마다 바로 커밋되므로 실행이 중간에 죽어도 끝난 저장소는 남습니다.
+    path가 ":memory:"면 재개 없이 한 번만 쓰는 저장소입니다.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " repo_id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL,"
+            " record TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, repo_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT record FROM results WHERE repo_id = ?", (repo_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, record: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (repo_id, status, attempts, record, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                record["repo_id"],
+                record["status"],
+                record["attempts"],
+                json.dumps(record, ensure_ascii=False, default=str),
+                time.time(),
+            ),
+        )
+        self._conn.commit()
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._conn.execute("SELECT status, COUNT(*) FROM results GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM results")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class BulkDiagnosisRunner:
+    """
+    저장소 목록 동시 진단기.
+
+    stream()은 새로 끝난 결과를 완료 순서대로 내보내고, run()은 상태 파일에 남은 이전 결과까지
+    입력 순서대로 돌려줍니다. 결과 record는 repo_id/owner/repo/ref/status/attempts/data/error/finished_at.
+
+    실행할 저장소는 ref별로 prefetch_chunk_size개씩 묶어, 묶음의 첫 진단이 시작될 때 한 번
+    prefetch로 번들을 미리 조회합니다 (diagnose를 직접 넘기면 기본 prefetch는 쓰지 않음).
+    """
+
+    def __init__(
+        self,
+        diagnose: Optional[DiagnoseFunc] = None,
+        concurrency: int = BULK_DIAGNOSIS_CONCURRENCY,
+        store: Optional[CheckpointStore] = None,
+        max_attempts: int = BULK_DIAGNOSIS_MAX_ATTEMPTS,
+        min_rate_budget: int = BULK_DIAGNOSIS_MIN_RATE_BUDGET,
+        max_pause: float = BULK_DIAGNOSIS_MAX_PAUSE,
+        rate_scheduler: Optional[RateLimitScheduler] = None,
+        prefetch: Optional[PrefetchFunc] = None,
+        prefetch_chunk_size: int = GITHUB_GRAPHQL_BATCH_MAX_REPOS,
+    ):
+        self._diagnose = diagnose or diagnose_repo
+        self._prefetch = prefetch or (prefetch_repos if diagnose is None else None)
+        self.prefetch_chunk_size = max(1, prefetch_chunk_size)
+        self._prefetch_chunks: Dict[int, Tuple[str, List[Tuple[str, str]]]] = {}
+        self._prefetch_tasks: Dict[int, asyncio.Task] = {}
+        self._chunk_of: Dict[str, int] = {}
+        self.concurrency = max(1, concurrency)
+        self.store = store or CheckpointStore()
+        self.max_attempts = max(1, max_attempts)
+        self.min_rate_budget = min_rate_budget
+        self.max_pause = max_pause
+        self._rate_scheduler = rate_scheduler
+        self._pause_lock: Optional[asyncio.Lock] = None
+
+    def _pending(self, repos: Iterable[RepoSpec]) -> List[Tuple[RepoSpec, int]]:
+        """이번에 실행할 저장소와 이전 시도 횟수 (끝났거나 시도를 다 쓴 저장소, 중복 제외)."""
+        pending = []
+        seen = set()
+        skipped = 0
+        for owner, repo, ref in repos:
+            repo_id = f"{owner}/{repo}@{ref}"
+            if repo_id in seen:
+                continue
+            seen.add(repo_id)
+            previous = self.store.get(repo_id)
+            attempts = previous["attempts"] if previous else 0
+            if previous and (previous["status"] == STATUS_DONE or attempts >= self.max_attempts):
+                skipped += 1
+                continue
+            pending.append(((owner, repo, ref), attempts))
+        if skipped:
+            logger.info(f"Resuming: skipping {skipped} repos already in {self.store.path}")
+        return pending
+
+    async def stream(self, repos: Iterable[RepoSpec]) -> AsyncIterator[Dict[str, Any]]:
+        """새로 끝난 진단 결과를 완료 순서대로 반환 (중단되면 진행 중인 진단은 취소)."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._pause_lock = asyncio.Lock()
+        pending = self._pending(repos)
+        self._plan_prefetch([spec for spec, _ in pending])
+        tasks = [
+            asyncio.create_task(self._run_one(semaphore, spec, attempts))
+            for spec, attempts in pending
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            prefetches = list(self._prefetch_tasks.values())
+            for task in prefetches:
+                task.cancel()
+            await asyncio.gather(*tasks, *prefetches, return_exceptions=True)
+
+    async def run(self, repos: Iterable[RepoSpec]) -> List[Dict[str, Any]]:
+        """전체 실행 후 입력 순서대로 결과 반환 (이전 실행에서 끝난 결과 포함)."""
+        repos = list(repos)
+        async for _ in self.stream(repos):
+            pass
+        return self.records(repos)
+
+    def records(self, repos: Iterable[RepoSpec]) -> List[Dict[str, Any]]:
+        """상태 파일에 있는 결과를 입력 순서대로 반환 (실행하지 않음)."""
+        records = []
+        for repo_id in dict.fromkeys(f"{o}/{r}@{ref}" for o, r, ref in repos):
+            record = self.store.get(repo_id)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def _plan_prefetch(self, specs: List[RepoSpec]) -> None:
+        """실행할 저장소를 ref별 prefetch_chunk_size개 묶음으로 나눔 (repo_id → 묶음 번호)."""
+        self._prefetch_chunks = {}
+        self._prefetch_tasks = {}
+        self._chunk_of = {}
+        if self._prefetch is None:
+            return
+        by_ref: Dict[str, List[Tuple[str, str]]] = {}
+        for owner, repo, ref in specs:
+            by_ref.setdefault(ref, []).append((owner, repo))
+        chunks: List[Tuple[str, List[Tuple[str, str]]]] = []
+        for ref, pairs in by_ref.items():
+            for start in range(0, len(pairs), self.prefetch_chunk_size):
+                chunks.append((ref, pairs[start:start + self.prefetch_chunk_size]))
+        for index, (ref, pairs) in enumerate(chunks):
+            self._prefetch_chunks[index] = (ref, pairs)
+            for owner, repo in pairs:
+                self._chunk_of[f"{owner}/{repo}@{ref}"] = index
+
+    async def _prefetch_for(self, repo_id: str) -> None:
+        """저장소가 속한 묶음의 사전 조회를 (처음 요청될 때 한 번) 기다림. 실패해도 진단은 진행."""
+        index = self._chunk_of.get(repo_id)
+        if index is None:
+            return
+        task = self._prefetch_tasks.get(index)
+        if task is None:
+            ref, pairs = self._prefetch_chunks[index]
+            task = asyncio.create_task(self._prefetch(pairs, ref))
+            self._prefetch_tasks[index] = task
+        try:
+            await asyncio.shield(task)
+        except Exception as e:
+            logger.info(f"Bundle prefetch failed for chunk {index}, diagnosing individually: {e}")
+
+    async def _run_one(self, semaphore: asyncio.Semaphore, spec: RepoSpec, attempts: int) -> Dict[str, Any]:
+        owner, repo, ref = spec
+        repo_id = f"{owner}/{repo}@{ref}"
+        async with semaphore:
+            await self._prefetch_for(repo_id)
+            while True:
+                await self._wait_for_rate_budget()
+                attempts += 1
+                started = time.monotonic()
+                try:
+                    response = await self._diagnose(owner, repo, ref)
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                ok = bool(response.get("ok"))
+                error = None if ok else str(response.get("error") or "unknown error")
+                if ok or not _is_rate_limited(error) or attempts >= self.max_attempts:
+                    break
+                logger.warning(f"{repo_id} hit GitHub rate limit (attempt {attempts}), retrying after pause")
+                await self._wait_for_rate_budget(force=True)
+
+        record = {
+            "repo_id": repo_id,
+            "owner": owner,
+            "repo": repo,
+            "ref": ref,
+            "status": STATUS_DONE if ok else STATUS_FAILED,
+            "attempts": attempts,
+            "data": response.get("data") if ok else None,
+            "error": error,
+            "duration_s": round(time.monotonic() - started, 2),
+            "finished_at": datetime.now().isoformat(),
+        }
+        self.store.save(record)
+        return record
+
+    async def _wait_for_rate_budget(self, force: bool = False) -> None:
+        """
+        남은 GitHub 예산이 min_rate_budget보다 적으면 reset까지(최대 max_pause초) 대기.
+
+        한 작업자만 대기하고 나머지는 lock 뒤에서 기다렸다가 예산을 다시 확인합니다.
+        force면 rate limit 응답을 받은 직후이므로 예산 추정치와 관계없이 대기합니다.
+        """
+        if self.min_rate_budget <= 0 and not force:
+            return
+        scheduler = self._rate_scheduler or get_rate_limit_scheduler()
+        async with self._pause_lock:
+            remaining, reset_in = scheduler.headroom("core")
+            if not force and (remaining >= self.min_rate_budget or reset_in <= 0):
+                return
+            pause = min(reset_in or self.max_pause, self.max_pause)
+            if pause <= 0:
+                return
+            logger.warning(f"GitHub core budget low ({remaining} left), pausing new diagnoses for {pause:.0f}s")
+            await asyncio.sleep(pause)
+
+
+# === 스크립트 공용 ===
+
+def add_runner_arguments(parser: argparse.ArgumentParser) -> None:
+    """--concurrency / --state-file / --fresh / --stream 옵션 추가."""
+    parser.add_argument(
+        "--concurrency", type=int, default=BULK_DIAGNOSIS_CONCURRENCY,
+        help="Number of repositories diagnosed at the same time",
+    )
+    parser.add_argument(
+        "--state-file",
+        help="SQLite checkpoint file; re-running with the same file resumes where it stopped",
+    )
+    parser.add_argument(
+        "--fresh", action="store_true",
+        help="Ignore results already recorded in --state-file",
+    )
+    parser.add_argument(
+        "--stream",
+        help="Write each result as a JSON line as soon as it finishes ('-' for stdout)",
+    )
+
+
+def runner_from_args(args: argparse.Namespace, **kwargs: Any) -> BulkDiagnosisRunner:
+    store = CheckpointStore(args.state_file or ":memory:")
+    if args.fresh:
+        store.clear()
+    return BulkDiagnosisRunner(concurrency=args.concurrency, store=store, **kwargs)
+
+
+@contextmanager
+def _open_stream(path: Optional[str]) -> Iterator[Optional[TextIO]]:
+    if not path:
+        yield None
+    elif path == "-":
+        yield sys.stdout
+    else:
+        with open(path, "a", encoding="utf-8") as f:
+            yield f
+
+
+async def run_with_progress(
+    runner: BulkDiagnosisRunner,
+    repos: List[RepoSpec],
+    stream_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """진행 상황을 로그로 남기고 결과 행을 끝나는 대로 JSONL로 쓰면서 실행."""
+    total = len(repos)
+    finished = 0
+    with _open_stream(stream_path) as out:
+        async for record in runner.stream(repos):
+            finished += 1
+            row = summary_row(record)
+            if row["error"]:
+                logger.warning(f"[{finished}] {record['repo_id']} -> Error: {record['error']}")
+            else:
+                logger.info(
+                    f"[{finished}] {record['repo_id']} -> Success. Health: {row['health_score']}, "
+                    f"Onboarding: {row['onboarding_score']}, Complexity: {row['dependency_complexity_score']} "
+                    f"({record['duration_s']}s)"
+                )
+            if out is not None:
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+                out.flush()
+    records = runner.records(repos)
+    logger.info(f"Finished {finished} new diagnoses ({len(records)}/{total} repos have results)")
+    return records
@@ -6,68 +6,47 @@ Usage:
     python backend/scripts/compare_repos.py repo1 repo2 --output-json
 """
 import argparse
+import asyncio
 import json
 import os
 import sys
 import logging
-from typing import Tuple, Dict, Any
+from typing import Dict, Any, List
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from backend.api.agent_service import run_agent_task
+from backend.scripts.bulk_runner import STATUS_DONE, BulkDiagnosisRunner, parse_repo_string
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-def parse_repo_string(repo_str: str) -> Tuple[str, str, str]:
+def run_diagnoses_safe(repo_strs: List[str]) -> List[Dict[str, Any]]:
     """
-    'owner/repo' 또는 'owner/repo@ref' 문자열을 파싱합니다.
-    ref가 없으면 'main'을 기본값으로 사용합니다.
-    (benchmark_repos.py와 동일한 로직)
-    """
-    repo_str = repo_str.strip()
-    ref = "main"
-    
-    if "@" in repo_str:
-        repo_part, ref = repo_str.split("@", 1)
-    else:
-        repo_part = repo_str
-        
-    if "/" not in repo_part:
-        raise ValueError(f"Invalid repo format: {repo_str}. Expected 'owner/repo' or 'owner/repo@ref'")
-        
-    owner, repo = repo_part.split("/", 1)
-    return owner.strip(), repo.strip(), ref.strip()
+    레포지토리들을 동시에 진단하고 에러 발생 시 종료합니다.
 
-def run_diagnosis_safe(repo_str: str) -> Dict[str, Any]:
-    """진단을 실행하고 에러 발생 시 종료합니다."""
+    "점수 계산은 항상 빠르게, LLM 요약은 선택 사항" 취지에 따라 LLM 요약 없이 진행합니다.
+    """
     try:
-        owner, repo, ref = parse_repo_string(repo_str)
-        logger.info(f"Diagnosing {repo_str}...")
-        
-        # CLI에서는 기본적으로 LLM 요약 없이 빠르게 진행 (필요시 옵션 처리 가능)
-        # 하지만 compare_repos는 상세 비교이므로 LLM 요약이 있으면 좋을 수도 있음.
-        # 일단 속도를 위해 False로 설정하거나, 인자로 받을 수 있게 확장 가능.
-        # 여기서는 사용자 요청에 따라 "점수 계산은 항상 빠르게, LLM 요약은 선택 사항" 취지를 살려 False로 둠.
-        response = run_agent_task(
-            task_type="diagnose_repo",
-            owner=owner,
-            repo=repo,
-            ref=ref,
-            use_llm_summary=False
-        )
-        
-        if not response["ok"]:
-            logger.error(f"Failed to diagnose {repo_str}: {response['error']}")
-            sys.exit(1)
-            
-        return response["data"]
-    except Exception as e:
-        logger.error(f"Exception while diagnosing {repo_str}: {e}")
+        specs = [parse_repo_string(repo_str) for repo_str in repo_strs]
+    except ValueError as e:
+        logger.error(str(e))
         sys.exit(1)
 
+    logger.info(f"Diagnosing {', '.join(repo_strs)}...")
+    runner = BulkDiagnosisRunner(concurrency=len(specs))
+    records = {record["repo_id"]: record for record in asyncio.run(runner.run(specs))}
+
+    results = []
+    for repo_str, (owner, repo, ref) in zip(repo_strs, specs):
+        record = records[f"{owner}/{repo}@{ref}"]
+        if record["status"] != STATUS_DONE:
+            logger.error(f"Failed to diagnose {repo_str}: {record['error']}")
+            sys.exit(1)
+        results.append(record["data"])
+    return results
+
 def print_comparison_table(repo1_str: str, result1: Dict[str, Any], 
                            repo2_str: str, result2: Dict[str, Any]):
     """두 진단 결과를 텍스트 표 형태로 출력합니다."""
@@ -127,8 +106,7 @@ def main():
     args = parser.parse_args()
     
     # 진단 실행
-    result1 = run_diagnosis_safe(args.repo1)
-    result2 = run_diagnosis_safe(args.repo2)
+    result1, result2 = run_diagnoses_safe([args.repo1, args.repo2])
     
     # 결과 출력
     if args.output_json:
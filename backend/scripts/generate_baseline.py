@@ -5,19 +5,27 @@ Usage:
     python backend/scripts/generate_baseline.py
     python backend/scripts/generate_baseline.py --output tests/fixtures/oss_eval_baseline.json
     python backend/scripts/generate_baseline.py --repos "owner/repo@ref,owner2/repo2"
+    python backend/scripts/generate_baseline.py --concurrency 4 --state-file baseline.sqlite
 """
 import argparse
+import asyncio
 import json
 import os
 import sys
 import logging
-from datetime import datetime
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from backend.api.agent_service import run_agent_task
+from backend.scripts.bulk_runner import (
+    BulkDiagnosisRunner,
+    add_runner_arguments,
+    parse_repo_string,
+    run_with_progress,
+    runner_from_args,
+    summary_row,
+)
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -32,84 +40,21 @@ DEFAULT_REPOS = [
 ]
 
 
-def parse_repo_string(repo_str: str) -> Tuple[str, str, str]:
-    """'owner/repo@ref' 문자열을 파싱합니다."""
-    repo_str = repo_str.strip()
-    ref = "main"
-    
-    if "@" in repo_str:
-        repo_part, ref = repo_str.split("@", 1)
-    else:
-        repo_part = repo_str
-        
-    if "/" not in repo_part:
-        raise ValueError(f"Invalid repo format: {repo_str}")
-        
-    owner, repo = repo_part.split("/", 1)
-    return owner.strip(), repo.strip(), ref.strip()
-
+def generate_baseline(
+    repos: List[Tuple[str, str, str]],
+    runner: Optional[BulkDiagnosisRunner] = None,
+    stream_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """레포지토리 목록에 대해 베이스라인 데이터를 생성합니다 (동시 실행, 입력 순서 유지)."""
+    runner = runner or BulkDiagnosisRunner()
+    records = asyncio.run(run_with_progress(runner, repos, stream_path))
 
-def generate_baseline(repos: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
-    """레포지토리 목록에 대해 베이스라인 데이터를 생성합니다."""
     results = []
-    total = len(repos)
-    
-    for idx, (owner, repo, ref) in enumerate(repos, 1):
-        repo_id = f"{owner}/{repo}@{ref}"
-        logger.info(f"[{idx}/{total}] Generating baseline for {repo_id}...")
-        
-        entry = {
-            "repo_id": repo_id,
-            "documentation_quality": None,
-            "activity_maintainability": None,
-            "health_score": None,
-            "health_level": None,
-            "onboarding_score": None,
-            "onboarding_level": None,
-            "dependency_complexity_score": None,
-            "dependency_flags": "",
-            "docs_issues_count": 0,
-            "activity_issues_count": 0,
-            "error": False,
-            "error_message": None,
-            "generated_at": datetime.now().isoformat(),
-        }
-        
-        try:
-            result = run_agent_task(
-                task_type="diagnose_repo",
-                owner=owner,
-                repo=repo,
-                ref=ref,
-                use_llm_summary=False
-            )
-            
-            if not result["ok"]:
-                entry["error"] = True
-                entry["error_message"] = result.get("error")
-                logger.warning(f"  -> Error: {result.get('error')}")
-            else:
-                data = result["data"]
-                entry["documentation_quality"] = data["documentation_quality"]
-                entry["activity_maintainability"] = data["activity_maintainability"]
-                entry["health_score"] = data["health_score"]
-                entry["health_level"] = data["health_level"]
-                entry["onboarding_score"] = data["onboarding_score"]
-                entry["onboarding_level"] = data["onboarding_level"]
-                entry["dependency_complexity_score"] = data["dependency_complexity_score"]
-                entry["dependency_flags"] = ",".join(data["dependency_flags"]) if data["dependency_flags"] else ""
-                entry["docs_issues_count"] = data["docs_issues_count"]
-                entry["activity_issues_count"] = data["activity_issues_count"]
-                
-                logger.info(f"  -> Success. Health: {data['health_score']}, Onboarding: {data['onboarding_score']}")
-                
-        except Exception as e:
-            entry["error"] = True
-            entry["error_message"] = str(e)
-            logger.error(f"  -> Exception: {e}")
-        
+    for record in records:
+        entry = summary_row(record)
+        entry["dependency_flags"] = entry["dependency_flags"] or ""
+        entry["generated_at"] = record["finished_at"]
         results.append(entry)
-    
     return results
 
 
@@ -138,6 +83,7 @@ def main():
         "--repos",
         help="Comma-separated list of repos (owner/repo@ref)"
     )
+    add_runner_arguments(parser)
     
     args = parser.parse_args()
     
@@ -150,7 +96,7 @@ def main():
         logger.info(f"Using default repos: {len(repos)} repos")
     
     # 베이스라인 생성
-    results = generate_baseline(repos)
+    results = generate_baseline(repos, runner_from_args(args), args.stream)
     
     # 저장
     save_baseline(results, args.output)
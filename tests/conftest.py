@@ -8,8 +8,11 @@ pytest 설정 및 공통 fixture.
     # 전체 테스트 실행 (CI/CD)
     pytest
 """
+import threading
+from http.server import ThreadingHTTPServer
+
 import pytest
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from unittest.mock import MagicMock, AsyncMock
 
 
@@ -135,3 +138,44 @@ def mock_github_client():
         {"sha": "abc123", "message": "Initial commit"}
     ])
     return mock
+
+
+@pytest.fixture
+def local_github_server(monkeypatch) -> Callable[..., str]:
+    """
+    로컬 GitHub API 흉내 서버 팩토리.
+
+    start(handler_cls, *modules)는 do_GET만 정의한 핸들러로 keep-alive(HTTP/1.1) 서버를 띄우고,
+    넘긴 모듈들의 GITHUB_API_BASE를 서버 주소로 바꾼 뒤 base URL을 반환합니다.
+    handler_cls에 requests_seen 목록이 있으면 빈 목록으로 초기화합니다. 서버는 테스트 후 종료.
+    """
+    servers = []
+
+    def start(handler_cls, *modules) -> str:
+        if hasattr(handler_cls, "requests_seen"):
+            handler_cls.requests_seen = []
+        handler_cls.protocol_version = "HTTP/1.1"
+        handler_cls.log_message = lambda self, format, *args: None
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        for module in modules:
+            monkeypatch.setattr(module, "GITHUB_API_BASE", base)
+        return base
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_health_history(monkeypatch):
+    """진단 테스트가 로컬 건강도 시계열 파일에 기록을 남기지 않도록 메모리 저장소 사용."""
+    from backend.common import health_history
+
+    store = health_history.HealthHistoryStore(":memory:")
+    monkeypatch.setattr(health_history, "_store", store)
+    yield store
+    store.close()
@@ -3,7 +3,10 @@
 
 CacheManager 클래스 및 캐시 무효화 트리거 테스트.
 """
+import asyncio
 import time
+from datetime import datetime, timedelta
+
 import pytest
 
 from backend.common.cache_manager import (
@@ -128,6 +131,82 @@ class TestCacheInvalidationTrigger:
         """캐시가 없으면 무효화 불필요."""
         result = self.trigger.should_invalidate_on_push("nonexistent", "repo", "main", time.time())
         assert result is False
+    
+    def test_reanalysis_debounced_per_repo(self):
+        """연속 push는 마지막 push 이후 한 번만 재분석."""
+        trigger = CacheInvalidationTrigger(self.cache, debounce_seconds=0.05)
+        calls = []
+        
+        async def reanalyze():
+            calls.append(1)
+            self.cache.set_analysis("owner", "repo", "main", {"v": 2})
+        
+        async def run():
+            scheduled = []
+            for _ in range(3):
+                scheduled.append(trigger.schedule_reanalysis("owner", "repo", "main", reanalyze))
+                await asyncio.sleep(0.02)
+            pending = trigger.has_pending_reanalysis("owner", "repo", "main")
+            await asyncio.sleep(0.15)
+            return scheduled, pending
+        
+        scheduled, pending = asyncio.run(run())
+        assert scheduled == [True, False, False]
+        assert pending is True
+        assert calls == [1]
+        assert not trigger.has_pending_reanalysis("owner", "repo", "main")
+        assert self.cache.get_analysis("owner", "repo", "main") == {"v": 2}
+
+
+class TestStaleWhileRevalidate:
+    """만료 후 유예 기간 stale 제공 및 백그라운드 갱신 테스트."""
+    
+    def setup_method(self):
+        self.cache = CacheManager(default_ttl_hours=1, stale_grace_hours=2)
+        self.cache.set_analysis("owner", "repo", "main", {"v": 1})
+    
+    def _age(self, hours: float):
+        key = self.cache.make_repo_key("owner", "repo", "main")
+        entry = self.cache.get_entry(key, allow_stale=True)
+        entry.cached_at = datetime.now() - timedelta(hours=hours)
+    
+    def test_fresh_and_stale_lookup(self):
+        fresh = self.cache.lookup_analysis("owner", "repo", "main")
+        assert fresh.stale is False
+        assert fresh.data == {"v": 1}
+        
+        self._age(1.5)
+        stale = self.cache.lookup_analysis("owner", "repo", "main")
+        assert stale.stale is True
+        assert stale.age_seconds >= 5400
+        # 기존 조회 API는 신선한 결과만 반환
+        assert self.cache.get_analysis("owner", "repo", "main") is None
+        
+        self._age(3.5)
+        assert self.cache.lookup_analysis("owner", "repo", "main") is None
+    
+    def test_refresh_runs_once_per_key(self):
+        self._age(1.5)
+        calls = []
+        
+        async def refresh():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            self.cache.set_analysis("owner", "repo", "main", {"v": 2})
+        
+        async def run():
+            scheduled = [
+                self.cache.refresh_in_background("owner", "repo", "main", refresh)
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.1)
+            return scheduled
+        
+        assert asyncio.run(run()) == [True, False, False, False, False]
+        assert calls == [1]
+        lookup = self.cache.lookup_analysis("owner", "repo", "main")
+        assert lookup.stale is False
+        assert lookup.data == {"v": 2}
 
 
 class TestGlobalAnalysisCache:
@@ -0,0 +1,206 @@
+"""
+분석 작업 큐 테스트.
+
+POST /api/analyze가 작업 ID를 즉시 반환하고, 같은 저장소+ref 제출이 작업을 공유하며,
+동시 실행 수 제한과 상태/결과/취소 조회가 동작하는지 검증.
+"""
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api import http_router
+from backend.api.analysis_jobs import AnalysisJobQueue, analysis_job_id
+
+
+def test_job_id_matches_response_job_id():
+    assert analysis_job_id("o", "r", "main") == "o/r@main"
+    with_message = analysis_job_id("o", "r", "main", "보안 중점")
+    assert with_message.startswith("o/r@main:")
+    assert with_message != analysis_job_id("o", "r", "main", "문서 중점")
+    assert analysis_job_id("o", "r", "main", priority="speed") != "o/r@main"
+
+
+def test_job_id_separates_deadlines():
+    no_deadline = analysis_job_id("o", "r", "main")
+    short = analysis_job_id("o", "r", "main", time_budget=2.0)
+    assert short != no_deadline
+    assert short != analysis_job_id("o", "r", "main", time_budget=30.0)
+    assert short == analysis_job_id("o", "r", "main", time_budget=2.0)
+    assert analysis_job_id("o", "r", "main", priority="speed", time_budget=10.0) != analysis_job_id(
+        "o", "r", "main", priority="speed", time_budget=2.0
+    )
+
+
+def test_same_job_id_shares_running_job():
+    calls = []
+
+    async def main():
+        queue = AnalysisJobQueue(max_workers=2)
+        release = asyncio.Event()
+
+        async def run():
+            calls.append(1)
+            await release.wait()
+            return {"score": 1}
+
+        first = queue.submit("o/r@main", run)
+        second = queue.submit("o/r@main", run)
+        await asyncio.sleep(0)
+        release.set()
+        await queue.wait("o/r@main")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert first.submissions == 2
+    assert first.status == "done"
+    assert first.result == {"score": 1}
+    assert calls == [1]
+
+
+def test_worker_pool_bounds_concurrency():
+    async def main():
+        queue = AnalysisJobQueue(max_workers=2)
+        running = []
+        peak = []
+        release = asyncio.Event()
+
+        def make_run(i):
+            async def run():
+                running.append(i)
+                peak.append(len(running))
+                await release.wait()
+                running.remove(i)
+                return {"i": i}
+            return run
+
+        jobs = [queue.submit(f"o/r{i}@main", make_run(i)) for i in range(4)]
+        await asyncio.sleep(0.01)
+        statuses = [job.status for job in jobs]
+        release.set()
+        for job in jobs:
+            await queue.wait(job.job_id)
+        return statuses, max(peak), queue.stats()
+
+    statuses, peak, stats = asyncio.run(main())
+    assert statuses.count("running") == 2
+    assert statuses.count("queued") == 2
+    assert peak == 2
+    assert stats["done"] == 4
+
+
+def test_cancel_and_failure_states():
+    async def main():
+        queue = AnalysisJobQueue(max_workers=1)
+
+        async def forever():
+            await asyncio.sleep(10)
+            return {}
+
+        async def broken():
+            raise HTTPException(status_code=502, detail="GitHub unavailable")
+
+        queue.submit("slow", forever)
+        queue.submit("broken", broken)
+        await asyncio.sleep(0)
+        queue.cancel("slow")
+        await queue.wait("slow", 1)
+        await queue.wait("broken", 1)
+        return queue.get("slow"), queue.get("broken")
+
+    slow, broken = asyncio.run(main())
+    assert slow.status == "cancelled"
+    assert broken.status == "failed"
+    assert broken.error == "GitHub unavailable"
+    assert broken.error_status == 502
+
+
+def test_finished_job_can_be_resubmitted():
+    async def main():
+        queue = AnalysisJobQueue()
+
+        async def run():
+            return {"ok": True}
+
+        first = queue.submit("o/r@main", run)
+        await queue.wait("o/r@main")
+        second = queue.submit("o/r@main", run)
+        await queue.wait("o/r@main")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is not second
+    assert second.status == "done"
+
+
+@pytest.fixture
+def isolated_queue(monkeypatch):
+    queue = AnalysisJobQueue(max_workers=2)
+    monkeypatch.setattr(http_router, "get_analysis_job_queue", lambda: queue)
+
+    from backend.common.cache_manager import analysis_cache
+    monkeypatch.setattr(analysis_cache, "lookup_analysis", lambda *args: None)
+    monkeypatch.setattr(analysis_cache, "set_analysis", lambda *args, **kwargs: None)
+    return queue
+
+
+def _response(owner, repo, ref):
+    return http_router.AnalyzeResponse(job_id=f"{owner}/{repo}@{ref}", score=70, analysis={})
+
+
+def test_analyze_without_wait_returns_job(isolated_queue, monkeypatch):
+    calls = []
+
+    async def fake_run_analysis(owner, repo, ref, user_message, priority, time_budget=None):
+        calls.append(owner)
+        await asyncio.sleep(0.01)
+        return _response(owner, repo, ref)
+
+    monkeypatch.setattr(http_router, "_run_analysis", fake_run_analysis)
+
+    async def main():
+        request = http_router.AnalyzeRequest(repo_url="https://github.com/o/r", wait=False)
+        accepted = await http_router.analyze_repository(request)
+        duplicate = await http_router.analyze_repository(request)
+        pending = await http_router.get_analysis_job_result("o/r@main")
+        result = await http_router.get_analysis_job_result("o/r@main", wait=5)
+        status = await http_router.get_analysis_job("o/r@main")
+        return accepted, duplicate, pending, result, status
+
+    accepted, duplicate, pending, result, status = asyncio.run(main())
+
+    assert accepted.status_code == 202
+    body = json.loads(accepted.body)
+    assert body["job_id"] == "o/r@main"
+    assert body["status"] in ("queued", "running")
+    assert json.loads(duplicate.body)["submissions"] == 2
+    assert pending.status_code == 202
+    assert result.score == 70
+    assert status.status == "done"
+    assert calls == ["o"]
+
+
+def test_cancel_endpoint(isolated_queue, monkeypatch):
+    async def slow_analysis(owner, repo, ref, user_message, priority, time_budget=None):
+        await asyncio.sleep(10)
+        return _response(owner, repo, ref)
+
+    monkeypatch.setattr(http_router, "_run_analysis", slow_analysis)
+
+    async def main():
+        request = http_router.AnalyzeRequest(repo_url="https://github.com/o/r", wait=False)
+        await http_router.analyze_repository(request)
+        await asyncio.sleep(0)
+        cancelled = await http_router.cancel_analysis_job("o/r@main")
+        with pytest.raises(HTTPException) as exc:
+            await http_router.get_analysis_job_result("o/r@main")
+        with pytest.raises(HTTPException) as missing:
+            await http_router.get_analysis_job("x/y@main")
+        return cancelled, exc.value, missing.value
+
+    cancelled, conflict, missing = asyncio.run(main())
+    assert cancelled.status == "cancelled"
+    assert conflict.status_code == 409
+    assert missing.status_code == 404
@@ -0,0 +1,131 @@
+"""
+blob SHA 기준 콘텐츠 캐시 테스트.
+
+같은 내용의 매니페스트가 저장소·ref가 달라도 한 번만 다운로드·파싱되는지 검증.
+"""
+import asyncio
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.agents.security.github.analyzer import RepositoryAnalyzer
+from backend.common import blob_cache
+from backend.common.cache_manager import immutable_cache
+from backend.core import github_core
+from backend.core.dependencies_core import parse_dependencies, parse_dependencies_async
+from backend.core.models import RepoSnapshot
+
+_REQUIREMENTS = "flask==2.0.1\nblob-cache-test>=1.0\n"
+_SHA = blob_cache.git_blob_sha(_REQUIREMENTS)
+_TREE = {"tree": [
+    {"path": "requirements.txt", "type": "blob", "sha": _SHA, "size": len(_REQUIREMENTS)},
+    {"path": "src", "type": "tree", "sha": "f" * 40},
+]}
+
+
+class _BlobHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        type(self).requests_seen.append(path)
+        if path.endswith("/git/trees/HEAD"):
+            status, body = 200, json.dumps(_TREE).encode()
+        elif path.endswith(f"/git/blobs/{_SHA}"):
+            status, body = 200, _REQUIREMENTS.encode()
+        else:
+            status, body = 404, b"{}"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _forget_blob():
+    for key in list(immutable_cache._store):
+        if key.startswith(blob_cache.__name__) and _SHA in key:
+            immutable_cache.delete(key)
+
+
+@pytest.fixture
+def local_github(local_github_server):
+    local_github_server(_BlobHandler, github_core)
+    _forget_blob()
+    yield _BlobHandler.requests_seen
+    for repo in ("a", "b"):
+        github_core.fetch_repo_tree_entries.invalidate("o", repo, "HEAD")
+        github_core.fetch_repo_tree_entries_async.invalidate("o", repo, "HEAD")
+    _forget_blob()
+
+
+def _snapshot(repo: str) -> RepoSnapshot:
+    return RepoSnapshot(
+        owner="o", repo=repo, ref="HEAD", full_name=f"o/{repo}", description=None,
+        stars=0, forks=0, open_issues=0, primary_language=None,
+        created_at=None, pushed_at=None, is_archived=False, is_fork=False,
+        readme_content=None, has_readme=False, license_spdx=None,
+    )
+
+
+def test_git_blob_sha_matches_git():
+    # git hash-object로 계산한 값
+    assert blob_cache.git_blob_sha("hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert blob_cache.git_blob_sha(b"hello\n") == blob_cache.git_blob_sha("hello\n")
+
+
+def test_parse_blob_runs_parser_once_per_sha():
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return ["dep"]
+
+    sha = blob_cache.git_blob_sha("parse-once")
+    try:
+        assert blob_cache.parse_blob(sha, "test", parse) == ["dep"]
+        assert blob_cache.parse_blob(sha, "test", parse) == ["dep"]
+        assert blob_cache.parse_blob(None, "test", parse) == ["dep"]
+        assert len(calls) == 2
+    finally:
+        immutable_cache.delete(blob_cache._parsed_key(sha, "test"))
+
+
+def test_identical_manifest_downloaded_once_across_repos(local_github):
+    first = parse_dependencies(_snapshot("a"))
+    second = asyncio.run(parse_dependencies_async(_snapshot("b")))
+
+    assert {d.name for d in first.dependencies} == {"flask", "blob-cache-test"}
+    assert [(d.name, d.source) for d in second.dependencies] == [
+        (d.name, d.source) for d in first.dependencies
+    ]
+    assert sum(path.endswith(f"/git/blobs/{_SHA}") for path in local_github) == 1
+    assert not any("/contents/" in path for path in local_github)
+
+
+class _FakeSecurityClient:
+    base_url = "https://api.github.com/repos"
+
+    def __init__(self):
+        self.content_calls = []
+
+    def get_repository_tree(self, owner, repo):
+        return [{"path": "requirements.txt", "sha": _SHA, "size": 0, "url": ""}]
+
+    def get_file_content_with_retry(self, owner, repo, path):
+        self.content_calls.append(f"{owner}/{repo}/{path}")
+        return _REQUIREMENTS
+
+
+def test_security_analyzer_shares_blob_between_repos():
+    _forget_blob()
+    client = _FakeSecurityClient()
+    analyzer = RepositoryAnalyzer(github_client=client)
+    try:
+        first = analyzer.analyze_repository("o", "a", fetch_mode="api")
+        second = analyzer.analyze_repository("o", "b", fetch_mode="api")
+    finally:
+        _forget_blob()
+
+    assert client.content_calls == ["o/a/requirements.txt"]
+    assert first["total_dependencies"] == second["total_dependencies"] == 2
@@ -0,0 +1,198 @@
+"""
+대량 진단 실행기 테스트.
+
+동시 진단 수 제한, 완료 순서 스트리밍, 상태 파일 기반 재개,
+rate limit 응답 후 대기/재시도를 검증.
+"""
+import asyncio
+
+from backend.scripts.bulk_runner import (
+    BulkDiagnosisRunner,
+    CheckpointStore,
+    parse_repo_string,
+    summary_row,
+)
+
+
+class FakeScheduler:
+    def __init__(self, remaining=5000, reset_in=0.0):
+        self.remaining = remaining
+        self.reset_in = reset_in
+
+    def headroom(self, resource="core"):
+        return self.remaining, self.reset_in
+
+
+def _data(score):
+    return {
+        "documentation_quality": score,
+        "activity_maintainability": score,
+        "health_score": score,
+        "health_level": "good",
+        "onboarding_score": score,
+        "onboarding_level": "easy",
+        "dependency_complexity_score": 10,
+        "dependency_flags": ["many_deps"],
+        "docs_issues_count": 1,
+        "activity_issues_count": 2,
+    }
+
+
+def _runner(diagnose, **kwargs):
+    kwargs.setdefault("rate_scheduler", FakeScheduler())
+    return BulkDiagnosisRunner(diagnose=diagnose, **kwargs)
+
+
+def _repos(n):
+    return [("o", f"r{i}", "main") for i in range(n)]
+
+
+def test_parse_repo_string_defaults_to_main():
+    assert parse_repo_string(" o/r ") == ("o", "r", "main")
+    assert parse_repo_string("o/r@dev") == ("o", "r", "dev")
+
+
+def test_concurrency_bound_and_completion_order():
+    running = []
+    peak = []
+
+    async def diagnose(owner, repo, ref):
+        running.append(repo)
+        peak.append(len(running))
+        # 뒤에 제출한 저장소가 먼저 끝나도록
+        await asyncio.sleep(0.05 if repo == "r0" else 0.01)
+        running.remove(repo)
+        return {"ok": True, "data": _data(70)}
+
+    async def main():
+        runner = _runner(diagnose, concurrency=2)
+        return [record["repo_id"] async for record in runner.stream(_repos(4))]
+
+    order = asyncio.run(main())
+
+    assert max(peak) == 2
+    assert sorted(order) == [f"o/r{i}@main" for i in range(4)]
+    assert order[-1] == "o/r0@main"
+
+
+def test_resume_skips_finished_and_retries_failed(tmp_path):
+    state_file = str(tmp_path / "state.sqlite")
+    calls = []
+
+    async def flaky(owner, repo, ref):
+        calls.append(repo)
+        if repo == "r1":
+            raise RuntimeError("GitHub unavailable")
+        return {"ok": True, "data": _data(60)}
+
+    store = CheckpointStore(state_file)
+    first = asyncio.run(_runner(flaky, store=store).run(_repos(3)))
+    store.close()
+    assert [r["status"] for r in first] == ["done", "failed", "done"]
+    assert first[1]["error"] == "GitHub unavailable"
+
+    calls.clear()
+
+    async def healthy(owner, repo, ref):
+        calls.append(repo)
+        return {"ok": True, "data": _data(80)}
+
+    store = CheckpointStore(state_file)
+    second = asyncio.run(_runner(healthy, store=store).run(_repos(3)))
+    assert calls == ["r1"]
+    assert [r["status"] for r in second] == ["done", "done", "done"]
+    assert second[1]["attempts"] == 2
+    assert store.counts() == {"done": 3}
+
+
+def test_failed_repo_not_retried_after_max_attempts(tmp_path):
+    calls = []
+
+    async def broken(owner, repo, ref):
+        calls.append(repo)
+        return {"ok": False, "error": "Repository not found"}
+
+    store = CheckpointStore(str(tmp_path / "state.sqlite"))
+    for _ in range(3):
+        asyncio.run(_runner(broken, store=store, max_attempts=2).run(_repos(1)))
+    assert calls == ["r0", "r0"]
+
+
+def test_low_budget_pauses_and_rate_limit_retries():
+    scheduler = FakeScheduler(remaining=5, reset_in=0.05)
+    attempts = []
+
+    async def diagnose(owner, repo, ref):
+        attempts.append(repo)
+        if len(attempts) == 1:
+            scheduler.remaining = 5000
+            return {"ok": False, "error": "GitHub API rate limit exceeded"}
+        return {"ok": True, "data": _data(50)}
+
+    async def main():
+        runner = _runner(diagnose, rate_scheduler=scheduler, min_rate_budget=100, max_pause=0.05)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        records = await runner.run(_repos(1))
+        return records, loop.time() - started
+
+    records, elapsed = asyncio.run(main())
+
+    assert records[0]["status"] == "done"
+    assert records[0]["attempts"] == 2
+    # 시작 전 예산 부족 대기 + rate limit 응답 후 대기
+    assert elapsed >= 0.09
+
+
+def test_summary_row_matches_benchmark_columns():
+    ok = summary_row({
+        "repo_id": "o/r@main", "status": "done", "data": _data(70), "error": None,
+    })
+    failed = summary_row({
+        "repo_id": "o/x@main", "status": "failed", "data": None, "error": "boom",
+    })
+
+    assert ok["health_score"] == 70
+    assert ok["dependency_flags"] == "many_deps"
+    assert ok["error"] is False
+    assert failed["error"] is True
+    assert failed["error_message"] == "boom"
+    assert failed["health_score"] is None
+
+
+def test_prefetches_bundles_per_chunk_before_diagnosing():
+    events = []
+
+    async def prefetch(pairs, ref):
+        events.append(("prefetch", ref, [repo for _, repo in pairs]))
+
+    async def diagnose(owner, repo, ref):
+        events.append(("diagnose", ref, repo))
+        return {"ok": True, "data": _data(70)}
+
+    repos = _repos(5) + [("o", "x", "dev")]
+    runner = _runner(diagnose, concurrency=1, prefetch=prefetch, prefetch_chunk_size=2)
+    records = asyncio.run(runner.run(repos))
+
+    assert len(records) == 6
+    prefetches = [e for e in events if e[0] == "prefetch"]
+    assert prefetches == [
+        ("prefetch", "main", ["r0", "r1"]),
+        ("prefetch", "main", ["r2", "r3"]),
+        ("prefetch", "main", ["r4"]),
+        ("prefetch", "dev", ["x"]),
+    ]
+    # 묶음의 첫 진단 직전에 한 번만 조회
+    assert events.index(("prefetch", "main", ["r2", "r3"])) == events.index(("diagnose", "main", "r2")) - 1
+
+
+def test_prefetch_failure_does_not_block_diagnosis():
+    async def prefetch(pairs, ref):
+        raise RuntimeError("graphql down")
+
+    async def diagnose(owner, repo, ref):
+        return {"ok": True, "data": _data(70)}
+
+    records = asyncio.run(_runner(diagnose, prefetch=prefetch).run(_repos(3)))
+
+    assert [r["status"] for r in records] == ["done"] * 3
@@ -0,0 +1,78 @@
+"""
+분석 결과 캐시 백엔드 테스트.
+
+SQLite 백엔드로 여러 CacheManager(워커/재시작)가 같은 캐시를 공유하는지 검증.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.common.cache_backends import (
+    CacheEntry,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+    create_cache_backend,
+    deserialize_value,
+    serialize_value,
+)
+from backend.common.cache_manager import CacheInvalidationTrigger, CacheManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache" / "analysis.db")
+
+
+def test_serialization_is_compact_and_round_trips():
+    data = {"health_score": 85, "findings": ["x" * 50] * 20, "name": "한글"}
+    blob = serialize_value(data)
+    assert deserialize_value(blob) == data
+    assert len(blob) < len(repr(data))
+
+
+def test_sqlite_backend_shared_between_managers(db_path):
+    worker_a = CacheManager(default_ttl_hours=1, backend=SQLiteCacheBackend(db_path))
+    worker_b = CacheManager(default_ttl_hours=1, backend=SQLiteCacheBackend(db_path))
+
+    worker_a.set_analysis("Owner", "Repo", "main", {"health_score": 85})
+    worker_a.set_analysis("owner", "repo", "dev", {"health_score": 70})
+    worker_a.set_analysis("other", "repo", "main", {"health_score": 60})
+
+    assert worker_b.get_analysis("owner", "repo", "main") == {"health_score": 85}
+    assert worker_b.get_stats()["total_accesses"] == 1
+
+    assert worker_b.invalidate_all_refs("owner", "repo") == 2
+    assert worker_a.get_analysis("owner", "repo", "dev") is None
+    assert worker_a.get_analysis("other", "repo", "main") == {"health_score": 60}
+
+    # 재시작 후에도 유지
+    restarted = CacheManager(default_ttl_hours=1, backend=SQLiteCacheBackend(db_path))
+    stats = restarted.get_stats()
+    assert stats["backend"] == "sqlite"
+    assert stats["total_entries"] == 1
+
+
+def test_sqlite_backend_expiry_and_trigger(db_path):
+    backend = SQLiteCacheBackend(db_path)
+    cache = CacheManager(default_ttl_hours=1, backend=backend)
+    backend.set(CacheEntry(
+        key=cache.make_repo_key("o", "r", "old"),
+        data={"v": 1},
+        cached_at=datetime.now() - timedelta(hours=2),
+        ttl_hours=1,
+    ))
+    cache.set_analysis("o", "r", "main", {"v": 2})
+
+    assert cache.get_analysis("o", "r", "old") is None
+    cache.cleanup_expired()
+    assert cache.get_stats()["total_entries"] == 1
+
+    trigger = CacheInvalidationTrigger(cache)
+    future = datetime.now().timestamp() + 60
+    assert trigger.trigger_push_invalidation("o", "r", "main", pushed_at=future) is True
+    assert cache.get_analysis("o", "r", "main") is None
+
+
+def test_create_backend_falls_back_to_memory():
+    assert isinstance(create_cache_backend("memory"), InMemoryCacheBackend)
+    assert isinstance(create_cache_backend("unknown"), InMemoryCacheBackend)
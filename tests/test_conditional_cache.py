@@ -0,0 +1,129 @@
+"""
+조건부 요청 캐시 테스트.
+
+로컬 서버의 ETag 응답으로 hit / revalidated(304) / miss 흐름을 검증.
+"""
+import asyncio
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common import conditional_cache
+from backend.common.conditional_cache import (
+    ConditionalRequestCache,
+    conditional_get,
+    conditional_get_async,
+)
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """ETag가 일치하면 304를 돌려주는 테스트 핸들러."""
+    etag = '"v1"'
+    full_responses = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        type(self).full_responses += 1
+        body = b'{"name": "r", "stargazers_count": 3}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def etag_server(local_github_server):
+    _ETagHandler.full_responses = 0
+    return f"{local_github_server(_ETagHandler)}/repos/o/r"
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    cache = ConditionalRequestCache(max_entries=10, fresh_seconds=0)
+    monkeypatch.setattr(conditional_cache, "_conditional_cache_instance", cache)
+    return cache
+
+
+class TestConditionalGet:
+    """conditional_get 흐름 테스트."""
+
+    def test_revalidate_with_etag(self, etag_server, fresh_cache):
+        first = conditional_get(etag_server, timeout=5)
+        second = conditional_get(etag_server, timeout=5)
+
+        assert first.json() == second.json() == {"name": "r", "stargazers_count": 3}
+        assert second.status_code == 200
+        assert second.revalidated is True
+        assert _ETagHandler.full_responses == 1
+
+        stats = fresh_cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["revalidated"] == 1
+        assert stats["bytes_saved"] > 0
+
+    def test_fresh_entry_skips_network(self, etag_server, fresh_cache):
+        conditional_get(etag_server, timeout=5, fresh_seconds=60)
+        cached = conditional_get(etag_server, timeout=5)
+
+        assert cached.json()["name"] == "r"
+        assert fresh_cache.get_stats()["hits"] == 1
+        assert _ETagHandler.full_responses == 1
+
+    def test_async_revalidate(self, etag_server, fresh_cache):
+        async def run():
+            await conditional_get_async(etag_server, timeout=5)
+            return await conditional_get_async(etag_server, timeout=5)
+
+        second = asyncio.run(run())
+        assert second.revalidated is True
+        assert fresh_cache.get_stats()["revalidated"] == 1
+
+
+    def test_refetches_when_entry_evicted_before_304(self, etag_server, fresh_cache, monkeypatch):
+        conditional_get(etag_server, timeout=5)
+        prepare = fresh_cache.prepare
+
+        def prepare_then_evict(*args, **kwargs):
+            # 검증자를 붙인 뒤 응답이 오기 전에 다른 요청이 엔트리를 축출한 상황
+            result = prepare(*args, **kwargs)
+            fresh_cache.clear()
+            return result
+
+        monkeypatch.setattr(fresh_cache, "prepare", prepare_then_evict)
+        resp = conditional_get(etag_server, timeout=5)
+
+        assert resp.status_code == 200
+        assert resp.json() == {"name": "r", "stargazers_count": 3}
+        assert _ETagHandler.full_responses == 2
+
+
+class TestConditionalRequestCache:
+    """ConditionalRequestCache 단위 테스트."""
+
+    def test_key_depends_on_auth(self):
+        a = ConditionalRequestCache.make_key("u", {"Authorization": "Bearer a"})
+        b = ConditionalRequestCache.make_key("u", {"Authorization": "Bearer b"})
+        assert a != b
+
+    def test_lru_eviction(self):
+        cache = ConditionalRequestCache(max_entries=1, fresh_seconds=60)
+
+        class _Resp:
+            status_code = 200
+            content = b"{}"
+            encoding = "utf-8"
+
+            def __init__(self, etag):
+                self.headers = {"ETag": etag}
+
+        cache.complete("k1", _Resp('"1"'))
+        cache.complete("k2", _Resp('"2"'))
+        assert cache.get_stats()["entries"] == 1
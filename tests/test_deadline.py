@@ -0,0 +1,146 @@
+"""
+요청 마감 전파 테스트.
+
+마감이 중첩 범위/클라이언트 타임아웃에 반영되고, quick 진단이 마감까지 끝난 분석기로
+partial 결과를 만드는지 검증.
+"""
+import asyncio
+import time
+
+import pytest
+
+from backend.agents.diagnosis import full_path, partial_cache
+from backend.agents.diagnosis.summary_jobs import summary_jobs
+from backend.api import http_router
+from backend.common.async_utils import run_blocking
+from backend.common.deadline import (
+    DeadlineExceeded,
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+    detached_context,
+    remaining_seconds,
+)
+from backend.core.models import ActivityCoreResult, DocsCoreResult, StructureCoreResult
+
+_SHA = "e" * 40
+
+
+def test_nested_scope_keeps_earlier_deadline():
+    with deadline_scope(0.5) as outer:
+        with deadline_scope(10) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert remaining_seconds() <= 0.5
+        with deadline_scope(None) as same:
+            assert same is outer
+    assert current_deadline() is None
+    assert remaining_seconds() is None
+
+
+def test_clamp_timeout():
+    assert clamp_timeout(10) == 10
+    with deadline_scope(1):
+        assert clamp_timeout(10) <= 1.5
+        assert clamp_timeout(0.1) == 0.1
+        assert clamp_timeout(None) <= 1.5
+        connect, read = clamp_timeout((5, None))
+        assert connect <= 1.5 and read <= 1.5
+    with deadline_scope(0.001):
+        time.sleep(0.3)
+        with pytest.raises(DeadlineExceeded):
+            clamp_timeout(10)
+
+
+def test_deadline_follows_run_blocking_but_not_detached_context():
+    async def main():
+        with deadline_scope(5):
+            inherited = await run_blocking(remaining_seconds)
+            detached = detached_context().run(remaining_seconds)
+        return inherited, detached
+
+    inherited, detached = asyncio.run(main())
+    assert 0 < inherited <= 5
+    assert detached is None
+
+
+def test_mark_partial_reaches_outer_scope():
+    with deadline_scope(5) as outer:
+        with deadline_scope(1) as inner:
+            inner.mark_partial(["activity"])
+        assert outer.partial
+        assert outer.missing_parts == ["activity"]
+
+
+@pytest.fixture
+def slow_activity(monkeypatch):
+    async def resolve(owner, repo, ref="HEAD"):
+        return _SHA
+
+    async def slow(owner, repo, days):
+        await asyncio.sleep(2)
+        return ActivityCoreResult(
+            commit_score=0.7, issue_score=0.7, pr_score=0.7, total_score=70,
+            days_since_last_commit=1, total_commits_in_window=40, unique_authors=5,
+        )
+
+    monkeypatch.setattr(full_path, "resolve_commit_sha_async", resolve)
+    monkeypatch.setattr(full_path, "analyze_activity_async", slow)
+    partial_cache.store_parts("o", "r", _SHA, "quick", {
+        "docs": DocsCoreResult(
+            readme_present=True, readme_word_count=300, category_scores={},
+            total_score=80, missing_sections=[], present_sections=["WHAT"],
+        ),
+        "structure": StructureCoreResult(
+            has_tests=True, has_ci=True, has_docs_folder=False, has_build_config=True,
+            structure_score=75,
+        ),
+    })
+    summary_jobs.clear()
+    yield
+    summary_jobs.clear()
+    for part in (*partial_cache.ANALYZER_PARTS, "summary"):
+        key = partial_cache.part_key(part, "o", "r", _SHA, "quick")
+        partial_cache.github_cache.delete(key)
+        partial_cache.immutable_cache.delete(key)
+
+
+def test_quick_diagnosis_returns_partial_at_deadline(slow_activity):
+    async def main():
+        with deadline_scope(5) as request_deadline:
+            result = await full_path.execute_full_path(
+                "o", "r", "main", analysis_depth="quick", time_budget=0.1,
+            )
+        return result, request_deadline
+
+    started = time.perf_counter()
+    result, request_deadline = asyncio.run(main())
+
+    assert time.perf_counter() - started < 1.5
+    assert result["partial"] is True
+    assert result["missing_parts"] == ["activity"]
+    assert result["activity"] is None
+    assert result["docs_score"] == 80
+    assert result["summary_status"] == "skipped"
+    assert request_deadline.missing_parts == ["activity"]
+
+
+def test_complete_diagnosis_is_not_partial(slow_activity, monkeypatch):
+    async def fast(owner, repo, days):
+        return ActivityCoreResult(
+            commit_score=0.7, issue_score=0.7, pr_score=0.7, total_score=70,
+            days_since_last_commit=1, total_commits_in_window=40, unique_authors=5,
+        )
+
+    monkeypatch.setattr(full_path, "analyze_activity_async", fast)
+    result = asyncio.run(full_path.execute_full_path(
+        "o", "r", "main", analysis_depth="quick", use_llm_summary=False, time_budget=5,
+    ))
+    assert result["partial"] is False
+    assert result["missing_parts"] == []
+
+
+def test_analyze_request_time_budget():
+    budget = http_router._analysis_time_budget
+    assert budget(http_router.AnalyzeRequest(repo_url="o/r", deadline_ms=1500)) == 1.5
+    speed = budget(http_router.AnalyzeRequest(repo_url="o/r", priority="speed"))
+    assert speed == (http_router.QUICK_ANALYSIS_TIME_BUDGET or None)
@@ -0,0 +1,129 @@
+"""
+비동기 GitHub 조회 테스트.
+
+로컬 HTTP 서버로 async 조회 함수와 cached 데코레이터의 async 지원을 검증.
+"""
+import asyncio
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common.async_http_client import AsyncPooledHttpClient
+from backend.common.cache_manager import SimpleCache, cached
+from backend.core import github_core
+from backend.core.dependencies_core import parse_dependencies_async
+from backend.core.models import RepoSnapshot
+
+
+_ROUTES = {
+    "/repos/o/r/git/trees/HEAD": {
+        "tree": [
+            {"path": "requirements.txt"},
+            {"path": "web/package.json"},
+            {"path": "src/main.py"},
+        ]
+    },
+    "/repos/o/r/contents/requirements.txt": "flask==2.0.1\nrequests\n",
+    "/repos/o/r/contents/web/package.json": json.dumps(
+        {"dependencies": {"react": "^18.0.0"}, "devDependencies": {"jest": "^29"}}
+    ),
+}
+
+
+class _GitHubHandler(BaseHTTPRequestHandler):
+    """GitHub REST 경로 일부를 흉내내는 테스트 핸들러."""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        payload = _ROUTES.get(path)
+        if payload is None:
+            status, body = 404, b"{}"
+        elif isinstance(payload, str):
+            status, body = 200, payload.encode()
+        else:
+            status, body = 200, json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def local_github(local_github_server):
+    local_github_server(_GitHubHandler, github_core)
+    github_core.fetch_repo_tree_entries_async.invalidate("o", "r", "HEAD")
+    yield
+    github_core.fetch_repo_tree_entries_async.invalidate("o", "r", "HEAD")
+
+
+def _snapshot() -> RepoSnapshot:
+    return RepoSnapshot(
+        owner="o", repo="r", ref="HEAD", full_name="o/r", description=None,
+        stars=0, forks=0, open_issues=0, primary_language=None,
+        created_at=None, pushed_at=None, is_archived=False, is_fork=False,
+        readme_content=None, has_readme=False, license_spdx=None,
+    )
+
+
+class TestCachedAsync:
+    """cached 데코레이터의 코루틴 지원 테스트."""
+
+    def test_async_result_cached(self):
+        cache = SimpleCache(ttl=60)
+        calls = []
+
+        @cached(cache=cache)
+        async def fetch(x):
+            calls.append(x)
+            return {"value": x}
+
+        async def run():
+            return await fetch(1), await fetch(1)
+
+        first, second = asyncio.run(run())
+        assert first == second == {"value": 1}
+        assert calls == [1]
+
+        fetch.invalidate(1)
+        asyncio.run(fetch(1))
+        assert calls == [1, 1]
+
+
+class TestAsyncFetch:
+    """async 조회 함수 테스트."""
+
+    def test_fetch_repo_tree_async(self, local_github):
+        paths = asyncio.run(github_core.fetch_repo_tree_async("o", "r", "HEAD"))
+        assert paths == ["requirements.txt", "web/package.json", "src/main.py"]
+
+    def test_fetch_file_content_missing(self, local_github):
+        content = asyncio.run(github_core.fetch_file_content_async("o", "r", "nope.txt"))
+        assert content is None
+
+    def test_parse_dependencies_async(self, local_github):
+        result = asyncio.run(parse_dependencies_async(_snapshot()))
+
+        names = {d.name for d in result.dependencies}
+        assert names == {"flask", "requests", "react", "jest"}
+        assert result.analyzed_files == ["requirements.txt", "web/package.json"]
+        assert result.parse_errors == []
+
+
+class TestAsyncPooledHttpClient:
+    """AsyncPooledHttpClient 테스트."""
+
+    def test_client_per_event_loop(self):
+        client = AsyncPooledHttpClient(pool_size=4, max_retries=0)
+
+        async def grab():
+            first = client.client
+            second = client.client
+            await client.aclose()
+            return first, second
+
+        a1, a2 = asyncio.run(grab())
+        b1, _ = asyncio.run(grab())
+        assert a1 is a2
+        assert a1 is not b1
+        assert client.get_stats()["pool_size"] == 4
@@ -0,0 +1,223 @@
+"""
+GraphQL 쿼리 합성기 테스트.
+
+alias 합성, 변수 병합/충돌, 응답 분리, 배치 청크 분할, 진단 번들 조립 검증.
+"""
+import pytest
+
+from backend.common.errors import RepoNotFoundError
+from backend.common.github_client import (
+    build_activity_summary_query,
+    build_beginner_issues_query,
+    parse_activity_summary,
+    parse_beginner_issues,
+)
+from backend.common.graphql_composer import (
+    BatchQueryComposer,
+    RepoQueryComposer,
+    build_repository_query,
+    estimate_node_count,
+)
+from backend.core import bundle_core
+
+
+class TestRepoQueryComposer:
+    """합성기 문서/변수 생성 테스트."""
+
+    def test_document_has_one_aliased_repository_per_part(self):
+        composer = RepoQueryComposer()
+        composer.add("meta", "stargazerCount")
+        composer.add("tree", "defaultBranchRef { name }")
+        query, variables = composer.build("octo", "hello")
+
+        assert "meta: repository(owner: $owner, name: $name)" in query
+        assert "tree: repository(owner: $owner, name: $name)" in query
+        assert "rateLimit { cost remaining resetAt }" in query
+        assert variables == {"owner": "octo", "name": "hello"}
+
+    def test_single_part_query_keeps_repository_key(self):
+        query = build_repository_query("stargazerCount", {"since": "GitTimestamp!"})
+        assert "query($owner: String!, $name: String!, $since: GitTimestamp!)" in query
+        assert "repository: repository(owner: $owner, name: $name)" in query
+
+    def test_parts_share_variables(self):
+        composer = build_activity_summary_query(days=30)
+        build_beginner_issues_query(["good first issue"], 5, composer=composer)
+        query, variables = composer.build("octo", "hello")
+
+        assert query.count("$beginnerFirst: Int!") == 1
+        assert variables["beginnerFirst"] == 5
+        assert variables["beginnerLabels"] == ["good first issue"]
+        assert "since" in variables and "commitsLimit" in variables
+
+    def test_conflicting_declarations_rejected(self):
+        composer = RepoQueryComposer()
+        composer.add("a", "id", {"limit": "Int!"}, limit=1)
+        with pytest.raises(ValueError):
+            composer.add("b", "id", {"limit": "String!"})
+        with pytest.raises(ValueError):
+            composer.add("c", "id", {"limit": "Int!"}, limit=2)
+        with pytest.raises(ValueError):
+            composer.add("a", "id")
+        with pytest.raises(ValueError):
+            composer.add("bad-alias", "id")
+
+    def test_missing_variable_value_rejected(self):
+        composer = RepoQueryComposer()
+        composer.add("a", "id", {"limit": "Int!"})
+        with pytest.raises(ValueError):
+            composer.build("octo", "hello")
+
+
+class TestSplit:
+    """응답 분리 테스트."""
+
+    def test_split_blobs_maps_expressions(self):
+        composer = RepoQueryComposer()
+        mapping = composer.add_blobs("files", ["HEAD:a.txt", "HEAD:b.png", "HEAD:c.txt"])
+        data = {
+            "files": {
+                mapping["HEAD:a.txt"]: {"text": "hello", "isBinary": False},
+                mapping["HEAD:b.png"]: {"text": None, "isBinary": True},
+                mapping["HEAD:c.txt"]: None,
+            }
+        }
+
+        assert composer.split_blobs(data, "files") == {
+            "HEAD:a.txt": "hello",
+            "HEAD:b.png": None,
+            "HEAD:c.txt": None,
+        }
+
+    def test_beginner_issues_fill_from_recent(self):
+        def issue(number):
+            return {"number": number, "title": f"#{number}", "labels": {"nodes": []}}
+
+        parts = {
+            "beginnerLabeled": {"repository": {"issues": {"nodes": [issue(1)]}}},
+            "beginnerRecent": {"repository": {"issues": {"nodes": [issue(1), issue(2), issue(3)]}}},
+        }
+        assert [i["number"] for i in parse_beginner_issues(parts, 5)] == [1, 2, 3]
+
+
+class TestBatchQueryComposer:
+    """여러 저장소 배치 쿼리 테스트."""
+
+    def test_node_estimate_multiplies_nested_connections(self):
+        fields = """
+            issues(first: $n, orderBy: { field: CREATED_AT, direction: DESC }) {
+              nodes { labels(first: 10) { nodes { name } } }
+            }
+            pullRequests(first: 5) { totalCount }
+        """
+        assert estimate_node_count(fields, {"n": 20}) == 20 + 20 * 10 + 5
+        assert build_activity_summary_query(days=30).estimate_nodes() == 300
+
+    def test_chunks_respect_node_and_repo_limits(self):
+        template = build_activity_summary_query(days=30)
+        repos = [(f"owner{i}", "repo") for i in range(7)]
+
+        by_nodes = BatchQueryComposer(template, repos, max_nodes=1000, max_repos=10)
+        assert [len(c.repos) for c in by_nodes.chunks()] == [3, 3, 1]
+
+        by_repos = BatchQueryComposer(template, repos, max_repos=5)
+        assert [len(c.repos) for c in by_repos.chunks()] == [5, 2]
+
+        with pytest.raises(ValueError):
+            BatchQueryComposer(template, repos, max_nodes=100).chunks()
+
+    def test_build_and_split_per_repository(self):
+        template = RepoQueryComposer()
+        template.add("meta", "stargazerCount")
+        template.add_blobs("readme", ["HEAD:README.md"])
+        batch = BatchQueryComposer(template, [("a", "x"), ("b", "y")])
+        query, variables = batch.build()
+
+        assert "repo1_meta: repository(owner: $owner1, name: $name1)" in query
+        assert query.count("$readme_0: String!") == 1
+        assert variables["owner0"] == "a" and variables["name1"] == "y"
+
+        data = {
+            "rateLimit": {"cost": 1},
+            "repo0_meta": {"stargazerCount": 3},
+            "repo0_readme": {"readme_0": {"text": "# A", "isBinary": False}},
+            "repo1_meta": None,
+            "repo1_readme": None,
+        }
+        views = batch.split(data)
+        assert template.split(views[("a", "x")])["meta"]["repository"] == {"stargazerCount": 3}
+        assert template.split_blobs(views[("a", "x")], "readme") == {"HEAD:README.md": "# A"}
+        assert template.split(views[("b", "y")])["meta"]["repository"] is None
+
+
+def _primary_response(composer, readme=None, package_json=None):
+    blobs = composer._blob_aliases
+    readme_part = {alias: None for alias in blobs["readme"].values()}
+    if readme is not None:
+        readme_part[blobs["readme"]["HEAD:README.md"]] = {"text": readme, "isBinary": False}
+    manifest_part = {alias: None for alias in blobs.get("manifests", {}).values()}
+    if package_json is not None:
+        manifest_part[blobs["manifests"]["HEAD:package.json"]] = {
+            "text": package_json, "isBinary": False
+        }
+    return {
+        "meta": {
+            "nameWithOwner": "octo/hello",
+            "stargazerCount": 7,
+            "forkCount": 2,
+            "openIssues": {"totalCount": 3},
+            "openPullRequests": {"totalCount": 1},
+            "primaryLanguage": {"name": "Python"},
+            "licenseInfo": {"spdxId": "MIT"},
+            "isArchived": False,
+            "isFork": False,
+        },
+        "readme": readme_part,
+        "manifests": manifest_part,
+        "activity": {"defaultBranchRef": None, "issues": {"nodes": []}, "pullRequests": {"nodes": []}},
+    }
+
+
+class TestBundleAssembly:
+    """진단 번들 조립 테스트."""
+
+    def test_assemble_maps_meta_readme_and_root_manifests(self):
+        composer = bundle_core._compose_primary("HEAD", 90, True, False)
+        data = _primary_response(composer, readme="# Hello", package_json='{"dependencies": {}}')
+        tree = ["README.md", "package.json", "svc/requirements.txt"]
+
+        bundle = bundle_core._assemble("octo", "hello", "HEAD", composer, data, tree, False)
+
+        assert bundle.snapshot.stars == 7
+        assert bundle.snapshot.open_issues == 4
+        assert bundle.snapshot.readme_content == "# Hello"
+        assert bundle.manifest_contents == {"package.json": '{"dependencies": {}}'}
+        assert parse_activity_summary(composer.split(data), composer)["commits"] == []
+        assert bundle_core._followup_paths(tree, bundle.manifest_contents, True, True) == [
+            "svc/requirements.txt"
+        ]
+
+    def test_missing_repository_raises_not_found(self):
+        composer = bundle_core._compose_primary("HEAD", 90, False, False)
+        data = _primary_response(composer)
+        data["meta"] = None
+        with pytest.raises(RepoNotFoundError):
+            bundle_core._assemble("octo", "missing", "HEAD", composer, data, [], False)
+
+    def test_followup_blobs_split_across_queries(self):
+        composer = bundle_core._compose_primary("HEAD", 90, True, False)
+        data = _primary_response(composer, readme="# Hello")
+        tree = ["README.md"] + [f"pkg{i}/requirements.txt" for i in range(7)]
+        bundle = bundle_core._assemble("octo", "hello", "HEAD", composer, data, tree, False)
+
+        composers = bundle_core._followup_composers(bundle, "HEAD", True, max_blobs=3)
+
+        assert [len(c._blob_aliases["followup"]) for c in composers] == [3, 3, 1]
+        for followup in composers:
+            response = {"followup": {
+                alias: {"text": expression, "isBinary": False}
+                for expression, alias in followup._blob_aliases["followup"].items()
+            }}
+            bundle = bundle_core._apply_followup(bundle, "HEAD", followup, response)
+        assert sorted(bundle.manifest_contents) == sorted(tree[1:])
+        assert bundle.graphql_calls == 4
@@ -0,0 +1,129 @@
+"""
+저장소 건강도 시계열 테스트.
+
+추가 전용 기록(같은 날 같은 커밋은 한 번), 기간 조회/추세 계산, 진단 후 기록과 추세 API 검증.
+"""
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from backend.agents.diagnosis import full_path
+from backend.api.http_router import get_health_trend
+from backend.common.health_history import HealthHistoryStore, build_snapshot
+from backend.core.models import (
+    ActivityCoreResult,
+    DependenciesSnapshot,
+    DocsCoreResult,
+    StructureCoreResult,
+)
+
+_SHA_A = "a" * 40
+_SHA_B = "b" * 40
+
+
+def _activity(total_commits=10):
+    return ActivityCoreResult(
+        commit_score=0.8, issue_score=0.5, pr_score=0.6, total_score=70,
+        days_since_last_commit=1, total_commits_in_window=total_commits, unique_authors=3,
+        issue_close_rate=0.4, open_issues_count=12,
+    )
+
+
+def _snapshot(sha, day, health, depth="standard", commits=10):
+    return build_snapshot(
+        "Owner", "Repo", sha, depth, {"health_score": health, "docs_score": 50},
+        _activity(commits), recorded_at=datetime(2026, 9, day, 12, tzinfo=timezone.utc),
+    )
+
+
+def test_append_is_idempotent_per_day_commit_and_depth():
+    store = HealthHistoryStore(":memory:")
+
+    assert store.append(_snapshot(_SHA_A, 1, 60)) is True
+    assert store.append(_snapshot(_SHA_A, 1, 99)) is False
+    assert store.append(_snapshot(_SHA_A, 1, 60, depth="deep")) is True
+    assert store.append(_snapshot(_SHA_A, 2, 61)) is True
+    assert store.count() == 3
+
+    first = store.query("owner", "repo", analysis_depth="standard")[0]
+    assert first.health_score == 60
+    assert first.total_commits_in_window == 10
+    assert first.open_issues_count == 12
+    assert first.median_pr_merge_days is None
+
+
+def test_query_range_and_trend():
+    store = HealthHistoryStore(":memory:")
+    store.append(_snapshot(_SHA_A, 1, 60, commits=10))
+    store.append(_snapshot(_SHA_A, 5, 65, commits=14))
+    store.append(_snapshot(_SHA_B, 9, 72, commits=20))
+    store.append(build_snapshot("other", "repo", _SHA_A, "standard", {"health_score": 10}))
+
+    in_range = store.query("OWNER", "repo", since=date(2026, 9, 2), until=date(2026, 9, 9))
+    assert [s.date for s in in_range] == ["2026-09-05", "2026-09-09"]
+
+    trend = store.trend("owner", "repo", ["health_score", "total_commits_in_window", "pr_score"])
+    assert [p["commit_sha"] for p in trend["points"]] == [_SHA_A, _SHA_A, _SHA_B]
+    assert trend["points"][0] == {
+        "date": "2026-09-01", "commit_sha": _SHA_A, "analysis_depth": "standard",
+        "health_score": 60, "total_commits_in_window": 10, "pr_score": 0.6,
+    }
+    assert trend["changes"] == {"health_score": 12, "total_commits_in_window": 10, "pr_score": 0}
+
+
+def test_trend_endpoint_reads_local_history(isolated_health_history):
+    isolated_health_history.append(_snapshot(_SHA_A, 1, 60))
+    isolated_health_history.append(_snapshot(_SHA_B, 3, 70))
+
+    response = asyncio.run(get_health_trend(
+        "https://github.com/owner/repo", since="2026-09-02", metrics="health_score,docs_score",
+    ))
+    assert response.repo == "owner/repo"
+    assert response.metrics == ["health_score", "docs_score"]
+    assert [p["health_score"] for p in response.points] == [70]
+    assert response.changes == {"health_score": None, "docs_score": None}
+
+    for kwargs in ({"metrics": "stars"}, {"since": "yesterday"}):
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(get_health_trend("owner/repo", **kwargs))
+        assert exc.value.status_code == 400
+
+
+def test_full_path_records_snapshot(isolated_health_history, monkeypatch):
+    async def resolve(owner, repo, ref="HEAD"):
+        return _SHA_A
+
+    async def no_parts(*args, **kwargs):
+        return None
+
+    async def fake_stages(owner, repo, ref, analysis_depth, parts, stage_timings=None):
+        return {
+            "docs": DocsCoreResult(
+                readme_present=True, readme_word_count=300, category_scores={},
+                total_score=80, missing_sections=[], present_sections=["WHAT"],
+            ),
+            "activity": _activity(),
+            "structure": StructureCoreResult(
+                has_tests=True, has_ci=True, has_docs_folder=False, has_build_config=True,
+                structure_score=75,
+            ),
+            "dependencies": DependenciesSnapshot(repo_id=f"{owner}/{repo}"),
+        }
+
+    monkeypatch.setattr(full_path, "resolve_commit_sha_async", resolve)
+    monkeypatch.setattr(full_path, "_analyze_from_parts_async", no_parts)
+    monkeypatch.setattr(full_path, "_analyze_from_bundle_async", no_parts)
+    monkeypatch.setattr(full_path, "_run_analyzer_stages", fake_stages)
+
+    result = asyncio.run(full_path.execute_full_path(
+        "hist", "repo", "main", use_llm_summary=False, force_refresh=True,
+    ))
+
+    assert "error" not in result
+    [snapshot] = isolated_health_history.query("hist", "repo")
+    assert snapshot.commit_sha == _SHA_A
+    assert snapshot.health_score == result["health_score"]
+    assert snapshot.structure_score == 75
+    assert snapshot.unique_authors == 3
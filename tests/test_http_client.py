@@ -0,0 +1,66 @@
+"""
+공유 HTTP 클라이언트 테스트.
+
+PooledHttpClient의 세션 구성과 커넥션 재사용 통계 테스트.
+"""
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common.http_client import PooledHttpClient, get_http_client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """keep-alive 응답을 돌려주는 테스트 핸들러."""
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def local_server(local_github_server):
+    return local_github_server(_KeepAliveHandler)
+
+
+class TestPooledHttpClient:
+    """PooledHttpClient 테스트."""
+
+    def test_singleton(self):
+        """get_http_client는 항상 같은 인스턴스 반환."""
+        assert get_http_client() is get_http_client()
+
+    def test_session_has_retry_adapter(self):
+        """세션에 재시도 어댑터가 마운트되어 있는지 확인."""
+        client = PooledHttpClient(pool_size=7, max_retries=2)
+        adapter = client.session.get_adapter("https://api.github.com")
+
+        assert adapter.max_retries.total == 2
+        assert 502 in adapter.max_retries.status_forcelist
+        assert client.get_stats()["pool_size"] == 7
+        client.close()
+
+    def test_connection_reuse(self, local_server):
+        """연속 요청이 같은 연결을 재사용하는지 확인."""
+        client = PooledHttpClient(pool_size=2, max_retries=0)
+        for _ in range(5):
+            resp = client.get(f"{local_server}/repos/o/r", timeout=5)
+            assert resp.status_code == 200
+
+        stats = client.get_stats()
+        assert stats["total_requests"] == 5
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 4
+        assert stats["reuse_ratio"] == 0.8
+        client.close()
+
+    def test_stats_before_first_request(self):
+        """요청 전 통계는 0으로 초기화."""
+        client = PooledHttpClient()
+        stats = client.get_stats()
+        assert stats["total_requests"] == 0
+        assert stats["reuse_ratio"] == 0.0
@@ -0,0 +1,203 @@
+"""
+증분 재진단 테스트.
+
+입력 지문 비교로 바뀐 분석기만 다시 계산하는지, 활동성이 변경분 병합으로 갱신되는지 검증.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.agents.diagnosis import full_path, incremental, partial_cache
+from backend.core.activity_core import activity_cursor, merge_activity_summary
+from backend.core.models import (
+    ActivityCoreResult,
+    DependenciesSnapshot,
+    DocsCoreResult,
+    StructureCoreResult,
+    TreeEntry,
+)
+
+_OLD = "1" * 40
+_NEW = "2" * 40
+_OWNER, _REPO = "inc", "repo"
+
+
+def _iso(days_ago=0.0):
+    moment = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _commit(sha, days_ago):
+    return {
+        "sha": sha,
+        "commit": {
+            "author": {"name": sha, "email": f"{sha}@x", "date": _iso(days_ago)},
+            "committer": {"date": _iso(days_ago)},
+        },
+        "author": {"login": sha},
+    }
+
+
+def _tree(readme="r1", manifest="m1", app="a1", extra=()):
+    entries = [
+        TreeEntry("README.md", "blob", readme),
+        TreeEntry("requirements.txt", "blob", manifest),
+        TreeEntry("src", "tree", "t1"),
+        TreeEntry("src/app.py", "blob", app),
+    ]
+    return entries + [TreeEntry(path, "blob", "x") for path in extra]
+
+
+def _fingerprint(sha, **kwargs):
+    return incremental.compute_fingerprint(sha, _tree(**kwargs))
+
+
+@pytest.fixture
+def clean_state():
+    yield
+    incremental.immutable_cache.delete(incremental._fingerprint_key(_OWNER, _REPO))
+    incremental.immutable_cache.delete(incremental._activity_key(_OWNER, _REPO, 90))
+    for sha in (_OLD, _NEW):
+        for part in partial_cache.ANALYZER_PARTS:
+            for depth in partial_cache.DEPTH_PREFERENCE:
+                key = partial_cache.part_key(part, _OWNER, _REPO, sha, depth)
+                partial_cache.github_cache.delete(key)
+                partial_cache.immutable_cache.delete(key)
+
+
+def test_changed_parts_by_fingerprint():
+    base = _fingerprint(_OLD)
+
+    assert incremental.changed_parts(base, _fingerprint(_NEW)) == {"activity"}
+    # 경로가 같은 소스 파일 내용 변경은 어떤 정적 분석기 입력도 아님
+    assert incremental.changed_parts(base, _fingerprint(_NEW, app="a2")) == {"activity"}
+    assert incremental.changed_parts(base, _fingerprint(_NEW, readme="r2")) == {"activity", "docs"}
+    assert incremental.changed_parts(base, _fingerprint(_NEW, manifest="m2")) == {
+        "activity", "dependencies",
+    }
+    assert incremental.changed_parts(base, _fingerprint(_NEW, extra=["tests/test_app.py"])) == {
+        "activity", "structure",
+    }
+    assert incremental.changed_parts(base, _fingerprint(_NEW, extra=["package.json"])) == {
+        "activity", "dependencies", "structure",
+    }
+
+
+def test_merge_activity_summary_applies_delta_and_trims_window():
+    base = {
+        "commits": [_commit("a", 1), _commit("old", 100)],
+        "issues": [
+            {"number": 1, "state": "OPEN", "createdAt": _iso(5), "closedAt": None},
+            {"number": 2, "state": "CLOSED", "createdAt": _iso(200), "closedAt": _iso(120)},
+        ],
+        "pull_requests": [{"number": 10, "state": "OPEN", "createdAt": _iso(3)}],
+    }
+    delta = {
+        "commits": [_commit("b", 0), _commit("a", 1)],
+        "issues": [{"number": 1, "state": "CLOSED", "createdAt": _iso(5), "closedAt": _iso(0)}],
+        "pull_requests": [
+            {"number": 10, "state": "MERGED", "createdAt": _iso(3), "mergedAt": _iso(0)},
+            {"number": 11, "state": "OPEN", "createdAt": _iso(0)},
+        ],
+    }
+
+    merged = merge_activity_summary(base, delta, days=90)
+
+    assert [c["sha"] for c in merged["commits"]] == ["b", "a"]
+    assert merged["issues"] == [delta["issues"][0]]
+    assert {pr["number"]: pr["state"] for pr in merged["pull_requests"]} == {10: "MERGED", 11: "OPEN"}
+    assert activity_cursor(merged) == delta["issues"][0]["closedAt"]
+
+
+def test_refresh_activity_merges_delta(clean_state, monkeypatch):
+    base = {"commits": [_commit("a", 2)], "issues": [], "pull_requests": []}
+    incremental.remember_activity_summary(_OWNER, _REPO, 90, base)
+    calls = []
+
+    async def fake_delta(owner, repo, since_iso):
+        calls.append(since_iso)
+        return {"commits": [_commit("b", 0)], "issues": [], "pull_requests": [], "truncated": False}
+
+    monkeypatch.setattr(incremental, "fetch_activity_delta_async", fake_delta)
+
+    result = asyncio.run(incremental.refresh_activity_async(_OWNER, _REPO, 90))
+
+    assert result.total_commits_in_window == 2
+    assert result.unique_authors == 2
+    # 커서(마지막 커밋 시각)보다 조금 앞에서 변경분 조회
+    assert calls[0] < activity_cursor(base)
+    window = incremental.load_activity_window(_OWNER, _REPO, 90)
+    assert [c["sha"] for c in window.summary["commits"]] == ["b", "a"]
+
+
+def test_refresh_activity_falls_back_to_full_fetch(clean_state, monkeypatch):
+    async def truncated(owner, repo, since_iso):
+        return {"commits": [], "issues": [], "pull_requests": [], "truncated": True}
+
+    monkeypatch.setattr(incremental, "fetch_activity_delta_async", truncated)
+
+    assert asyncio.run(incremental.refresh_activity_async(_OWNER, _REPO, 90)) is None
+
+    incremental.remember_activity_summary(
+        _OWNER, _REPO, 90, {"commits": [_commit("a", 1)]}, base_fetched_at=time.time() - 10**7,
+    )
+    assert asyncio.run(incremental.refresh_activity_async(_OWNER, _REPO, 90)) is None
+
+    incremental.remember_activity_summary(_OWNER, _REPO, 90, {"commits": [_commit("a", 1)]})
+    assert asyncio.run(incremental.refresh_activity_async(_OWNER, _REPO, 90)) is None
+
+
+def test_full_path_recomputes_only_changed_analyzers(clean_state, monkeypatch):
+    partial_cache.store_parts(_OWNER, _REPO, _OLD, "standard", {
+        "docs": DocsCoreResult(
+            readme_present=True, readme_word_count=300, category_scores={},
+            total_score=80, missing_sections=[], present_sections=["WHAT"],
+        ),
+        "structure": StructureCoreResult(
+            has_tests=True, has_ci=True, has_docs_folder=False, has_build_config=True,
+            structure_score=75,
+        ),
+        "dependencies": DependenciesSnapshot(repo_id=f"{_OWNER}/{_REPO}"),
+    })
+    incremental.store_fingerprint(_OWNER, _REPO, _fingerprint(_OLD))
+
+    async def resolve(owner, repo, ref="HEAD"):
+        return _NEW
+
+    async def new_tree(owner, repo, ref):
+        assert ref == _NEW
+        return _tree(readme="r2", app="a2")
+
+    requested = []
+
+    async def fake_stages(owner, repo, ref, analysis_depth, parts, stage_timings=None):
+        requested.extend(parts)
+        return {
+            "docs": DocsCoreResult(
+                readme_present=True, readme_word_count=10, category_scores={},
+                total_score=40, missing_sections=["HOW"], present_sections=[],
+            ),
+            "activity": ActivityCoreResult(
+                commit_score=0.5, issue_score=0.5, pr_score=0.5, total_score=50,
+                days_since_last_commit=0, total_commits_in_window=3, unique_authors=1,
+            ),
+        }
+
+    monkeypatch.setattr(full_path, "resolve_commit_sha_async", resolve)
+    monkeypatch.setattr(incremental, "fetch_repo_tree_entries_async", new_tree)
+    monkeypatch.setattr(full_path, "_run_analyzer_stages", fake_stages)
+
+    result = asyncio.run(full_path.execute_full_path(_OWNER, _REPO, "main", use_llm_summary=False))
+
+    assert "error" not in result
+    assert sorted(requested) == ["activity", "docs"]
+    assert result["structure_score"] == 75
+    assert result["documentation"]["total_score"] == 40
+    assert result["incremental"] == {
+        "base_sha": _OLD,
+        "changed_parts": ["activity", "docs"],
+        "reused_parts": ["structure", "dependencies"],
+    }
+    assert incremental.load_fingerprint(_OWNER, _REPO).commit_sha == _NEW
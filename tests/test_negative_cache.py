@@ -0,0 +1,84 @@
+"""
+Negative 캐시 테스트.
+
+404 README/파일/저장소 응답은 짧게 캐시하고, 일시적 오류는 캐시하지 않는지 검증.
+"""
+import asyncio
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common import github_client
+from backend.common.cache_manager import NEGATIVE, SimpleCache, cached, mark_negative
+from backend.core import github_core
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(self.path)
+        status = 409 if self.path.startswith("/repos/o/flaky") else 404
+        body = b'{"message": "Not Found"}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def local_github(local_github_server):
+    local_github_server(_Handler, github_client, github_core)
+    yield _Handler.requests_seen
+    for repo in ("gone", "flaky"):
+        github_client.clear_repo_cache("o", repo)
+        github_core.fetch_file_content.invalidate("o", repo, "setup.py")
+        github_core._fetch_readme_content_async.invalidate("o", repo)
+
+
+def test_marked_none_is_cached_until_negative_ttl():
+    cache = SimpleCache(ttl=60)
+    calls = []
+
+    @cached(cache=cache, negative_ttl=30)
+    def lookup(name, missing):
+        calls.append(name)
+        if missing:
+            mark_negative()
+        return None
+
+    assert lookup("a", True) is None
+    assert lookup("a", True) is None
+    assert lookup("b", False) is None
+    assert lookup("b", False) is None
+    assert calls == ["a", "b", "b"]
+    assert any(entry.value is NEGATIVE for entry in cache._store.values())
+
+
+def test_missing_file_and_readme_hit_github_once(local_github):
+    assert github_core.fetch_file_content("o", "gone", "setup.py") is None
+    assert github_core.fetch_file_content("o", "gone", "setup.py") is None
+    assert asyncio.run(github_core._fetch_readme_content_async("o", "gone")) is None
+    assert asyncio.run(github_core._fetch_readme_content_async("o", "gone")) is None
+
+    assert local_github.count("/repos/o/gone/contents/setup.py?ref=HEAD") == 1
+    assert local_github.count("/repos/o/gone/readme") == 1
+
+
+def test_other_errors_are_not_negative_cached(local_github):
+    github_core.fetch_file_content("o", "flaky", "setup.py")
+    github_core.fetch_file_content("o", "flaky", "setup.py")
+
+    assert local_github.count("/repos/o/flaky/contents/setup.py?ref=HEAD") == 2
+
+
+def test_missing_repo_access_is_remembered(local_github):
+    first = github_client.check_repo_access("o", "gone")
+    second = asyncio.run(github_client.check_repo_access_async("o", "gone"))
+
+    assert first.reason == second.reason == "not_found"
+    assert local_github.count("/repos/o/gone") == 1
+
+    github_client.clear_repo_cache("o", "gone")
+    github_client.check_repo_access("o", "gone")
+    assert local_github.count("/repos/o/gone") == 2
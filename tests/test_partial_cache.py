@@ -0,0 +1,195 @@
+"""
+분석기별 부분 결과 캐시 테스트.
+
+full path가 저장한 docs/activity/structure/dependencies 결과를
+fast path와 부분 재실행이 재사용하는지 검증.
+"""
+import asyncio
+
+import pytest
+
+from backend.agents.diagnosis import fast_path, full_path, partial_cache
+from backend.common.stage_scheduler import listen_stages
+from backend.core.models import (
+    ActivityCoreResult,
+    DependenciesSnapshot,
+    DocsCoreResult,
+    StructureCoreResult,
+)
+
+_SHA = "c" * 40
+
+
+def _docs():
+    return DocsCoreResult(
+        readme_present=True, readme_word_count=300, category_scores={},
+        total_score=80, missing_sections=[], present_sections=["WHAT", "HOW"],
+    )
+
+
+def _activity(score=70):
+    return ActivityCoreResult(
+        commit_score=0.7, issue_score=0.7, pr_score=0.7, total_score=score,
+        days_since_last_commit=1, total_commits_in_window=40, unique_authors=5,
+    )
+
+
+def _structure():
+    return StructureCoreResult(
+        has_tests=True, has_ci=True, has_docs_folder=False, has_build_config=True,
+        structure_score=75,
+    )
+
+
+@pytest.fixture
+def repo_at_sha(monkeypatch):
+    async def resolve(owner, repo, ref="HEAD"):
+        return _SHA
+
+    monkeypatch.setattr(full_path, "resolve_commit_sha_async", resolve)
+    monkeypatch.setattr(fast_path.github_client, "resolve_commit_sha_async", resolve)
+    yield
+    for part in partial_cache.ANALYZER_PARTS:
+        for depth in partial_cache.DEPTH_PREFERENCE:
+            key = partial_cache.part_key(part, "o", "r", _SHA, depth)
+            partial_cache.github_cache.delete(key)
+            partial_cache.immutable_cache.delete(key)
+
+
+def test_store_and_load_parts(repo_at_sha):
+    partial_cache.store_parts("O", "R", _SHA, "standard", {
+        "docs": _docs(), "activity": _activity(), "structure": None,
+    })
+
+    parts = partial_cache.load_parts("o", "r", _SHA, "standard")
+    assert set(parts) == {"docs", "activity"}
+    assert partial_cache.load_parts("o", "r", _SHA, "quick") == {}
+    assert partial_cache.load_parts("o", "r", None, "standard") == {}
+
+
+def test_fast_path_reuses_full_diagnosis_part(repo_at_sha):
+    partial_cache.store_parts("o", "r", _SHA, "thorough", {"structure": _structure()})
+
+    result = asyncio.run(fast_path.execute_fast_path("o", "r", "main", "structure"))
+
+    assert result["from_cache"] is True
+    assert result["data"]["structure_score"] == 75
+
+
+def test_full_path_refreshes_only_activity(repo_at_sha, monkeypatch):
+    partial_cache.store_parts("o", "r", _SHA, "standard", {
+        "docs": _docs(),
+        "structure": _structure(),
+        "dependencies": DependenciesSnapshot(repo_id="o/r"),
+    })
+    activity_calls = []
+
+    async def fake_activity(owner, repo, days):
+        activity_calls.append((owner, repo, days))
+        return _activity(score=55)
+
+    async def no_bundle(*args):
+        raise AssertionError("bundle fetch should not run")
+
+    monkeypatch.setattr(full_path, "analyze_activity_async", fake_activity)
+    monkeypatch.setattr(full_path, "_analyze_from_bundle_async", no_bundle)
+
+    result = asyncio.run(full_path.execute_full_path("o", "r", "main", use_llm_summary=False))
+
+    assert "error" not in result
+    assert result["commit_sha"] == _SHA
+    assert result["structure_score"] == 75
+    assert result["activity"]["total_score"] == 55
+    assert activity_calls == [("o", "r", 90)]
+    assert partial_cache.load_parts("o", "r", _SHA, "standard")["activity"].total_score == 55
+
+
+def test_affected_parts_by_changed_path():
+    assert partial_cache.affected_parts(["README.md"]) == {"activity", "docs"}
+    assert partial_cache.affected_parts(["api/package.json", "poetry.lock"]) == {
+        "activity", "dependencies",
+    }
+    assert partial_cache.affected_parts(["src/app.py"]) == {"activity", "structure"}
+    # 파일 추가/삭제는 트리 구조를 바꿈
+    assert partial_cache.affected_parts([], ["docs/README.md"]) == {
+        "activity", "docs", "structure",
+    }
+
+
+def test_push_carries_unaffected_parts_and_recomputes_rest(repo_at_sha, monkeypatch):
+    before = "b" * 40
+    partial_cache.store_parts("o", "r", before, "standard", {
+        "docs": _docs(),
+        "activity": _activity(),
+        "structure": _structure(),
+        "dependencies": DependenciesSnapshot(repo_id="o/r"),
+    })
+    carried = partial_cache.carry_forward_parts(
+        "o", "r", before, _SHA, partial_cache.affected_parts(["src/app.py"])
+    )
+    assert carried == ["docs@standard", "dependencies@standard"]
+
+    async def fake_snapshot(owner, repo, ref, analysis_depth):
+        return object()
+
+    async def fake_tree(owner, repo, ref):
+        return ["src/app.py"]
+
+    def fake_structure(owner, repo, tree):
+        assert tree == ["src/app.py"]
+        return StructureCoreResult(
+            has_tests=False, has_ci=False, has_docs_folder=False, has_build_config=False,
+            structure_score=40,
+        )
+
+    async def fake_activity(owner, repo, days):
+        return _activity(score=60)
+
+    async def no_docs(snapshot):
+        raise AssertionError("docs should be reused")
+
+    monkeypatch.setattr(full_path, "_fetch_snapshot_async", fake_snapshot)
+    monkeypatch.setattr(full_path, "_fetch_tree_async", fake_tree)
+    monkeypatch.setattr(full_path, "analyze_structure_from_tree", fake_structure)
+    monkeypatch.setattr(full_path, "_analyze_docs_async", no_docs)
+    monkeypatch.setattr(full_path, "analyze_activity_async", fake_activity)
+
+    result = asyncio.run(full_path.execute_full_path("o", "r", "main", use_llm_summary=False))
+
+    assert "error" not in result
+    assert result["structure_score"] == 40
+    assert result["activity"]["total_score"] == 60
+    assert set(result["stage_timings"]) == {"tree", "structure", "activity"}
+    for part in partial_cache.ANALYZER_PARTS:
+        partial_cache.immutable_cache.delete(partial_cache.part_key(part, "o", "r", before, "standard"))
+        partial_cache.github_cache.delete(partial_cache.part_key(part, "o", "r", before, "standard"))
+
+
+def test_full_path_emits_stage_events(repo_at_sha, monkeypatch):
+    partial_cache.store_parts("o", "r", _SHA, "standard", {
+        "docs": _docs(),
+        "structure": _structure(),
+        "dependencies": DependenciesSnapshot(repo_id="o/r"),
+    })
+
+    async def fake_activity(owner, repo, days):
+        return _activity(score=55)
+
+    monkeypatch.setattr(full_path, "analyze_activity_async", fake_activity)
+
+    events = []
+
+    async def run():
+        with listen_stages(lambda name, payload: events.append((name, payload))):
+            return await full_path.execute_full_path("o", "r", "main", use_llm_summary=False)
+
+    asyncio.run(run())
+
+    stages = dict(events)
+    assert [name for name, _ in events][-1] == "scoring"
+    assert set(stages) == {"docs", "activity", "structure", "dependencies", "scoring"}
+    assert stages["docs"]["docs_score"] == 80
+    assert stages["activity"]["activity_score"] == 55
+    assert stages["activity"]["total_commits_in_window"] == 40
+    assert stages["structure"]["has_tests"] is True
+    assert stages["dependencies"]["dependency_count"] == 0
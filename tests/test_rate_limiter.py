@@ -0,0 +1,171 @@
+"""
+GitHub Rate Limit 스케줄러 테스트.
+
+토큰 풀 순환, 예산 추적, 토큰 버킷, 대기/에러 동작 검증.
+"""
+import time
+from http.server import BaseHTTPRequestHandler
+from types import SimpleNamespace
+
+import pytest
+
+from backend.common import rate_limiter
+from backend.common.errors import GitHubRateLimitError
+from backend.common.http_client import PooledHttpClient
+from backend.common.rate_limiter import RateLimitScheduler, TokenBucket
+
+
+def _resp(status=200, **headers):
+    return SimpleNamespace(status_code=status, headers=headers)
+
+
+def _scheduler(**kwargs):
+    params = dict(
+        tokens=["token-aaaa", "token-bbbb"],
+        rate_per_second=0,
+        burst=1,
+        reserve=10,
+        max_wait=5,
+        api_base="https://api.github.com",
+    )
+    params.update(kwargs)
+    return RateLimitScheduler(**params)
+
+
+class TestTokenSelection:
+    """토큰 선택/순환 테스트."""
+
+    def test_rotates_away_from_low_budget(self):
+        scheduler = _scheduler()
+        lease = scheduler.acquire("core")
+        scheduler.record(lease, _resp(**{
+            "X-RateLimit-Remaining": "3",
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }))
+
+        for _ in range(3):
+            assert scheduler.acquire("core").token != lease.token
+
+    def test_retry_after_blocks_token(self):
+        scheduler = _scheduler()
+        lease = scheduler.acquire("core")
+        limited = scheduler.record(lease, _resp(403, **{"Retry-After": "30"}))
+
+        assert limited is True
+        assert scheduler.acquire("core").token != lease.token
+
+    def test_budgets_are_per_resource(self):
+        scheduler = _scheduler(tokens=["token-aaaa"])
+        lease = scheduler.acquire("graphql")
+        scheduler.record(lease, _resp(**{
+            "X-RateLimit-Resource": "graphql",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }))
+
+        assert scheduler.acquire("core").token == "token-aaaa"
+        with pytest.raises(GitHubRateLimitError):
+            scheduler.acquire("graphql")
+
+    def test_headroom_sums_budgets_above_reserve(self):
+        scheduler = _scheduler()
+        lease = scheduler.acquire("core")
+        scheduler.record(lease, _resp(**{
+            "X-RateLimit-Remaining": "40",
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Reset": str(int(time.time()) + 600),
+        }))
+
+        remaining, reset_in = scheduler.headroom("core")
+        assert remaining == 30 + 4990
+        assert 590 < reset_in <= 600
+
+    def test_waits_for_reset_then_resumes(self):
+        scheduler = _scheduler(tokens=["token-aaaa"], max_wait=5)
+        lease = scheduler.acquire("core")
+        scheduler.record(lease, _resp(403, **{"Retry-After": "0.2"}))
+
+        start = time.monotonic()
+        assert scheduler.acquire("core").token == "token-aaaa"
+        assert time.monotonic() - start >= 0.15
+        assert scheduler.get_stats()["waits"] == 1
+
+    def test_caller_token_outside_pool_is_pinned(self):
+        scheduler = _scheduler()
+        headers, caller_token, managed = scheduler.prepare_headers(
+            {"Authorization": "token user-pat"}
+        )
+        assert managed is False
+        lease = scheduler.acquire("core", pinned_token=caller_token)
+        assert lease.token == "user-pat"
+
+    def test_caller_token_states_are_bounded(self):
+        scheduler = _scheduler(caller_token_max_entries=2)
+        for i in range(5):
+            _, caller_token, managed = scheduler.prepare_headers({"Authorization": f"token pat-{i}"})
+            assert managed is False
+            assert scheduler.acquire("core", pinned_token=caller_token).token == f"pat-{i}"
+
+        assert scheduler.get_stats()["caller_tokens"] == 2
+        assert list(scheduler._caller_states) == ["pat-3", "pat-4"]
+        assert "pat-0" not in scheduler._by_token
+
+    def test_graphql_cost_recorded(self):
+        scheduler = _scheduler(tokens=["token-aaaa"])
+        resp = SimpleNamespace(
+            request=SimpleNamespace(headers={"Authorization": "Bearer token-aaaa"})
+        )
+        scheduler.record_graphql_cost(resp, {"cost": 3, "remaining": 4990, "resetAt": None})
+
+        budget = scheduler.get_stats()["tokens"][0]["budgets"]["graphql"]
+        assert budget["last_cost"] == 3
+        assert budget["remaining"] == 4990
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트."""
+
+    def test_paces_after_burst(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """첫 번째 토큰에만 rate limit 응답을 주는 핸들러."""
+    seen_tokens = []
+
+    def do_GET(self):
+        token = self.headers.get("Authorization", "").split(" ")[-1]
+        type(self).seen_tokens.append(token)
+        if token == "token-aaaa":
+            self.send_response(403)
+            self.send_header("X-RateLimit-Remaining", "0")
+            self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        else:
+            self.send_response(200)
+            self.send_header("X-RateLimit-Remaining", "4999")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+
+def test_http_client_retries_with_next_token(monkeypatch, local_github_server):
+    _RateLimitedHandler.seen_tokens = []
+    base = local_github_server(_RateLimitedHandler)
+
+    scheduler = _scheduler(api_base=base)
+    # bbbb 잔여 예산을 낮춰 aaaa가 먼저 선택되도록 설정
+    scheduler.record(
+        scheduler.acquire("core", pinned_token="token-bbbb"),
+        _resp(**{"X-RateLimit-Remaining": "100"}),
+    )
+    monkeypatch.setattr(rate_limiter, "_scheduler_instance", scheduler)
+
+    client = PooledHttpClient(max_retries=0)
+    resp = client.get(f"{base}/repos/o/r", timeout=5)
+    assert resp.status_code == 200
+    assert _RateLimitedHandler.seen_tokens == ["token-aaaa", "token-bbbb"]
+    client.close()
@@ -0,0 +1,100 @@
+"""
+저장소 아카이브(tarball) 조회 테스트.
+
+로컬 HTTP 서버가 내려주는 tarball로 스트리밍 추출과 archive 모드 분석 검증.
+"""
+import io
+import json
+import tarfile
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common.repo_archive import read_tarball, tarball_url
+from backend.core import github_core
+from backend.core.dependencies_core import MANIFEST_ARCHIVE_PATTERNS, parse_dependencies
+from backend.core.models import RepoSnapshot
+from backend.core.structure_core import analyze_structure
+
+
+def _make_tarball(files: dict) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for path, content in files.items():
+            data = content.encode()
+            info = tarfile.TarInfo(f"o-r-abc123/{path}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+_FILES = {
+    "requirements.txt": "flask==2.0.1\n",
+    "services/web/package.json": json.dumps({"dependencies": {"react": "^18.0.0"}}),
+    "tests/test_app.py": "def test_ok():\n    pass\n",
+    ".github/workflows/ci.yml": "on: push\n",
+    "src/app.py": "print('hi')\n",
+}
+
+
+class _ArchiveHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(self.path)
+        if self.path.startswith("/repos/o/r/tarball"):
+            status, body = 200, _make_tarball(_FILES)
+        else:
+            status, body = 404, b"{}"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def local_archive(local_github_server):
+    local_github_server(_ArchiveHandler, github_core)
+    github_core.fetch_repo_archive.invalidate("o", "r", "HEAD", MANIFEST_ARCHIVE_PATTERNS)
+    yield _ArchiveHandler.requests_seen
+    github_core.fetch_repo_archive.invalidate("o", "r", "HEAD", MANIFEST_ARCHIVE_PATTERNS)
+
+
+def _snapshot() -> RepoSnapshot:
+    return RepoSnapshot(
+        owner="o", repo="r", ref="HEAD", full_name="o/r", description=None,
+        stars=0, forks=0, open_issues=0, primary_language=None,
+        created_at=None, pushed_at=None, is_archived=False, is_fork=False,
+        readme_content=None, has_readme=False, license_spdx=None,
+    )
+
+
+def test_read_tarball_extracts_matching_paths_only():
+    archive = read_tarball(
+        io.BytesIO(_make_tarball(_FILES)), ["package.json", "*.txt"], max_file_bytes=1000
+    )
+
+    assert sorted(archive.paths) == sorted(_FILES)
+    assert set(archive.files) == {"requirements.txt", "services/web/package.json"}
+    assert archive.files["requirements.txt"] == "flask==2.0.1\n"
+    assert archive.bytes_read > 0
+
+    small = read_tarball(io.BytesIO(_make_tarball(_FILES)), ["*.json"], max_file_bytes=5)
+    assert small.files == {}
+    assert small.skipped == ["services/web/package.json"]
+
+
+def test_tarball_url_uses_default_branch_for_head():
+    assert tarball_url("https://api", "o", "r", "HEAD") == "https://api/repos/o/r/tarball"
+    assert tarball_url("https://api", "o", "r", "v1.0") == "https://api/repos/o/r/tarball/v1.0"
+
+
+def test_archive_mode_shares_one_download(local_archive):
+    deps = parse_dependencies(_snapshot(), fetch_mode="archive")
+    structure = analyze_structure(_snapshot(), fetch_mode="archive")
+
+    assert {d.name for d in deps.dependencies} == {"flask", "react"}
+    assert sorted(deps.analyzed_files) == ["requirements.txt", "services/web/package.json"]
+    assert structure.has_tests is True
+    assert structure.has_ci is True
+    assert local_archive == ["/repos/o/r/tarball"]
@@ -0,0 +1,98 @@
+"""
+커밋 SHA 기준 캐시 테스트.
+
+ref→SHA 조회와 SHA로 고정된 콘텐츠의 immutable 캐시 선택 검증.
+"""
+import asyncio
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from backend.common import github_client
+from backend.common.cache_manager import (
+    cached_by_ref,
+    github_cache,
+    is_commit_sha,
+)
+from backend.core import github_core
+
+_SHA = "a" * 40
+
+
+class _CommitHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        type(self).requests_seen.append((self.path, self.headers.get("Accept")))
+        if self.path == "/repos/o/r/commits/main":
+            status, body = 200, f"{_SHA}\n".encode()
+        elif self.path.startswith(f"/repos/o/r/git/trees/{_SHA}"):
+            status, body = 200, b'{"tree": [{"path": "README.md"}]}'
+        else:
+            status, body = 404, b"{}"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def local_github(local_github_server):
+    local_github_server(_CommitHandler, github_client, github_core)
+    github_client._resolve_commit_sha.invalidate("o", "r", "main")
+    github_client._resolve_commit_sha_async.invalidate("o", "r", "main")
+    github_core.fetch_repo_tree_entries.invalidate("o", "r", _SHA)
+    yield _CommitHandler.requests_seen
+    github_client._resolve_commit_sha.invalidate("o", "r", "main")
+    github_client._resolve_commit_sha_async.invalidate("o", "r", "main")
+    github_core.fetch_repo_tree_entries.invalidate("o", "r", _SHA)
+
+
+def test_is_commit_sha():
+    assert is_commit_sha(_SHA)
+    assert not is_commit_sha("main")
+    assert not is_commit_sha("HEAD")
+    assert not is_commit_sha("A" * 40)
+    assert not is_commit_sha(None)
+
+
+def test_cached_by_ref_picks_cache_by_ref():
+    calls = []
+
+    @cached_by_ref(ttl=60)
+    def fetch(owner, ref="HEAD"):
+        calls.append(ref)
+        return {"ref": ref}
+
+    fetch.invalidate("o")
+    fetch.invalidate("o", _SHA)
+    try:
+        assert fetch("o") == {"ref": "HEAD"}
+        assert fetch("o", ref=_SHA) == {"ref": _SHA}
+        assert fetch("o", _SHA) == {"ref": _SHA}
+        assert calls == ["HEAD", _SHA]
+
+        # 브랜치 캐시만 비워도 SHA 결과는 유지
+        github_cache.clear()
+        fetch("o", _SHA)
+        fetch("o")
+        assert calls == ["HEAD", _SHA, "HEAD"]
+    finally:
+        fetch.invalidate("o")
+        fetch.invalidate("o", _SHA)
+
+
+def test_resolve_commit_sha_and_immutable_tree(local_github):
+    assert github_client.resolve_commit_sha("o", "r", "main") == _SHA
+    assert github_client.resolve_commit_sha("o", "r", "main") == _SHA
+    assert asyncio.run(github_client.resolve_commit_sha_async("o", "r", _SHA)) == _SHA
+    assert github_client.resolve_commit_sha("o", "r", "missing") is None
+
+    assert github_core.fetch_repo_tree("o", "r", _SHA) == ["README.md"]
+    github_cache.clear()
+    assert github_core.fetch_repo_tree("o", "r", _SHA) == ["README.md"]
+
+    paths = [path for path, _ in local_github]
+    assert paths.count("/repos/o/r/commits/main") == 1
+    assert paths.count(f"/repos/o/r/git/trees/{_SHA}?recursive=1") == 1
+    assert ("/repos/o/r/commits/main", "application/vnd.github.sha") in local_github
@@ -0,0 +1,93 @@
+"""
+SimpleCache 상한/LRU/통계 테스트.
+"""
+import asyncio
+import threading
+import time
+
+from backend.api.cache_router import get_cache_stats
+from backend.common.cache_manager import SimpleCache, cached, estimate_size
+
+
+class TestSimpleCacheBounds:
+    """용량 상한과 제거 정책."""
+
+    def test_lru_eviction_by_entries(self):
+        cache = SimpleCache(ttl=60, max_entries=2)
+        cache.set("f:a", 1)
+        cache.set("f:b", 2)
+        assert cache.get("f:a") == 1  # a를 최근 사용으로 갱신
+        cache.set("f:c", 3)
+
+        assert cache.get("f:b") is None
+        assert cache.get("f:a") == 1
+        assert cache.get("f:c") == 3
+        assert cache.get_stats()["functions"]["f"]["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        payload = "x" * 1000
+        cache = SimpleCache(ttl=60, max_bytes=estimate_size(payload) * 2 + 10)
+        for name in ("a", "b", "c"):
+            cache.set(f"f:{name}", payload)
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert cache.get("f:a") is None
+
+        # 상한보다 큰 단일 항목은 저장하지 않음
+        cache.set("f:big", "y" * 10_000)
+        assert cache.get("f:big") is None
+        assert len(cache) == 2
+
+    def test_sweep_removes_expired(self):
+        cache = SimpleCache(ttl=60)
+        cache.set("f:old", 1, ttl=1)
+        cache.set("f:new", 2)
+        cache._store["f:old"].expires_at = time.time() - 1
+
+        assert cache.sweep() == 1
+        assert len(cache) == 1
+        assert cache.get_stats()["functions"]["f"]["expirations"] == 1
+
+    def test_concurrent_writes_stay_within_bound(self):
+        cache = SimpleCache(ttl=60, max_entries=50)
+
+        def writer(n):
+            for i in range(200):
+                cache.set(f"f:{n}-{i}", i)
+                cache.get(f"f:{n}-{i // 2}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 50
+        assert stats["functions"]["f"]["entries"] == 50
+
+
+def test_cached_records_per_function_stats():
+    cache = SimpleCache(ttl=60, name="test")
+
+    @cached(cache=cache)
+    def lookup(x):
+        return {"x": x}
+
+    lookup(1)
+    lookup(1)
+    lookup(2)
+
+    stats = cache.get_stats()["functions"][f"{__name__}.lookup"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["entries"] == 2
+    assert stats["bytes"] > 0
+
+
+def test_cache_stats_endpoint_includes_memory_caches():
+    response = asyncio.run(get_cache_stats())
+    assert {"github", "immutable"} <= set(response.memory)
+    assert "functions" in response.memory["github"]
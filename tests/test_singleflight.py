@@ -0,0 +1,165 @@
+"""
+Singleflight 요청 병합 테스트.
+
+동기/비동기 병합, 예외 전파, cached 데코레이터와 진단 작업 병합 검증.
+"""
+import asyncio
+import threading
+import time
+
+from backend.api import agent_service
+from backend.common.cache_manager import SimpleCache, cached
+from backend.common.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 단위 테스트."""
+
+    def test_threads_share_one_execution(self):
+        flight = SingleFlight()
+        calls = []
+        start = threading.Barrier(5)
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(flight.do("key", slow))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert flight.get_stats()["coalesced"] == 4
+
+    def test_async_waiters_share_result_and_error(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def slow(fail):
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            if fail:
+                raise RuntimeError("boom")
+            return {"n": 1}
+
+        async def run():
+            ok = await asyncio.gather(*(flight.do_async("ok", slow, False) for _ in range(4)))
+            failed = await asyncio.gather(
+                *(flight.do_async("bad", slow, True) for _ in range(3)),
+                return_exceptions=True,
+            )
+            return ok, failed
+
+        ok, failed = asyncio.run(run())
+        assert ok == [{"n": 1}] * 4
+        assert all(isinstance(e, RuntimeError) for e in failed)
+        assert len(calls) == 2
+        assert flight.get_stats()["in_flight"] == 0
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def run():
+            first = asyncio.create_task(flight.do_async("key", slow))
+            second = asyncio.create_task(flight.do_async("key", slow))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == "done"
+
+
+def test_cached_coroutine_coalesces_concurrent_misses():
+    cache = SimpleCache(ttl=60)
+    calls = []
+
+    @cached(cache=cache)
+    async def fetch(name):
+        calls.append(name)
+        await asyncio.sleep(0.05)
+        return {"name": name}
+
+    async def run():
+        return await asyncio.gather(*(fetch("repo") for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert all(r == {"name": "repo"} for r in results)
+    assert calls == ["repo"]
+
+
+def test_concurrent_diagnose_tasks_run_once(monkeypatch):
+    calls = []
+
+    async def fake_handler(owner, repo, *args):
+        calls.append((owner, repo))
+        await asyncio.sleep(0.05)
+        return {"ok": True, "data": {"repo": repo}}
+
+    monkeypatch.setattr(agent_service, "_handle_diagnose_repo_async", fake_handler)
+
+    async def run():
+        return await asyncio.gather(*(
+            agent_service.run_agent_task_async("diagnose_repo", "octo", "hello")
+            for _ in range(5)
+        ))
+
+    responses = asyncio.run(run())
+    assert calls == [("octo", "hello")]
+    assert all(r["data"]["repo"] == "hello" for r in responses)
+    responses[0]["data"]["repo"] = "changed"
+    assert responses[1]["data"]["repo"] == "hello"
+
+
+def test_coalesced_diagnose_streams_receive_stage_events(monkeypatch):
+    from backend.api.sse_analyze import stream_stage_events
+    from backend.common.stage_scheduler import emit_stage
+
+    late_joined = None
+
+    async def fake_handler(owner, repo, *args):
+        emit_stage("docs", {"total_score": 80})
+        await late_joined.wait()
+        emit_stage("activity", {"total_score": 50})
+        return {"ok": True, "data": {"repo": repo}}
+
+    monkeypatch.setattr(agent_service, "_handle_diagnose_repo_async", fake_handler)
+
+    async def collect(started=None):
+        events = []
+        stream = stream_stage_events(agent_service.run_agent_task_async("diagnose_repo", "octo", "sse"))
+        async for stage, _ in stream:
+            events.append(stage)
+            if started is not None and not started.is_set():
+                started.set()
+        return events
+
+    async def run():
+        nonlocal late_joined
+        late_joined = asyncio.Event()
+        leader_started = asyncio.Event()
+        leader = asyncio.create_task(collect(leader_started))
+        await leader_started.wait()
+        # 첫 단계가 끝난 뒤 같은 진단에 합류한 두 번째 스트림
+        follower = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        late_joined.set()
+        return await asyncio.gather(leader, follower)
+
+    leader_events, follower_events = asyncio.run(run())
+    assert leader_events == ["docs", "activity", "result"]
+    assert follower_events == ["docs", "activity", "result"]
+    assert agent_service._stage_fanouts == {}
@@ -135,6 +135,72 @@ class TestSSEAnalyzeUnit:
         assert request.repo_url == "https://github.com/owner/repo"
 
 
+class TestSSEStageStreaming:
+    """실제 단계 완료 시점 스트리밍 테스트."""
+    
+    def test_stage_events_carry_partial_results(self):
+        """분석기 완료 알림이 부분 결과와 함께 complete 이전에 전달되는지 테스트."""
+        from backend.api.sse_analyze import analyze_with_progress
+        from backend.common.stage_scheduler import emit_stage
+        
+        async def fake_task(**kwargs):
+            emit_stage("activity", {"activity_score": 70, "unique_authors": 4})
+            await asyncio.sleep(0)
+            emit_stage("docs", {"docs_score": 80})
+            emit_stage("scoring", {"health_score": 75})
+            emit_stage("llm_summary", {"llm_summary": "요약"})
+            return {"ok": True, "data": {"health_score": 75}}
+        
+        with patch("backend.api.agent_service.run_agent_task_async", side_effect=fake_task), \
+             patch("backend.common.cache_manager.analysis_cache.get_analysis", return_value=None), \
+             patch("backend.common.cache_manager.analysis_cache.set_analysis"), \
+             patch("backend.common.github_client.fetch_beginner_issues", return_value=[]):
+            async def collect():
+                return [
+                    json.loads(event_str[6:].strip())
+                    async for event_str in analyze_with_progress("test", "repo", "main")
+                ]
+            
+            events = asyncio.run(collect())
+        
+        steps = [e["step"] for e in events]
+        assert steps[:5] == ["github", "activity", "docs", "scoring", "llm"]
+        assert steps[-1] == "complete"
+        assert events[1]["data"] == {"stage": "activity", "partial": {"activity_score": 70, "unique_authors": 4}}
+        assert events[4]["data"]["partial"]["llm_summary"] == "요약"
+        progress = [e["progress"] for e in events]
+        assert progress == sorted(progress)
+
+
+    def test_background_summary_follows_complete(self):
+        """백그라운드 요약은 complete 이후 summary 이벤트로 전달되는지 테스트."""
+        from backend.agents.diagnosis.summary_jobs import summary_jobs
+        from backend.api.sse_analyze import analyze_with_progress
+        from backend.common.stage_scheduler import emit_stage
+        
+        async def fake_task(**kwargs):
+            summary_jobs.submit("test/repo@main", lambda: "백그라운드 요약")
+            emit_stage("summary_pending", {"job_id": "test/repo@main"})
+            return {"ok": True, "data": {"health_score": 75}}
+        
+        with patch("backend.api.agent_service.run_agent_task_async", side_effect=fake_task), \
+             patch("backend.common.cache_manager.analysis_cache.get_analysis", return_value=None), \
+             patch("backend.common.cache_manager.analysis_cache.set_analysis"), \
+             patch("backend.common.github_client.fetch_beginner_issues", return_value=[]):
+            async def collect():
+                return [
+                    json.loads(event_str[6:].strip())
+                    async for event_str in analyze_with_progress("test", "repo", "main")
+                ]
+            
+            events = asyncio.run(collect())
+        
+        assert [e["step"] for e in events][-2:] == ["complete", "summary"]
+        assert events[-2]["data"]["result"]["summary_job_id"] == "test/repo@main"
+        assert events[-1]["data"]["summary"] == "백그라운드 요약"
+        assert events[-1]["data"]["status"] == "done"
+
+
 class TestSSEWithMockedDependencies:
     """의존성 모킹 테스트."""
     
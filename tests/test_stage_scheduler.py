@@ -0,0 +1,160 @@
+"""
+단계 스케줄러/공용 실행기 테스트.
+
+선행 단계가 없는 단계는 동시에 시작하고, 선행 결과는 deps 순서대로 전달되며,
+실패 시 나머지 단계가 취소되는지 검증.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backend.common.async_utils import get_shared_executor, run_blocking
+from backend.common.stage_scheduler import StageScheduler, emit_stage, listen_stages
+
+
+def test_independent_stages_overlap():
+    async def slow(value):
+        await asyncio.sleep(0.1)
+        return value
+
+    scheduler = StageScheduler("test")
+    scheduler.add("snapshot", lambda: slow("snap"))
+    scheduler.add("activity", lambda: slow("act"))
+
+    started = time.perf_counter()
+    results = asyncio.run(scheduler.run())
+    elapsed = time.perf_counter() - started
+
+    assert results == {"snapshot": "snap", "activity": "act"}
+    assert elapsed < 0.18
+    assert scheduler.timings["activity"].started_ms < 50
+
+
+def test_dependency_results_passed_in_order():
+    async def tree():
+        await asyncio.sleep(0.02)
+        return ["requirements.txt"]
+
+    scheduler = StageScheduler()
+    scheduler.add("snapshot", lambda: "snap")
+    scheduler.add("tree", tree)
+    scheduler.add("deps", lambda snap, paths: (snap, paths), deps=("snapshot", "tree"), blocking=True)
+
+    results = asyncio.run(scheduler.run())
+    assert results["deps"] == ("snap", ["requirements.txt"])
+    assert scheduler.timings["deps"].started_ms >= scheduler.timings["tree"].duration_ms
+
+
+def test_failure_cancels_other_stages():
+    cancelled = []
+
+    async def long_running():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    def broken():
+        raise RuntimeError("boom")
+
+    scheduler = StageScheduler()
+    scheduler.add("activity", long_running)
+    scheduler.add("snapshot", broken, blocking=True)
+    scheduler.add("docs", lambda snap: snap, deps=("snapshot",))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(scheduler.run())
+    assert cancelled == [True]
+    assert scheduler.timings["snapshot"].ok is False
+    assert "docs" not in scheduler.timings
+
+
+def test_register_validation():
+    scheduler = StageScheduler()
+    scheduler.add("a", lambda: 1)
+    with pytest.raises(ValueError):
+        scheduler.add("a", lambda: 2)
+    with pytest.raises(ValueError):
+        scheduler.add("b", lambda x: x, deps=("missing",))
+
+
+def test_timings_dict():
+    scheduler = StageScheduler()
+    scheduler.add("a", lambda: 1)
+    asyncio.run(scheduler.run())
+    timing = scheduler.timings_dict()["a"]
+    assert set(timing) == {"started_ms", "duration_ms", "ok"}
+    assert timing["ok"] is True
+
+
+def test_blocking_runs_on_shared_executor():
+    names = asyncio.run(run_blocking(lambda: threading.current_thread().name))
+    assert names.startswith("odoc-shared")
+    assert get_shared_executor() is get_shared_executor()
+
+
+def test_on_complete_called_as_stages_finish():
+    completed = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    scheduler = StageScheduler(on_complete=lambda name, result: completed.append((name, result)))
+    scheduler.add("slow", slow)
+    scheduler.add("fast", lambda: "fast", blocking=True)
+    asyncio.run(scheduler.run())
+
+    assert completed == [("fast", "fast"), ("slow", "slow")]
+
+
+def test_listener_follows_tasks_and_shared_executor():
+    received = []
+
+    async def main():
+        with listen_stages(lambda name, payload: received.append((name, payload))):
+            task = asyncio.ensure_future(run_blocking(emit_stage, "docs", {"docs_score": 80}))
+        emit_stage("ignored", {})
+        await task
+
+    asyncio.run(main())
+    assert received == [("docs", {"docs_score": 80})]
+
+
+def test_timeout_returns_finished_stages():
+    async def slow():
+        await asyncio.sleep(5)
+        return "late"
+
+    scheduler = StageScheduler()
+    scheduler.add("snapshot", lambda: "snap")
+    scheduler.add("activity", slow)
+    scheduler.add("docs", lambda snap: snap, deps=("snapshot",))
+    scheduler.add("report", lambda act: act, deps=("activity",))
+
+    started = time.perf_counter()
+    results = asyncio.run(scheduler.run(timeout=0.05))
+
+    assert time.perf_counter() - started < 1
+    assert results == {"snapshot": "snap", "docs": "snap"}
+    assert scheduler.expired == ["activity", "report"]
+    assert scheduler.timings["activity"].ok is False
+
+
+def test_deadline_exceeded_stage_counts_as_expired():
+    from backend.common.deadline import DeadlineExceeded
+
+    def past_deadline():
+        raise DeadlineExceeded("late")
+
+    scheduler = StageScheduler()
+    scheduler.add("tree", past_deadline, blocking=True)
+    scheduler.add("structure", lambda tree: tree, deps=("tree",))
+    scheduler.add("activity", lambda: "act")
+
+    results = asyncio.run(scheduler.run())
+    assert results == {"activity": "act"}
+    assert scheduler.expired == ["tree", "structure"]
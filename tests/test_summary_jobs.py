@@ -0,0 +1,158 @@
+"""
+백그라운드 LLM 요약 작업 테스트.
+
+full path가 점수/발견사항을 먼저 반환하고 요약은 작업 ID로 조회/대기할 수 있는지,
+완료된 요약이 같은 커밋의 다음 진단에서 재사용되는지 검증.
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend.agents.diagnosis import full_path, partial_cache
+from backend.agents.diagnosis import graph as diagnosis_graph
+from backend.agents.diagnosis.intent_parser import DiagnosisIntentV2
+from backend.agents.diagnosis.summary_jobs import SummaryJobRegistry, summary_jobs
+from backend.api.http_router import get_analysis_summary
+from backend.core.models import (
+    ActivityCoreResult,
+    DependenciesSnapshot,
+    DocsCoreResult,
+    StructureCoreResult,
+)
+
+_SHA = "d" * 40
+
+
+@pytest.fixture
+def cached_parts(monkeypatch):
+    async def resolve(owner, repo, ref="HEAD"):
+        return _SHA
+
+    async def fake_activity(owner, repo, days):
+        return ActivityCoreResult(
+            commit_score=0.7, issue_score=0.7, pr_score=0.7, total_score=70,
+            days_since_last_commit=1, total_commits_in_window=40, unique_authors=5,
+        )
+
+    monkeypatch.setattr(full_path, "resolve_commit_sha_async", resolve)
+    monkeypatch.setattr(full_path, "analyze_activity_async", fake_activity)
+    partial_cache.store_parts("o", "r", _SHA, "standard", {
+        "docs": DocsCoreResult(
+            readme_present=True, readme_word_count=300, category_scores={},
+            total_score=80, missing_sections=[], present_sections=["WHAT"],
+        ),
+        "structure": StructureCoreResult(
+            has_tests=True, has_ci=True, has_docs_folder=False, has_build_config=True,
+            structure_score=75,
+        ),
+        "dependencies": DependenciesSnapshot(repo_id="o/r"),
+    })
+    summary_jobs.clear()
+    yield
+    summary_jobs.clear()
+    for part in (*partial_cache.ANALYZER_PARTS, "summary"):
+        key = partial_cache.part_key(part, "o", "r", _SHA, "standard")
+        partial_cache.github_cache.delete(key)
+        partial_cache.immutable_cache.delete(key)
+
+
+def test_full_path_returns_before_summary(cached_parts, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def slow_summary(owner, repo, scoring, docs, activity):
+        calls.append(owner)
+        release.wait(5)
+        return "요약"
+
+    monkeypatch.setattr(full_path, "_generate_summary", slow_summary)
+
+    result = asyncio.run(full_path.execute_full_path("o", "r", "main", defer_llm_summary=True))
+
+    assert result["health_score"] > 0
+    assert result["llm_summary"] is None
+    assert result["summary_status"] == "pending"
+    assert result["summary_job_id"] == "o/r@main"
+    assert asyncio.run(get_analysis_summary("o/r@main"))["status"] == "pending"
+
+    release.set()
+    polled = asyncio.run(get_analysis_summary("o/r@main", wait=5))
+    assert polled["status"] == "done"
+    assert polled["summary"] == "요약"
+
+    # 같은 커밋의 다음 진단은 저장된 요약을 바로 사용
+    again = asyncio.run(full_path.execute_full_path("o", "r", "main", defer_llm_summary=True))
+    assert again["llm_summary"] == "요약"
+    assert again["summary_status"] == "done"
+    assert calls == ["o"]
+
+
+def test_inline_summary_by_default(cached_parts, monkeypatch):
+    monkeypatch.setattr(full_path, "_generate_summary", lambda *args: None)
+
+    result = asyncio.run(full_path.execute_full_path("o", "r", "main"))
+
+    assert result["summary_status"] == "failed"
+    assert result["stage_timings"]["llm_summary"]["ok"] is False
+
+
+def test_diagnosis_graph_passes_defer_and_skips_caching_pending(monkeypatch):
+    seen = []
+    stored = []
+
+    async def fake_full_path(**kwargs):
+        seen.append(kwargs["defer_llm_summary"])
+        return {"health_score": 70, "llm_summary": None, "summary_status": "pending"}
+
+    class FakeCache:
+        def set(self, **kwargs):
+            stored.append(kwargs)
+
+    monkeypatch.setattr(diagnosis_graph, "execute_full_path", fake_full_path)
+    monkeypatch.setattr(diagnosis_graph, "get_cache_manager", FakeCache)
+
+    state = {
+        "owner": "o", "repo": "r", "ref": "main", "cache_key": "diagnosis:o/r@main",
+        "diagnosis_intent": DiagnosisIntentV2(execution_path="full"), "defer_llm_summary": True,
+    }
+    result = asyncio.run(diagnosis_graph.full_path_node(state))
+
+    assert result["result"]["summary_status"] == "pending"
+    assert seen == [True]
+    assert stored == []
+
+
+def test_registry_wait_timeout_keeps_job_running():
+    registry = SummaryJobRegistry()
+    release = threading.Event()
+    done = []
+
+    job = registry.submit("a/b@main", lambda: release.wait(5) and "ok", on_done=done.append)
+    waited = asyncio.run(registry.wait("a/b@main", 0.05))
+    assert waited is job
+    assert job.status == "pending"
+
+    release.set()
+    job.future.result(timeout=5)
+    assert job.status == "done"
+    assert done == ["ok"]
+
+
+def test_registry_record_and_eviction():
+    registry = SummaryJobRegistry(max_entries=2)
+    registry.record("a", "요약 A")
+    registry.record("b", None)
+    registry.record("c", "요약 C")
+
+    assert registry.get("a") is None
+    assert registry.get("b").status == "failed"
+    assert registry.get("c").to_dict()["summary"] == "요약 C"
+
+
+def test_unknown_job_returns_404():
+    summary_jobs.clear()
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_analysis_summary("missing/repo@main"))
+    assert exc.value.status_code == 404
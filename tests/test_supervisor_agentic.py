@@ -491,6 +491,45 @@ class TestComparisonNodes:
         # 점수도 언급되어야 함 (구체적 형식은 LLM에 따라 다를 수 있음)
         assert "80" in result["compare_summary"] or "건강" in result["compare_summary"]
 
+    def test_batch_diagnosis_node_runs_inside_event_loop(self, monkeypatch):
+        import asyncio
+        from backend.agents.comparison import nodes as comparison_nodes
+        from backend.agents.diagnosis import service as diagnosis_service
+        from backend.agents.supervisor.nodes.comparison_nodes import batch_diagnosis_node
+        from backend.common.cache_manager import analysis_cache
+        
+        prefetched = []
+        
+        async def fake_prefetch(repos, ref):
+            prefetched.extend(repos)
+        
+        class _Output:
+            def __init__(self, repo):
+                self.repo = repo
+            
+            def to_dict(self):
+                return {"health_score": 70, "repo": self.repo}
+        
+        async def fake_run_diagnosis(inp):
+            return _Output(inp.repo)
+        
+        monkeypatch.setattr(comparison_nodes, "prefetch_bundles", fake_prefetch)
+        monkeypatch.setattr(diagnosis_service, "run_diagnosis", fake_run_diagnosis)
+        repos = ["batchnode/repo1", "batchnode/repo2"]
+        state = SupervisorState(
+            task_type="diagnose_repo", owner="batchnode", repo="repo1", compare_repos=repos,
+        )
+        try:
+            # FastAPI 요청 루프 안에서 graph.ainvoke로 실행되는 것과 같은 조건
+            result = asyncio.run(batch_diagnosis_node(state))
+        finally:
+            for repo_str in repos:
+                analysis_cache.invalidate_analysis(*repo_str.split("/"), "main")
+        
+        assert prefetched == [("batchnode", "repo1"), ("batchnode", "repo2")]
+        assert sorted(result["compare_results"]) == repos
+        assert result["next_node_override"] == "compare_results_node"
+
     def test_parse_repo_string(self):
         from backend.agents.supervisor.nodes.comparison_nodes import _parse_repo_string
         
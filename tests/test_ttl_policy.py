@@ -0,0 +1,90 @@
+"""
+활동성 기반 TTL 정책 테스트.
+
+pushed_at/is_archived/커밋 속도로 저장소 등급을 정하고
+분석 결과 캐시와 GitHub 조회 캐시 TTL에 반영되는지 검증.
+"""
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from backend.common import ttl_policy
+from backend.common.cache_manager import CacheManager, SimpleCache, cached
+from backend.common.ttl_policy import RepoActivityProfile, classify
+
+
+@pytest.fixture(autouse=True)
+def clean_profiles():
+    ttl_policy.repo_profiles.clear()
+    yield
+    ttl_policy.repo_profiles.clear()
+
+
+def _days_ago(days: int) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def test_classify_tiers():
+    assert classify(RepoActivityProfile(is_archived=True, commits_per_week=80)) == "archived"
+    assert classify(RepoActivityProfile(pushed_at=_days_ago(400))) == "dormant"
+    assert classify(RepoActivityProfile(pushed_at=_days_ago(45))) == "quiet"
+    assert classify(RepoActivityProfile(pushed_at=_days_ago(1), commits_per_week=3)) == "steady"
+    assert classify(RepoActivityProfile(pushed_at=_days_ago(1), commits_per_week=12)) == "active"
+    assert classify(RepoActivityProfile(pushed_at=_days_ago(0), commits_per_week=120)) == "hyperactive"
+    assert classify(RepoActivityProfile()) is None
+
+
+def test_commits_per_week_uses_truncated_span():
+    # 100개 상한에 걸려 최근 10일치만 받은 경우 90일이 아니라 10일 기준
+    oldest = datetime.now(timezone.utc).date() - timedelta(days=9)
+    assert ttl_policy.commits_per_week(100, 90, oldest) == pytest.approx(70.0)
+    assert ttl_policy.commits_per_week(9, 90, date(2000, 1, 1)) == pytest.approx(0.7)
+
+
+def test_unknown_repo_keeps_base_ttl():
+    assert ttl_policy.scaled_ttl("o", "r", 180) == 180
+    assert ttl_policy.analysis_ttl_hours("o", "r") is None
+
+
+def test_observations_merge_into_policy():
+    ttl_policy.observe_repo("O", "R", pushed_at=_days_ago(300), is_archived=False)
+    assert ttl_policy.policy_for("o", "r").tier == "dormant"
+    assert ttl_policy.scaled_ttl("o", "r", 180) == 180 * 24
+
+    # 이후 활동성 분석에서 잦은 커밋이 관측되면 짧은 TTL로 전환
+    ttl_policy.observe_repo("o", "r", last_commit_at=_days_ago(0), commits_per_week=90)
+    assert ttl_policy.analysis_ttl_hours("o", "r") == 1
+    assert ttl_policy.scaled_ttl("o", "r", 180) == 90
+
+
+def test_cached_with_repo_ttl():
+    cache = SimpleCache(ttl=60)
+    ttl_policy.observe_repo("o", "r", is_archived=True)
+
+    @cached(cache=cache, ttl=ttl_policy.repo_ttl(300))
+    def fetch(owner, repo):
+        return {"owner": owner}
+
+    now = time.time()
+    fetch("other", "r")
+    fetch("o", "r")
+    default_entry, archived_entry = cache._store.values()
+    assert default_entry.expires_at - now == pytest.approx(300, abs=5)
+    assert archived_entry.expires_at - now == pytest.approx(300 * 96, abs=5)
+
+
+def test_analysis_ttl_from_resolver():
+    manager = CacheManager(default_ttl_hours=24, ttl_resolver=ttl_policy.analysis_ttl_hours)
+    ttl_policy.observe_repo("busy", "repo", commits_per_week=200)
+
+    manager.set_analysis("busy", "repo", "main", {"v": 1})
+    manager.set_analysis("calm", "repo", "main", {"v": 1})
+    manager.set_analysis("busy", "repo", "dev", {"v": 1}, ttl_hours=5)
+
+    def ttl(owner, ref="main"):
+        return manager.get_entry(manager.make_repo_key(owner, "repo", ref)).ttl_hours
+
+    assert ttl("busy") == 1
+    assert ttl("calm") == 24
+    assert ttl("busy", "dev") == 5